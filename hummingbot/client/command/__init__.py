@@ -20,6 +20,8 @@ from .open_orders_command import OpenOrdersCommand
 from .trades_command import TradesCommand
 from .pnl_command import PnlCommand
 from .rate_command import RateCommand
+from .order_latency_command import OrderLatencyCommand
+from .http_stats_command import HttpStatsCommand
 
 
 __all__ = [
@@ -45,4 +47,6 @@ __all__ = [
     TradesCommand,
     PnlCommand,
     RateCommand,
+    OrderLatencyCommand,
+    HttpStatsCommand,
 ]
@@ -2,6 +2,7 @@
 
 import asyncio
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_pool import HTTPClientPool
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -27,8 +28,14 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            # Writes out the trades and order statuses still queued for the database.
+            self.markets_recorder.stop()
+
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
 
+        await HTTPClientPool.get_instance().close()
+
         self.app.exit()
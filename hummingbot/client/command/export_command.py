@@ -67,7 +67,11 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
-        trades: List[TradeFill] = self._get_trades_from_session(int(self.init_time * 1e3))
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+        trades: pd.DataFrame = TradeFill.get_trade_columns(self.trade_fill_db.get_shared_session(),
+                                                           start_time=int(self.init_time * 1e3),
+                                                           columns=TradeFill.DISPLAY_COLUMNS)
         if len(trades) == 0:
             self._notify("No past trades to export.")
             return
@@ -79,7 +83,7 @@ class ExportCommand:
         file_name = await self.prompt_new_export_file_name(path)
         file_path = os.path.join(path, file_name)
         try:
-            df: pd.DataFrame = TradeFill.to_pandas(trades)
+            df: pd.DataFrame = TradeFill.columns_to_pandas(trades)
             df.to_csv(file_path, header=True)
             self._notify(f"Successfully exported trades to {file_path}")
         except Exception as e:
@@ -92,10 +96,13 @@ class ExportCommand:
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
         session: Session = self.trade_fill_db.get_shared_session()
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
-            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+            # Matched exactly, as the markets recorder saves it, so the config and timestamp index is used.
+            filters.append(TradeFill.config_file_path == config_file_path)
         query: Query = (session
                         .query(TradeFill)
                         .filter(*filters)
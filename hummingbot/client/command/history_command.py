@@ -20,7 +20,12 @@ from hummingbot.client.settings import (
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.client.performance import PerformanceMetrics, calculate_performance_metrics, smart_round
+from hummingbot.client.performance import (
+    PerformanceMetrics,
+    PerformanceTracker,
+    calculate_performance_metrics,
+    smart_round,
+)
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -50,29 +55,70 @@ class HistoryCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        if days == 0:
+            performance_tracker: Optional[PerformanceTracker] = self.session_performance_tracker()
+        else:
+            performance_tracker: Optional[PerformanceTracker] = self.trades_performance_tracker(int(start_time * 1e3))
+        if performance_tracker is None or performance_tracker.num_trades == 0:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
             self.list_trades(start_time)
         if self.strategy_name != "celo_arb":
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, None, precision,
+                                                   performance_tracker=performance_tracker))
+
+    def trades_performance_tracker(self,  # type: HummingbotApplication
+                                   start_timestamp: int) -> PerformanceTracker:
+        """
+        The performance of the trades of the strategy config since start_timestamp, computed by the trades database.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+        performance_tracker: PerformanceTracker = PerformanceTracker()
+        performance_tracker.reset_from_database(self.trade_fill_db.get_shared_session(), start_timestamp,
+                                                self.strategy_file_name)
+        return performance_tracker
+
+    def session_performance_tracker(self,  # type: HummingbotApplication
+                                    ) -> Optional[PerformanceTracker]:
+        """
+        The performance of the trades since the start of the session, kept up to date by the markets recorder. It is
+        computed by the trades database the first time only.
+        """
+        if self.markets_recorder is None:
+            return None
+        performance_tracker: PerformanceTracker = self.markets_recorder.performance_tracker
+        start_timestamp: int = int(self.init_time * 1e3)
+        if performance_tracker.start_timestamp != start_timestamp:
+            self.markets_recorder.flush()
+            performance_tracker.reset_from_database(self.trade_fill_db.get_shared_session(), start_timestamp,
+                                                    self.strategy_file_name)
+        return performance_tracker
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             performance_tracker: Optional[PerformanceTracker] = None) -> Decimal:
+        """
+        Reports the performance of the trades, read from the performance tracker instead if one is given.
+        """
+        if performance_tracker is not None:
+            market_info: Set[Tuple[str, str]] = set(performance_tracker.accumulators.keys())
+        else:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             cur_balances = await self.get_current_balances(market)
-            perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
+            if performance_tracker is not None:
+                perf = await performance_tracker.performance_metrics(market, symbol, cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -197,10 +243,8 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(self.init_time, None, display_report=False,
+                                               performance_tracker=self.session_performance_tracker())
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
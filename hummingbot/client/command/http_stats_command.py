@@ -0,0 +1,28 @@
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from hummingbot.core.utils.http_client_pool import HTTPClientPool
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class HttpStatsCommand:
+    def http_stats(self,  # type: HummingbotApplication
+                   option: Optional[str] = None):
+        """
+        Shows the active and idle connections of the pooled HTTP sessions of each host and the latencies of their
+        endpoints, or resets them.
+        """
+        pool = HTTPClientPool.get_instance()
+        if option == "reset":
+            pool.reset_stats()
+            self._notify("\n HTTP connection stats cleared.")
+            return
+        stats = pool.format_stats()
+        if len(stats) == 0:
+            self._notify("\n No HTTP requests sent through the shared client pool yet.")
+            return
+        self._notify(f"\n HTTP connections:\n{stats}")
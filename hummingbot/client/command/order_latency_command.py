@@ -0,0 +1,45 @@
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class OrderLatencyCommand:
+    def order_latency(self,  # type: HummingbotApplication
+                      option: Optional[str] = None,
+                      exchange: Optional[str] = None,
+                      file_name: Optional[str] = None):
+        """
+        Shows the order placement latencies traced by the running connectors that trace them (Peatio), or enables,
+        disables, resets or dumps their tracing.
+        """
+        tracers = {name: market.order_latency_tracer for name, market in self.markets.items()
+                   if hasattr(market, "order_latency_tracer") and (exchange is None or name == exchange)}
+        if len(tracers) == 0:
+            self._notify("\n No running connector traces order latencies.")
+            return
+        for name, tracer in tracers.items():
+            if option == "enable":
+                tracer.enabled = True
+                self._notify(f"\n {name}: order latency tracing enabled.")
+            elif option == "disable":
+                tracer.enabled = False
+                self._notify(f"\n {name}: order latency tracing disabled.")
+            elif option == "reset":
+                tracer.reset()
+                self._notify(f"\n {name}: traced order latencies cleared.")
+            elif option == "dump":
+                path = global_config_map["log_file_path"].value or DEFAULT_LOG_FILE_PATH
+                path = os.path.join(path, file_name or f"order_latency_{name}_{int(time.time())}.jsonl")
+                count = tracer.dump(path)
+                self._notify(f"\n {name}: {count} traced orders written to {path}.")
+            else:
+                self._notify(f"\n {name} order latencies:\n{tracer.format_summary()}")
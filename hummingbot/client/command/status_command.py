@@ -79,6 +79,7 @@ class StatusCommand:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status + "\n" + app_warning
         if self._script_iterator is not None:
+            status += "\n" + self._script_iterator.format_latency_status()
             self._script_iterator.request_status()
         return status
 
@@ -113,9 +114,18 @@ class StatusCommand:
         return missing_globals + missing_configs
 
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               clock: bool = False):
+        if clock:
+            self._notify(self.clock_status())
+            return
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
 
+    def clock_status(self) -> str:
+        if self.clock is None:
+            return "  Clock is not running."
+        return self.clock.stats.format_status()
+
     async def status_check_all(self,  # type: HummingbotApplication
                                notify_success=True,
                                live=False) -> bool:
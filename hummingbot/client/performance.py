@@ -1,11 +1,18 @@
+import json
+import time
 from decimal import Decimal
 from dataclasses import dataclass
 from typing import (
+    Awaitable,
+    Callable,
     Dict,
     Optional,
     List,
-    Any
+    Any,
+    Tuple,
 )
+import pandas as pd
+from sqlalchemy.orm import Session
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.core.utils.market_price import get_last_price
 
@@ -13,6 +20,14 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+def divide(value, divisor) -> Decimal:
+    value = Decimal(str(value))
+    divisor = Decimal(str(divisor))
+    if divisor == s_decimal_0:
+        return s_decimal_0
+    return value / divisor
+
+
 @dataclass
 class PerformanceMetrics:
     num_buys: int = 0
@@ -69,6 +84,31 @@ def position_order(open: list, close: list):
     return None
 
 
+class AggregatedOrder:
+    """
+    The fills of one order: average fill price and total amount, the position is the one of the first fill.
+    """
+    __slots__ = ("order_id", "position", "price_sum", "fill_count", "amount", "index")
+
+    def __init__(self, order_id: str, position: str):
+        self.order_id: str = order_id
+        self.position: str = position
+        self.price_sum: float = 0
+        self.fill_count: int = 0
+        self.amount: float = 0
+        # Position of the order among the open or close orders of its side
+        self.index: int = -1
+
+    @property
+    def price(self) -> float:
+        return self.price_sum / self.fill_count
+
+    def add_fill(self, price: float, amount: float):
+        self.price_sum += price
+        self.fill_count += 1
+        self.amount += amount
+
+
 def aggregate_position_order(buys: list, sells: list):
     """
     Aggregate the amount field for orders with multiple fills
@@ -76,25 +116,16 @@ def aggregate_position_order(buys: list, sells: list):
     :param sells: a list of sell orders
     :return: 2 lists containing aggregated amounts for buy and sell orders.
     """
-    aggregated_buys = []
-    aggregated_sells = []
-    for buy in buys:
-        if buy.order_id not in [ag.order_id for ag in aggregated_buys]:
-            aggregate_price = [b.price for b in buys if b.order_id == buy.order_id]
-            aggregate_amount = [b.amount for b in buys if b.order_id == buy.order_id]
-            buy.price = sum(aggregate_price) / len(aggregate_price)
-            buy.amount = sum(aggregate_amount)
-            aggregated_buys.append(buy)
-
-    for sell in sells:
-        if sell.order_id not in [ag.order_id for ag in aggregated_sells]:
-            aggregate_price = [s.price for s in sells if s.order_id == sell.order_id]
-            aggregate_amount = [s.amount for s in sells if s.order_id == sell.order_id]
-            sell.price = sum(aggregate_price) / len(aggregate_price)
-            sell.amount = sum(aggregate_amount)
-            aggregated_sells.append(sell)
+    def aggregate(trades: list) -> List[AggregatedOrder]:
+        orders: Dict[str, AggregatedOrder] = {}
+        for trade in trades:
+            order: Optional[AggregatedOrder] = orders.get(trade.order_id)
+            if order is None:
+                order = orders[trade.order_id] = AggregatedOrder(trade.order_id, trade.position)
+            order.add_fill(trade.price, trade.amount)
+        return list(orders.values())
 
-    return aggregated_buys, aggregated_sells
+    return aggregate(buys), aggregate(sells)
 
 
 def derivative_pnl(long: list, short: list):
@@ -126,13 +157,6 @@ async def calculate_performance_metrics(exchange: str,
     :return: A PerformanceMetrics object
     """
 
-    def divide(value, divisor):
-        value = Decimal(str(value))
-        divisor = Decimal(str(divisor))
-        if divisor == s_decimal_0:
-            return s_decimal_0
-        return value / divisor
-
     base, quote = trading_pair.split("-")
     perf = PerformanceMetrics()
     buys = [t for t in trades if t.trade_type.upper() == "BUY"]
@@ -159,27 +183,12 @@ async def calculate_performance_metrics(exchange: str,
     perf.avg_b_price = abs(perf.avg_b_price)
     perf.avg_s_price = abs(perf.avg_s_price)
 
-    perf.cur_base_bal = current_balances.get(base, 0)
-    perf.cur_quote_bal = current_balances.get(quote, 0)
-    perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
-    perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
-
     perf.start_price = Decimal(str(trades[0].price))
-    perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
-    if perf.cur_price is None:
-        perf.cur_price = Decimal(str(trades[-1].price))
-    perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
-                                       (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
-    perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
-                                     (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
-
-    perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
-    perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
-    perf.trade_pnl = perf.cur_value - perf.hold_value
 
     # Handle trade_pnl differently for derivatives
+    derivative_trade_pnl: Optional[Decimal] = None
     if derivative:
-        buys_copy, sells_copy = aggregate_position_order(buys.copy(), sells.copy())
+        buys_copy, sells_copy = aggregate_position_order(buys, sells)
         long = []
         short = []
 
@@ -194,18 +203,11 @@ async def calculate_performance_metrics(exchange: str,
             if lng is None and sht is None:
                 break
 
-        perf.trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
+        derivative_trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
 
     for trade in trades:
         if type(trade) is TradeFill:
-            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
-            for flat_fee in trade.trade_fee.get("flat_fees", []):
-                if flat_fee["asset"] not in perf.fees:
-                    perf.fees[flat_fee["asset"]] = s_decimal_0
-                perf.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
+            add_trade_fill_fees(perf.fees, quote, trade.price, trade.amount, trade.trade_fee)
         else:  # assume this is Trade object
             if trade.trade_fee.percent > 0:
                 if quote not in perf.fees:
@@ -216,18 +218,334 @@ async def calculate_performance_metrics(exchange: str,
                     perf.fees[flat_fee[0]] = s_decimal_0
                 perf.fees[flat_fee[0]] += flat_fee[1]
 
+    await complete_performance_metrics(perf, exchange, trading_pair, current_balances, trades[-1].price,
+                                       derivative_trade_pnl)
+    return perf
+
+
+def add_trade_fill_fees(fees: Dict[str, Decimal], quote: str, price: float, amount: float, trade_fee: Dict[str, Any]):
+    """
+    Adds the fees of a trade fill, as saved in its trade_fee column, to the fee totals per token.
+    """
+    if trade_fee.get("percent") is not None and trade_fee["percent"] > 0:
+        if quote not in fees:
+            fees[quote] = s_decimal_0
+        fees[quote] += Decimal(price * amount * trade_fee["percent"])
+    for flat_fee in trade_fee.get("flat_fees", []):
+        if flat_fee["asset"] not in fees:
+            fees[flat_fee["asset"]] = s_decimal_0
+        fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
+
+
+async def complete_performance_metrics(perf: PerformanceMetrics,
+                                       exchange: str,
+                                       trading_pair: str,
+                                       current_balances: Dict[str, Decimal],
+                                       last_trade_price: float,
+                                       derivative_trade_pnl: Optional[Decimal] = None,
+                                       last_price_function: Callable[[str, str], Awaitable[Optional[Decimal]]] = None):
+    """
+    Fills in the balances, prices and P&L of performance metrics whose trade counts, volumes, start price and fees are
+    already set.
+    :param last_trade_price: the price of the last trade, used if the current price can't be fetched
+    :param derivative_trade_pnl: the P&L of the closed positions, for derivatives
+    :param last_price_function: gets the last traded price of an exchange and trading pair, get_last_price by default
+    """
+    last_price_function = last_price_function or get_last_price
+    base, quote = trading_pair.split("-")
+    perf.cur_base_bal = current_balances.get(base, 0)
+    perf.cur_quote_bal = current_balances.get(quote, 0)
+    perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
+    perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
+
+    perf.cur_price = await last_price_function(exchange.replace("_PaperTrade", ""), trading_pair)
+    if perf.cur_price is None:
+        perf.cur_price = Decimal(str(last_trade_price))
+    perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
+                                       (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
+    perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
+                                     (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
+
+    perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
+    perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
+    perf.trade_pnl = perf.cur_value - perf.hold_value
+
+    # Handle trade_pnl differently for derivatives
+    if derivative_trade_pnl is not None:
+        perf.trade_pnl = derivative_trade_pnl
+
     for fee_token, fee_amount in perf.fees.items():
         if fee_token == quote:
             perf.fee_in_quote += fee_amount
         else:
-            last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
+            last_price = await last_price_function(exchange, f"{fee_token}-{quote}")
             if last_price is not None:
                 perf.fee_in_quote += fee_amount * last_price
 
     perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
     perf.return_pct = divide(perf.total_pnl, perf.hold_value)
 
-    return perf
+
+class PerformanceAccumulator:
+    """
+    Performance of the trade fills of one market and trading pair, updated fill by fill: trade counts, running
+    volumes, fees per token and, for derivatives, the pairing of open and close position orders. Fed the same trade
+    fills in the same order, it comes to exactly the same metrics as calculate_performance_metrics.
+    """
+    def __init__(self, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._quote: str = trading_pair.split("-")[1]
+        self._num_buys: int = 0
+        self._num_sells: int = 0
+        # Running float sums, added up in the same order as the batch computation
+        self._b_amount: float = 0
+        self._s_amount: float = 0
+        self._b_quote_amount: float = 0
+        self._s_quote_amount: float = 0
+        self._start_price: Optional[float] = None
+        self._last_price: Optional[float] = None
+        self._fees: Dict[str, Decimal] = {}
+        self._non_position_trade: bool = False
+        # Aggregated orders per side, keyed by order id, and the open and close orders of each side in order
+        self._orders: Tuple[Dict[str, AggregatedOrder], Dict[str, AggregatedOrder]] = ({}, {})
+        self._open_orders: Tuple[List[AggregatedOrder], List[AggregatedOrder]] = ([], [])
+        self._close_orders: Tuple[List[AggregatedOrder], List[AggregatedOrder]] = ([], [])
+        # P&L of the paired long (open buy, close sell) and short (open sell, close buy) positions
+        self._long_pnls: List[float] = []
+        self._short_pnls: List[float] = []
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_buys + self._num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        return self.num_trades > 0 and not self._non_position_trade
+
+    def add_trade(self, trade: TradeFill):
+        self.add_fill(trade.trade_type, trade.price, trade.amount, trade.trade_fee, trade.order_id, trade.position)
+
+    def add_fill(self, trade_type: str, price: float, amount: float, trade_fee: Dict[str, Any], order_id: str,
+                 position: str):
+        is_buy: bool = trade_type.upper() == "BUY"
+        if not is_buy and trade_type.upper() != "SELL":
+            return
+        if self._start_price is None:
+            self._start_price = price
+        self._last_price = price
+        if is_buy:
+            self._num_buys += 1
+            self._b_amount += amount
+            self._b_quote_amount += amount * price
+        else:
+            self._num_sells += 1
+            self._s_amount += amount
+            self._s_quote_amount += amount * price
+        add_trade_fill_fees(self._fees, self._quote, price, amount, trade_fee)
+        if position == "NILL":
+            self._non_position_trade = True
+        self._add_position_fill(0 if is_buy else 1, price, amount, order_id, position)
+
+    def add_aggregated_fills(self, trade_type: str, num_trades: int, amount: float, quote_amount: float,
+                             trade_fee: Dict[str, Any]):
+        """
+        Adds trade fills of spot trading summed up by TradeFill.aggregate_trades. The start and last prices are set
+        with set_prices as the sums don't have them.
+        :param quote_amount: the sum of amount * price of the fills
+        """
+        is_buy: bool = trade_type.upper() == "BUY"
+        if not is_buy and trade_type.upper() != "SELL":
+            return
+        if is_buy:
+            self._num_buys += num_trades
+            self._b_amount += amount
+            self._b_quote_amount += quote_amount
+        else:
+            self._num_sells += num_trades
+            self._s_amount += amount
+            self._s_quote_amount += quote_amount
+        if trade_fee.get("percent") is not None and trade_fee["percent"] > 0:
+            self._fees[self._quote] = self._fees.get(self._quote, s_decimal_0) + \
+                Decimal(quote_amount * trade_fee["percent"])
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self._fees[flat_fee["asset"]] = self._fees.get(flat_fee["asset"], s_decimal_0) + \
+                Decimal(flat_fee["amount"]) * num_trades
+        self._non_position_trade = True
+
+    def set_prices(self, start_price: float, last_price: float):
+        self._start_price = start_price
+        self._last_price = last_price
+
+    def _add_position_fill(self, side: int, price: float, amount: float, order_id: str, position: str):
+        order: Optional[AggregatedOrder] = self._orders[side].get(order_id)
+        if order is None:
+            order = self._orders[side][order_id] = AggregatedOrder(order_id, position)
+            if position == "OPEN":
+                order.index = len(self._open_orders[side])
+                self._open_orders[side].append(order)
+            elif position == "CLOSE":
+                order.index = len(self._close_orders[side])
+                self._close_orders[side].append(order)
+        order.add_fill(price, amount)
+        if order.position == "OPEN":
+            self._update_position_pnl(side, order.index)
+        elif order.position == "CLOSE":
+            self._update_position_pnl(1 - side, order.index)
+
+    def _update_position_pnl(self, open_side: int, index: int):
+        """
+        Open orders are paired with close orders of the other side in order, like position_order does.
+        """
+        open_orders: List[AggregatedOrder] = self._open_orders[open_side]
+        close_orders: List[AggregatedOrder] = self._close_orders[1 - open_side]
+        if index >= len(open_orders) or index >= len(close_orders):
+            return
+        open_order, close_order = open_orders[index], close_orders[index]
+        pnls: List[float] = self._long_pnls if open_side == 0 else self._short_pnls
+        if open_side == 0:
+            pnl: float = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnl: float = (open_order.price - close_order.price) * close_order.amount
+        if index == len(pnls):
+            pnls.append(pnl)
+        else:
+            pnls[index] = pnl
+
+    async def performance_metrics(self,
+                                  exchange: str,
+                                  current_balances: Dict[str, Decimal],
+                                  last_price_function: Callable[[str, str], Awaitable[Optional[Decimal]]] = None
+                                  ) -> PerformanceMetrics:
+        """
+        :return: the performance metrics of the fills so far, only the current prices are fetched
+        """
+        perf = PerformanceMetrics()
+        perf.num_buys = self._num_buys
+        perf.num_sells = self._num_sells
+        perf.num_trades = self.num_trades
+
+        perf.b_vol_base = Decimal(str(self._b_amount))
+        perf.s_vol_base = Decimal(str(self._s_amount)) * Decimal("-1")
+        perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
+
+        perf.b_vol_quote = Decimal(str(self._b_quote_amount)) * Decimal("-1")
+        perf.s_vol_quote = Decimal(str(self._s_quote_amount))
+        perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
+
+        perf.avg_b_price = abs(divide(perf.b_vol_quote, perf.b_vol_base))
+        perf.avg_s_price = abs(divide(perf.s_vol_quote, perf.s_vol_base))
+        perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
+                                    abs(perf.b_vol_base) + abs(perf.s_vol_base))
+        perf.start_price = Decimal(str(self._start_price))
+        perf.fees = dict(self._fees)
+
+        derivative_trade_pnl: Optional[Decimal] = None
+        if self.is_derivative:
+            # Longs first, then shorts, summed in the order derivative_pnl lists them
+            derivative_trade_pnl = Decimal(str(sum(self._short_pnls, sum(self._long_pnls))))
+        await complete_performance_metrics(perf, exchange, self._trading_pair, current_balances, self._last_price,
+                                           derivative_trade_pnl, last_price_function)
+        return perf
+
+
+class PerformanceTracker:
+    """
+    Keeps a PerformanceAccumulator per market and trading pair for the trade fills since a start time, so the history
+    report and the kill switch don't go through every trade fill again. It is reset from the trade fills in the
+    database on demand, and fed every fill recorded afterwards. The prices fetched to value the portfolio and the
+    fees are cached for price_ttl seconds.
+    """
+    def __init__(self, price_ttl: float = 30.0):
+        self._start_timestamp: Optional[int] = None
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._price_ttl: float = price_ttl
+        self._prices: Dict[Tuple[str, str], Tuple[float, Optional[Decimal]]] = {}
+
+    @property
+    def start_timestamp(self) -> Optional[int]:
+        """
+        :return: the start of the tracked trade fills in milliseconds, None until the tracker is reset
+        """
+        return self._start_timestamp
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def reset(self, start_timestamp: int, trades: List[TradeFill]):
+        """
+        Recomputes the performance from the trade fills since start_timestamp, oldest first.
+        """
+        self._start_timestamp = start_timestamp
+        self._accumulators.clear()
+        for trade in trades:
+            self._get_accumulator(trade.market, trade.symbol).add_trade(trade)
+
+    def reset_from_database(self, sql_session: Session, start_timestamp: int, config_file_path: Optional[str] = None):
+        """
+        Recomputes the performance from the trade fills in the database since start_timestamp. The fills of spot
+        trading pairs are summed up by the database, only derivative ones are read fill by fill, in columns, to pair
+        up their positions.
+        """
+        self._start_timestamp = start_timestamp
+        self._accumulators.clear()
+        aggregates: pd.DataFrame = TradeFill.aggregate_trades(sql_session, config_file_path, start_timestamp)
+        if len(aggregates) == 0:
+            return
+        for (market, trading_pair), groups in aggregates.groupby(["market", "symbol"], sort=False):
+            accumulator: PerformanceAccumulator = self._get_accumulator(market, trading_pair)
+            # Derivative unless any of the fills is a spot one, as calculate_performance_metrics decides
+            if all(position != "NILL" for position in groups["position"]):
+                for trades in TradeFill.iter_trade_columns(sql_session, config_file_path, start_timestamp,
+                                                           market=market, trading_pair=trading_pair,
+                                                           columns=["trade_type", "price", "amount", "trade_fee",
+                                                                    "order_id", "position"]):
+                    for trade in trades.itertuples(index=False):
+                        accumulator.add_fill(trade.trade_type, trade.price, trade.amount, trade.trade_fee,
+                                             trade.order_id, trade.position)
+                continue
+            for group in groups.itertuples(index=False):
+                accumulator.add_aggregated_fills(group.trade_type, int(group.num_trades), float(group.amount),
+                                                 float(group.quote_amount), json.loads(group.trade_fee))
+            accumulator.set_prices(*TradeFill.get_first_and_last_prices(sql_session, market, trading_pair,
+                                                                        config_file_path, start_timestamp))
+
+    def _get_accumulator(self, market: str, trading_pair: str) -> PerformanceAccumulator:
+        accumulator: Optional[PerformanceAccumulator] = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            accumulator = self._accumulators[(market, trading_pair)] = PerformanceAccumulator(trading_pair)
+        return accumulator
+
+    def add_fill(self, market: str, trading_pair: str, timestamp: int, trade_type: str, price: float, amount: float,
+                 trade_fee: Dict[str, Any], order_id: str, position: str):
+        if self._start_timestamp is None or timestamp < self._start_timestamp:
+            return
+        self._get_accumulator(market, trading_pair).add_fill(trade_type, price, amount, trade_fee, order_id,
+                                                             position)
+
+    async def get_last_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        now: float = time.time()
+        cached: Optional[Tuple[float, Optional[Decimal]]] = self._prices.get((exchange, trading_pair))
+        if cached is not None and now - cached[0] < self._price_ttl:
+            return cached[1]
+        price: Optional[Decimal] = await get_last_price(exchange, trading_pair)
+        self._prices[(exchange, trading_pair)] = (now, price)
+        return price
+
+    async def performance_metrics(self, market: str, trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> Optional[PerformanceMetrics]:
+        accumulator: Optional[PerformanceAccumulator] = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            return None
+        return await accumulator.performance_metrics(market, current_balances, self.get_last_price)
 
 
 def smart_round(value: Decimal, precision: Optional[int] = None) -> Decimal:
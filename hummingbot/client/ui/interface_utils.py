@@ -1,14 +1,9 @@
 from decimal import Decimal
-from typing import (
-    Set,
-    Tuple,
-    List
-)
+from typing import Optional
 import psutil
 import datetime
 import asyncio
-from hummingbot.model.trade_fill import TradeFill
-from hummingbot.client.performance import calculate_performance_metrics, smart_round
+from hummingbot.client.performance import PerformanceTracker, smart_round
 
 
 s_decimal_0 = Decimal("0")
@@ -56,16 +51,13 @@ async def start_trade_monitor(trade_monitor):
     while True:
         if hb.strategy_task is not None and not hb.strategy_task.done():
             if all(market.ready for market in hb.markets.values()):
-                trades: List[TradeFill] = hb._get_trades_from_session(int(hb.init_time * 1e3),
-                                                                      config_file_path=hb.strategy_file_name)
-                if len(trades) > total_trades:
-                    total_trades = len(trades)
-                    market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                    for market, symbol in market_info:
+                performance_tracker: Optional[PerformanceTracker] = hb.session_performance_tracker()
+                if performance_tracker is not None and performance_tracker.num_trades > total_trades:
+                    total_trades = performance_tracker.num_trades
+                    for market, symbol in performance_tracker.accumulators.keys():
                         quote_asset = symbol.split("-")[1]  # Note that the qiote asset of the last pair is assumed to be the quote asset of P&L for simplicity
-                        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
                         cur_balances = await hb.get_current_balances(market)
-                        perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
+                        perf = await performance_tracker.performance_metrics(market, symbol, cur_balances)
                         return_pcts.append(perf.return_pct)
                         pnls.append(perf.total_pnl)
                     avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
@@ -99,6 +99,8 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
 
     status_parser = subparsers.add_parser("status", help="Get the market status of the current bot")
     status_parser.add_argument("--live", default=False, action="store_true", dest="live", help="Show status updates")
+    status_parser.add_argument("--clock", default=False, action="store_true", dest="clock",
+                               help="Show the tick durations of the connectors and strategy")
     status_parser.set_defaults(func=hummingbot.status)
 
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
@@ -146,4 +148,17 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
                              dest="token", help="The token you want to see its value.")
     rate_parser.set_defaults(func=hummingbot.rate)
 
+    order_latency_parser = subparsers.add_parser("order_latency", help="Show or control the order latency tracing")
+    order_latency_parser.add_argument("option", nargs="?", choices=["enable", "disable", "reset", "dump"],
+                                      default=None, help="Tracing action, show the traced latencies if omitted")
+    order_latency_parser.add_argument("--exchange", type=str, dest="exchange", help="The exchange of the tracer")
+    order_latency_parser.add_argument("--file", type=str, dest="file_name",
+                                      help="Name of the JSON lines file to dump the traced orders to")
+    order_latency_parser.set_defaults(func=hummingbot.order_latency)
+
+    http_stats_parser = subparsers.add_parser("http_stats", help="Show the HTTP connections and endpoint latencies")
+    http_stats_parser.add_argument("option", nargs="?", choices=["reset"], default=None,
+                                   help="Clear the stats, show them if omitted")
+    http_stats_parser.set_defaults(func=hummingbot.http_stats)
+
     return parser
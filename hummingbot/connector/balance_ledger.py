@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+from collections import deque
+from decimal import Decimal
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+
+
+class BalanceLedger(EventListener):
+    """
+    Keeps the balances locked in the in-flight orders of a connector and the balance changes from its filled orders,
+    as ConnectorBase.in_flight_asset_balances and ConnectorBase.order_filled_balances compute them, up to date on the
+    order events instead of recomputing them over all the orders and event logs on every balance query.
+
+    The fills are summed from the start, as the event logs only keep the latest events. The locked balances are kept
+    from the first query on, starting from a full computation. The locked balance of an order is updated on each of
+    its events, and orders are added or removed when the in-flight orders differ from the orders in the ledger (an order
+    is tracked before its created event, and a done order stays in the ledger until it is no longer tracked). A new
+    in-flight orders snapshot rebuilds the locked balances from scratch.
+    """
+    ORDER_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderExpired,
+    ]
+
+    def __init__(self, connector):
+        super().__init__()
+        self._connector = connector
+        self._active: bool = False
+        # The locked (asset, amount) of each in-flight order, None for the ones which are done
+        self._order_balances: Dict[str, Optional[Tuple[str, Decimal]]] = {}
+        self._locked_balances: Dict[str, Decimal] = {}
+        self._snapshot: Optional[Dict[str, InFlightOrderBase]] = None
+        self._snapshot_balances: Dict[str, Decimal] = {}
+        self._filled_balances: Dict[str, Decimal] = {}
+        # The balance changes of each fill after _since_timestamp and their sums
+        self._fills_since: Optional[Deque[Tuple[float, List[Tuple[str, Decimal]]]]] = None
+        self._filled_balances_since: Dict[str, Decimal] = {}
+        self._since_timestamp: float = 0.0
+
+    def __call__(self, event):
+        if isinstance(event, OrderFilledEvent):
+            self._add_fill(event)
+        if not self._active:
+            return
+        order_id = getattr(event, "order_id", None)
+        if order_id is not None:
+            order = self._connector.in_flight_orders.get(order_id)
+            if order is not None:
+                self._set_order_balance(order_id, self._order_balance(order))
+            elif order_id in self._order_balances:
+                self._remove_order(order_id)
+
+    def locked_balances(self, in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
+        """
+        :param in_flight_orders: the in-flight orders of the connector
+        :returns The balances locked in the in-flight orders, including the estimated fee. Not to be modified.
+        """
+        self._active = True
+        # Compared by order id, as a done order may still be in the ledger while a new one is not yet.
+        if self._order_balances.keys() != in_flight_orders.keys():
+            for order_id in [o for o in self._order_balances if o not in in_flight_orders]:
+                self._remove_order(order_id)
+            for order_id, order in in_flight_orders.items():
+                if order_id not in self._order_balances:
+                    self._set_order_balance(order_id, self._order_balance(order))
+        return self._locked_balances
+
+    def snapshot_locked_balances(self, snapshot: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
+        """
+        :param snapshot: the in-flight orders snapshot taken along with the last balance update
+        :returns The balances locked in the snapshot orders, computed once per snapshot. Not to be modified.
+        """
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._snapshot_balances = self._connector.in_flight_asset_balances(snapshot)
+            # Resynchronizes the locked balances with the connector along with its balances.
+            self._order_balances.clear()
+            self._locked_balances.clear()
+        return self._snapshot_balances
+
+    def filled_balances(self, starting_timestamp: float = 0.0) -> Dict[str, Decimal]:
+        """
+        :param starting_timestamp: the fills after this timestamp are included
+        :returns The balance changes from the filled orders since the timestamp. Not to be modified.
+        """
+        if starting_timestamp == 0:
+            return self._filled_balances
+        if self._fills_since is None or starting_timestamp < self._since_timestamp:
+            self._since_timestamp = starting_timestamp
+            self._fills_since = deque((e.timestamp, self._fill_balances(e)) for e in
+                                      self._connector.event_journal.iter_events(OrderFilledEvent,
+                                                                                since=starting_timestamp))
+            self._sum_fills_since()
+        elif starting_timestamp > self._since_timestamp:
+            self._since_timestamp = starting_timestamp
+            while self._fills_since and self._fills_since[0][0] <= starting_timestamp:
+                self._fills_since.popleft()
+            self._sum_fills_since()
+        return self._filled_balances_since
+
+    def check_consistency(self, tolerance: Decimal = Decimal("1e-18")) -> Dict[Tuple[str, str], Tuple[Decimal, Decimal]]:
+        """
+        Compares the ledger with a full computation over the in-flight orders and the event logs of the connector, the
+        total fills only while no fill has left the event logs. The locked balances are summed incrementally, so they
+        may differ from the full computation by a rounding error.
+        :param tolerance: the largest difference accepted
+        :returns The (ledger, computed) balances which differ, by (balance name, asset)
+        """
+        connector = self._connector
+        comparisons = [
+            ("locked", self.locked_balances(connector.in_flight_orders),
+             connector.in_flight_asset_balances(connector.in_flight_orders)),
+        ]
+        if connector.event_journal.evicted_count == 0:
+            comparisons.append(("filled", self.filled_balances(), connector.order_filled_balances()))
+        if self._snapshot is not None:
+            comparisons.append(("snapshot_locked", self._snapshot_balances,
+                                connector.in_flight_asset_balances(self._snapshot)))
+        if self._fills_since is not None:
+            comparisons.append(("filled_since_snapshot", self._filled_balances_since,
+                                connector.order_filled_balances(self._since_timestamp)))
+        mismatches = {}
+        for name, ledger_balances, computed_balances in comparisons:
+            for asset in set(ledger_balances) | set(computed_balances):
+                ledger_balance = ledger_balances.get(asset, s_decimal_0)
+                computed_balance = computed_balances.get(asset, s_decimal_0)
+                if abs(ledger_balance - computed_balance) > tolerance:
+                    mismatches[(name, asset)] = (ledger_balance, computed_balance)
+        return mismatches
+
+    def _order_balance(self, order: InFlightOrderBase) -> Optional[Tuple[str, Decimal]]:
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return None
+        if order.trade_type is TradeType.BUY:
+            outstanding_value = Decimal(order.amount * order.price) - order.executed_amount_quote
+            return order.quote_asset, outstanding_value * (Decimal(1) + self._connector.estimate_fee_pct(True))
+        return order.base_asset, order.amount - order.executed_amount_base
+
+    def _set_order_balance(self, order_id: str, balance: Optional[Tuple[str, Decimal]]):
+        old_balance = self._order_balances.get(order_id)
+        if old_balance is not None:
+            self._locked_balances[old_balance[0]] -= old_balance[1]
+        if balance is not None:
+            self._locked_balances[balance[0]] = self._locked_balances.get(balance[0], s_decimal_0) + balance[1]
+        self._order_balances[order_id] = balance
+
+    def _remove_order(self, order_id: str):
+        self._set_order_balance(order_id, None)
+        del self._order_balances[order_id]
+
+    @staticmethod
+    def _fill_balances(event: OrderFilledEvent) -> List[Tuple[str, Decimal]]:
+        base, quote = event.trading_pair.split("-")
+        if event.trade_type is TradeType.BUY:
+            return [(base, event.amount), (quote, Decimal("-1") * event.price * event.amount)]
+        return [(base, Decimal("-1") * event.amount), (quote, event.price * event.amount)]
+
+    def _add_fill(self, event: OrderFilledEvent):
+        balances = self._fill_balances(event)
+        if event.timestamp > 0:
+            for asset, amount in balances:
+                self._filled_balances[asset] = self._filled_balances.get(asset, s_decimal_0) + amount
+        if self._fills_since is not None and event.timestamp > self._since_timestamp:
+            self._fills_since.append((event.timestamp, balances))
+            for asset, amount in balances:
+                self._filled_balances_since[asset] = self._filled_balances_since.get(asset, s_decimal_0) + amount
+
+    def _sum_fills_since(self):
+        # Summed again in order rather than subtracted, so that the sums match order_filled_balances exactly.
+        self._filled_balances_since = {}
+        for _, balances in self._fills_since:
+            for asset, amount in balances:
+                self._filled_balances_since[asset] = self._filled_balances_since.get(asset, s_decimal_0) + amount
@@ -1,11 +1,10 @@
 from hummingbot.core.event.event_reporter cimport EventReporter
-from hummingbot.core.event.event_logger cimport EventLogger
 from hummingbot.core.network_iterator cimport NetworkIterator
 
 cdef class ConnectorBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
-        EventLogger _event_logger
+        object _event_journal
         public bint _trading_required
         public dict _account_available_balances
         public dict _account_balances
@@ -14,6 +13,7 @@ cdef class ConnectorBase(NetworkIterator):
         public double _in_flight_orders_snapshot_timestamp
         public set _current_trade_fills
         public dict _exchange_order_ids
+        object _balance_ledger
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
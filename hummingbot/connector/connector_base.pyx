@@ -11,8 +11,9 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
-from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.event_journal import EventJournal
 from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.events import OrderFilledEvent
@@ -37,15 +38,19 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.SellOrderCreated,
         MarketEvent.OrderExpired
     ]
+    # Retention of the event logs, by number of events and by age in seconds (None to keep all)
+    EVENT_LOG_MAX_EVENTS = 100000
+    EVENT_LOG_MAX_AGE = None
 
     def __init__(self):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_journal = EventJournal(event_source=self.display_name, max_events=self.EVENT_LOG_MAX_EVENTS,
+                                           max_age=self.EVENT_LOG_MAX_AGE)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
-            self.c_add_listener(event_tag.value, self._event_logger)
+            self.c_add_listener(event_tag.value, self._event_journal)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -58,6 +63,10 @@ cdef class ConnectorBase(NetworkIterator):
         self._in_flight_orders_snapshot_timestamp = 0.0
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
+        # Keeps the locked and filled balances used by the balance queries up to date on the order events.
+        self._balance_ledger = BalanceLedger(self)
+        for event_tag in BalanceLedger.ORDER_EVENTS:
+            self.c_add_listener(event_tag.value, self._balance_ledger)
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -67,6 +76,10 @@ cdef class ConnectorBase(NetworkIterator):
     def real_time_balance_update(self, value: bool):
         self._real_time_balance_update = value
 
+    @property
+    def balance_ledger(self) -> BalanceLedger:
+        return self._balance_ledger
+
     @property
     def in_flight_orders_snapshot(self) -> Dict[str, InFlightOrderBase]:
         return self._in_flight_orders_snapshot
@@ -126,14 +139,12 @@ cdef class ConnectorBase(NetworkIterator):
         """
         Calculates total asset balance changes from filled orders since the timestamp
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
-        opposite. This does not account for fee.
+        opposite. This does not account for fee. Only the fills still in the event logs are counted.
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
-        for event in order_filled_events:
+        for event in self._event_journal.iter_events(OrderFilledEvent, since=starting_timestamp):
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
             if event.trade_type is TradeType.BUY:
                 quote_value = Decimal("-1") * event.price * event.amount
@@ -176,7 +187,14 @@ cdef class ConnectorBase(NetworkIterator):
 
     @property
     def event_logs(self) -> List[any]:
-        return self._event_logger.event_log
+        return self._event_journal.event_log
+
+    @property
+    def event_journal(self) -> EventJournal:
+        """
+        The event logs, with iterators by event type, trading pair and time which don't copy them.
+        """
+        return self._event_journal
 
     @property
     def ready(self) -> bool:
@@ -298,9 +316,9 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self._balance_ledger.locked_balances(self.in_flight_orders).get(currency, s_decimal_0)
         limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
+        filled_balance = self._balance_ledger.filled_balances().get(currency, s_decimal_0)
         limit += filled_balance
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
@@ -313,10 +331,11 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        snapshot_bal = self._balance_ledger.snapshot_locked_balances(self._in_flight_orders_snapshot).get(currency,
+                                                                                                          s_decimal_0)
+        in_flight_bal = self._balance_ledger.locked_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        orders_filled_bal = self._balance_ledger.filled_balances(self._in_flight_orders_snapshot_timestamp).get(
+            currency, s_decimal_0)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
@@ -3,6 +3,7 @@
 
 import logging
 import numpy as np
+cimport numpy as np
 
 from decimal import Decimal
 from typing import Dict
@@ -11,8 +12,37 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 _logger = None
 s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
+s_empty_numpy_diff = np.ndarray(shape=(0, 3), dtype="float64")
 PeatioOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
 
+
+def entries_to_numpy_diff(object entries, double update_id):
+    """
+    Parses the price levels of one side of an ob-inc message, a single [price, amount] pair or a list of them, into
+    a [price, amount, update_id] array as taken by OrderBook.apply_numpy_diffs. Empty amounts remove the level.
+    """
+    cdef:
+        Py_ssize_t count
+        Py_ssize_t i
+        np.ndarray[np.float64_t, ndim=2] result
+        object entry
+
+    if not entries:
+        return s_empty_numpy_diff
+    if not isinstance(entries[0], (list, tuple)):
+        entries = (entries,)
+    count = len(entries)
+    result = np.empty((count, 3), dtype="float64")
+    for i in range(count):
+        entry = entries[i]
+        result[i, 0] = float(entry[0])
+        try:
+            result[i, 1] = float(entry[1])
+        except ValueError:
+            result[i, 1] = 0.0
+        result[i, 2] = update_id
+    return result
+
 cdef class PeatioActiveOrderTracker:
     def __init__(self,
                  active_asks: PeatioOrderBookTrackingDictionary = None,
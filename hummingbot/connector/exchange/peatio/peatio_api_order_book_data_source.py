@@ -2,22 +2,26 @@
 import asyncio
 import logging
 import time
-import pandas as pd
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-# from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from .peatio_constants import Constants
 from .peatio_active_order_tracker import PeatioActiveOrderTracker
 from .peatio_order_book import PeatioOrderBook
+from .peatio_order_book_resync import PeatioOrderBookResyncScheduler
 from .peatio_websocket import PeatioWebsocket
 from .peatio_utils import (
     convert_to_exchange_trading_pair,
     convert_from_exchange_trading_pair,
     api_call_with_retries,
+    ws_reconnect_delay,
     PeatioAPIError,
 )
 
@@ -35,6 +39,20 @@ class PeatioAPIOrderBookDataSource(OrderBookTrackerDataSource):
         super().__init__(trading_pairs)
         self._trading_pairs: List[str] = trading_pairs
         self._snapshot_msg: Dict[str, any] = {}
+        self._message_outputs: Dict[OrderBookMessageType, asyncio.Queue] = {}
+        self._public_stream_task: Optional[asyncio.Task] = None
+        self._sequences: Dict[str, int] = {}
+        self._last_update_times: Dict[str, float] = {}
+        self._public_stream_connected_at: Optional[float] = None
+        self._snapshot_output: Optional[asyncio.Queue] = None
+        self._resync_scheduler: PeatioOrderBookResyncScheduler = \
+            PeatioOrderBookResyncScheduler(Constants.ORDER_BOOK_RESYNC_COOLDOWN)
+        self._resync_requested: asyncio.Event = asyncio.Event()
+        self._resync_task: Optional[asyncio.Task] = None
+
+    @property
+    def resync_scheduler(self) -> PeatioOrderBookResyncScheduler:
+        return self._resync_scheduler
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, Decimal]:
@@ -98,126 +116,246 @@ class PeatioAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Listen for trades using websocket trade channel
         """
-        while True:
-            try:
-                ws = PeatioWebsocket()
+        await self._listen_public_streams(OrderBookMessageType.TRADE, output)
 
-                await ws.connect()
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        """
+        Listen for orderbook diffs using websocket book channel, the websocket and resync snapshots are put on the same
+        queue so they stay in order with the diffs.
+        """
+        await self._listen_public_streams(OrderBookMessageType.DIFF, output)
 
-                ws_streams = [
-                    Constants.WS_SUB['TRADES'].format(trading_pair=convert_to_exchange_trading_pair(trading_pair))
-                    for trading_pair in self._trading_pairs
-                ]
-                await ws.subscribe(ws_streams)
+    async def _listen_public_streams(self, message_type: OrderBookMessageType, output: asyncio.Queue):
+        """
+        The trade and order book listeners share one public websocket connection, it runs for as long as either of them
+        is listening.
+        """
+        self._message_outputs[message_type] = output
+        if self._public_stream_task is None:
+            self._public_stream_task = safe_ensure_future(self._public_stream_loop())
+        try:
+            await asyncio.shield(self._public_stream_task)
+        finally:
+            if self._message_outputs.get(message_type) is output:
+                del self._message_outputs[message_type]
+            if len(self._message_outputs) == 0:
+                self._stop_public_streams()
+
+    def _stop_public_streams(self):
+        if self._public_stream_task is not None:
+            self._public_stream_task.cancel()
+            self._public_stream_task = None
+        if self._resync_task is not None and self._snapshot_output is None:
+            self._resync_task.cancel()
+            self._resync_task = None
+
+    def _public_streams(self) -> List[str]:
+        streams: List[str] = []
+        for trading_pair in self._trading_pairs:
+            ex_pair: str = convert_to_exchange_trading_pair(trading_pair)
+            streams.extend(Constants.WS_SUB[stream].format(trading_pair=ex_pair)
+                           for stream in ("TRADES", "ORDERS", "ORDERS_SNAPSHOT"))
+        return streams
 
+    async def _public_stream_loop(self):
+        try_count: int = 0
+        while True:
+            ws = PeatioWebsocket()
+            try:
+                await ws.connect()
+                await ws.subscribe(self._public_streams())
+                # Sequences start over with the snapshots sent on subscription.
+                self._sequences.clear()
+                self._public_stream_connected_at = time.time()
                 async for response in ws.on_message():
                     if response is not None:
-                        for msg_key in list(response.keys()):
-                            split_key = msg_key.split(Constants.WS_METHODS['TRADES_UPDATE'], 1)
-                            if len(split_key) != 2:
-                                # Debug log output for pub WS messages
-                                self.logger().info(f"Unrecognized message received from Peatio websocket: {response}")
-                                continue
-                            trading_pair = convert_from_exchange_trading_pair(split_key[0])
-                            for trade in response[msg_key]["trades"]:
-                                trade_timestamp: int = int(trade.get('date', time.time()))
-                                trade_msg: OrderBookMessage = PeatioOrderBook.trade_message_from_exchange(
-                                    trade,
-                                    trade_timestamp,
-                                    metadata={"trading_pair": trading_pair})
-                                output.put_nowait(trade_msg)
+                        try_count = 0
+                        self._process_public_message(response)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Trades: Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(Constants.MESSAGE_TIMEOUT)
+                self.logger().network(
+                    "Unexpected error with WebSocket connection.", exc_info=True,
+                    app_warning_msg="Unexpected error with WebSocket connection. Check network connection.")
             finally:
+                self._public_stream_connected_at = None
                 await ws.disconnect()
+            delay: float = ws_reconnect_delay(try_count)
+            try_count += 1
+            self.logger().info(f"Public WebSocket connection closed. Reconnecting in {delay:.1f} seconds.")
+            await asyncio.sleep(delay)
 
-    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+    def _process_public_message(self, response: Dict[str, Any]):
+        """
+        Demultiplexes a public websocket message by stream key onto the trade or order book queue.
         """
-        Listen for orderbook diffs using websocket book channel
+        for msg_key, data in response.items():
+            if msg_key.endswith(Constants.WS_METHODS["TRADES_UPDATE"]):
+                message_type = OrderBookMessageType.TRADE
+                ex_pair: str = msg_key[:-len(Constants.WS_METHODS["TRADES_UPDATE"])]
+            elif msg_key.endswith(Constants.WS_METHODS["ORDERS_UPDATE"]):
+                message_type = OrderBookMessageType.DIFF
+                ex_pair: str = msg_key[:-len(Constants.WS_METHODS["ORDERS_UPDATE"])]
+            elif msg_key.endswith(Constants.WS_METHODS["ORDERS_SNAPSHOT"]):
+                message_type = OrderBookMessageType.SNAPSHOT
+                ex_pair: str = msg_key[:-len(Constants.WS_METHODS["ORDERS_SNAPSHOT"])]
+            else:
+                # Debug log output for pub WS messages
+                self.logger().info(f"Unrecognized message received from Peatio websocket: {response}")
+                continue
+            trading_pair: str = convert_from_exchange_trading_pair(ex_pair)
+
+            if message_type is OrderBookMessageType.TRADE:
+                output: Optional[asyncio.Queue] = self._message_outputs.get(OrderBookMessageType.TRADE)
+                if output is None:
+                    continue
+                for trade in data["trades"]:
+                    trade_timestamp: int = int(trade.get('date', time.time()))
+                    trade_msg: OrderBookMessage = PeatioOrderBook.trade_message_from_exchange(
+                        trade,
+                        trade_timestamp,
+                        metadata={"trading_pair": trading_pair})
+                    output.put_nowait(trade_msg)
+            else:
+                output: Optional[asyncio.Queue] = self._message_outputs.get(OrderBookMessageType.DIFF)
+                if output is None or not self._check_sequence(trading_pair, message_type, data.get("sequence")):
+                    continue
+                self._last_update_times[trading_pair] = time.time()
+                if message_type is OrderBookMessageType.DIFF:
+                    orderbook_msg: OrderBookMessage = PeatioOrderBook.numpy_diff_message_from_exchange(
+                        data,
+                        int(time.time()),
+                        trading_pair)
+                else:
+                    orderbook_msg: OrderBookMessage = PeatioOrderBook.snapshot_message_from_exchange(
+                        data,
+                        int(time.time()),
+                        metadata={"trading_pair": trading_pair})
+                output.put_nowait(orderbook_msg)
+
+    def _check_sequence(self, trading_pair: str, message_type: OrderBookMessageType, sequence: Optional[int]) -> bool:
+        """
+        Tracks the ranger sequence numbers of a trading pair, increments are numbered one after the other from the
+        snapshot. A gap means increments were lost and the order book is resynced from a REST snapshot.
+        :return: False if the message is older than one already received and has to be dropped
+        """
+        if sequence is None:
+            return True
+        last_sequence: Optional[int] = self._sequences.get(trading_pair)
+        if message_type is OrderBookMessageType.DIFF and last_sequence is not None:
+            if sequence <= last_sequence:
+                return False
+            if sequence > last_sequence + 1:
+                self.logger().warning(f"Order book increments {last_sequence + 1} to {sequence - 1} of "
+                                      f"{trading_pair} were missed, resyncing the order book.")
+                self.request_resync(trading_pair, "gap")
+        self._sequences[trading_pair] = sequence
+        return True
+
+    def request_resync(self, trading_pair: str, reason: str,
+                       priority: int = PeatioOrderBookResyncScheduler.RESYNC_PRIORITY):
+        """
+        Schedules a REST snapshot of the order book of a trading pair, fetched as soon as its cooldown allows.
+        """
+        if self._resync_scheduler.request(trading_pair, reason, priority, time.time()):
+            self._resync_requested.set()
+        if self._resync_task is None or self._resync_task.done():
+            self._resync_task = safe_ensure_future(self._resync_loop())
+
+    async def _resync_loop(self):
+        """
+        Fetches the scheduled snapshots one at a time until none is left.
         """
         while True:
-            try:
-                ws = PeatioWebsocket()
-                await ws.connect()
+            self._resync_requested.clear()
+            now: float = time.time()
+            request: Optional[Tuple[str, str]] = self._resync_scheduler.pop_ready(now)
+            if request is None:
+                ready_time: Optional[float] = self._resync_scheduler.next_ready_time()
+                if ready_time is None:
+                    return
+                try:
+                    # A new request may be ready before the pending ones.
+                    await asyncio.wait_for(self._resync_requested.wait(), timeout=ready_time - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            trading_pair, reason = request
+            await self._resync_order_book(trading_pair, reason)
+            if self._resync_scheduler.pending_count > 0:
+                await asyncio.sleep(Constants.ORDER_BOOK_SNAPSHOT_INTERVAL)
 
-                ws_streams = [
-                    Constants.WS_SUB['ORDERS'].format(trading_pair=convert_to_exchange_trading_pair(trading_pair))
-                    for trading_pair in self._trading_pairs
-                ]
-                await ws.subscribe(ws_streams)
+    async def _resync_order_book(self, trading_pair: str, reason: str):
+        """
+        Puts a REST snapshot on the diff queue, or on the snapshot queue when order book diffs are not listened for.
+        """
+        # Diffs received from now on are replayed on top of the snapshot. Failed fetches count for the cooldown too.
+        snapshot_timestamp: int = int(time.time())
+        self._resync_scheduler.record_fetch(trading_pair, reason, time.time())
+        try:
+            snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
+            snapshot_msg: OrderBookMessage = PeatioOrderBook.snapshot_message_from_exchange(
+                snapshot,
+                snapshot_timestamp,
+                metadata={"trading_pair": trading_pair}
+            )
+            output: Optional[asyncio.Queue] = self._message_outputs.get(OrderBookMessageType.DIFF,
+                                                                        self._snapshot_output)
+            if output is not None:
+                output.put_nowait(snapshot_msg)
+                self.logger().debug(f"Resynced the order book of {trading_pair} ({reason}).")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Unexpected error resyncing the order book of {trading_pair}.", exc_info=True,
+                                  app_warning_msg=f"Could not resync the order book of {trading_pair}. "
+                                                  f"Check network connection.")
 
-                async for response in ws.on_message():
-                    if response is not None:
-                        for msg_key in list(response.keys()):
-                            # split_key = msg_key.split(Constants.WS_METHODS['TRADES_UPDATE'], 1)
-                            if Constants.WS_METHODS['ORDERS_UPDATE'] in msg_key:
-                                order_book_msg_cls = PeatioOrderBook.diff_message_from_exchange
-                                split_key = msg_key.split(Constants.WS_METHODS['ORDERS_UPDATE'], 1)
-                            elif Constants.WS_METHODS['ORDERS_SNAPSHOT'] in msg_key:
-                                order_book_msg_cls = PeatioOrderBook.snapshot_message_from_exchange
-                                split_key = msg_key.split(Constants.WS_METHODS['ORDERS_SNAPSHOT'], 1)
-                            else:
-                                # Debug log output for pub WS messages
-                                self.logger().info(f"Unrecognized message received from Peatio websocket: {response}")
-                                continue
-                            order_book_data: str = response.get(msg_key, None)
-                            timestamp: int = int(time.time())
-                            trading_pair: str = convert_from_exchange_trading_pair(split_key[0])
-
-                            orderbook_msg: OrderBookMessage = order_book_msg_cls(
-                                order_book_data,
-                                timestamp,
-                                metadata={"trading_pair": trading_pair})
-                            output.put_nowait(orderbook_msg)
+    def _request_stale_resyncs(self, timestamp: float):
+        """
+        Resyncs the order books not updated for the stale timeout while the public websocket is connected.
+        """
+        if self._public_stream_connected_at is None:
+            return
+        for trading_pair in self._trading_pairs:
+            last_update: float = max(self._last_update_times.get(trading_pair, 0.0),
+                                     self._public_stream_connected_at,
+                                     self._resync_scheduler.last_fetch_time(trading_pair))
+            if timestamp - last_update > Constants.ORDER_BOOK_STALE_TIMEOUT and \
+                    not self._resync_scheduler.is_pending(trading_pair):
+                self.request_resync(trading_pair, "stale")
 
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    "Unexpected error with WebSocket connection.", exc_info=True,
-                    app_warning_msg="Unexpected error with WebSocket connection. Retrying in 30 seconds. "
-                                    "Check network connection.")
-                await asyncio.sleep(30.0)
-            finally:
-                await ws.disconnect()
+    def _request_scheduled_snapshots(self, timestamp: float):
+        for trading_pair in self._trading_pairs:
+            if timestamp - self._resync_scheduler.last_fetch_time(trading_pair) >= 3600:
+                self.request_resync(trading_pair, "scheduled", PeatioOrderBookResyncScheduler.SCHEDULED_PRIORITY)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
-        Listen for orderbook snapshots by fetching orderbook
+        Order books are fetched over REST only when they need a resync, this checks for stale order books, logs the
+        number of snapshots fetched each hour and, if hourly snapshots are enabled, schedules a refresh of the order
+        books not fetched within the last hour.
         """
-        while True:
-            try:
-                for trading_pair in self._trading_pairs:
-                    try:
-                        snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
-                        snapshot_timestamp: int = int(snapshot["timestamp"])
-                        snapshot_msg: OrderBookMessage = PeatioOrderBook.snapshot_message_from_exchange(
-                            snapshot,
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
-                        output.put_nowait(snapshot_msg)
-                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                        # Be careful not to go above API rate limits.
-                        await asyncio.sleep(5.0)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        self.logger().network(
-                            "Unexpected error with WebSocket connection.", exc_info=True,
-                            app_warning_msg="Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                            "Check network connection.")
-                        await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
-                await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        self._snapshot_output = output
+        next_hour: float = (time.time() // 3600 + 1) * 3600
+        try:
+            while True:
+                try:
+                    now: float = time.time()
+                    self._request_stale_resyncs(now)
+                    if now >= next_hour:
+                        counts: Dict[str, int] = self._resync_scheduler.fetch_counts(next_hour - 1)
+                        self.logger().info(f"Fetched {sum(counts.values())} order book snapshots in the last hour"
+                                           + "".join(f", {reason}: {count}" for reason, count in counts.items()))
+                        if Constants.ORDER_BOOK_HOURLY_SNAPSHOTS:
+                            self._request_scheduled_snapshots(now)
+                        next_hour = (now // 3600 + 1) * 3600
+                    await asyncio.sleep(min(Constants.ORDER_BOOK_STALE_CHECK_INTERVAL, max(next_hour - now, 0)))
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error.", exc_info=True)
+                    await asyncio.sleep(5.0)
+        finally:
+            if self._snapshot_output is output:
+                self._snapshot_output = None
@@ -23,6 +23,7 @@ class Constants:
         "ORDER_BOOK": "public/markets/{trading_pair}/depth",
         "ORDER_CREATE": "market/orders",
         "ORDER_DELETE": "market/orders/{id}/cancel",
+        "ORDER_DELETE_ALL": "market/orders/cancel",
         "ORDER_STATUS": "market/orders/{id}",
         "USER_ORDERS": "market/orders",
         "USER_BALANCES": "account/balances",
@@ -31,6 +32,7 @@ class Constants:
     WS_SUB = {
         "TRADES": "{trading_pair}.trades",
         "ORDERS": "{trading_pair}.ob-inc",
+        "ORDERS_SNAPSHOT": "{trading_pair}.ob-snap",
         "USER_ORDERS_TRADES": ['balance', 'order', 'trade'],
 
     }
@@ -57,6 +59,15 @@ class Constants:
     PING_TIMEOUT = 10.0
     API_CALL_TIMEOUT = 10.0
     API_MAX_RETRIES = 4
+    # REST requests of the exchange, its data sources and user stream share kept alive connections to the host
+    HTTP_CONNECTION_LIMIT = 20
+    HTTP_KEEPALIVE_TIMEOUT = 60.0
+    HTTP_DNS_CACHE_TTL = 300
+    # Public websocket reconnects back off exponentially up to the max delay, with jitter
+    WS_RECONNECT_BASE_DELAY = 1.0
+    WS_RECONNECT_MAX_DELAY = 30.0
+    # How long user stream messages for not yet acknowledged orders are kept around
+    PENDING_MESSAGE_MAX_AGE = 30.0
 
     # Intervals
     # Only used when nothing is received from WS
@@ -65,10 +76,41 @@ class Constants:
     LONG_POLL_INTERVAL = 120.0
     # Two minutes should be fine for order status since we get these via WS
     UPDATE_ORDER_STATUS_INTERVAL = 120.0
+    # Reconcile order statuses from the per market order lists rather than one request per order
+    ORDER_STATUS_BULK_UPDATE = True
+    ORDER_STATUS_PAGE_LIMIT = 100
+    # Pages of recent orders (any state) looked through for orders which are no longer open
+    ORDER_STATUS_MAX_PAGES = 2
+    # Order book snapshots fetched at the same time on start, they share the request throttler with orders
+    ORDER_BOOK_INIT_CONCURRENCY = 4
+    # Order book snapshots are fetched over REST when a book is found inconsistent (sequence gap, crossed book or no
+    # update for the stale timeout), one trading pair is not fetched again within the cooldown
+    ORDER_BOOK_RESYNC_COOLDOWN = 30.0
+    # A quiet market is not resynced more often than the hourly snapshot sweep used to refresh it
+    ORDER_BOOK_STALE_TIMEOUT = 3600.0
+    ORDER_BOOK_STALE_CHECK_INTERVAL = 10.0
+    # Time between two snapshot fetches, be careful not to go above API rate limits
+    ORDER_BOOK_SNAPSHOT_INTERVAL = 1.0
+    # Refresh every order book not fetched within the last hour at the top of each hour
+    ORDER_BOOK_HOURLY_SNAPSHOTS = False
     # We don't get many messages here if we're not updating orders so set this pretty high
     USER_TRACKER_MAX_AGE = 300.0
     # 10 minute interval to update trading rules, these would likely never change whilst running.
     INTERVAL_TRADING_RULES = 600
 
+    # Cancels of all the open orders of a market, or of one side of it, are sent as one cancel by market request.
+    # Off by default as it also cancels the orders of the market which were not placed by the bot, only enable it for
+    # an account the bot trades alone. Operators set it with the peatio_bulk_cancel config, this is its default.
+    BULK_CANCEL = False
+    # Fewer orders than this are cancelled one by one
+    BULK_CANCEL_MIN_ORDERS = 2
+    # How long a bulk cancel waits for the user stream to confirm the cancellations before it cancels the orders
+    # still open one by one, well below the timeouts of cancel_all (5 seconds on start, 10 seconds on stop and exit)
+    BULK_CANCEL_CONFIRM_TIMEOUT = 2.0
+
+    # Order latency tracing (see the order_latency command), off unless enabled, keeps the stages of the last orders
+    ORDER_LATENCY_TRACING = False
+    ORDER_LATENCY_TRACE_CAPACITY = 10000
+
     # Trading pair splitter regex
     TRADING_PAIR_SPLITTER = r"^(\w+)(btc|ltc|altm|doge|eth|bnb|usdt|usdc|usds|tusd|cro|roger)$"
@@ -5,10 +5,13 @@ from typing import (
     Optional,
     Any,
     AsyncIterable,
+    Callable,
+    Tuple,
 )
 from decimal import Decimal
 import asyncio
 import aiohttp
+import functools
 import math
 import time
 import ujson
@@ -41,18 +44,24 @@ from hummingbot.connector.exchange.peatio.peatio_order_book_tracker import Peati
 from hummingbot.connector.exchange.peatio.peatio_user_stream_tracker import PeatioUserStreamTracker
 from hummingbot.connector.exchange.peatio.peatio_auth import PeatioAuth
 from hummingbot.connector.exchange.peatio.peatio_in_flight_order import PeatioInFlightOrder
+from hummingbot.connector.exchange.peatio.peatio_order_latency_tracer import (
+    OrderLatencyStage,
+    PeatioOrderLatencyTracer,
+)
 from hummingbot.connector.exchange.peatio.peatio_utils import (
     REQUEST_THROTTLER,
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair,
     get_new_client_order_id,
     aiohttp_response_with_errors,
+    rest_client_session,
     retry_sleep_time,
     str_date_to_ts,
     PeatioAPIError,
 )
 from hummingbot.connector.exchange.peatio.peatio_constants import Constants
 from hummingbot.core.data_type.common import OpenOrder
+from hummingbot.client.config.global_config_map import global_config_map
 ctce_logger = None
 s_decimal_NaN = Decimal("nan")
 s_decimal_0 = Decimal(0)
@@ -96,13 +105,19 @@ class PeatioExchange(ExchangeBase):
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
         self._in_flight_orders = {}  # Dict[client_order_id:str, PeatioInFlightOrder]
+        self._exchange_order_ids = {}  # Dict[exchange_order_id:str, client_order_id:str]
+        self._pending_order_messages = {}  # Dict[exchange_order_id:str, List[Tuple[timestamp, method, message]]]
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
+        self._pending_cancels = {}  # Dict[trading_pair:str, List[client_order_id:str]]
+        self._pending_cancels_flush = None
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
         self._status_polling_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._last_poll_timestamp = 0
         self._throttler = REQUEST_THROTTLER
+        self._order_latency_tracer = PeatioOrderLatencyTracer(Constants.ORDER_LATENCY_TRACE_CAPACITY,
+                                                              Constants.ORDER_LATENCY_TRACING)
 
     @property
     def name(self) -> str:
@@ -120,6 +135,19 @@ class PeatioExchange(ExchangeBase):
     def in_flight_orders(self) -> Dict[str, PeatioInFlightOrder]:
         return self._in_flight_orders
 
+    @property
+    def order_latency_tracer(self) -> PeatioOrderLatencyTracer:
+        return self._order_latency_tracer
+
+    @property
+    def bulk_cancel(self) -> bool:
+        """
+        Whether the cancels of all the open orders of a market (or side) are sent as one cancel by market request, as
+        set by the peatio_bulk_cancel config (Constants.BULK_CANCEL when it is not set)
+        """
+        config = global_config_map.get("peatio_bulk_cancel")
+        return Constants.BULK_CANCEL if config is None or config.value is None else config.value
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         """
@@ -141,6 +169,13 @@ class PeatioExchange(ExchangeBase):
         """
         return all(self.status_dict.values())
 
+    def set_required_trading_pairs(self, trading_pairs: Optional[List[str]]):
+        """
+        Lets the connector become ready as soon as the order books of the given trading pairs are loaded, while the
+        other order books are still initializing.
+        """
+        self._order_book_tracker.required_trading_pairs = trading_pairs
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [
@@ -169,6 +204,11 @@ class PeatioExchange(ExchangeBase):
             key: PeatioInFlightOrder.from_json(value)
             for key, value in saved_states.items()
         })
+        self._exchange_order_ids.update({
+            order.exchange_order_id: key
+            for key, order in self._in_flight_orders.items()
+            if order.exchange_order_id is not None
+        })
 
     def supported_order_types(self) -> List[OrderType]:
         """
@@ -240,10 +280,9 @@ class PeatioExchange(ExchangeBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         """
-        :returns Shared client session instance
+        :returns The pooled client session of the REST API host, shared with the data sources
         """
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+        self._shared_client = rest_client_session()
         return self._shared_client
 
     async def _trading_rules_polling_loop(self):
@@ -309,7 +348,9 @@ class PeatioExchange(ExchangeBase):
                            endpoint: str,
                            params: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False,
-                           try_count: int = 0) -> Dict[str, Any]:
+                           try_count: int = 0,
+                           trace_order_id: Optional[str] = None,
+                           before_send: Optional[Callable[[], bool]] = None) -> Optional[Dict[str, Any]]:
         """
         Sends an aiohttp request and waits for a response.
         :param method: The HTTP method, e.g. get or post
@@ -317,9 +358,16 @@ class PeatioExchange(ExchangeBase):
         :param params: Additional get/post parameters
         :param is_auth_required: Whether an authentication is required, when True the function will add encrypted
         signature to the request.
-        :returns A response in json format.
+        :param trace_order_id: The client order id the request's throttling and sending are traced for
+        :param before_send: Called once the throttler lets the request through, the request is not sent when it
+        returns False
+        :returns A response in json format, None if before_send stopped the request.
         """
         async with self._throttler.weighted_task(request_weight=1):
+            if before_send is not None and not before_send():
+                return None
+            if trace_order_id is not None and self._order_latency_tracer.enabled:
+                self._order_latency_tracer.record(trace_order_id, OrderLatencyStage.THROTTLED)
             url = f"{Constants.REST_URL}/{endpoint}"
             shared_client = await self._http_client()
             # Turn `params` into either GET params or POST body data
@@ -329,10 +377,16 @@ class PeatioExchange(ExchangeBase):
             headers: dict = {"Content-Type": "application/json", "User-Agent": Constants.USER_AGENT}
             if is_auth_required:
                 headers: dict = self._peatio_auth.get_headers()
+            # The request is traced as sent when aiohttp starts it, from the trace config of the pooled session.
+            trace_request_ctx = None
+            if trace_order_id is not None and self._order_latency_tracer.enabled:
+                trace_request_ctx = functools.partial(self._order_latency_tracer.record, trace_order_id,
+                                                      OrderLatencyStage.SENT)
             # Build request coro
             response_coro = shared_client.request(method=method.upper(), url=url, headers=headers,
                                                   params=qs_params, data=req_params,
-                                                  timeout=Constants.API_CALL_TIMEOUT)
+                                                  timeout=Constants.API_CALL_TIMEOUT,
+                                                  trace_request_ctx=trace_request_ctx)
             http_status, parsed_response, request_errors = await aiohttp_response_with_errors(response_coro)
             if request_errors or parsed_response is None:
                 if try_count < Constants.API_MAX_RETRIES:
@@ -345,7 +399,8 @@ class PeatioExchange(ExchangeBase):
                                            f"Retrying in {time_sleep:.0f}s. {str_msg}")
                     await asyncio.sleep(time_sleep)
                     return await self._api_request(method=method, endpoint=endpoint, params=params,
-                                                   is_auth_required=is_auth_required, try_count=try_count)
+                                                   is_auth_required=is_auth_required, try_count=try_count,
+                                                   trace_order_id=trace_order_id, before_send=before_send)
                 else:
                     raise PeatioAPIError({"errors": parsed_response, "status": http_status})
             if "errors" in parsed_response or "error" in parsed_response:
@@ -385,6 +440,8 @@ class PeatioExchange(ExchangeBase):
         :returns A new internal order id
         """
         order_id: str = get_new_client_order_id(True, trading_pair)
+        if self._order_latency_tracer.enabled:
+            self._order_latency_tracer.start(order_id, trading_pair)
         safe_ensure_future(self._create_order(TradeType.BUY, order_id, trading_pair, amount, order_type, price))
         return order_id
 
@@ -400,6 +457,8 @@ class PeatioExchange(ExchangeBase):
         :returns A new internal order id
         """
         order_id: str = get_new_client_order_id(False, trading_pair)
+        if self._order_latency_tracer.enabled:
+            self._order_latency_tracer.start(order_id, trading_pair)
         safe_ensure_future(self._create_order(TradeType.SELL, order_id, trading_pair, amount, order_type, price))
         return order_id
 
@@ -407,12 +466,127 @@ class PeatioExchange(ExchangeBase):
         """
         Cancel an order. This function returns immediately.
         To get the cancellation result, you'll have to wait for OrderCancelledEvent.
+        The cancels requested in the same event loop iteration (e.g. by a strategy refreshing its orders on a tick) are
+        sent together, see _cancel_orders.
         :param trading_pair: The market (e.g. BTC-USDT) of the order.
         :param order_id: The internal order id (also called client_order_id)
         """
-        safe_ensure_future(self._execute_cancel(trading_pair, order_id))
+        if not self.bulk_cancel:
+            safe_ensure_future(self._execute_cancel(trading_pair, order_id))
+            return order_id
+        self._pending_cancels.setdefault(trading_pair, []).append(order_id)
+        if self._pending_cancels_flush is None:
+            self._pending_cancels_flush = self._ev_loop.call_soon(self._flush_pending_cancels)
         return order_id
 
+    def _flush_pending_cancels(self):
+        pending_cancels, self._pending_cancels = self._pending_cancels, {}
+        self._pending_cancels_flush = None
+        for trading_pair, order_ids in pending_cancels.items():
+            safe_ensure_future(self._cancel_orders(trading_pair, order_ids))
+
+    def _bulk_cancel_scope(self,
+                           trading_pair: str,
+                           tracked_orders: List[PeatioInFlightOrder]) -> Tuple[bool, Optional[TradeType]]:
+        """
+        Finds whether the given orders of a market can be cancelled by one cancel by market request, which they can
+        when they are all the open orders of the market or of one side of it, and all of them are placed.
+        :returns Whether to cancel them by market, and the side to cancel (None for both sides)
+        """
+        if not self.bulk_cancel or len(tracked_orders) < Constants.BULK_CANCEL_MIN_ORDERS or \
+                any(o.exchange_order_id is None for o in tracked_orders):
+            return False, None
+        cancelled_ids = set(o.client_order_id for o in tracked_orders)
+        sides = set(o.trade_type for o in tracked_orders)
+        side = next(iter(sides)) if len(sides) == 1 else None
+        for tracked_order in self._in_flight_orders.values():
+            if tracked_order.trading_pair == trading_pair and not tracked_order.is_done and \
+                    tracked_order.client_order_id not in cancelled_ids and \
+                    (side is None or tracked_order.trade_type is side):
+                # An open order of the market (or side) the strategy wants to keep
+                return False, None
+        # Cancel both sides when the market has no other open orders.
+        if side is not None and not any(o.trading_pair == trading_pair and not o.is_done and o.trade_type is not side
+                                        for o in self._in_flight_orders.values()):
+            side = None
+        return True, side
+
+    async def _cancel_orders(self, trading_pair: str, order_ids: List[str]) -> List[CancellationResult]:
+        """
+        Cancels orders of a market, by one cancel by market request when they are all the open orders of the market
+        or of one side of it, one by one otherwise.
+        """
+        tracked_orders = [self._in_flight_orders[order_id] for order_id in order_ids
+                          if order_id in self._in_flight_orders]
+        bulk_cancel, side = self._bulk_cancel_scope(trading_pair, tracked_orders)
+        if not bulk_cancel:
+            return await safe_gather(*[self._execute_cancel(trading_pair, order_id) for order_id in order_ids])
+        untracked_ids = [order_id for order_id in order_ids if order_id not in self._in_flight_orders]
+        results = await safe_gather(self._execute_bulk_cancel(trading_pair, side, tracked_orders),
+                                    *[self._execute_cancel(trading_pair, order_id) for order_id in untracked_ids])
+        return results[0] + results[1:]
+
+    async def _execute_bulk_cancel(self,
+                                   trading_pair: str,
+                                   side: Optional[TradeType],
+                                   tracked_orders: List[PeatioInFlightOrder]) -> List[CancellationResult]:
+        """
+        Cancels the open orders of a market (or of one side of it) with one cancel by market request. The request only
+        starts the cancellations, each is confirmed by its order update on the user stream (or in the response). The
+        orders not confirmed within BULK_CANCEL_CONFIRM_TIMEOUT are then cancelled one by one, as are all of them if
+        the request fails or if they are no longer all the open orders of the market (or side) once the throttler
+        lets the request through.
+        :param trading_pair: The market trading pair
+        :param side: The side to cancel, None for both sides
+        :param tracked_orders: The in-flight orders being cancelled
+        """
+        params = {"market": convert_to_exchange_trading_pair(trading_pair)}
+        if side is not None:
+            params["side"] = side.name.lower()
+        if self._order_latency_tracer.enabled:
+            for tracked_order in tracked_orders:
+                self._order_latency_tracer.record(tracked_order.client_order_id, OrderLatencyStage.CANCEL_REQUESTED)
+        unconfirmed = tracked_orders
+
+        def in_scope() -> bool:
+            # Orders placed while the request waited for the throttler would be cancelled along with these.
+            return self._bulk_cancel_scope(trading_pair, tracked_orders) == (True, side)
+
+        try:
+            response = await self._api_request("POST", Constants.ENDPOINT["ORDER_DELETE_ALL"], params, True,
+                                               before_send=in_scope)
+            if response is None:
+                self.logger().debug(f"The open {trading_pair} orders changed before they could be cancelled by market, "
+                                    f"cancelling them one by one.")
+            for order_msg in response if isinstance(response, list) else []:
+                client_order_id = self._exchange_order_ids.get(str(order_msg.get("id")))
+                if client_order_id is not None:
+                    self._process_order_message(order_msg)
+                    # As for the cancel request of one order, the state in the response confirms the cancellation.
+                    tracked_order = self._in_flight_orders.get(client_order_id)
+                    if tracked_order is not None and order_msg.get("state") in Constants.ORDER_STATES['CANCEL_WAIT']:
+                        self._confirm_cancellation(tracked_order)
+            unconfirmed = [o for o in tracked_orders
+                           if not o.cancelled_event.is_set() and o.client_order_id in self._in_flight_orders]
+            if response is not None and len(unconfirmed) > 0:
+                try:
+                    async with timeout(Constants.BULK_CANCEL_CONFIRM_TIMEOUT):
+                        await safe_gather(*[o.cancelled_event.wait() for o in unconfirmed])
+                except asyncio.TimeoutError:
+                    pass
+                unconfirmed = [o for o in unconfirmed
+                               if not o.cancelled_event.is_set() and o.client_order_id in self._in_flight_orders]
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().network(f"Error cancelling the {trading_pair} orders by market, cancelling them one by one. "
+                                  f"Error: {e}", exc_info=True)
+        unconfirmed_ids = set(o.client_order_id for o in unconfirmed)
+        results = [CancellationResult(o.client_order_id, o.cancelled_event.is_set())
+                   for o in tracked_orders if o.client_order_id not in unconfirmed_ids]
+        results.extend(await safe_gather(*[self._execute_cancel(trading_pair, o.client_order_id) for o in unconfirmed]))
+        return results
+
     async def _create_order(self,
                             trade_type: TradeType,
                             order_id: str,
@@ -450,13 +624,16 @@ class PeatioExchange(ExchangeBase):
         #     api_params["postOnly"] = "true"
         self.start_tracking_order(order_id, None, trading_pair, trade_type, price, amount, order_type)
         try:
-            order_result = await self._api_request("POST", Constants.ENDPOINT["ORDER_CREATE"], api_params, True)
+            order_result = await self._api_request("POST", Constants.ENDPOINT["ORDER_CREATE"], api_params, True,
+                                                   trace_order_id=order_id)
             exchange_order_id = str(order_result["id"])
+            if self._order_latency_tracer.enabled:
+                self._order_latency_tracer.record_exchange_order_id(order_id, exchange_order_id)
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
                 self.logger().info(f"Created {order_type.name} {trade_type.name} order {order_id} for "
                                    f"{amount} {trading_pair}.")
-                tracked_order.update_exchange_order_id(exchange_order_id)
+                self._update_exchange_order_id(tracked_order, exchange_order_id)
             else:
                 raise Exception('Order not tracked.')
             if trade_type is TradeType.BUY:
@@ -467,6 +644,7 @@ class PeatioExchange(ExchangeBase):
                 event_cls = SellOrderCreatedEvent
             self.trigger_event(event_tag,
                                event_cls(self.current_timestamp, order_type, trading_pair, amount, price, order_id, exchange_order_id))
+            self._replay_pending_order_messages(exchange_order_id)
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -504,16 +682,62 @@ class PeatioExchange(ExchangeBase):
             price=price,
             amount=amount
         )
+        if exchange_order_id is not None:
+            self._exchange_order_ids[exchange_order_id] = order_id
 
     def stop_tracking_order(self, order_id: str):
         """
         Stops tracking an order by simply removing it from _in_flight_orders dictionary.
         """
         if order_id in self._in_flight_orders:
+            exchange_order_id = self._in_flight_orders[order_id].exchange_order_id
+            if self._exchange_order_ids.get(exchange_order_id) == order_id:
+                del self._exchange_order_ids[exchange_order_id]
             del self._in_flight_orders[order_id]
         if order_id in self._order_not_found_records:
             del self._order_not_found_records[order_id]
 
+    def _update_exchange_order_id(self, tracked_order: PeatioInFlightOrder, exchange_order_id: str):
+        """
+        Records the exchange order id of a tracked order in the exchange order id index.
+        """
+        tracked_order.update_exchange_order_id(exchange_order_id)
+        self._exchange_order_ids[exchange_order_id] = tracked_order.client_order_id
+
+    def _replay_pending_order_messages(self, exchange_order_id: str):
+        """
+        Processes user stream messages that arrived for an order before its create order response.
+        """
+        for _, method, message in self._pending_order_messages.pop(exchange_order_id, []):
+            if method == Constants.WS_METHODS["USER_TRADES"]:
+                safe_ensure_future(self._process_trade_message(message))
+            else:
+                self._process_order_message(message)
+
+    def _tracked_order_by_exchange_id(self, exchange_order_id: str) -> Optional[PeatioInFlightOrder]:
+        """
+        Looks up an in-flight order by its exchange order id.
+        """
+        client_order_id = self._exchange_order_ids.get(exchange_order_id)
+        if client_order_id is None:
+            return None
+        return self._in_flight_orders.get(client_order_id)
+
+    def _buffer_order_message(self, exchange_order_id: str, method: str, message: Dict[str, Any]):
+        """
+        Keeps a user stream message for an unknown exchange order id while some orders are still waiting for their
+        create order response, the message is replayed once the matching exchange order id arrives.
+        """
+        if len(self._exchange_order_ids) >= len(self._in_flight_orders):
+            # Every tracked order already has its exchange order id, so the message is not ours.
+            return
+        now = time.time()
+        stale_ids = [ex_id for ex_id, messages in self._pending_order_messages.items()
+                     if now - messages[-1][0] > Constants.PENDING_MESSAGE_MAX_AGE]
+        for ex_id in stale_ids:
+            del self._pending_order_messages[ex_id]
+        self._pending_order_messages.setdefault(exchange_order_id, []).append((now, method, message))
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Executes order cancellation process by first calling cancel-order API. The API result doesn't confirm whether
@@ -534,6 +758,8 @@ class PeatioExchange(ExchangeBase):
                 except Exception:
                     order_state = "reject"
             exchange_order_id = tracked_order.exchange_order_id
+            if self._order_latency_tracer.enabled:
+                self._order_latency_tracer.record(order_id, OrderLatencyStage.CANCEL_REQUESTED)
             response = await self._api_request("POST",
                                                Constants.ENDPOINT["ORDER_DELETE"].format(id=exchange_order_id),
                                                is_auth_required=True)
@@ -549,11 +775,7 @@ class PeatioExchange(ExchangeBase):
                 self._order_not_found_records[order_id] = self._order_not_found_records.get(order_id, 0) + 1
         if order_state in Constants.ORDER_STATES['CANCEL_WAIT'] or \
                 self._order_not_found_records.get(order_id, 0) >= self.ORDER_NOT_EXIST_CANCEL_COUNT:
-            self.logger().info(f"Successfully cancelled order {order_id} on {Constants.EXCHANGE_NAME}.")
-            self.stop_tracking_order(order_id)
-            self.trigger_event(MarketEvent.OrderCancelled,
-                               OrderCancelledEvent(self.current_timestamp, order_id))
-            tracked_order.cancelled_event.set()
+            self._confirm_cancellation(tracked_order)
             return CancellationResult(order_id, True)
         else:
             self.logger().network(
@@ -564,6 +786,19 @@ class PeatioExchange(ExchangeBase):
             )
             return CancellationResult(order_id, False)
 
+    def _confirm_cancellation(self, tracked_order: PeatioInFlightOrder):
+        """
+        Stops tracking an order the exchange accepted to cancel and triggers its cancelled event.
+        """
+        order_id = tracked_order.client_order_id
+        self.logger().info(f"Successfully cancelled order {order_id} on {Constants.EXCHANGE_NAME}.")
+        if self._order_latency_tracer.enabled:
+            self._order_latency_tracer.record(order_id, OrderLatencyStage.CANCEL_ACKED)
+        self.stop_tracking_order(order_id)
+        self.trigger_event(MarketEvent.OrderCancelled,
+                           OrderCancelledEvent(self.current_timestamp, order_id))
+        tracked_order.cancelled_event.set()
+
     async def _status_polling_loop(self):
         """
         Periodically update user balances and order status via REST API. This serves as a fallback measure for web
@@ -614,43 +849,115 @@ class PeatioExchange(ExchangeBase):
         current_tick = int(self.current_timestamp / Constants.UPDATE_ORDER_STATUS_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
-            tasks = []
-            for tracked_order in tracked_orders:
-                if tracked_order.exchange_order_id is None:
-                    try:
-                        async with timeout(6):
-                            await tracked_order.get_exchange_order_id()
-                    except Exception:
-                        continue
-                exchange_order_id = tracked_order.exchange_order_id
-                tasks.append(self._api_request("GET",
-                                               Constants.ENDPOINT["ORDER_STATUS"].format(id=exchange_order_id),
-                                               is_auth_required=True))
-            self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
-            responses = await safe_gather(*tasks, return_exceptions=True)
-            for response, tracked_order in zip(responses, tracked_orders):
-                client_order_id = tracked_order.client_order_id
-                if isinstance(response, PeatioAPIError):
-                    err = response.error_payload.get('errors', response.error_payload)
-                    if "record.not_found" in err:
-                        self._order_not_found_records[client_order_id] = \
-                            self._order_not_found_records.get(client_order_id, 0) + 1
-                        if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
-                            # Wait until the order not found error have repeated a few times before actually treating
-                            # it as failed. See: https://github.com/CoinAlpha/hummingbot/issues/601
-                            continue
-                        self.trigger_event(MarketEvent.OrderFailure,
-                                           MarketOrderFailureEvent(
-                                               self.current_timestamp, client_order_id, tracked_order.order_type))
-                        self.stop_tracking_order(client_order_id)
-                    else:
-                        continue
-                elif "id" not in response:
-                    self.logger().info(f"_update_order_status order id not in resp: {response}")
+            if Constants.ORDER_STATUS_BULK_UPDATE:
+                await self._update_order_status_by_market()
+            else:
+                await self._update_order_status_by_id(list(self._in_flight_orders.values()))
+
+    async def _update_order_status_by_market(self):
+        """
+        Reconciles in-flight orders against the order lists of each market, a few paginated calls per market instead
+        of one call per order. Orders missing from the lists are looked up individually.
+        """
+        orders_by_market = {}  # Dict[exchange_trading_pair:str, Dict[exchange_order_id:str, PeatioInFlightOrder]]
+        for tracked_order in list(self._in_flight_orders.values()):
+            if tracked_order.exchange_order_id is None:
+                # Still waiting for the create order response, picked up on the next sweep.
+                continue
+            market = convert_to_exchange_trading_pair(tracked_order.trading_pair)
+            orders_by_market.setdefault(market, {})[tracked_order.exchange_order_id] = tracked_order
+        self.logger().debug(f"Polling for order status updates of {len(self._exchange_order_ids)} orders "
+                            f"in {len(orders_by_market)} markets.")
+        results = await safe_gather(*[self._fetch_market_orders(market, set(orders.keys()))
+                                      for market, orders in orders_by_market.items()],
+                                    return_exceptions=True)
+        missing_orders = []
+        for (market, orders), result in zip(orders_by_market.items(), results):
+            if isinstance(result, Exception):
+                self.logger().network(f"Error fetching {market} orders. Error: {result}", exc_info=True)
+                continue
+            for order_msg in result:
+                exchange_order_id = str(order_msg["id"])
+                if orders.pop(exchange_order_id, None) is not None:
+                    self._process_order_message(order_msg)
+            missing_orders.extend(orders.values())
+        if len(missing_orders) > 0:
+            await self._update_order_status_by_id(missing_orders)
+
+    async def _fetch_market_orders(self, market: str, exchange_order_ids: set) -> List[Dict[str, Any]]:
+        """
+        Pages through the orders of a market, first the open ones then the most recent ones of any state, until all
+        the given exchange order ids are found.
+        :param market: The exchange trading pair
+        :param exchange_order_ids: The exchange order ids to look for
+        :returns The order messages found, in the same format as the order status end point
+        """
+        remaining = set(exchange_order_ids)
+        found = []
+        for state, max_pages in (("wait", None), (None, Constants.ORDER_STATUS_MAX_PAGES)):
+            page = 1
+            while len(remaining) > 0 and (max_pages is None or page <= max_pages):
+                params = {"market": market, "limit": Constants.ORDER_STATUS_PAGE_LIMIT, "page": page}
+                if state is not None:
+                    params["state"] = state
+                orders = await self._api_request("GET", Constants.ENDPOINT["USER_ORDERS"], params=params,
+                                                 is_auth_required=True)
+                for order_msg in orders:
+                    exchange_order_id = str(order_msg["id"])
+                    if exchange_order_id in remaining:
+                        remaining.remove(exchange_order_id)
+                        found.append(order_msg)
+                if len(orders) < Constants.ORDER_STATUS_PAGE_LIMIT:
+                    break
+                page += 1
+            if len(remaining) == 0:
+                break
+        return found
+
+    async def _update_order_status_by_id(self, tracked_orders: List[PeatioInFlightOrder]):
+        """
+        Calls REST API to get status update for each of the given in-flight orders.
+        """
+        polled_orders = []
+        tasks = []
+        for tracked_order in tracked_orders:
+            if tracked_order.exchange_order_id is None:
+                try:
+                    async with timeout(6):
+                        await tracked_order.get_exchange_order_id()
+                except Exception:
                     continue
+            exchange_order_id = tracked_order.exchange_order_id
+            polled_orders.append(tracked_order)
+            tasks.append(self._api_request("GET",
+                                           Constants.ENDPOINT["ORDER_STATUS"].format(id=exchange_order_id),
+                                           is_auth_required=True))
+        self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
+        responses = await safe_gather(*tasks, return_exceptions=True)
+        for response, tracked_order in zip(responses, polled_orders):
+            client_order_id = tracked_order.client_order_id
+            if isinstance(response, PeatioAPIError):
+                err = response.error_payload.get('errors', response.error_payload)
+                if "record.not_found" in err:
+                    self._order_not_found_records[client_order_id] = \
+                        self._order_not_found_records.get(client_order_id, 0) + 1
+                    if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
+                        # Wait until the order not found error have repeated a few times before actually treating
+                        # it as failed. See: https://github.com/CoinAlpha/hummingbot/issues/601
+                        continue
+                    self.trigger_event(MarketEvent.OrderFailure,
+                                       MarketOrderFailureEvent(
+                                           self.current_timestamp, client_order_id, tracked_order.order_type))
+                    self.stop_tracking_order(client_order_id)
                 else:
-                    self._process_order_message(response)
+                    continue
+            elif isinstance(response, Exception):
+                continue
+            elif "id" not in response:
+                self.logger().info(f"_update_order_status order id not in resp: {response}")
+                continue
+            else:
+                self._process_order_message(response)
 
     def _process_order_message(self, order_msg: Dict[str, Any]):
         """
@@ -677,12 +984,10 @@ class PeatioExchange(ExchangeBase):
         """
         exchange_order_id = str(order_msg["id"])
 
-        tracked_orders = list(self._in_flight_orders.values())
-        track_order = [o for o in tracked_orders if exchange_order_id == o.exchange_order_id]
-
-        if not track_order:
+        tracked_order = self._tracked_order_by_exchange_id(exchange_order_id)
+        if tracked_order is None:
+            self._buffer_order_message(exchange_order_id, Constants.WS_METHODS["USER_ORDERS"], order_msg)
             return
-        tracked_order = track_order[0]
         # Estimate fee
         order_msg["trade_fee"] = self.estimate_fee_pct(tracked_order.order_type is OrderType.LIMIT_MAKER)
         try:
@@ -695,6 +1000,8 @@ class PeatioExchange(ExchangeBase):
             safe_ensure_future(self._trigger_order_fill(tracked_order, order_msg))
         elif tracked_order.is_cancelled:
             self.logger().info(f"Successfully cancelled order {tracked_order.client_order_id}.")
+            if self._order_latency_tracer.enabled:
+                self._order_latency_tracer.record(tracked_order.client_order_id, OrderLatencyStage.CANCEL_ACKED)
             self.stop_tracking_order(tracked_order.client_order_id)
             self.trigger_event(MarketEvent.OrderCancelled,
                                OrderCancelledEvent(self.current_timestamp, tracked_order.client_order_id))
@@ -713,19 +1020,10 @@ class PeatioExchange(ExchangeBase):
         """
         exchange_order_id = str(trade_msg["order_id"])
 
-        tracked_orders = list(self._in_flight_orders.values())
-        for order in tracked_orders:
-            if order.exchange_order_id is None:
-                try:
-                    async with timeout(6):
-                        await order.get_exchange_order_id()
-                except Exception:
-                    pass
-        track_order = [o for o in tracked_orders if exchange_order_id == o.exchange_order_id]
-
-        if not track_order:
+        tracked_order = self._tracked_order_by_exchange_id(exchange_order_id)
+        if tracked_order is None:
+            self._buffer_order_message(exchange_order_id, Constants.WS_METHODS["USER_TRADES"], trade_msg)
             return
-        tracked_order = track_order[0]
 
         # Estimate fee
         trade_msg["trade_fee"] = self.estimate_fee_pct(tracked_order.order_type is OrderType.LIMIT_MAKER)
@@ -744,6 +1042,8 @@ class PeatioExchange(ExchangeBase):
     async def _trigger_order_fill(self,
                                   tracked_order: PeatioInFlightOrder,
                                   update_msg: Dict[str, Any]):
+        if self._order_latency_tracer.enabled:
+            self._order_latency_tracer.record(tracked_order.client_order_id, OrderLatencyStage.FILLED)
         executed_price = Decimal(str(update_msg.get("price")
                                      if update_msg.get("price") is not None
                                      else update_msg.get("avg_price", "0")))
@@ -797,11 +1097,15 @@ class PeatioExchange(ExchangeBase):
         open_orders = [o for o in self._in_flight_orders.values() if not o.is_done]
         if len(open_orders) == 0:
             return []
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in open_orders]
+        order_ids_by_pair = {}  # Dict[trading_pair:str, List[client_order_id:str]]
+        for tracked_order in open_orders:
+            order_ids_by_pair.setdefault(tracked_order.trading_pair, []).append(tracked_order.client_order_id)
+        tasks = [self._cancel_orders(trading_pair, order_ids) for trading_pair, order_ids in order_ids_by_pair.items()]
         cancellation_results = []
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=False)
+                results_by_pair = await safe_gather(*tasks, return_exceptions=False)
+                cancellation_results = [result for results in results_by_pair for result in results]
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.", exc_info=True,
@@ -873,6 +1177,11 @@ class PeatioExchange(ExchangeBase):
 
                     if params is None or method not in event_methods:
                         continue
+                    if self._order_latency_tracer.enabled and method != Constants.WS_METHODS["USER_BALANCES"]:
+                        exchange_order_id = str(params["id" if method == Constants.WS_METHODS["USER_ORDERS"]
+                                                       else "order_id"])
+                        self._order_latency_tracer.record_ws_update(exchange_order_id,
+                                                                    self._exchange_order_ids.get(exchange_order_id))
                     if method == Constants.WS_METHODS["USER_TRADES"]:
                         await self._process_trade_message(params)
                     elif method == Constants.WS_METHODS["USER_ORDERS"]:
@@ -887,9 +1196,6 @@ class PeatioExchange(ExchangeBase):
 
     # This is currently unused, but looks like a future addition.
     async def get_open_orders(self) -> List[OpenOrder]:
-        tracked_orders = list(self._in_flight_orders.values())
-        # for order in tracked_orders:
-        #     await order.get_exchange_order_id()
         result = await self._api_request("GET", Constants.ENDPOINT["USER_ORDERS"], is_auth_required=True)
         ret_val = []
         for order in result:
@@ -898,11 +1204,10 @@ class PeatioExchange(ExchangeBase):
                 continue
             exchange_order_id = str(order["id"])
             # AltMarkets doesn't support client order ids yet so we must find it from the tracked orders.
-            track_order = [o for o in tracked_orders if exchange_order_id == o.exchange_order_id]
-            if not track_order or len(track_order) < 1:
+            client_order_id = self._exchange_order_ids.get(exchange_order_id)
+            if client_order_id is None:
                 # Skip untracked orders
                 continue
-            client_order_id = track_order[0].client_order_id
             if order["ord_type"] != OrderType.LIMIT.name.lower():
                 self.logger().info(f"Unsupported order type found: {order['type']}")
                 # Skip and report non-limit orders
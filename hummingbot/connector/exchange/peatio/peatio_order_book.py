@@ -12,6 +12,7 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage, OrderBookMessageType
 )
 from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_active_order_tracker import entries_to_numpy_diff
 from hummingbot.connector.exchange.peatio.peatio_order_book_message import PeatioOrderBookMessage
 
 _logger = None
@@ -81,6 +82,31 @@ class PeatioOrderBook(OrderBook):
             timestamp=timestamp
         )
 
+    @classmethod
+    def numpy_diff_message_from_exchange(cls,
+                                         msg: Dict[str, any],
+                                         timestamp: float,
+                                         trading_pair: str):
+        """
+        Same as diff_message_from_exchange, with the bids and asks also parsed into [price, amount, update_id] arrays
+        on receipt so the order book tracker can apply them as they are
+        :param msg: json diff data from live web socket stream
+        :param timestamp: timestamp attached to incoming data
+        :param trading_pair: trading pair of the diff
+        :return: PeatioOrderBookMessage
+        """
+        update_id: int = int(timestamp * 1e3)
+        msg["trading_pair"] = trading_pair
+        # The raw levels are not needed once parsed, dropping them keeps queued messages small.
+        msg["bids_array"] = entries_to_numpy_diff(msg.pop("bids", None), update_id)
+        msg["asks_array"] = entries_to_numpy_diff(msg.pop("asks", None), update_id)
+
+        return PeatioOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content=msg,
+            timestamp=timestamp
+        )
+
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None):
         """
@@ -4,8 +4,11 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
@@ -70,6 +73,15 @@ class PeatioOrderBookMessage(OrderBookMessage):
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount in bids
         ]
 
+    @property
+    def numpy_diffs(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        :return: the bids and asks as [price, amount, update_id] arrays if they were parsed on receipt, else None
+        """
+        if "bids_array" in self.content:
+            return self.content["bids_array"], self.content["asks_array"]
+        return None
+
     def __eq__(self, other) -> bool:
         return self.type == other.type and self.timestamp == other.timestamp
 
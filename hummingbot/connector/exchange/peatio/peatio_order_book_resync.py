@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+
+class PeatioOrderBookResyncScheduler:
+    """
+    Decides which REST order book snapshot to fetch next. Each trading pair has at most one pending request, resyncs of
+    inconsistent order books go before scheduled refreshes and a trading pair is not fetched again until the cooldown
+    since its last fetch has passed. The fetches are counted per hour and reason.
+    """
+    RESYNC_PRIORITY = 0
+    SCHEDULED_PRIORITY = 1
+
+    def __init__(self, cooldown: float, history_hours: int = 24):
+        self._cooldown: float = cooldown
+        self._history_hours: int = history_hours
+        # trading pair -> (priority, request timestamp, reason)
+        self._pending: Dict[str, Tuple[int, float, str]] = {}
+        self._last_fetch_times: Dict[str, float] = {}
+        self._hourly_counts: Dict[int, Dict[str, int]] = OrderedDict()
+
+    @property
+    def cooldown(self) -> float:
+        return self._cooldown
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, trading_pair: str) -> bool:
+        return trading_pair in self._pending
+
+    def last_fetch_time(self, trading_pair: str) -> float:
+        return self._last_fetch_times.get(trading_pair, 0.0)
+
+    def request(self, trading_pair: str, reason: str, priority: int, timestamp: float) -> bool:
+        """
+        :return: True if the request is new or raised the priority of the pending one
+        """
+        pending: Optional[Tuple[int, float, str]] = self._pending.get(trading_pair)
+        if pending is not None and pending[0] <= priority:
+            return False
+        self._pending[trading_pair] = (priority, timestamp, reason)
+        return True
+
+    def _ready_time(self, trading_pair: str, requested_at: float) -> float:
+        return max(requested_at, self.last_fetch_time(trading_pair) + self._cooldown)
+
+    def next_ready_time(self) -> Optional[float]:
+        """
+        :return: the earliest time a pending request can be fetched at, None if nothing is pending
+        """
+        if len(self._pending) == 0:
+            return None
+        return min(self._ready_time(trading_pair, requested_at)
+                   for trading_pair, (_, requested_at, _) in self._pending.items())
+
+    def pop_ready(self, timestamp: float) -> Optional[Tuple[str, str]]:
+        """
+        Takes the highest priority request out of the ones past their cooldown, the oldest first.
+        :return: (trading pair, reason) or None if no request can be fetched yet
+        """
+        best_key: Optional[Tuple[int, float]] = None
+        best_trading_pair: Optional[str] = None
+        for trading_pair, (priority, requested_at, _) in self._pending.items():
+            ready_time: float = self._ready_time(trading_pair, requested_at)
+            if ready_time > timestamp:
+                continue
+            if best_key is None or (priority, ready_time) < best_key:
+                best_key = (priority, ready_time)
+                best_trading_pair = trading_pair
+        if best_trading_pair is None:
+            return None
+        _, _, reason = self._pending.pop(best_trading_pair)
+        return best_trading_pair, reason
+
+    def record_fetch(self, trading_pair: str, reason: str, timestamp: float):
+        self._last_fetch_times[trading_pair] = timestamp
+        hour: int = int(timestamp // 3600)
+        counts: Dict[str, int] = self._hourly_counts.get(hour)
+        if counts is None:
+            counts = self._hourly_counts[hour] = {}
+            while len(self._hourly_counts) > self._history_hours:
+                self._hourly_counts.popitem(last=False)
+        counts[reason] = counts.get(reason, 0) + 1
+
+    def fetch_counts(self, timestamp: float) -> Dict[str, int]:
+        """
+        :return: the number of snapshots fetched per reason in the hour of the timestamp
+        """
+        return dict(self._hourly_counts.get(int(timestamp // 3600), {}))
+
+    def hourly_fetch_counts(self) -> Dict[float, int]:
+        """
+        :return: the number of snapshots fetched per hour, keyed by the start of the hour
+        """
+        return {hour * 3600.0: sum(counts.values()) for hour, counts in self._hourly_counts.items()}
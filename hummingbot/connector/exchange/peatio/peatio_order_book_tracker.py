@@ -4,10 +4,12 @@ import bisect
 import logging
 from hummingbot.connector.exchange.peatio.peatio_constants import Constants
 import time
+import numpy as np
 
 from collections import defaultdict, deque
-from typing import Optional, Dict, List, Deque
+from typing import Optional, Dict, List, Deque, Tuple
 from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange.peatio.peatio_order_book_message import PeatioOrderBookMessage
@@ -17,6 +19,7 @@ from hummingbot.connector.exchange.peatio.peatio_order_book import PeatioOrderBo
 
 
 class PeatioOrderBookTracker(OrderBookTracker):
+    INIT_ORDER_BOOK_CONCURRENCY: int = Constants.ORDER_BOOK_INIT_CONCURRENCY
     _logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -48,11 +51,79 @@ class PeatioOrderBookTracker(OrderBookTracker):
         """
         return Constants.EXCHANGE_NAME
 
+    async def _next_message_batch(self, trading_pair: str,
+                                  message_queue: asyncio.Queue) -> List[PeatioOrderBookMessage]:
+        saved_messages: Deque[PeatioOrderBookMessage] = self._saved_message_queues[trading_pair]
+        # Process saved messages first if there are any
+        if len(saved_messages) > 0:
+            messages: List[PeatioOrderBookMessage] = list(saved_messages)
+            saved_messages.clear()
+            return messages
+        return await super()._next_message_batch(trading_pair, message_queue)
+
+    def _diff_message_rows(self, trading_pair: str,
+                           message: PeatioOrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        return self._active_order_trackers[trading_pair].convert_diff_message_to_order_book_row(message)
+
+    def _apply_diff_messages(self,
+                             trading_pair: str,
+                             order_book: PeatioOrderBook,
+                             messages: List[PeatioOrderBookMessage],
+                             past_diffs_window: Deque[PeatioOrderBookMessage]):
+        if len(messages) > 0 and all(message.numpy_diffs is not None for message in messages):
+            bids, asks = self._concatenate_numpy_diffs(messages)
+            if self.crosses_book(order_book, bids, asks):
+                self.logger().debug(f"Order book increments of {trading_pair} cross the book, resyncing it.")
+                self.data_source.request_resync(trading_pair, "crossed")
+            order_book.apply_numpy_diffs(bids, asks)
+            past_diffs_window.extend(messages)
+        else:
+            super()._apply_diff_messages(trading_pair, order_book, messages, past_diffs_window)
+
+    @staticmethod
+    def _concatenate_numpy_diffs(messages: List[PeatioOrderBookMessage]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Combines diffs parsed on receipt into one diff, the arrays are concatenated in order so the last row received
+        for a price wins.
+        """
+        if len(messages) == 1:
+            return messages[0].numpy_diffs
+        return (np.concatenate([message.numpy_diffs[0] for message in messages]),
+                np.concatenate([message.numpy_diffs[1] for message in messages]))
+
+    @staticmethod
+    def crosses_book(order_book: PeatioOrderBook, bids: np.ndarray, asks: np.ndarray) -> bool:
+        """
+        Checks whether diffs would cross the order book. The order book silently drops the older side of a crossing, so
+        this has to be checked before they are applied. Levels the diffs remove do not count, and only the last row
+        for a price counts, as when the diffs are applied.
+        """
+        bids = PeatioOrderBookTracker._last_rows_per_price(bids)
+        asks = PeatioOrderBookTracker._last_rows_per_price(asks)
+        book_bids, book_asks = order_book.to_numpy(1)
+        bid_prices: np.ndarray = bids[bids[:, 1] > 0, 0]
+        ask_prices: np.ndarray = asks[asks[:, 1] > 0, 0]
+        if len(book_bids) > 0 and not np.any(bids[bids[:, 1] <= 0, 0] == book_bids[0, 0]):
+            bid_prices = np.append(bid_prices, book_bids[0, 0])
+        if len(book_asks) > 0 and not np.any(asks[asks[:, 1] <= 0, 0] == book_asks[0, 0]):
+            ask_prices = np.append(ask_prices, book_asks[0, 0])
+        return len(bid_prices) > 0 and len(ask_prices) > 0 and bid_prices.max() >= ask_prices.min()
+
+    @staticmethod
+    def _last_rows_per_price(rows: np.ndarray) -> np.ndarray:
+        """
+        The last row received for each price of diff rows, as coalesce_diff_rows keeps them.
+        """
+        if len(rows) < 2:
+            return rows
+        _, reversed_indexes = np.unique(rows[::-1, 0], return_index=True)
+        return rows[len(rows) - 1 - reversed_indexes]
+
     async def _track_single_book(self, trading_pair: str):
         """
         Update an order book with changes from the latest batch of received messages
         """
-        past_diffs_window: Deque[PeatioOrderBookMessage] = deque()
+        past_diffs_window: Deque[PeatioOrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -64,40 +135,42 @@ class PeatioOrderBookTracker(OrderBookTracker):
 
         while True:
             try:
-                message: PeatioOrderBookMessage = None
-                saved_messages: Deque[PeatioOrderBookMessage] = self._saved_message_queues[trading_pair]
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[PeatioOrderBookMessage] = list(past_diffs_window)
-                    # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
-                    replay_position = bisect.bisect_right(past_diffs, message)
-                    replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
-                    for diff_message in replay_diffs:
-                        d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
-                        order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
-
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                messages: List[PeatioOrderBookMessage] = await self._next_message_batch(trading_pair, message_queue)
+                diff_messages: List[PeatioOrderBookMessage] = []
+                for message in messages:
+                    if message.type is OrderBookMessageType.DIFF:
+                        diff_messages.append(message)
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+                        diff_messages_accepted += len(diff_messages)
+                        diff_messages = []
+                        past_diffs: List[PeatioOrderBookMessage] = list(past_diffs_window)
+                        # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
+                        replay_position = bisect.bisect_right(past_diffs, message)
+                        replay_diffs = past_diffs[replay_position:]
+                        s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
+                        order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+                        if len(replay_diffs) > 0 and all(diff_message.numpy_diffs is not None
+                                                         for diff_message in replay_diffs):
+                            order_book.apply_numpy_diffs(*self._concatenate_numpy_diffs(replay_diffs))
+                        else:
+                            for diff_message in replay_diffs:
+                                d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(
+                                    diff_message)
+                                order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
+
+                        self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+                diff_messages_accepted += len(diff_messages)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    stats = self._queue_stats[trading_pair]
+                    self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}, "
+                                        f"queue depth: {stats.max_queue_depth}, lag: {stats.max_lag:.3f}s.")
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+import json
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+
+class OrderLatencyStage(IntEnum):
+    QUEUED = 0  # buy() or sell() returned the client order id
+    THROTTLED = 1  # the request throttler let the create order request through
+    SENT = 2  # aiohttp started sending the create order request
+    ACKED = 3  # the create order response arrived
+    FIRST_WS_UPDATE = 4  # the first order or trade message of the user stream arrived
+    FILLED = 5  # the first fill
+    CANCEL_REQUESTED = 6  # the cancel request is sent
+    CANCEL_ACKED = 7  # the cancellation is confirmed
+
+
+class PeatioOrderLatencyTracer:
+    """
+    Timestamps the lifecycle stages of every order placed while it is enabled, in a preallocated ring of the last
+    `capacity` orders. The exchange checks `enabled` before recording anything, so a disabled tracer costs an
+    attribute lookup per stage.
+    """
+    # Stages kept at their first occurrence, the others are overwritten (e.g. the last attempt of a retried request).
+    FIRST_ONLY_STAGES = (OrderLatencyStage.FIRST_WS_UPDATE, OrderLatencyStage.FILLED, OrderLatencyStage.CANCEL_ACKED)
+    # (name, start stage, end stage) of the reported intervals
+    INTERVALS: List[Tuple[str, OrderLatencyStage, OrderLatencyStage]] = [
+        ("throttle wait", OrderLatencyStage.QUEUED, OrderLatencyStage.THROTTLED),
+        ("request signing", OrderLatencyStage.THROTTLED, OrderLatencyStage.SENT),
+        ("create order response", OrderLatencyStage.SENT, OrderLatencyStage.ACKED),
+        ("websocket confirmation", OrderLatencyStage.SENT, OrderLatencyStage.FIRST_WS_UPDATE),
+        ("queued to acked", OrderLatencyStage.QUEUED, OrderLatencyStage.ACKED),
+        ("acked to first fill", OrderLatencyStage.ACKED, OrderLatencyStage.FILLED),
+        ("cancel", OrderLatencyStage.CANCEL_REQUESTED, OrderLatencyStage.CANCEL_ACKED),
+    ]
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, capacity: int = 10000, enabled: bool = False):
+        self.enabled: bool = enabled
+        self._capacity: int = capacity
+        self._timestamps: np.ndarray = np.full((capacity, len(OrderLatencyStage)), np.nan)
+        self._order_ids: List[Optional[str]] = [None] * capacity
+        self._trading_pairs: List[Optional[str]] = [None] * capacity
+        self._slots: Dict[str, int] = {}
+        self._next_slot: int = 0
+        # User stream messages received before the create order response, by exchange order id
+        self._early_ws_updates: Dict[str, float] = OrderedDict()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def start(self, order_id: str, trading_pair: str, timestamp: Optional[float] = None):
+        """
+        Starts tracing an order at the QUEUED stage, taking the slot of the oldest traced order once the ring is full.
+        """
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self._capacity
+        old_order_id = self._order_ids[slot]
+        if old_order_id is not None:
+            del self._slots[old_order_id]
+        self._order_ids[slot] = order_id
+        self._trading_pairs[slot] = trading_pair
+        self._slots[order_id] = slot
+        row = self._timestamps[slot]
+        row.fill(np.nan)
+        row[OrderLatencyStage.QUEUED] = time.time() if timestamp is None else timestamp
+
+    def record(self, order_id: str, stage: OrderLatencyStage, timestamp: Optional[float] = None):
+        """
+        Records a stage of a traced order, orders placed before the tracer was enabled are ignored.
+        """
+        slot = self._slots.get(order_id)
+        if slot is None:
+            return
+        if stage in self.FIRST_ONLY_STAGES and not np.isnan(self._timestamps[slot, stage]):
+            return
+        self._timestamps[slot, stage] = time.time() if timestamp is None else timestamp
+
+    def record_ws_update(self, exchange_order_id: str, order_id: Optional[str], timestamp: Optional[float] = None):
+        """
+        Records the FIRST_WS_UPDATE stage of an order, a message that arrives before the create order response is kept
+        until record_exchange_order_id matches it with its order.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        if order_id is not None:
+            self.record(order_id, OrderLatencyStage.FIRST_WS_UPDATE, timestamp)
+        elif exchange_order_id not in self._early_ws_updates:
+            self._early_ws_updates[exchange_order_id] = timestamp
+            if len(self._early_ws_updates) > self._capacity:
+                self._early_ws_updates.popitem(last=False)
+
+    def record_exchange_order_id(self, order_id: str, exchange_order_id: str, timestamp: Optional[float] = None):
+        """
+        Records the ACKED stage of an order along with a user stream message that arrived before it.
+        """
+        self.record(order_id, OrderLatencyStage.ACKED, timestamp)
+        early_timestamp = self._early_ws_updates.pop(exchange_order_id, None)
+        if early_timestamp is not None:
+            self.record(order_id, OrderLatencyStage.FIRST_WS_UPDATE, early_timestamp)
+
+    def stage_timestamps(self, order_id: str) -> Dict[str, float]:
+        slot = self._slots.get(order_id)
+        if slot is None:
+            return {}
+        return {stage.name.lower(): float(self._timestamps[slot, stage]) for stage in OrderLatencyStage
+                if not np.isnan(self._timestamps[slot, stage])}
+
+    def intervals(self) -> Dict[str, np.ndarray]:
+        """
+        :returns The seconds of each interval over the traced orders which went through both of its stages
+        """
+        timestamps = self._timestamps[list(self._slots.values())] if self._slots \
+            else np.zeros((0, len(OrderLatencyStage)))
+        results = {}
+        for name, start_stage, end_stage in self.INTERVALS:
+            durations = timestamps[:, end_stage] - timestamps[:, start_stage]
+            results[name] = durations[~np.isnan(durations)]
+        return results
+
+    def format_summary(self) -> str:
+        lines = [f"  Traced orders: {len(self)} (last {self._capacity} kept), tracing "
+                 f"{'enabled' if self.enabled else 'disabled'}",
+                 f"  {'Interval':<24} {'Orders':>7} " + " ".join(f"{f'p{p} ms':>9}" for p in self.PERCENTILES) +
+                 f" {'max ms':>9}"]
+        for name, durations in self.intervals().items():
+            if len(durations) == 0:
+                lines.append(f"  {name:<24} {0:>7}")
+                continue
+            durations_ms = durations * 1e3
+            percentiles = np.percentile(durations_ms, self.PERCENTILES)
+            lines.append(f"  {name:<24} {len(durations):>7} " + " ".join(f"{p:>9.2f}" for p in percentiles) +
+                         f" {durations_ms.max():>9.2f}")
+        return "\n".join(lines)
+
+    def dump(self, file_path: str) -> int:
+        """
+        Writes the traced orders, oldest first, as one JSON object per line with the timestamp of each stage reached.
+        :returns The number of orders written
+        """
+        count = 0
+        with open(file_path, "w") as f:
+            for i in range(self._capacity):
+                slot = (self._next_slot + i) % self._capacity
+                order_id = self._order_ids[slot]
+                if order_id is None:
+                    continue
+                record = {"client_order_id": order_id, "trading_pair": self._trading_pairs[slot]}
+                record.update(self.stage_timestamps(order_id))
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def reset(self):
+        self._timestamps.fill(np.nan)
+        self._order_ids = [None] * self._capacity
+        self._trading_pairs = [None] * self._capacity
+        self._slots.clear()
+        self._next_slot = 0
+        self._early_ws_updates.clear()
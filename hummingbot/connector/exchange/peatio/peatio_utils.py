@@ -12,8 +12,13 @@ from typing import (
 )
 
 from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_client_pool import (
+    HTTPClientPool,
+    HTTPClientPoolConfig,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_methods import using_exchange
 from .peatio_constants import Constants
 
@@ -28,6 +33,10 @@ DEFAULT_FEES = [0.1, 0.2]
 
 REQUEST_THROTTLER = Throttler(rate_limit = (8.0, 6.0))
 
+REST_CLIENT_CONFIG = HTTPClientPoolConfig(limit=Constants.HTTP_CONNECTION_LIMIT,
+                                          keepalive_timeout=Constants.HTTP_KEEPALIVE_TIMEOUT,
+                                          ttl_dns_cache=Constants.HTTP_DNS_CACHE_TTL)
+
 
 class PeatioAPIError(IOError):
     def __init__(self, error_payload: Dict[str, Any]):
@@ -91,6 +100,15 @@ def retry_sleep_time(try_count: int) -> float:
     return float(2 + float(randSleep * (1 + (try_count ** try_count))))
 
 
+def ws_reconnect_delay(try_count: int) -> float:
+    """
+    Exponential backoff for websocket reconnects, jittered so that clients dropped at the same time don't all come
+    back at the same time.
+    """
+    delay = min(Constants.WS_RECONNECT_MAX_DELAY, Constants.WS_RECONNECT_BASE_DELAY * 2 ** try_count)
+    return random.uniform(delay / 2, delay)
+
+
 async def aiohttp_response_with_errors(request_coroutine):
     http_status, parsed_response, request_errors = None, None, False
     try:
@@ -123,6 +141,15 @@ async def aiohttp_response_with_errors(request_coroutine):
     return http_status, parsed_response, request_errors
 
 
+def rest_client_session() -> aiohttp.ClientSession:
+    """
+    :returns The pooled client session of the REST API host
+    """
+    pool = HTTPClientPool.get_instance()
+    pool.configure(HTTPClientPool.host_key(Constants.REST_URL)[1], REST_CLIENT_CONFIG)
+    return pool.get_session(Constants.REST_URL)
+
+
 async def api_call_with_retries(method,
                                 endpoint,
                                 params: Optional[Dict[str, Any]] = None,
@@ -131,13 +158,11 @@ async def api_call_with_retries(method,
     async with REQUEST_THROTTLER.weighted_task(request_weight=1):
         url = f"{Constants.REST_URL}/{endpoint}"
         headers = {"Content-Type": "application/json", "User-Agent": Constants.USER_AGENT}
-        http_client = shared_client if shared_client is not None else aiohttp.ClientSession()
+        http_client = shared_client if shared_client is not None else rest_client_session()
         # Build request coro
         response_coro = http_client.request(method=method.upper(), url=url, headers=headers,
                                             params=params, timeout=Constants.API_CALL_TIMEOUT)
         http_status, parsed_response, request_errors = await aiohttp_response_with_errors(response_coro)
-        if shared_client is None:
-            await http_client.close()
         if request_errors or parsed_response is None:
             if try_count < Constants.API_MAX_RETRIES:
                 try_count += 1
@@ -172,4 +197,13 @@ KEYS = {
                   required_if=using_exchange("peatio"),
                   is_secure=True,
                   is_connect_key=True),
+    "peatio_bulk_cancel":
+        ConfigVar(key="peatio_bulk_cancel",
+                  prompt=f"Would you like to cancel the open orders of a {Constants.EXCHANGE_NAME} market with one "
+                         "request? Note that it also cancels the orders of the market which were not placed by the "
+                         "bot, only enable it for an account the bot trades alone (Yes/No) >>> ",
+                  required_if=lambda: False,
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
 }
@@ -2,7 +2,7 @@
 import asyncio
 import logging
 import websockets
-import json
+import ujson
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from typing import (
     Any,
@@ -66,10 +66,10 @@ class PeatioWebsocket(RequestId):
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=Constants.MESSAGE_TIMEOUT)
                     try:
-                        msg = json.loads(raw_msg_str)
+                        msg = ujson.loads(raw_msg_str)
                         if "ping" in msg:
                             payload = {"op": "pong", "timestamp": str(msg["ping"])}
-                            safe_ensure_future(self._client.send(json.dumps(payload)))
+                            safe_ensure_future(self._client.send(ujson.dumps(payload)))
                             yield None
                         elif "success" in msg:
                             ws_method: str = msg.get('success', {}).get('message')
@@ -103,7 +103,7 @@ class PeatioWebsocket(RequestId):
             "event": method,
         }
 
-        await self._client.send(json.dumps({**payload, **data}))
+        await self._client.send(ujson.dumps({**payload, **data}))
 
         return id
 
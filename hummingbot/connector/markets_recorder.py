@@ -1,5 +1,6 @@
 #!/usr/bin/env python
-import os.path
+import csv
+import os
 import pandas as pd
 from shutil import move
 import asyncio
@@ -7,12 +8,18 @@ from sqlalchemy.orm import (
     Session,
     Query
 )
+import logging
+import queue
 import time
 import threading
 from typing import (
+    Any,
     Dict,
     List,
+    NamedTuple,
     Optional,
+    Set,
+    TextIO,
     Tuple,
     Union,
 )
@@ -32,8 +39,10 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
@@ -42,17 +51,142 @@ from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.funding_payment import FundingPayment
 
 
+class TradesCSVWriter:
+    """
+    Append-only writer of a trades CSV file. The header is checked once when the file is opened, the file is kept open
+    and rows are flushed to disk every flush_interval seconds or flush_rows rows. A row with a different header moves
+    the current file aside and starts a new one. With no flush_interval, rows are only flushed by count or by the
+    owner calling flush(), for writers used outside of the event loop thread.
+    """
+    def __init__(self, csv_path: str, flush_interval: Optional[float] = 1.0, flush_rows: int = 100):
+        self._csv_path: str = csv_path
+        self._flush_interval: Optional[float] = flush_interval
+        self._flush_rows: int = flush_rows
+        self._header: Optional[Tuple[str, ...]] = None
+        self._file: Optional[TextIO] = None
+        self._writer = None
+        self._pending_rows: int = 0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @property
+    def header(self) -> Optional[Tuple[str, ...]]:
+        return self._header
+
+    @staticmethod
+    def read_header(csv_path: str) -> Optional[Tuple[str, ...]]:
+        with open(csv_path, newline="") as f:
+            first_row = next(csv.reader(f), None)
+        return tuple(first_row) if first_row is not None else None
+
+    def _rotate(self):
+        move(self._csv_path, self._csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+
+    def _open(self, header: Tuple[str, ...]):
+        if os.path.exists(self._csv_path) and self.read_header(self._csv_path) != header:
+            self._rotate()
+        is_new_file: bool = not os.path.exists(self._csv_path)
+        self._file = open(self._csv_path, "a", newline="")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+        self._header = header
+        if is_new_file:
+            self._writer.writerow(header)
+            self.flush()
+
+    def write_row(self, header: Tuple[str, ...], row: Tuple[Any, ...]):
+        if self._file is None or header != self._header:
+            self.close()
+            self._open(header)
+        self._writer.writerow(row)
+        self._pending_rows += 1
+        if self._pending_rows >= self._flush_rows:
+            self.flush()
+        elif self._flush_interval is not None and self._flush_timer is None:
+            self._flush_timer = asyncio.get_event_loop().call_later(self._flush_interval, self.flush)
+
+    def flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending_rows = 0
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        self._writer = None
+        self._header = None
+
+
+class _OrderCreatedRecord(NamedTuple):
+    order: Dict[str, Any]
+    status: str
+    timestamp: int
+
+
+class _OrderStatusRecord(NamedTuple):
+    order_id: str
+    status: str
+    timestamp: int
+    trade_fill: Optional[Dict[str, Any]] = None
+
+
+class _MarketStateRecord(NamedTuple):
+    config_file_path: str
+    market: str
+    timestamp: int
+    saved_state: Dict[str, Any]
+
+
+class _FundingPaymentRecord(NamedTuple):
+    payment: Dict[str, Any]
+
+
+# Queue markers: write out what has been queued so far, and stop the writer thread.
+_FLUSH = object()
+_STOP = object()
+
+
 class MarketsRecorder:
+    """
+    Records orders, trade fills, order statuses and market states of the markets to the trades database.
+
+    With write_behind, the event handlers only queue plain records and return; a writer thread saves the queued
+    records in one transaction every flush_interval seconds or flush_size records, whichever comes first. Within a
+    batch the order records are looked up once and the market states are saved once per market, so a burst of
+    status updates and fills costs a single commit. Reads through the recorder, and stop(), wait for the queue to be
+    written out first.
+    """
+    _mr_logger: Optional[HummingbotLogger] = None
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = True,
+                 flush_interval: float = 0.1,
+                 flush_size: int = 100):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -61,6 +195,13 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._csv_writers: Dict[str, TradesCSVWriter] = {}
+        self._write_behind: bool = write_behind
+        self._flush_interval: float = flush_interval
+        self._flush_size: int = flush_size
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._performance_tracker: PerformanceTracker = PerformanceTracker()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -111,6 +252,17 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def pending_records_count(self) -> int:
+        return self._write_queue.qsize()
+
+    @property
+    def performance_tracker(self) -> PerformanceTracker:
+        """
+        Performance of the recorded trade fills, fed every fill once it is reset from the database.
+        """
+        return self._performance_tracker
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
@@ -120,10 +272,150 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            self._write_queue.put(_STOP)
+            self._writer_thread.join()
+            self._writer_thread = None
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+        self._csv_writers.clear()
+
+    def flush(self):
+        """
+        Blocks until every queued record is saved to the database.
+        """
+        if not self._write_behind:
+            return
+        if self._writer_thread is not None:
+            self._write_queue.put(_FLUSH)
+            self._write_queue.join()
+        # Ends the shared session transaction so that objects it already holds are read again.
+        self.session.commit()
+
+    def _submit(self, records: List[Any]):
+        if not self._write_behind:
+            trade_fills: List[TradeFill] = self._save_records(self.session, records)
+            self.session.commit()
+            for trade_fill in trade_fills:
+                self.append_to_csv(trade_fill)
+            return
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
+        for record in records:
+            self._write_queue.put(record)
+
+    def _writer_loop(self):
+        while True:
+            batch: List[Any] = [self._write_queue.get()]
+            deadline: float = time.monotonic() + self._flush_interval
+            while len(batch) < self._flush_size and batch[-1] is not _FLUSH and batch[-1] is not _STOP:
+                timeout: float = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            records: List[Any] = [record for record in batch if record is not _FLUSH and record is not _STOP]
+            try:
+                if records:
+                    self._write_batch(records)
+            except Exception:
+                self.logger().error(f"Error saving {len(records)} records to the trades database.", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            if batch[-1] is _STOP:
+                return
+
+    def _write_batch(self, records: List[Any]):
+        csv_rows: List[Tuple[str, Tuple[str, ...], Tuple[Any, ...]]] = []
+        with self._sql.begin() as session:
+            for trade_fill in self._save_records(session, records):
+                csv_rows.append(self._trade_csv_row(trade_fill))
+        for csv_path, field_names, field_data in csv_rows:
+            self._get_csv_writer(csv_path).write_row(field_names, field_data)
+        for csv_writer in self._csv_writers.values():
+            csv_writer.flush()
+
+    def _save_records(self, session: Session, records: List[Any]) -> List[TradeFill]:
+        """
+        Adds the records to the session and flushes it, the caller commits.
+        :return: the trade fills added
+        """
+        orders: Dict[str, Optional[Order]] = {}
+        market_states: Dict[Tuple[str, str], _MarketStateRecord] = {}
+        funding_timestamps: Set[float] = set()
+        trade_fills: List[TradeFill] = []
+
+        def find_order(order_id: str) -> Optional[Order]:
+            if order_id not in orders:
+                orders[order_id] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            return orders[order_id]
+
+        with session.no_autoflush:
+            for record in records:
+                if isinstance(record, _OrderCreatedRecord):
+                    order_record: Order = Order(**record.order)
+                    orders[order_record.id] = order_record
+                    session.add(order_record)
+                    session.add(OrderStatus(order=order_record, timestamp=record.timestamp, status=record.status))
+                elif isinstance(record, _OrderStatusRecord):
+                    order_record: Optional[Order] = find_order(record.order_id)
+                    if order_record is not None:
+                        order_record.last_status = record.status
+                        order_record.last_update_timestamp = record.timestamp
+                    # Order status and trade fill record should be added even if the order record is not found,
+                    # because it's possible for fill event to come in before the order created event for market
+                    # orders.
+                    if order_record is not None or record.trade_fill is not None:
+                        session.add(OrderStatus(order_id=record.order_id,
+                                                timestamp=record.timestamp,
+                                                status=record.status))
+                    if record.trade_fill is not None:
+                        trade_fill_record: TradeFill = TradeFill(**record.trade_fill)
+                        session.add(trade_fill_record)
+                        trade_fills.append(trade_fill_record)
+                elif isinstance(record, _MarketStateRecord):
+                    # Only the latest state of each market needs saving.
+                    market_states[(record.config_file_path, record.market)] = record
+                elif isinstance(record, _FundingPaymentRecord):
+                    timestamp: float = record.payment["timestamp"]
+                    # Try to find the funding payment has been recorded already.
+                    if timestamp in funding_timestamps or \
+                            session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none():
+                        continue
+                    funding_timestamps.add(timestamp)
+                    session.add(FundingPayment(**record.payment))
+
+            for record in market_states.values():
+                market_state: Optional[MarketState] = (session
+                                                       .query(MarketState)
+                                                       .filter(MarketState.config_file_path == record.config_file_path,
+                                                               MarketState.market == record.market)
+                                                       .one_or_none())
+                if market_state is not None:
+                    market_state.saved_state = record.saved_state
+                    market_state.timestamp = record.timestamp
+                else:
+                    session.add(MarketState(config_file_path=record.config_file_path,
+                                            market=record.market,
+                                            timestamp=record.timestamp,
+                                            saved_state=record.saved_state))
+        session.flush()
+        return trade_fills
+
+    def _market_state_record(self, config_file_path: str, market: ConnectorBase) -> _MarketStateRecord:
+        return _MarketStateRecord(config_file_path=config_file_path,
+                                  market=market.display_name,
+                                  timestamp=self.db_timestamp,
+                                  saved_state=market.tracking_states)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         session: Session = self.session
         filters = [Order.config_file_path == config_file_path,
                    Order.market == market.display_name]
@@ -139,6 +431,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -150,22 +443,13 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
-        session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
-        timestamp: int = self.db_timestamp
-
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
-        else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
-
+        record: _MarketStateRecord = self._market_state_record(config_file_path, market)
+        if self._write_behind:
+            self._submit([record])
+            return
+        self._save_records(self.session, [record])
         if not no_commit:
-            session.commit()
+            self.session.commit()
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
@@ -174,6 +458,7 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -190,34 +475,28 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.trading_pair,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=float(evt.amount),
-                                    leverage=evt.leverage if evt.leverage else 1,
-                                    price=float(evt.price) if evt.price == evt.price else 0,
-                                    position=evt.position if evt.position else "NILL",
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp,
-                                    exchange_order_id=evt.exchange_order_id)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
+        order_record: Dict[str, Any] = dict(id=evt.order_id,
+                                            config_file_path=self._config_file_path,
+                                            strategy=self._strategy_name,
+                                            market=market.display_name,
+                                            symbol=evt.trading_pair,
+                                            base_asset=base_asset,
+                                            quote_asset=quote_asset,
+                                            creation_timestamp=timestamp,
+                                            order_type=evt.type.name,
+                                            amount=float(evt.amount),
+                                            leverage=evt.leverage if evt.leverage else 1,
+                                            price=float(evt.price) if evt.price == evt.price else 0,
+                                            position=evt.position if evt.position else "NILL",
+                                            last_status=event_type.name,
+                                            last_update_timestamp=timestamp,
+                                            exchange_order_id=evt.exchange_order_id)
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._submit([_OrderCreatedRecord(order=order_record, status=event_type.name, timestamp=timestamp),
+                      self._market_state_record(self._config_file_path, market)])
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -227,24 +506,12 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
-        # Order status and trade fill record should be added even if the order record is not found, because it's
-        # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
+        trade_fill_record: Dict[str, Any] = dict(config_file_path=self.config_file_path,
                                                  strategy=self.strategy_name,
                                                  market=market.display_name,
                                                  symbol=evt.trading_pair,
@@ -260,12 +527,18 @@ class MarketsRecorder:
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id,
                                                  position=evt.position if evt.position else "NILL",)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
-        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market, trade_fill_record.exchange_trade_id, trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._performance_tracker.add_fill(market.display_name, evt.trading_pair, timestamp,
+                                           trade_fill_record["trade_type"], trade_fill_record["price"],
+                                           trade_fill_record["amount"], trade_fill_record["trade_fee"], order_id,
+                                           trade_fill_record["position"])
+        self._submit([_OrderStatusRecord(order_id=order_id,
+                                         status=event_type.name,
+                                         timestamp=timestamp,
+                                         trade_fill=trade_fill_record),
+                      self._market_state_record(self._config_file_path, market)])
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -275,21 +548,12 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
-        timestamp: float = evt.timestamp
-
-        # Try to find the funding payment has been recorded already.
-        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none()
-        if payment_record is None:
-            funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                    config_file_path=self.config_file_path,
-                                                                    market=market.display_name,
-                                                                    rate=evt.funding_rate,
-                                                                    symbol=evt.trading_pair,
-                                                                    amount=float(evt.amount))
-            session.add(funding_payment_record)
-            session.commit()
-            # self.append_to_csv(funding_payment_record)
+        self._submit([_FundingPaymentRecord(payment=dict(timestamp=evt.timestamp,
+                                                         config_file_path=self.config_file_path,
+                                                         market=market.display_name,
+                                                         rate=evt.funding_rate,
+                                                         symbol=evt.trading_pair,
+                                                         amount=float(evt.amount)))])
 
     @staticmethod
     def _is_primitive_type(obj: object) -> bool:
@@ -299,12 +563,7 @@ class MarketsRecorder:
     def _is_protected_method(method_name: str) -> bool:
         return method_name.startswith('_')
 
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
-
-    def append_to_csv(self, trade: TradeFill):
+    def _trade_csv_row(self, trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -320,15 +579,19 @@ class MarketsRecorder:
             '%H:%M:%S') if "//" not in trade.order_id else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
-        if(os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+    def _get_csv_writer(self, csv_path: str) -> TradesCSVWriter:
+        csv_writer: Optional[TradesCSVWriter] = self._csv_writers.get(csv_path)
+        if csv_writer is None:
+            # The writer thread flushes its CSV files after every batch.
+            flush_interval: Optional[float] = None if self._write_behind else 1.0
+            csv_writer = self._csv_writers[csv_path] = TradesCSVWriter(csv_path, flush_interval=flush_interval)
+        return csv_writer
 
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def append_to_csv(self, trade: TradeFill):
+        csv_path, field_names, field_data = self._trade_csv_row(trade)
+        self._get_csv_writer(csv_path).write_row(field_names, field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -342,23 +605,9 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
-        timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        self._submit([_OrderStatusRecord(order_id=evt.order_id, status=event_type.name, timestamp=self.db_timestamp),
+                      self._market_state_record(self._config_file_path, market)])
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -10,3 +10,10 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _connectors_first
+        dict _iterator_priorities
+        object _stats
+        double _last_overrun_log_timestamp
+
+    cdef list c_sort_iterators(self, list iterators)
+    cdef c_tick_iterators(self, list iterators)
@@ -3,14 +3,20 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_stats import ClockStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+# Minimum interval between two tick overrun warnings, in seconds.
+OVERRUN_LOG_INTERVAL = 60.0
 
 
 cdef class Clock:
@@ -21,12 +27,15 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 connectors_first: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param connectors_first: tick connectors and wallets before the other iterators, whatever order they are
+        added in
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +45,10 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._connectors_first = connectors_first
+        self._iterator_priorities = {}
+        self._stats = ClockStats(tick_size)
+        self._last_overrun_log_timestamp = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,10 +70,24 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def stats(self) -> ClockStats:
+        """
+        :return: tick durations of each child iterator, tick overruns and skipped ticks
+        """
+        return self._stats
+
+    def get_iterator_priority(self, iterator: TimeIterator) -> int:
+        return self._iterator_priorities.get(iterator, 0)
+
+    cdef list c_sort_iterators(self, list iterators):
+        # Stable sort, iterators of the same priority tick in the order they were added.
+        return sorted(iterators, key=self.get_iterator_priority)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
-        self._current_context = self._child_iterators.copy()
+        self._current_context = self.c_sort_iterators(self._child_iterators)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -69,18 +96,62 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, priority: Optional[int] = None):
+        """
+        :param iterator: the iterator to tick
+        :param priority: iterators tick in increasing priority, the default is 0, or -1 for connectors and wallets
+        if the clock ticks connectors first
+        """
+        from hummingbot.core.network_iterator import NetworkIterator
+
+        if priority is None and self._connectors_first and isinstance(iterator, NetworkIterator):
+            priority = -1
+        if priority is not None:
+            self._iterator_priorities[iterator] = priority
         if self._current_context is not None:
             self._current_context.append(iterator)
+            self._current_context = self.c_sort_iterators(self._current_context)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        self._child_iterators = self.c_sort_iterators(self._child_iterators)
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_priorities.pop(iterator, None)
+        self._stats.remove_iterator(iterator)
+
+    cdef c_tick_iterators(self, list iterators):
+        cdef:
+            TimeIterator child_iterator
+            double tick_start = time.perf_counter()
+            double iterator_start
+
+        for ci in iterators:
+            child_iterator = ci
+            iterator_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            self._stats.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+        self._stats.record_tick(time.perf_counter() - tick_start)
+
+    def _log_skipped_ticks(self, skipped_ticks: int, now: float):
+        self._stats.record_skipped_ticks(skipped_ticks)
+        if now - self._last_overrun_log_timestamp < OVERRUN_LOG_INTERVAL:
+            return
+        self._last_overrun_log_timestamp = now
+        slowest = self._stats.slowest_iterator()
+        slowest_desc = f" Slowest iterator: {slowest.name} ({slowest.last_duration * 1e3:.1f} ms)." \
+            if slowest is not None else ""
+        self.logger().warning(f"Clock tick overran the {self._tick_size}s tick size, skipped {skipped_ticks} "
+                              f"tick(s).{slowest_desc}")
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,11 +161,14 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            long long tick_index
+            long long next_tick_index
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        tick_index = <long long>(now // self._tick_size)
+        self._current_tick = tick_index * self._tick_size
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
@@ -107,28 +181,33 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
+                # Ticks are on multiples of the tick size, computed from the tick index rather than accumulated so
+                # sub-second tick sizes do not drift. Grid points passed while the last tick was running are skipped.
+                next_tick_index = max(<long long>(now // self._tick_size) + 1, tick_index + 1)
+                if next_tick_index > tick_index + 1:
+                    self._log_skipped_ticks(next_tick_index - tick_index - 1, now)
+                tick_index = next_tick_index
+
                 # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                next_tick_time = tick_index * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                try:
+                    self.c_tick_iterators(self._current_context)
+                except StopIteration:
+                    self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                    return
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            long long tick_index
 
         if not self._started:
             for ci in self._child_iterators:
@@ -136,17 +215,12 @@ cdef class Clock:
                 child_iterator.c_start(self, self._start_time)
             self._started = True
 
+        tick_index = <long long>round((self._current_tick - self._start_time) / self._tick_size)
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                tick_index += 1
+                self._current_tick = self._start_time + tick_index * self._tick_size
+                self.c_tick_iterators(self._child_iterators)
         except StopIteration:
             return
         finally:
@@ -0,0 +1,147 @@
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+)
+
+import numpy as np
+
+
+class IteratorTickStats:
+    """
+    Tick durations of one clock child iterator. Percentiles are over the last window_size ticks, the counts and the
+    max since the iterator was added.
+    """
+    def __init__(self, name: str, tick_size: float, window_size: int = 1000):
+        self._name: str = name
+        self._tick_size: float = tick_size
+        self._durations: Deque[float] = deque(maxlen=window_size)
+        self._tick_count: int = 0
+        self._overrun_count: int = 0
+        self._max_duration: float = 0.0
+        self._last_duration: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick_count
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        :return: the number of ticks that took longer than the clock tick size on their own
+        """
+        return self._overrun_count
+
+    @property
+    def max_duration(self) -> float:
+        return self._max_duration
+
+    @property
+    def last_duration(self) -> float:
+        return self._last_duration
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    def percentile(self, q: float) -> float:
+        if len(self._durations) == 0:
+            return 0.0
+        return float(np.percentile(self._durations, q))
+
+    def record(self, duration: float):
+        self._durations.append(duration)
+        self._tick_count += 1
+        self._last_duration = duration
+        if duration > self._max_duration:
+            self._max_duration = duration
+        if duration > self._tick_size:
+            self._overrun_count += 1
+
+
+class ClockStats:
+    """
+    Timing of the clock ticks: per child iterator tick durations, the number of ticks that overran the tick size and
+    the number of ticks skipped because the previous one was still running.
+    """
+    def __init__(self, tick_size: float, window_size: int = 1000):
+        self._tick_size: float = tick_size
+        self._window_size: int = window_size
+        self._iterator_stats: Dict[int, IteratorTickStats] = {}
+        self._tick_stats: IteratorTickStats = IteratorTickStats("total", tick_size, window_size)
+        self._skipped_tick_count: int = 0
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick_stats.tick_count
+
+    @property
+    def overrun_count(self) -> int:
+        return self._tick_stats.overrun_count
+
+    @property
+    def skipped_tick_count(self) -> int:
+        return self._skipped_tick_count
+
+    @property
+    def tick_stats(self) -> IteratorTickStats:
+        """
+        :return: the durations of whole ticks, all child iterators included
+        """
+        return self._tick_stats
+
+    @property
+    def iterator_stats(self) -> List[IteratorTickStats]:
+        return list(self._iterator_stats.values())
+
+    @staticmethod
+    def iterator_name(iterator) -> str:
+        return getattr(iterator, "display_name", None) or type(iterator).__name__
+
+    def get_iterator_stats(self, iterator) -> Optional[IteratorTickStats]:
+        return self._iterator_stats.get(id(iterator))
+
+    def record_iterator_tick(self, iterator, duration: float):
+        stats: Optional[IteratorTickStats] = self._iterator_stats.get(id(iterator))
+        if stats is None:
+            stats = self._iterator_stats[id(iterator)] = IteratorTickStats(self.iterator_name(iterator),
+                                                                           self._tick_size,
+                                                                           self._window_size)
+        stats.record(duration)
+
+    def record_tick(self, duration: float):
+        self._tick_stats.record(duration)
+
+    def record_skipped_ticks(self, count: int):
+        self._skipped_tick_count += count
+
+    def remove_iterator(self, iterator):
+        self._iterator_stats.pop(id(iterator), None)
+
+    def slowest_iterator(self) -> Optional[IteratorTickStats]:
+        """
+        :return: the iterator that took the longest on the last tick
+        """
+        if len(self._iterator_stats) == 0:
+            return None
+        return max(self._iterator_stats.values(), key=lambda s: s.last_duration)
+
+    def format_status(self) -> str:
+        lines: List[str] = [f"  Clock ticks: {self.tick_count}, overruns: {self.overrun_count}, "
+                            f"skipped: {self.skipped_tick_count} (tick size {self._tick_size}s)",
+                            f"    {'Iterator':<30} {'Ticks':>8} {'p50 ms':>9} {'p99 ms':>9} {'Max ms':>9} "
+                            f"{'Overruns':>8}"]
+        for stats in self.iterator_stats + [self._tick_stats]:
+            lines.append(f"    {stats.name:<30} {stats.tick_count:>8} {stats.p50 * 1e3:>9.3f} "
+                         f"{stats.p99 * 1e3:>9.3f} {stats.max_duration * 1e3:>9.3f} {stats.overrun_count:>8}")
+        return "\n".join(lines)
@@ -168,12 +168,56 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self, depth: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the order book straight from the C++ books, without creating a Python object per entry.
+        :param depth: number of price levels from the top of each side, all of them if negative
+        :return: bids and asks arrays with 3 columns, [price, amount, update_id], best prices first
+        """
+        return self.c_entries_to_numpy(True, depth, False), self.c_entries_to_numpy(False, depth, False)
+
+    def cumulative_depth(self, is_buy: bool, depth: int = -1) -> np.ndarray:
+        """
+        :param is_buy: True for the asks, the side a buy order takes from, False for the bids
+        :param depth: number of price levels from the top of the book, all of them if negative
+        :return: an array with 3 columns, [price, amount, cumulative amount], best prices first
+        """
+        return self.c_entries_to_numpy(not is_buy, depth, True)
+
+    cdef np.ndarray c_entries_to_numpy(self, bint is_bid, int64_t depth, bint cumulative):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            int64_t size = deref(book).size()
+            int64_t rows = size if depth < 0 else min(depth, size)
+            np.ndarray[np.float64_t, ndim=2] result = np.empty((rows, 3), dtype=np.float64)
+            double[:, :] values = result
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+            double cumulative_amount = 0
+            int64_t i
+
+        for i in range(rows):
+            if is_bid:
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            else:
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            values[i, 0] = entry.getPrice()
+            values[i, 1] = entry.getAmount()
+            if cumulative:
+                cumulative_amount += entry.getAmount()
+                values[i, 2] = cumulative_amount
+            else:
+                values[i, 2] = entry.getUpdateId()
+        return result
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -223,13 +267,14 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>(bids_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>(asks_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -250,13 +295,14 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>(bids_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>(asks_array[i, 2])))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -337,36 +383,74 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+        while True:
+            if is_buy:
+                if ask_iterator == self._ask_book.end():
                     break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            else:
+                if bid_iterator == self._bid_book.rend():
                     break
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+            if total_volume >= volume:
+                total_cost -= entry.getAmount() * entry.getPrice()
+                total_volume -= entry.getAmount()
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * entry.getPrice()
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
+    cdef np.ndarray c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            np.ndarray[np.int64_t, ndim=1] order = np.argsort(volumes, kind="stable").astype(np.int64)
+            np.ndarray[np.float64_t, ndim=1] result = np.full(len(volumes), NaN, dtype=np.float64)
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+            double total_cost = 0
+            double total_volume = 0
+            double volume
+            int64_t index = 0
+            int64_t count = len(volumes)
+
+        # Volumes of 0 or less have no VWAP.
+        while index < count and volumes[order[index]] <= 0:
+            index += 1
+        # Walk the book once, answering the volumes from the smallest, each one is filled at the first level where the
+        # cumulative volume reaches it.
+        while index < count:
+            if is_buy:
+                if ask_iterator == self._ask_book.end():
+                    break
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            else:
+                if bid_iterator == self._bid_book.rend():
+                    break
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            while index < count and total_volume + entry.getAmount() >= volumes[order[index]]:
+                volume = volumes[order[index]]
+                result[order[index]] = (total_cost + (volume - total_volume) * entry.getPrice()) / volume
+                index += 1
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+        return result
+
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
             double cumulative_volume = 0
@@ -460,6 +544,13 @@ cdef class OrderBook(PubSub):
     def get_vwap_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_vwap_for_volume(is_buy, volume)
 
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> np.ndarray:
+        """
+        Same as get_vwap_for_volume for several volumes at once, in a single walk of the book.
+        :return: the VWAP of each volume, NaN where the book is not deep enough
+        """
+        return self.c_get_vwap_for_volumes(is_buy, np.asarray(volumes, dtype=np.float64))
+
     def get_price_for_quote_volume(self, is_buy: bool, quote_volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_quote_volume(is_buy, quote_volume)
 
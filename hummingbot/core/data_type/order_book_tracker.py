@@ -10,17 +10,22 @@ from typing import (
     Dict,
     Deque,
     Optional,
+    Set,
     Tuple,
     List)
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
@@ -32,8 +37,42 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookQueueStats:
+    """
+    Backlog of the message queue of one tracked order book: how many messages were waiting each time the tracking loop
+    drained it and how old the oldest of them was, from the message timestamps.
+    """
+    def __init__(self):
+        self.diff_count: int = 0
+        self.batch_count: int = 0
+        self.last_queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+    @property
+    def average_batch_size(self) -> float:
+        return self.diff_count / self.batch_count if self.batch_count > 0 else 0.0
+
+    def record_batch(self, queue_depth: int, diff_count: int, lag: float):
+        self.batch_count += 1
+        self.diff_count += diff_count
+        self.last_queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Most messages taken off a tracking queue at once, the diffs among them are applied to the order book together.
+    MAX_DIFF_BATCH_SIZE: int = 1000
+    # Number of order book snapshots fetched at the same time on start, the requests are still subject to the data
+    # source throttler. 0 fetches them one at a time with a pause in between.
+    INIT_ORDER_BOOK_CONCURRENCY: int = 0
+    INIT_ORDER_BOOK_RETRY_INTERVAL: float = 5.0
+    # Diff messages kept for each order book that is not initialized yet, replayed once its snapshot is loaded.
+    PENDING_DIFF_WINDOW_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -47,10 +86,16 @@ class OrderBookTracker(ABC):
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = {
+            trading_pair: asyncio.Event() for trading_pair in trading_pairs or []
+        }
+        self._required_trading_pairs: Optional[Set[str]] = None
+        self._pending_diff_messages: Dict[str, Deque[OrderBookMessage]] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._queue_stats: Dict[str, OrderBookQueueStats] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -73,9 +118,42 @@ class OrderBookTracker(ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def queue_stats(self) -> Dict[str, OrderBookQueueStats]:
+        return self._queue_stats
+
     @property
     def ready(self) -> bool:
-        return self._order_books_initialized.is_set()
+        """
+        :return: True once the order books of the required trading pairs are loaded, all of them by default
+        """
+        if self._order_books_initialized.is_set():
+            return True
+        return self._required_trading_pairs is not None and \
+            all(self.is_order_book_ready(trading_pair) for trading_pair in self._required_trading_pairs)
+
+    @property
+    def required_trading_pairs(self) -> List[str]:
+        return list(self._required_trading_pairs) if self._required_trading_pairs is not None else self._trading_pairs
+
+    @required_trading_pairs.setter
+    def required_trading_pairs(self, trading_pairs: Optional[List[str]]):
+        """
+        Lets the tracker report ready once the given order books are loaded, so a strategy can start trading on them
+        while the rest are still initializing. None waits for all of them again.
+        """
+        self._required_trading_pairs = set(trading_pairs) if trading_pairs is not None else None
+
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        event: Optional[asyncio.Event] = self._order_book_ready_events.get(trading_pair)
+        return event is not None and event.is_set()
+
+    async def wait_for_order_books(self, trading_pairs: List[str]):
+        await safe_gather(*[self._order_book_ready_events[trading_pair].wait() for trading_pair in trading_pairs])
 
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
@@ -142,13 +220,15 @@ class OrderBookTracker(ABC):
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
+        self._pending_diff_messages.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
         fall-back mechanism for when the web socket update channel fails.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
@@ -174,15 +254,61 @@ class OrderBookTracker(ABC):
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        for trading_pair in self._trading_pairs:
+            self._pending_diff_messages[trading_pair] = deque(maxlen=self.PENDING_DIFF_WINDOW_SIZE)
+        if self.INIT_ORDER_BOOK_CONCURRENCY > 0:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                await self._init_order_book(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await asyncio.sleep(1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.INIT_ORDER_BOOK_CONCURRENCY)
+        completed: List[str] = []
+
+        async def init_order_book(trading_pair: str):
+            async with semaphore:
+                while True:
+                    try:
+                        await self._init_order_book(trading_pair)
+                        break
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().network(
+                            f"Error fetching the order book snapshot for {trading_pair}.",
+                            exc_info=True,
+                            app_warning_msg=f"Error fetching the order book snapshot for {trading_pair}. "
+                                            f"Retrying after {self.INIT_ORDER_BOOK_RETRY_INTERVAL:.0f} seconds."
+                        )
+                        await asyncio.sleep(self.INIT_ORDER_BOOK_RETRY_INTERVAL)
+            completed.append(trading_pair)
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{len(completed)}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
+
+    async def _init_order_book(self, trading_pair: str):
+        """
+        Loads the order book snapshot of one trading pair and starts tracking it, the diffs received while the snapshot
+        was being fetched are replayed on top of it.
+        """
+        order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+        self._order_books[trading_pair] = order_book
+        message_queue: asyncio.Queue = asyncio.Queue()
+        for message in self._pending_diff_messages.pop(trading_pair, []):
+            if message.update_id >= order_book.snapshot_uid:
+                message_queue.put_nowait(message)
+        self._tracking_message_queues[trading_pair] = message_queue
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        if trading_pair not in self._order_book_ready_events:
+            self._order_book_ready_events[trading_pair] = asyncio.Event()
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -190,14 +316,17 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    # Keep the diffs of order books still being initialized, the rest are not tracked.
+                    if trading_pair in self._pending_diff_messages:
+                        self._pending_diff_messages[trading_pair].append(ob_message)
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -227,7 +356,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -242,8 +370,64 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    async def _next_message_batch(self, trading_pair: str, message_queue: asyncio.Queue) -> List[OrderBookMessage]:
+        """
+        Waits for the next message of an order book and takes the ones queued behind it as well, up to
+        MAX_DIFF_BATCH_SIZE, recording the queue depth and lag of the batch.
+        """
+        messages: List[OrderBookMessage] = [await message_queue.get()]
+        queue_depth: int = message_queue.qsize() + 1
+        while len(messages) < self.MAX_DIFF_BATCH_SIZE and not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+        diff_count: int = sum(1 for message in messages if message.type is OrderBookMessageType.DIFF)
+        lag: float = max(0.0, time.time() - messages[0].timestamp) if messages[0].timestamp else 0.0
+        if trading_pair not in self._queue_stats:
+            self._queue_stats[trading_pair] = OrderBookQueueStats()
+        self._queue_stats[trading_pair].record_batch(queue_depth, diff_count, lag)
+        return messages
+
+    @staticmethod
+    def coalesce_diff_rows(diff_rows: List[Tuple[List[OrderBookRow], List[OrderBookRow]]]
+                           ) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Merges consecutive order book diffs into one, the last row received for a price wins.
+        :param diff_rows: (bids, asks) of each diff, oldest first
+        :return: the merged (bids, asks)
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for diff_bids, diff_asks in diff_rows:
+            for row in diff_bids:
+                bids[row.price] = row
+            for row in diff_asks:
+                asks[row.price] = row
+        return list(bids.values()), list(asks.values())
+
+    def _diff_message_rows(self, trading_pair: str,
+                           message: OrderBookMessage) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        return message.bids, message.asks
+
+    def _apply_diff_messages(self,
+                             trading_pair: str,
+                             order_book: OrderBook,
+                             messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage]):
+        """
+        Applies consecutive diff messages to an order book as a single diff, each message is still kept in the past
+        diffs window for snapshot replays.
+        """
+        if len(messages) == 0:
+            return
+        if len(messages) == 1:
+            bids, asks = self._diff_message_rows(trading_pair, messages[0])
+        else:
+            bids, asks = self.coalesce_diff_rows([self._diff_message_rows(trading_pair, message)
+                                                  for message in messages])
+        order_book.apply_diffs(bids, asks, messages[-1].update_id)
+        past_diffs_window.extend(messages)
+
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -253,24 +437,29 @@ class OrderBookTracker(ABC):
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                messages: List[OrderBookMessage] = await self._next_message_batch(trading_pair, message_queue)
+                diff_messages: List[OrderBookMessage] = []
+                for message in messages:
+                    if message.type is OrderBookMessageType.DIFF:
+                        diff_messages.append(message)
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+                        diff_messages_accepted += len(diff_messages)
+                        diff_messages = []
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                        self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window)
+                diff_messages_accepted += len(diff_messages)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    stats: OrderBookQueueStats = self._queue_stats[trading_pair]
+                    self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}, "
+                                        f"queue depth: {stats.max_queue_depth}, lag: {stats.max_lag:.3f}s.")
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -281,7 +470,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+from bisect import bisect_right
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from hummingbot.core.event.event_listener import EventListener
+
+NaN = float("nan")
+
+
+class _EventIndex:
+    """
+    Events in arrival order along with a non decreasing time key for each (the largest timestamp so far), so that
+    the events after a timestamp are found by bisection even when some events arrive out of order.
+    Evicted events are skipped by an offset and compacted away once they make up half of the lists.
+    """
+    __slots__ = ("keys", "events", "start")
+
+    def __init__(self):
+        self.keys: List[float] = []
+        self.events: List[Any] = []
+        self.start: int = 0
+
+    def __len__(self) -> int:
+        return len(self.events) - self.start
+
+    def append(self, key: float, event: Any):
+        self.keys.append(key)
+        self.events.append(event)
+
+    def first_key(self) -> float:
+        return self.keys[self.start]
+
+    def pop_first(self) -> Any:
+        event = self.events[self.start]
+        self.events[self.start] = None
+        self.start += 1
+        if self.start >= 1024 and self.start * 2 >= len(self.events):
+            del self.keys[:self.start]
+            del self.events[:self.start]
+            self.start = 0
+        return event
+
+    def iter_since(self, timestamp: Optional[float]) -> Iterator[Any]:
+        if timestamp is None:
+            yield from self.events[self.start:]
+            return
+        position = bisect_right(self.keys, timestamp, self.start)
+        for event in self.events[position:]:
+            if getattr(event, "timestamp", NaN) > timestamp:
+                yield event
+
+
+class EventJournal(EventListener):
+    """
+    Logs the events of a connector like EventLogger, indexed by event type and by trading pair and ordered by time,
+    keeping at most max_events events, none older than max_age seconds before the latest one. Evicted events are
+    passed on to spill if given.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_events: Optional[int] = None,
+                 max_age: Optional[float] = None,
+                 spill: Optional[Callable[[Any], None]] = None):
+        super().__init__()
+        self._event_source = event_source
+        self._max_events = max_events
+        self._max_age = max_age
+        self._spill = spill
+        self._events: _EventIndex = _EventIndex()
+        self._events_by_type: Dict[type, _EventIndex] = {}
+        self._events_by_trading_pair: Dict[str, _EventIndex] = {}
+        self._last_key: float = 0.0
+        self._evicted_count: int = 0
+
+    def __call__(self, event_object):
+        self.add(event_object)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def event_source(self) -> str:
+        return self._event_source
+
+    @property
+    def evicted_count(self) -> int:
+        return self._evicted_count
+
+    @property
+    def event_log(self) -> List[Any]:
+        return self._events.events[self._events.start:]
+
+    def add(self, event_object: Any):
+        timestamp = getattr(event_object, "timestamp", NaN)
+        if timestamp > self._last_key:
+            self._last_key = timestamp
+        key = self._last_key
+        self._events.append(key, event_object)
+        event_type = type(event_object)
+        type_index = self._events_by_type.get(event_type)
+        if type_index is None:
+            type_index = self._events_by_type[event_type] = _EventIndex()
+        type_index.append(key, event_object)
+        trading_pair = getattr(event_object, "trading_pair", None)
+        if trading_pair is not None:
+            pair_index = self._events_by_trading_pair.get(trading_pair)
+            if pair_index is None:
+                pair_index = self._events_by_trading_pair[trading_pair] = _EventIndex()
+            pair_index.append(key, event_object)
+        if self._max_events is not None:
+            while len(self._events) > self._max_events:
+                self._evict_first()
+        if self._max_age is not None:
+            while self._events.first_key() < key - self._max_age:
+                self._evict_first()
+
+    def iter_events(self,
+                    event_type: Optional[type] = None,
+                    trading_pair: Optional[str] = None,
+                    since: Optional[float] = None) -> Iterator[Any]:
+        """
+        Iterates over the logged events in arrival order, the events are not copied.
+        :param event_type: only the events of this class
+        :param trading_pair: only the events of this trading pair
+        :param since: only the events with a timestamp after this one
+        """
+        if event_type is not None:
+            index = self._events_by_type.get(event_type)
+        elif trading_pair is not None:
+            index = self._events_by_trading_pair.get(trading_pair)
+        else:
+            index = self._events
+        if index is None:
+            return
+        for event in index.iter_since(since):
+            if event_type is not None and trading_pair is not None and \
+                    getattr(event, "trading_pair", None) != trading_pair:
+                continue
+            yield event
+
+    def clear(self):
+        self._events = _EventIndex()
+        self._events_by_type.clear()
+        self._events_by_trading_pair.clear()
+
+    def _evict_first(self):
+        event = self._events.pop_first()
+        # The oldest event is also the first of its indexes.
+        self._events_by_type[type(event)].pop_first()
+        trading_pair = getattr(event, "trading_pair", None)
+        if trading_pair is not None:
+            self._events_by_trading_pair[trading_pair].pop_first()
+        self._evicted_count += 1
+        if self._spill is not None:
+            self._spill(event)
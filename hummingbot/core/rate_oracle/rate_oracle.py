@@ -15,6 +15,7 @@ from hummingbot.connector.exchange.binance.binance_utils import convert_from_exc
     binance_convert_from_exchange_pair
 from hummingbot.core.rate_oracle.utils import find_rate
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_pool import HTTPClientPool
 from hummingbot.core.utils import async_ttl_cache
 
 
@@ -39,7 +40,6 @@ class RateOracle(NetworkBase):
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -69,10 +69,11 @@ class RateOracle(NetworkBase):
         self._ready_event = asyncio.Event()
 
     @classmethod
-    async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+    async def _http_client(cls, url: str) -> aiohttp.ClientSession:
+        """
+        :returns The pooled client session of the URL's host
+        """
+        return HTTPClientPool.get_instance().get_session(url)
 
     async def get_ready(self):
         """
@@ -197,7 +198,7 @@ class RateOracle(NetworkBase):
         :return A dictionary of trading pairs and prices
         """
         results = {}
-        client = await cls._http_client()
+        client = await cls._http_client(url)
         async with client.request("GET", url) as resp:
             records = await resp.json()
             for record in records:
@@ -223,7 +224,7 @@ class RateOracle(NetworkBase):
         """
         results = {}
         if not cls._cgecko_supported_vs_tokens:
-            client = await cls._http_client()
+            client = await cls._http_client(cls.coingecko_supported_vs_tokens_url)
             async with client.request("GET", cls.coingecko_supported_vs_tokens_url) as resp:
                 records = await resp.json()
                 cls._cgecko_supported_vs_tokens = records
@@ -250,8 +251,9 @@ class RateOracle(NetworkBase):
         :return A dictionary of trading pairs and prices (250 results max)
         """
         results = {}
-        client = await cls._http_client()
-        async with client.request("GET", cls.coingecko_usd_price_url.format(vs_currency, page_no)) as resp:
+        url = cls.coingecko_usd_price_url.format(vs_currency, page_no)
+        client = await cls._http_client(url)
+        async with client.request("GET", url) as resp:
             records = await resp.json()
             for record in records:
                 pair = f'{record["symbol"].upper()}-{vs_currency.upper()}'
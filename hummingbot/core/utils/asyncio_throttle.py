@@ -1,11 +1,14 @@
 import logging
-import time
 import asyncio
 from collections import deque
 from typing import (
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
     Optional,
+    Set,
     Tuple,
-    Deque
 )
 
 RequestWeight = int
@@ -13,32 +16,74 @@ Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+GLOBAL_LIMIT_ID = "global"
 
-class Throttler:
-    def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
-                 period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+
+class RateLimit(NamedTuple):
+    """
+    A weight limit over a sliding time window, e.g. RateLimit("orders", 10, 1.0) allows a total weight of 10 on the
+    "orders" pool per second.
+    """
+    limit_id: str
+    limit: RequestWeight
+    time_interval: Seconds
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the weights admitted for one rate limit, with a running total so capacity checks do not have
+    to re-sum the task logs.
+    """
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self._rate_limit: RateLimit = rate_limit
+        self._expiry: Seconds = rate_limit.time_interval - period_safety_margin
+        self._task_logs: Deque[TaskLog] = deque()
+        self._weight: RequestWeight = 0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def current_weight(self) -> RequestWeight:
+        return self._weight
+
+    def flush(self, now: Timestamp_s):
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        Remove task logs that have passed the rate limit period
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        while self._task_logs and now - self._task_logs[0][0] >= self._expiry:
+            _, weight = self._task_logs.popleft()
+            self._weight -= weight
 
-    def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+    def has_capacity(self, request_weight: RequestWeight) -> bool:
+        # A request heavier than the limit itself is let through on an empty window rather than blocking forever.
+        return self._weight + request_weight <= self._rate_limit.limit or self._weight == 0
 
+    def add(self, now: Timestamp_s, request_weight: RequestWeight):
+        self._task_logs.append((now, request_weight))
+        self._weight += request_weight
 
-class ThrottlerContextManager:
+    def available_at(self, request_weight: RequestWeight) -> Timestamp_s:
+        """
+        :return: the earliest time at which enough weight will have expired to admit request_weight
+        """
+        excess: RequestWeight = self._weight + request_weight - self._rate_limit.limit
+        for task_ts, weight in self._task_logs:
+            excess -= weight
+            if excess <= 0:
+                return task_ts + self._expiry
+        # The request is heavier than the limit itself, it can only go through on an empty window.
+        return self._task_logs[-1][0] + self._expiry if self._task_logs else 0.0
+
+
+class _Waiter(NamedTuple):
+    future: asyncio.Future
+    request_weight: RequestWeight
+    windows: List[RateLimitWindow]
+
+
+class Throttler:
     throttler_logger: Optional[logging.Logger] = None
 
     @classmethod
@@ -48,54 +93,142 @@ class ThrottlerContextManager:
         return cls.throttler_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
+                 rate_limit: Tuple[RequestWeight, Seconds],
                  period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 rate_limits: Optional[List[RateLimit]] = None):
         """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
+        :param rate_limit: Max weight allowed in the given period, applied to every task
         :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Unused, waiters are woken up when capacity frees instead of polling
+        :param rate_limits: Additional per-endpoint weight pools, selected with the limit_ids of weighted_task
         """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
+        self._period_safety_margin: Seconds = period_safety_margin
+        self._windows: Dict[str, RateLimitWindow] = {}
+        for limit in [RateLimit(GLOBAL_LIMIT_ID, rate_limit[0], rate_limit[1])] + (rate_limits or []):
+            self._windows[limit.limit_id] = RateLimitWindow(limit, period_safety_margin)
+        self._waiters: Deque[_Waiter] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._wakeup_count: int = 0
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [window.rate_limit for window in self._windows.values()]
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def wakeup_count(self) -> int:
+        """
+        :return: the number of times the waiter queue has been woken up by its timer
+        """
+        return self._wakeup_count
+
+    def current_weight(self, limit_id: str = GLOBAL_LIMIT_ID) -> RequestWeight:
+        window: RateLimitWindow = self._windows[limit_id]
+        window.flush(asyncio.get_event_loop().time())
+        return window.current_weight
 
-    def flush(self):
+    def weighted_task(self,
+                      request_weight: RequestWeight,
+                      limit_ids: Optional[List[str]] = None):
+        """
+        :param request_weight: Weight of the request, counted against every selected limit
+        :param limit_ids: Per-endpoint pools the request is counted against on top of the global limit
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        windows: List[RateLimitWindow] = [self._windows[GLOBAL_LIMIT_ID]]
+        for limit_id in limit_ids or []:
+            if limit_id not in self._windows:
+                raise ValueError(f"Unknown rate limit id '{limit_id}'.")
+            if limit_id != GLOBAL_LIMIT_ID:
+                windows.append(self._windows[limit_id])
+        return ThrottlerContextManager(throttler=self, request_weight=request_weight, windows=windows)
+
+    async def acquire(self, request_weight: RequestWeight, windows: List[RateLimitWindow]):
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        now: Timestamp_s = loop.time()
+        for window in windows:
+            window.flush(now)
+        if not self._waiters and all(window.has_capacity(request_weight) for window in windows):
+            for window in windows:
+                window.add(now, request_weight)
+            return
+        waiter: _Waiter = _Waiter(loop.create_future(), request_weight, windows)
+        self._waiters.append(waiter)
+        self._process_waiters()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._process_waiters()
+            raise
+
+    def _process_waiters(self):
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
+        Admits queued tasks in FIFO order while there is capacity, then schedules a single timer for when the first
+        blocked task can go through. A task only overtakes an earlier one if it does not need any of the limits the
+        earlier one is blocked on.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        now: Timestamp_s = loop.time()
+        for window in self._windows.values():
+            window.flush(now)
+        blocked: Set[str] = set()
+        next_wakeup: Optional[Timestamp_s] = None
+        for waiter in self._waiters:
+            if waiter.future.done():
+                continue
+            exhausted: List[RateLimitWindow] = [window for window in waiter.windows
+                                                if window.rate_limit.limit_id in blocked or
+                                                not window.has_capacity(waiter.request_weight)]
+            if exhausted:
+                for window in exhausted:
+                    if window.rate_limit.limit_id not in blocked:
+                        blocked.add(window.rate_limit.limit_id)
+                        available_at: Timestamp_s = window.available_at(waiter.request_weight)
+                        next_wakeup = available_at if next_wakeup is None else min(next_wakeup, available_at)
+                if GLOBAL_LIMIT_ID in blocked:
+                    # Every task counts against the global limit, nothing behind this one can go through.
+                    break
+                continue
+            for window in waiter.windows:
+                window.add(now, waiter.request_weight)
+            waiter.future.set_result(None)
+        self._waiters = deque(waiter for waiter in self._waiters if not waiter.future.done())
+        if self._waiters and next_wakeup is not None:
+            self._timer = loop.call_at(max(next_wakeup, now), self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._wakeup_count += 1
+        self._process_waiters()
+
+
+class ThrottlerContextManager:
+    def __init__(self,
+                 throttler: Throttler,
+                 request_weight: RequestWeight,
+                 windows: List[RateLimitWindow]):
+        """
+        :param throttler: The throttler the task is admitted by
+        :param request_weight: Weight of the request of the added task
+        :param windows: The rate limit windows the request is counted against
+        """
+        self._throttler: Throttler = throttler
+        self._request_weight: RequestWeight = request_weight
+        self._windows: List[RateLimitWindow] = windows
 
     async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        await self._throttler.acquire(self._request_weight, self._windows)
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self.acquire()
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
@@ -103,6 +236,7 @@ class ThrottlerContextManager:
 
 # Dev only
 if __name__ == "__main__":
+    import time
 
     throttler = Throttler(rate_limit=(20, 1.0))
 
@@ -0,0 +1,275 @@
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+import aiohttp
+
+HostKey = Tuple[str, str, int]
+
+# Path segments of object ids (order ids, uuids) are folded into one endpoint so the histograms stay per endpoint.
+ID_SEGMENT_PATTERN = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$")
+
+
+class HTTPClientPoolConfig(NamedTuple):
+    """
+    Connection settings of the pooled session of one host.
+    limit: Connections open at the same time to the host, requests above it wait for a free connection
+    keepalive_timeout: Seconds an idle connection is kept open for the next request
+    ttl_dns_cache: Seconds a resolved host address is reused, None caches it forever
+    request_timeout: Seconds for a whole request unless the request sets its own timeout
+    connect_timeout: Seconds to open a new connection (TLS handshake included)
+    """
+    limit: int = 20
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: Optional[int] = 300
+    request_timeout: float = 300.0
+    connect_timeout: float = 30.0
+
+
+class LatencyHistogram:
+    """
+    Request latencies in fixed buckets, from the request being sent until the response headers are received.
+    """
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, float("inf"))
+
+    def __init__(self):
+        self._counts: List[int] = [0] * len(self.BUCKET_BOUNDS_MS)
+        self._count: int = 0
+        self._total_ms: float = 0.0
+        self._max_ms: float = 0.0
+        self._errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def errors(self) -> int:
+        return self._errors
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._count if self._count else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    def add(self, latency_ms: float):
+        self._counts[bisect_left(self.BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def add_error(self):
+        self._errors += 1
+
+    def percentile(self, pct: float) -> float:
+        """
+        :returns The upper bound of the bucket the percentile falls in, capped at the max latency seen.
+        """
+        if self._count == 0:
+            return 0.0
+        rank = pct / 100 * self._count
+        seen = 0
+        for bound, count in zip(self.BUCKET_BOUNDS_MS, self._counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self._max_ms)
+        return self._max_ms
+
+    def buckets(self) -> Dict[float, int]:
+        return {bound: count for bound, count in zip(self.BUCKET_BOUNDS_MS, self._counts) if count}
+
+
+class HostConnectionStats:
+    """
+    Connections and request latencies of the pooled session of one host.
+    """
+    def __init__(self):
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, endpoint: str) -> LatencyHistogram:
+        histogram = self.histograms.get(endpoint)
+        if histogram is None:
+            histogram = self.histograms[endpoint] = LatencyHistogram()
+        return histogram
+
+
+class HTTPClientPool:
+    """
+    Shared aiohttp sessions, one per host, so that the connectors, their data sources and the rate oracle reuse the
+    same kept alive connections (and TLS sessions) to a host instead of each opening their own. The connection limit,
+    keep-alive and DNS cache of each host's connector are set by its HTTPClientPoolConfig.
+    The sessions are owned by the pool, users must not close them.
+    """
+    _shared_instance: Optional["HTTPClientPool"] = None
+
+    @classmethod
+    def get_instance(cls) -> "HTTPClientPool":
+        if cls._shared_instance is None:
+            cls._shared_instance = HTTPClientPool()
+        return cls._shared_instance
+
+    def __init__(self, default_config: HTTPClientPoolConfig = HTTPClientPoolConfig()):
+        self._default_config: HTTPClientPoolConfig = default_config
+        self._host_configs: Dict[str, HTTPClientPoolConfig] = {}
+        self._sessions: Dict[HostKey, aiohttp.ClientSession] = {}
+        self._stats: Dict[HostKey, HostConnectionStats] = {}
+
+    @staticmethod
+    def host_key(url: str) -> HostKey:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme in ("https", "wss") else 80)
+        return scheme, (parts.hostname or "").lower(), port
+
+    @staticmethod
+    def endpoint_name(method: str, url: str) -> str:
+        path = urlsplit(url).path
+        segments = ["{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/")]
+        return f"{method.upper()} {'/'.join(segments) or '/'}"
+
+    def configure(self, host: str, config: HTTPClientPoolConfig):
+        """
+        Sets the connection settings of a host, an open session of the host keeps its settings until it is closed.
+        """
+        self._host_configs[host.lower()] = config
+
+    def config(self, host: str) -> HTTPClientPoolConfig:
+        return self._host_configs.get(host.lower(), self._default_config)
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        :param url: Any URL on the host
+        :returns The pooled session of the URL's host
+        """
+        key = self.host_key(url)
+        session = self._sessions.get(key)
+        # A session is bound to the event loop it was created on.
+        if session is None or session.closed or getattr(session, "_loop", None) is not asyncio.get_event_loop():
+            if session is not None and not session.closed:
+                self._close_stale_session(session)
+            session = self._sessions[key] = self._create_session(key)
+        return session
+
+    @staticmethod
+    def _close_stale_session(session: aiohttp.ClientSession):
+        """
+        Closes the connections of a session of another event loop, which cannot be awaited on the current one.
+        """
+        try:
+            # The synchronous part of BaseConnector.close, which marks the connector (and so the session) closed
+            session.connector._close()
+        except RuntimeError:
+            # The transports of a closed event loop cannot be closed, they are gone with it.
+            pass
+
+    def _create_session(self, key: HostKey) -> aiohttp.ClientSession:
+        config = self.config(key[1])
+        stats = self._stats.setdefault(key, HostConnectionStats())
+        connector = aiohttp.TCPConnector(limit=config.limit,
+                                         keepalive_timeout=config.keepalive_timeout,
+                                         use_dns_cache=True,
+                                         ttl_dns_cache=config.ttl_dns_cache)
+        timeout = aiohttp.ClientTimeout(total=config.request_timeout, sock_connect=config.connect_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     trace_configs=[self._trace_config(stats)])
+
+    @staticmethod
+    def _trace_config(stats: HostConnectionStats) -> aiohttp.TraceConfig:
+        # The trace context holds the start time of each request.
+        trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+
+        async def on_request_start(session, context, params: aiohttp.TraceRequestStartParams):
+            context.start = time.perf_counter()
+            # A request's callable trace_request_ctx is called as the request is sent.
+            if callable(context.trace_request_ctx):
+                context.trace_request_ctx()
+
+        async def on_request_end(session, context, params: aiohttp.TraceRequestEndParams):
+            endpoint = HTTPClientPool.endpoint_name(params.method, str(params.url))
+            stats.histogram(endpoint).add((time.perf_counter() - context.start) * 1e3)
+
+        async def on_request_exception(session, context, params: aiohttp.TraceRequestExceptionParams):
+            stats.histogram(HTTPClientPool.endpoint_name(params.method, str(params.url))).add_error()
+
+        async def on_connection_create_end(session, context, params):
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            stats.connections_reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :returns Per host, the active (in use) and idle (kept alive) connections of its open session, the connections
+        created and reused, and the latency histogram of each endpoint
+        """
+        results = {}
+        for key, stats in self._stats.items():
+            scheme, host, port = key
+            session = self._sessions.get(key)
+            active, idle = connection_counts(session.connector) if session is not None and not session.closed \
+                else (0, 0)
+            results[f"{scheme}://{host}:{port}"] = {
+                "active_connections": active,
+                "idle_connections": idle,
+                "connections_created": stats.connections_created,
+                "connections_reused": stats.connections_reused,
+                "endpoints": dict(stats.histograms),
+            }
+        return results
+
+    def format_stats(self) -> str:
+        lines = []
+        for host, host_stats in self.stats().items():
+            lines.append(f"  {host}: {host_stats['active_connections']} active, "
+                         f"{host_stats['idle_connections']} idle connections, "
+                         f"{host_stats['connections_created']} created, "
+                         f"{host_stats['connections_reused']} reused")
+            for endpoint, histogram in sorted(host_stats["endpoints"].items()):
+                lines.append(f"    {endpoint}: {histogram.count} requests, {histogram.errors} errors, "
+                             f"mean {histogram.mean_ms:.1f} ms, p50 {histogram.percentile(50):.0f} ms, "
+                             f"p99 {histogram.percentile(99):.0f} ms")
+        return "\n".join(lines)
+
+    def reset_stats(self):
+        for stats in self._stats.values():
+            stats.connections_created = stats.connections_reused = 0
+            stats.histograms.clear()
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
+def connection_counts(connector: aiohttp.BaseConnector) -> Tuple[int, int]:
+    """
+    :returns The connections of a connector in use and kept alive idle, aiohttp does not expose them publicly.
+    """
+    active = len(getattr(connector, "_acquired", ()))
+    idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+    return active, idle
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 import functools
 from sqlalchemy import (
     Column,
+    Index,
+    inspect,
 )
 
 
@@ -55,3 +57,26 @@ class DatabaseTransformation(ABC):
             logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
         else:
             engine.execute(query_to_execute)
+
+    @staticmethod
+    def index_names(engine, table_name):
+        return {index["name"] for index in inspect(engine).get_indexes(table_name)}
+
+    def add_index(self, engine, index: Index, dry_run=True):
+        if index.name in self.index_names(engine, index.table.name):
+            return
+        if dry_run:
+            logging.getLogger().info(f"Index to create in DB: {index.name}")
+        else:
+            index.create(bind=engine)
+
+    def drop_index(self, engine, table_name, index_name, dry_run=True):
+        if index_name not in self.index_names(engine, table_name):
+            return
+        query_to_execute = f'DROP INDEX \"{index_name}\"'
+        if engine.dialect.name == "mysql":
+            query_to_execute = f'DROP INDEX `{index_name}` ON `{table_name}`'
+        if dry_run:
+            logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
+        else:
+            engine.execute(query_to_execute)
@@ -1,5 +1,6 @@
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 from sqlalchemy import (
     Column,
     Text,
@@ -45,3 +46,23 @@ class AddLeverageAndPositionColumns(DatabaseTransformation):
     @property
     def to_version(self):
         return 20210119
+
+
+class AddTradeFillConfigTimestampMarketSymbolIndex(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        index = [i for i in TradeFill.__table__.indexes if i.name == "tf_config_timestamp_market_symbol_index"][0]
+        self.add_index(db_handle.engine, index, dry_run=False)
+        # A prefix of the new index
+        self.drop_index(db_handle.engine, "TradeFill", "tf_config_timestamp_index", dry_run=False)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddTradeFillConfigTimestampMarketSymbolIndex"
+
+    @property
+    def to_version(self):
+        return 20210401
@@ -5,6 +5,7 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
@@ -35,6 +36,7 @@ class SQLSessionWrapper:
             self._session.commit()
         else:
             self._session.rollback()
+        self._session.close()
 
 
 class SQLConnectionType(Enum):
@@ -46,7 +48,7 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20210119"
+    LOCAL_DB_VERSION_VALUE = "20210401"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -87,7 +89,9 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            engine: Engine = create_engine(f"{dialect}:///{db_path}")
+            event.listen(engine, "connect", cls._set_sqlite_pragmas)
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -97,6 +101,15 @@ class SQLConnectionManager:
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets the markets recorder writer thread commit while the main thread reads, and only syncs to disk at
+        # checkpoints instead of on every commit.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None,
@@ -4,8 +4,10 @@ import pandas as pd
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 from sqlalchemy import (
     Column,
@@ -15,21 +17,26 @@ from sqlalchemy import (
     Index,
     BigInteger,
     Float,
-    JSON
+    JSON,
+    cast,
+    func,
+    select,
 )
 from sqlalchemy.orm import (
     relationship,
     Session
 )
+from sqlalchemy.sql import Select
 from datetime import datetime
+import time
 
 from . import HummingbotBase
 
 
 class TradeFill(HummingbotBase):
     __tablename__ = "TradeFill"
-    __table_args__ = (Index("tf_config_timestamp_index",
-                            "config_file_path", "timestamp"),
+    __table_args__ = (Index("tf_config_timestamp_market_symbol_index",
+                            "config_file_path", "timestamp", "market", "symbol"),
                       Index("tf_market_trading_pair_timestamp_index",
                             "market", "symbol", "timestamp"),
                       Index("tf_market_base_asset_timestamp_index",
@@ -57,6 +64,10 @@ class TradeFill(HummingbotBase):
     position = Column(Text, nullable=True)
     order = relationship("Order", back_populates="trade_fills")
 
+    # The columns columns_to_pandas formats
+    DISPLAY_COLUMNS: List[str] = ["timestamp", "market", "symbol", "order_type", "trade_type", "price", "amount",
+                                  "leverage", "position", "order_id"]
+
     def __repr__(self) -> str:
         return f"TradeFill(id={self.id}, config_file_path='{self.config_file_path}', strategy='{self.strategy}', " \
             f"market='{self.market}', symbol='{self.symbol}', base_asset='{self.base_asset}', " \
@@ -103,6 +114,166 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @staticmethod
+    def _filter_select(query: Select,
+                       config_file_path: Optional[str],
+                       start_time: Optional[int],
+                       end_time: Optional[int],
+                       market: Optional[str] = None,
+                       trading_pair: Optional[str] = None) -> Select:
+        table = TradeFill.__table__
+        if config_file_path is not None:
+            query = query.where(table.c.config_file_path == config_file_path)
+        if start_time is not None:
+            query = query.where(table.c.timestamp >= start_time)
+        if end_time is not None:
+            query = query.where(table.c.timestamp <= end_time)
+        if market is not None:
+            query = query.where(table.c.market == market)
+        if trading_pair is not None:
+            query = query.where(table.c.symbol == trading_pair)
+        return query
+
+    @staticmethod
+    def iter_trade_columns(sql_session: Session,
+                           config_file_path: Optional[str] = None,
+                           start_time: Optional[int] = None,
+                           end_time: Optional[int] = None,
+                           market: Optional[str] = None,
+                           trading_pair: Optional[str] = None,
+                           columns: Optional[List[str]] = None,
+                           chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+        """
+        Reads the trade fills in timestamp order with a core select, chunk_size rows at a time, without creating a
+        TradeFill object per row. The config file path is matched exactly so the config and timestamp index is used.
+        :param columns: the column names to read, all by default
+        :returns DataFrames of at most chunk_size rows, one column per table column
+        """
+        table = TradeFill.__table__
+        columns = columns or [column.name for column in table.columns]
+        query: Select = TradeFill._filter_select(select([table.c[name] for name in columns]),
+                                                 config_file_path, start_time, end_time, market, trading_pair)
+        query = query.order_by(table.c.timestamp.asc(), table.c.id.asc())
+        result = sql_session.connection().execution_options(stream_results=True).execute(query)
+        try:
+            while True:
+                rows = result.fetchmany(chunk_size)
+                if len(rows) == 0:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=columns)
+        finally:
+            result.close()
+
+    @staticmethod
+    def get_trade_columns(sql_session: Session,
+                          config_file_path: Optional[str] = None,
+                          start_time: Optional[int] = None,
+                          end_time: Optional[int] = None,
+                          columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads all the trade fills with iter_trade_columns into one DataFrame.
+        """
+        columns = columns or [column.name for column in TradeFill.__table__.columns]
+        chunks: List[pd.DataFrame] = list(TradeFill.iter_trade_columns(sql_session, config_file_path, start_time,
+                                                                       end_time, columns=columns))
+        if len(chunks) == 0:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(chunks, ignore_index=True)
+
+    @staticmethod
+    def aggregate_trades(sql_session: Session,
+                         config_file_path: Optional[str] = None,
+                         start_time: Optional[int] = None,
+                         end_time: Optional[int] = None) -> pd.DataFrame:
+        """
+        Sums up the trade fills in the database, grouped by market, trading pair (symbol), trade type, position and
+        trade fee. The fee structure of a market rarely changes, so this comes to a few rows per market.
+        :returns a DataFrame with the market, symbol, trade_type, position and trade_fee (as JSON text) columns and
+        the num_trades, amount, quote_amount (sum of amount * price), first_timestamp and last_timestamp of each group
+        """
+        table = TradeFill.__table__
+        trade_fee = cast(table.c.trade_fee, Text)
+        query: Select = select([table.c.market,
+                                table.c.symbol,
+                                table.c.trade_type,
+                                table.c.position,
+                                trade_fee.label("trade_fee"),
+                                func.count().label("num_trades"),
+                                func.sum(table.c.amount).label("amount"),
+                                func.sum(table.c.amount * table.c.price).label("quote_amount"),
+                                func.min(table.c.timestamp).label("first_timestamp"),
+                                func.max(table.c.timestamp).label("last_timestamp")])
+        query = (TradeFill._filter_select(query, config_file_path, start_time, end_time)
+                 .group_by(table.c.market, table.c.symbol, table.c.trade_type, table.c.position, trade_fee))
+        result = sql_session.connection().execute(query)
+        return pd.DataFrame.from_records(result.fetchall(), columns=list(result.keys()))
+
+    @staticmethod
+    def get_first_and_last_prices(sql_session: Session,
+                                  market: str,
+                                  trading_pair: str,
+                                  config_file_path: Optional[str] = None,
+                                  start_time: Optional[int] = None,
+                                  end_time: Optional[int] = None) -> Optional[Tuple[float, float]]:
+        """
+        :returns the prices of the first and the last trade fill of a market and trading pair, None if it has none
+        """
+        table = TradeFill.__table__
+        query: Select = TradeFill._filter_select(select([table.c.price]), config_file_path, start_time, end_time,
+                                                 market, trading_pair)
+        prices: List[float] = []
+        for order in ((table.c.timestamp.asc(), table.c.id.asc()), (table.c.timestamp.desc(), table.c.id.desc())):
+            price: Optional[float] = sql_session.connection().execute(query.order_by(*order).limit(1)).scalar()
+            if price is None:
+                return None
+            prices.append(price)
+        return prices[0], prices[1]
+
+    @staticmethod
+    def _datetime_strings(seconds: numpy.ndarray, local_time: bool) -> pd.Series:
+        """
+        Formats epoch seconds as %Y-%m-%d %H:%M:%S, in local time if local_time. The UTC offset is looked up once per
+        quarter of an hour, time zones change their offsets on those.
+        """
+        seconds = numpy.asarray(seconds, dtype="int64")
+        if local_time and len(seconds) > 0:
+            quarters, inverse = numpy.unique(seconds // 900, return_inverse=True)
+            offsets = numpy.array([time.localtime(quarter * 900).tm_gmtoff for quarter in quarters.tolist()],
+                                  dtype="int64")
+            seconds = seconds + offsets[inverse]
+        strings = numpy.datetime_as_string(seconds.astype("datetime64[s]"))
+        return pd.Series(strings).str.replace("T", " ", regex=False)
+
+    @classmethod
+    def columns_to_pandas(cls, trades: pd.DataFrame) -> pd.DataFrame:
+        """
+        Formats trade fill columns, as read by get_trade_columns, the same way to_pandas formats TradeFill objects.
+        :param trades: the DISPLAY_COLUMNS of the trade fills at least
+        """
+        trade_timestamps: numpy.ndarray = trades["timestamp"].to_numpy(dtype="float64")
+        order_ids: pd.Series = trades["order_id"].astype(str)
+        # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
+        is_paper_order: numpy.ndarray = order_ids.str.contains("//", regex=False).to_numpy(dtype=bool)
+        order_timestamps: numpy.ndarray = pd.to_numeric(order_ids.str[-16:].where(~is_paper_order, "0"),
+                                                        errors="coerce").fillna(0).to_numpy(dtype="float64")
+        ages: numpy.ndarray = (trade_timestamps / 1e3 - order_timestamps / 1e6).astype("int64") % 86400
+        age_strs: pd.Series = cls._datetime_strings(ages, False).str[11:].where(~is_paper_order, "n/a")
+        df = pd.DataFrame({
+            "Index": numpy.arange(1, len(trades) + 1),
+            "Timestamp": cls._datetime_strings((trade_timestamps / 1e3).astype("int64"), True),
+            "Exchange": trades["market"].to_numpy(),
+            "Market": trades["symbol"].to_numpy(),
+            "Order_type": trades["order_type"].str.lower().to_numpy(),
+            "Side": trades["trade_type"].str.lower().to_numpy(),
+            "Price": trades["price"].to_numpy(),
+            "Amount": trades["amount"].to_numpy(),
+            "Leverage": trades["leverage"].to_numpy(),
+            "Position": trades["position"].to_numpy(),
+            "Age": age_strs.to_numpy(),
+        })
+        df.set_index('Index', inplace=True)
+        return df
+
     @classmethod
     def to_pandas(cls, trades: List):
         columns: List[str] = ["Index",
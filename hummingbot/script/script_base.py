@@ -1,11 +1,25 @@
 import asyncio
+import time
 import traceback
 from multiprocessing import Queue
 from typing import List, Optional, Dict, Any, Callable
 from decimal import Decimal
 from statistics import mean, median
 from operator import itemgetter
-from .script_interface import OnTick, OnStatus, PMMParameters, CallNotify, CallLog, PmmMarketInfo, ScriptError
+import numpy as np
+from .script_interface import (
+    OnTick,
+    OnTickProcessed,
+    OnStatus,
+    PMMParameters,
+    CallNotify,
+    CallLog,
+    PmmMarketInfo,
+    ScriptError,
+    apply_balance_changes,
+)
+from .script_queue import ScriptQueueReader
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
@@ -23,6 +37,9 @@ class ScriptBase:
         self._queue_check_interval: float = 0.0
         self.mid_prices: List[Decimal] = []
         self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
+        # The same mid prices as float64 for the fast_* helpers, created on the first price so a derived class can
+        # change max_mid_prices_length in its __init__.
+        self.mid_price_history: Optional[RingBuffer] = None
         self.pmm_parameters: PMMParameters = None
         self.pmm_market_info: PmmMarketInfo = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
@@ -34,6 +51,7 @@ class ScriptBase:
     def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
+        # No longer used for polling, the parent queue is read by a blocking reader.
         self._queue_check_interval = queue_check_interval
 
     @property
@@ -47,25 +65,22 @@ class ScriptBase:
         asyncio.ensure_future(self.listen_to_parent())
 
     async def listen_to_parent(self):
+        parent_queue_reader = ScriptQueueReader(self._parent_queue)
+        parent_queue_reader.start()
         while True:
             try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
+                item = await parent_queue_reader.get()
                 # print(f"child gets {str(item)}")
                 if item is None:
                     # print("child exiting..")
                     asyncio.get_event_loop().stop()
                     break
                 if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
-                    self.all_total_balances = item.all_total_balances
-                    self.all_available_balances = item.all_available_balances
+                    received_timestamp = time.time()
+                    self.add_mid_price(item.mid_price)
+                    self.apply_on_tick_changes(item)
                     self.on_tick()
+                    self._child_queue.put(OnTickProcessed(item.tick_id, item.timestamp, received_timestamp))
                 elif isinstance(item, BuyOrderCompletedEvent):
                     self.on_buy_order_completed(item)
                 elif isinstance(item, SellOrderCompletedEvent):
@@ -83,6 +98,30 @@ class ScriptBase:
                 tb = "".join(traceback.TracebackException.from_exception(e).format())
                 self._child_queue.put(ScriptError(e, tb))
 
+    def apply_on_tick_changes(self, on_tick: OnTick):
+        """
+        Updates the strategy parameters and the balances with the changes sent on the tick.
+        """
+        if self.pmm_parameters is None:
+            self.pmm_parameters = PMMParameters()
+        for name, value in on_tick.pmm_parameter_changes.items():
+            # Set the underlying attribute, going through the StrategyParameter would send the value back.
+            setattr(self.pmm_parameters, "_" + name, value)
+        if self.all_total_balances is None:
+            self.all_total_balances = {}
+        if self.all_available_balances is None:
+            self.all_available_balances = {}
+        apply_balance_changes(self.all_total_balances, on_tick.total_balance_changes)
+        apply_balance_changes(self.all_available_balances, on_tick.available_balance_changes)
+
+    def add_mid_price(self, mid_price: Decimal):
+        self.mid_prices.append(mid_price)
+        if len(self.mid_prices) > self.max_mid_prices_length:
+            del self.mid_prices[:len(self.mid_prices) - self.max_mid_prices_length]
+        if self.mid_price_history is None:
+            self.mid_price_history = RingBuffer(self.max_mid_prices_length)
+        self.mid_price_history.add_value(float(mid_price))
+
     def notify(self, msg: str):
         """
         Notifies the user, the message will appear on top left panel of HB application.
@@ -155,6 +194,71 @@ class ScriptBase:
             changes.append(max(samples[index], samples[index - 1]) / min(samples[index], samples[index - 1]) - 1)
         return locate_function(changes)
 
+    def mid_price_samples(self, interval: int, length: int) -> Optional[np.ndarray]:
+        """
+        Takes samples out of the mid price history the same way take_samples does, as a read only float64 view into
+        the history rather than a copy. The view is only valid until the next mid price is added.
+        :param interval: The interval (in seconds) in which to sample the mid prices.
+        :param length: The number of the samples.
+        :returns None if there is not enough samples, otherwise the samples, the most recent last.
+        """
+        if self.mid_price_history is None:
+            return None
+        prices = self.mid_price_history.get_as_numpy_view()
+        if len(prices) == 0 or (len(prices) - 1) // interval + 1 < length:
+            return None
+        return prices[::-1][::interval][:length][::-1]
+
+    def fast_avg_mid_price(self, interval: int, length: int) -> Optional[float]:
+        """
+        Calculates the same average as avg_mid_price in float64 from the mid price history, it costs O(length)
+        instead of O(stored mid prices) and the average of all the stored mid prices is kept up to date on each tick.
+        :param interval: The interval (in seconds) in which to sample the mid prices.
+        :param length: The number of the samples to calculate the average.
+        :returns None if there is not enough samples, otherwise the average mid price.
+        """
+        if interval == 1 and self.mid_price_history is not None and length == len(self.mid_price_history):
+            return self.mid_price_history.running_mean
+        samples = self.mid_price_samples(interval, length)
+        if samples is None:
+            return None
+        return float(np.mean(samples))
+
+    def fast_avg_price_volatility(self, interval: int, length: int) -> Optional[float]:
+        """
+        Calculates the same volatility as avg_price_volatility in float64 from the mid price history.
+        :param interval: The interval (in seconds) in which to sample the mid prices.
+        :param length: The number of the samples to calculate the average.
+        :returns None if there is not enough samples, otherwise the average mid price change.
+        """
+        return self.fast_locate_central_price_volatility(interval, length, np.mean)
+
+    def fast_median_price_volatility(self, interval: int, length: int) -> Optional[float]:
+        """
+        Calculates the same volatility as median_price_volatility in float64 from the mid price history.
+        :param interval: The interval (in seconds) in which to sample the mid prices.
+        :param length: The number of the samples to calculate the average.
+        :returns None if there is not enough samples, otherwise the median mid price change.
+        """
+        return self.fast_locate_central_price_volatility(interval, length, np.median)
+
+    def fast_locate_central_price_volatility(self, interval: int, length: int, locate_function: Callable) \
+            -> Optional[float]:
+        """
+        Calculates the same volatility as locate_central_price_volatility in float64 from the mid price history.
+        :param interval: The interval in which to sample the mid prices.
+        :param length: The number of the samples.
+        :param locate_function: The function used to calculate the central location of an array of the changes, e.g.
+         np.mean or np.median.
+        :returns None if there is not enough samples, otherwise the central location of mid price change.
+        """
+        samples = self.mid_price_samples(interval, length + 1)
+        if samples is None:
+            return None
+        previous, current = samples[:-1], samples[1:]
+        changes = np.maximum(current, previous) / np.minimum(current, previous) - 1
+        return float(locate_function(changes))
+
     @staticmethod
     def round_by_step(a_number: Decimal, step_size: Decimal):
         """
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict, Optional
 from decimal import Decimal
 
 child_queue = None
@@ -113,15 +113,37 @@ class PmmMarketInfo:
 
 
 class OnTick:
+    """
+    Sent to the script on every strategy tick. Only the parameters and balances that changed since the previous tick
+    are sent, a balance of None is one that is no longer held.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]],
-                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 pmm_parameter_changes: Dict[str, Any],
+                 total_balance_changes: Dict[str, Dict[str, Optional[Decimal]]],
+                 available_balance_changes: Dict[str, Dict[str, Optional[Decimal]]],
+                 tick_id: int = 0,
+                 timestamp: float = 0.0,
                  ):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
-        self.all_total_balances = all_total_balances
-        self.all_available_balances = all_available_balances
+        self.pmm_parameter_changes = pmm_parameter_changes
+        self.total_balance_changes = total_balance_changes
+        self.available_balance_changes = available_balance_changes
+        self.tick_id = tick_id
+        # The time the tick was sent at
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} {str(self.__dict__)}"
+
+
+class OnTickProcessed:
+    """
+    Sent back by the script once it has processed an OnTick, for the latency of the script bridge.
+    """
+    def __init__(self, tick_id: int, sent_timestamp: float, received_timestamp: float):
+        self.tick_id = tick_id
+        self.sent_timestamp = sent_timestamp
+        self.received_timestamp = received_timestamp
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
@@ -154,3 +176,35 @@ class ScriptError:
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.error)} \nTrace back: {self.traceback}"
+
+
+def balance_changes(previous: Dict[str, Dict[str, Decimal]],
+                    current: Dict[str, Dict[str, Decimal]]) -> Dict[str, Dict[str, Optional[Decimal]]]:
+    """
+    Compares two {exchange: {token: balance}} dictionaries.
+    :returns the balances that changed or were added in current, and None for the ones no longer in current.
+    """
+    changes = {}
+    for exchange in set(previous) | set(current):
+        previous_balances = previous.get(exchange, {})
+        current_balances = current.get(exchange, {})
+        exchange_changes = {token: balance for token, balance in current_balances.items()
+                            if token not in previous_balances or previous_balances[token] != balance}
+        exchange_changes.update({token: None for token in previous_balances if token not in current_balances})
+        if exchange_changes:
+            changes[exchange] = exchange_changes
+    return changes
+
+
+def apply_balance_changes(balances: Dict[str, Dict[str, Decimal]],
+                          changes: Dict[str, Dict[str, Optional[Decimal]]]):
+    """
+    Applies the output of balance_changes to the balances in place.
+    """
+    for exchange, exchange_changes in changes.items():
+        exchange_balances = balances.setdefault(exchange, {})
+        for token, balance in exchange_changes.items():
+            if balance is None:
+                exchange_balances.pop(token, None)
+            else:
+                exchange_balances[token] = balance
@@ -15,6 +15,14 @@ cdef class ScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        object _child_queue_reader
+        list _pmm_parameter_names
+        dict _sent_parameters
+        dict _sent_total_balances
+        dict _sent_available_balances
+        long long _tick_id
+        object _delivery_stats
+        object _round_trip_stats
         object _ev_loop
         object _script_process
         object _listen_to_child_task
@@ -1,12 +1,15 @@
 # distutils: language=c++
 
+from copy import deepcopy
 from typing import List
 import asyncio
 import logging
+import time
 import traceback
 from multiprocessing import Process, Queue
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
+from hummingbot.core.clock_stats import IteratorTickStats
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -17,15 +20,18 @@ from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.script.script_process import run_script
+from hummingbot.script.script_queue import ScriptQueueReader
 from hummingbot.script.script_interface import (
     StrategyParameter,
     PMMParameters,
     OnTick,
+    OnTickProcessed,
     OnStatus,
     CallNotify,
     CallLog,
     PmmMarketInfo,
     ScriptError,
+    balance_changes,
 )
 
 sir_logger = None
@@ -45,6 +51,9 @@ cdef class ScriptIterator(TimeIterator):
                  strategy: PureMarketMakingStrategy,
                  queue_check_interval: float = 0.01,
                  is_unit_testing_mode: bool = False):
+        """
+        :param queue_check_interval: no longer used for polling, the queues are read by blocking readers
+        """
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
@@ -60,6 +69,15 @@ cdef class ScriptIterator(TimeIterator):
         self._ev_loop = asyncio.get_event_loop()
         self._parent_queue = Queue()
         self._child_queue = Queue()
+        self._child_queue_reader = ScriptQueueReader(self._child_queue, self._ev_loop)
+        self._pmm_parameter_names = [attr for attr in PMMParameters.__dict__.keys() if attr[:1] != '_']
+        # The parameters and balances the script has, the ticks only send the changes to these.
+        self._sent_parameters = {}
+        self._sent_total_balances = {}
+        self._sent_available_balances = {}
+        self._tick_id = 0
+        self._delivery_stats = None
+        self._round_trip_stats = None
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
@@ -73,8 +91,24 @@ cdef class ScriptIterator(TimeIterator):
     def strategy(self):
         return self._strategy
 
+    @property
+    def delivery_stats(self) -> IteratorTickStats:
+        """
+        :return: the times from sending a tick until the script received it
+        """
+        return self._delivery_stats
+
+    @property
+    def round_trip_stats(self) -> IteratorTickStats:
+        """
+        :return: the times from sending a tick until the script reported back that it processed it
+        """
+        return self._round_trip_stats
+
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
+        self._delivery_stats = IteratorTickStats("tick delivery", clock.tick_size)
+        self._round_trip_stats = IteratorTickStats("tick round trip", clock.tick_size)
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -88,18 +122,30 @@ cdef class ScriptIterator(TimeIterator):
         self._script_process.join()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+        self._child_queue_reader.stop()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+        cdef:
+            dict parameter_changes = {}
+            dict total_balances = self.all_total_balances()
+            dict available_balances = self.all_available_balances(total_balances)
+        for name in self._pmm_parameter_names:
+            param_value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != param_value:
+                # Copied as order_override and the like can be changed in place.
+                parameter_changes[name] = self._sent_parameters[name] = deepcopy(param_value)
+        cdef object on_tick = OnTick(self.strategy.get_mid_price(),
+                                     parameter_changes,
+                                     balance_changes(self._sent_total_balances, total_balances),
+                                     balance_changes(self._sent_available_balances, available_balances),
+                                     self._tick_id,
+                                     time.time())
+        self._sent_total_balances = total_balances
+        self._sent_available_balances = available_balances
+        self._tick_id += 1
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -115,17 +161,20 @@ cdef class ScriptIterator(TimeIterator):
         self._parent_queue.put(event)
 
     async def listen_to_child_queue(self):
+        self._child_queue_reader.start()
         while True:
             try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
+                item = await self._child_queue_reader.get()
+                if isinstance(item, OnTickProcessed):
+                    self._did_process_tick(item)
                     continue
-                item = self._child_queue.get()
                 self.logger().info(f"received: {str(item)}")
                 if item is None:
                     break
                 if isinstance(item, StrategyParameter):
                     setattr(self._strategy, item.name, item.updated_value)
+                    # The script already has the value, it is not sent back on the next tick.
+                    self._sent_parameters[item.name] = deepcopy(item.updated_value)
                 elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
                     # ignore this on unit testing as the below import will mess up unit testing.
                     from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -139,6 +188,22 @@ cdef class ScriptIterator(TimeIterator):
             except Exception:
                 self.logger().info("Unexpected error listening to child queue.", exc_info=True)
 
+    def _did_process_tick(self, item: OnTickProcessed):
+        if self._delivery_stats is None:
+            return
+        self._delivery_stats.record(item.received_timestamp - item.sent_timestamp)
+        self._round_trip_stats.record(time.time() - item.sent_timestamp)
+
+    def format_latency_status(self) -> str:
+        if self._delivery_stats is None or self._delivery_stats.tick_count == 0:
+            return "  Script latency: no ticks processed yet."
+        lines = ["  Script latency:",
+                 f"    {'':<16} {'Ticks':>8} {'p50 ms':>9} {'p99 ms':>9} {'Max ms':>9}"]
+        for stats in (self._delivery_stats, self._round_trip_stats):
+            lines.append(f"    {stats.name:<16} {stats.tick_count:>8} {stats.p50 * 1e3:>9.3f} "
+                         f"{stats.p99 * 1e3:>9.3f} {stats.max_duration * 1e3:>9.3f}")
+        return "\n".join(lines)
+
     def request_status(self):
         self._parent_queue.put(OnStatus())
 
@@ -146,8 +211,8 @@ cdef class ScriptIterator(TimeIterator):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
         return {exchange: {token: bal for token, bal in bals.items() if bal > 0} for exchange, bals in all_bals.items()}
 
-    def all_available_balances(self):
-        all_bals = self.all_total_balances()
+    def all_available_balances(self, all_total_balances=None):
+        all_bals = self.all_total_balances() if all_total_balances is None else all_total_balances
         ret_val = {}
         for exchange, balances in all_bals.items():
             connector = [c for c in self._markets if c.name == exchange][0]
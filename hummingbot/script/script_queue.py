@@ -0,0 +1,60 @@
+import asyncio
+import queue
+import threading
+from multiprocessing import Queue
+from typing import (
+    Any,
+    Optional,
+)
+
+
+class ScriptQueueReader:
+    """
+    Reads a multiprocessing queue of the script bridge on a daemon thread that blocks on the queue and hands the items
+    over to the event loop as they arrive, instead of the event loop polling the queue. The reader stops after it
+    passes on the None item that ends the script bridge, or when the queue or the event loop is closed.
+    """
+    def __init__(self,
+                 mp_queue: Queue,
+                 ev_loop: Optional[asyncio.AbstractEventLoop] = None,
+                 poll_timeout: float = 1.0):
+        self._mp_queue: Queue = mp_queue
+        self._ev_loop: asyncio.AbstractEventLoop = ev_loop or asyncio.get_event_loop()
+        # How long a blocking get waits before the thread checks whether it has been stopped.
+        self._poll_timeout: float = poll_timeout
+        self._items: asyncio.Queue = asyncio.Queue()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._read, name="ScriptQueueReader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def get(self) -> Any:
+        return await self._items.get()
+
+    def _read(self):
+        while not self._stopped.is_set():
+            try:
+                item = self._mp_queue.get(timeout=self._poll_timeout)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                # The queue is closed, end the reading side as the None item would.
+                item = None
+            try:
+                self._ev_loop.call_soon_threadsafe(self._items.put_nowait, item)
+            except RuntimeError:
+                # The event loop is closed.
+                break
+            if item is None:
+                break
@@ -9,13 +9,22 @@ cdef class RingBuffer:
         int64_t _stop_index
         int64_t _length
         bint _is_full
+        double _mean
+        double _m2
+        int64_t _updates_since_resync
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_index(self)
+    cdef void c_resync_statistics(self)
+    cdef int64_t c_count(self)
+    cdef double c_get_first_value(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef double c_running_mean(self)
+    cdef double c_running_variance(self)
+    cdef np.ndarray c_get_as_numpy_view(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
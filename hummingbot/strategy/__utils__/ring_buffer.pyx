@@ -1,11 +1,18 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added. Every value is written twice, at its index and one length further,
+    so the values in order are always a contiguous slice of the underlying array. The mean and variance are kept
+    up to date on each add (Welford's algorithm over the sliding window) and recomputed from the values once per
+    buffer length to bound the rounding error.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -15,31 +22,67 @@ cdef class RingBuffer:
 
     def __cinit__(self, int length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        self._buffer = np.zeros(length * 2, dtype=np.float64)
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates_since_resync = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double old_value
+            double old_mean = self._mean
+
+        if self._is_full:
+            # The oldest value is the one being overwritten.
+            old_value = self._buffer[self._stop_index]
+            self._mean += (val - old_value) / self._length
+            self._m2 += (val - old_value) * (val - self._mean + old_value - old_mean)
+        else:
+            self._mean += (val - old_mean) / (self.c_count() + 1)
+            self._m2 += (val - old_mean) * (val - self._mean)
         self._buffer[self._stop_index] = val
+        self._buffer[self._stop_index + self._length] = val
         self.c_increment_index()
+        self._updates_since_resync += 1
+        if self._is_full and self._updates_since_resync >= self._length:
+            self.c_resync_statistics()
 
     cdef void c_increment_index(self):
         self._stop_index = (self._stop_index + 1) % self._length
-        if(self._start_index == self._stop_index):
+        # Once full, the next value to be overwritten is the oldest one.
+        if self._is_full or self._start_index == self._stop_index:
             self._is_full = True
-            self._start_index = (self._start_index + 1) % self._length
+            self._start_index = self._stop_index
+
+    cdef void c_resync_statistics(self):
+        cdef np.ndarray values = self.c_get_as_numpy_view()
+        self._mean = np.mean(values)
+        self._m2 = np.sum(np.square(values - self._mean))
+        self._updates_since_resync = 0
+
+    cdef int64_t c_count(self):
+        if self._is_full:
+            return self._length
+        return self._stop_index - self._start_index
 
     cdef bint c_is_empty(self):
         return (not self._is_full) and (self._start_index==self._stop_index)
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._start_index]
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._stop_index-1]
+        return self._buffer[self._stop_index - 1 + self._length]
 
     cdef bint c_is_full(self):
         return self._is_full
@@ -47,37 +90,51 @@ cdef class RingBuffer:
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_running_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
 
-        if not self._is_full:
-            indexes = np.arange(self._start_index, stop=self._stop_index, dtype=np.int16)
-        else:
-            indexes = np.arange(self._start_index, stop=self._start_index + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+    cdef double c_running_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        return max(self._m2 / self.c_count(), 0.0)
+
+    cdef np.ndarray c_get_as_numpy_view(self):
+        cdef np.ndarray view = np.asarray(self._buffer)[self._start_index:self._start_index + self.c_count()]
+        view.setflags(write=False)
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
+        self._buffer = np.zeros(length * 2, dtype=np.double)
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates_since_resync = 0
+
+    def __len__(self):
+        return self.c_count()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,6 +142,16 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        :return: a read only view of the values, oldest first, without copying them. It is only valid until the next
+        value is added.
+        """
+        return self.c_get_as_numpy_view()
+
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -103,3 +170,17 @@ cdef class RingBuffer:
     @property
     def variance(self):
         return self.c_variance()
+
+    @property
+    def running_mean(self):
+        """
+        :return: the mean of the values in the buffer, whether it is full or not
+        """
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """
+        :return: the variance of the values in the buffer, whether it is full or not
+        """
+        return self.c_running_variance()
@@ -7,8 +7,7 @@ class AverageVolatilityIndicator(BaseTrailingIndicator):
         super().__init__(sampling_length, processing_length)
 
     def _indicator_calculation(self) -> float:
-        return np.var(self._sampling_buffer.get_as_numpy_array())
+        return self._sampling_buffer.running_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        return np.sqrt(np.mean(processing_array))
+        return np.sqrt(self._processing_buffer.running_mean)
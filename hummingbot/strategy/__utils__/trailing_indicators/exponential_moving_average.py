@@ -1,17 +1,34 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the samples in the sampling buffer, as pandas' ewm(span=sampling_length,
+    adjust=True) over the buffer. The weighted sum is updated on each sample, taking out the weight of the sample
+    leaving the buffer, instead of being recomputed over the whole buffer.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._decay: float = 1 - 2 / (sampling_length + 1)
+        self._evicted_weight: float = self._decay ** sampling_length
+        self._weighted_sum: float = 0.0
+        self._sample_count: int = 0
+
+    def add_sample(self, value: float):
+        self._weighted_sum *= self._decay
+        if self._sampling_buffer.is_full:
+            self._weighted_sum -= self._evicted_weight * self._sampling_buffer.get_first_value()
+        else:
+            self._sample_count += 1
+        self._weighted_sum += value
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        if self._decay == 0:
+            return self._weighted_sum
+        return self._weighted_sum * (1 - self._decay) / (1 - self._decay ** self._sample_count)
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -26,6 +26,12 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
+from hummingbot.strategy.arbitrage.order_book_search cimport (
+    ArbitrageAmount,
+    c_find_best_arbitrage_amount,
+    c_get_fixed_quanta,
+    c_to_decimal_amount,
+)
 from hummingbot.client.performance import smart_round
 
 NaN = float("nan")
@@ -521,6 +527,136 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The order books are searched in double precision with the fees and the balances read once, and the amount
+        found is checked in Decimal. The steps are walked in Decimal by c_find_best_profitable_amount_by_steps when
+        they are to be logged, when the markets do not quantize order book entries by fixed quanta, when the fees
+        change with the amount or when the search cannot tell a comparison apart in double precision.
+
+        :param buy_market_trading_pair_tuple: trading pair for buy side
+        :param sell_market_trading_pair_tuple: trading pair for sell side
+        :return: (order size, profitability ratio, bid_price, ask_price)
+        :rtype: Tuple[Decimal, Decimal, Decimal, Decimal]
+        """
+        cdef:
+            ArbitrageAmount result
+            object bid_price
+            object ask_price
+            object best_amount
+            object best_profitability
+            object buy_market_quote_balance
+            object sell_market_base_balance
+            str buy_trading_pair = buy_market_trading_pair_tuple.trading_pair
+            str sell_trading_pair = sell_market_trading_pair_tuple.trading_pair
+            ExchangeBase buy_market = buy_market_trading_pair_tuple.market
+            ExchangeBase sell_market = sell_market_trading_pair_tuple.market
+            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
+            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
+
+        if self._logging_options & (self.OPTION_LOG_PROFITABILITY_STEP |
+                                    self.OPTION_LOG_FULL_PROFITABILITY_STEP |
+                                    self.OPTION_LOG_INSUFFICIENT_ASSET) and \
+                self.logger().isEnabledFor(logging.DEBUG):
+            return self.c_find_best_profitable_amount_by_steps(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+        if sell_order_book._bid_book.empty() or buy_order_book._ask_book.empty():
+            return s_decimal_0, s_decimal_0, s_decimal_0, s_decimal_0
+
+        top_bid_price = sell_market.c_get_price(sell_trading_pair, False)
+        top_ask_price = buy_market.c_get_price(buy_trading_pair, True)
+        sell_quanta = c_get_fixed_quanta(sell_market, sell_trading_pair, top_bid_price)
+        buy_quanta = c_get_fixed_quanta(buy_market, buy_trading_pair, top_ask_price)
+        if sell_quanta is None or buy_quanta is None:
+            return self.c_find_best_profitable_amount_by_steps(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+
+        buy_fee, sell_fee, total_buy_flat_fees, total_sell_flat_fees = self.c_get_arbitrage_fees(
+            buy_market_trading_pair_tuple, sell_market_trading_pair_tuple, buy_quanta[1], top_ask_price, top_bid_price
+        )
+        buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+        sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
+        result = c_find_best_arbitrage_amount(sell_order_book,
+                                              buy_order_book,
+                                              float(self.market_conversion_rate(sell_market_trading_pair_tuple)),
+                                              float(self.market_conversion_rate(buy_market_trading_pair_tuple)),
+                                              float(sell_quanta[0]),
+                                              float(sell_quanta[1]),
+                                              float(buy_quanta[0]),
+                                              float(buy_quanta[1]),
+                                              float(self._min_profitability),
+                                              float(sell_fee.percent),
+                                              float(total_sell_flat_fees),
+                                              float(buy_fee.percent),
+                                              float(total_buy_flat_fees),
+                                              float(sell_market_base_balance),
+                                              float(buy_market_quote_balance))
+        if result.near_tie:
+            return self.c_find_best_profitable_amount_by_steps(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+        if result.steps == 0:
+            return s_decimal_0, s_decimal_0, s_decimal_0, s_decimal_0
+
+        # prices of the last step walked, as the markets quantize them
+        bid_price = sell_market.c_quantize_order_price(sell_trading_pair, Decimal(result.bid_price))
+        ask_price = buy_market.c_quantize_order_price(buy_trading_pair, Decimal(result.ask_price))
+        # the fees of the amount walked and of the amount found must be the ones they were searched with
+        fees = (buy_fee, sell_fee, total_buy_flat_fees, total_sell_flat_fees)
+        if self.c_get_arbitrage_fees(buy_market_trading_pair_tuple, sell_market_trading_pair_tuple,
+                                     Decimal(result.walked_amount), ask_price, bid_price) != fees:
+            return self.c_find_best_profitable_amount_by_steps(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+        if result.amount <= 0:
+            return s_decimal_0, s_decimal_0, bid_price, ask_price
+
+        if result.balance_limited:
+            best_amount = min(sell_market_base_balance,
+                              (buy_market_quote_balance / ask_price - total_buy_flat_fees) / (1 + buy_fee.percent))
+        else:
+            best_amount = c_to_decimal_amount(result.amount, min(buy_quanta[1], sell_quanta[1]))
+        if self.c_get_arbitrage_fees(buy_market_trading_pair_tuple, sell_market_trading_pair_tuple, best_amount,
+                                     ask_price, bid_price) != fees:
+            return self.c_find_best_profitable_amount_by_steps(buy_market_trading_pair_tuple,
+                                                               sell_market_trading_pair_tuple)
+        best_profitability = Decimal(str(result.profitability))
+        return best_amount, best_profitability, bid_price, ask_price
+
+    cdef tuple c_get_arbitrage_fees(self, object buy_market_trading_pair_tuple, object sell_market_trading_pair_tuple,
+                                    object amount, object ask_price, object bid_price):
+        """
+        The buy and sell fees of an arbitrage amount with their flat fees summed up in the quote assets.
+        """
+        cdef:
+            ExchangeBase buy_market = buy_market_trading_pair_tuple.market
+            ExchangeBase sell_market = sell_market_trading_pair_tuple.market
+
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            buy_market.get_taker_order_type(),
+            TradeType.BUY,
+            amount,
+            ask_price
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            sell_market.get_taker_order_type(),
+            TradeType.SELL,
+            amount,
+            bid_price
+        )
+        return (buy_fee,
+                sell_fee,
+                self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees),
+                self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees))
+
+    cdef tuple c_find_best_profitable_amount_by_steps(self, object buy_market_trading_pair_tuple,
+                                                      object sell_market_trading_pair_tuple):
+        """
+        Given a buy market and a sell market, calculate the optimal order size for the buy and sell orders on both
+        markets and the profitability ratio, walking the matched order book steps in Decimal. This function accounts
+        for trading fees required by both markets at every step before arriving at the optimal order size and
+        profitability ratio.
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
@@ -663,6 +799,10 @@ cdef class ArbitrageStrategy(StrategyBase):
     def find_best_profitable_amount(self, buy_market: MarketTradingPairTuple, sell_market: MarketTradingPairTuple):
         return self.c_find_best_profitable_amount(buy_market, sell_market)
 
+    def find_best_profitable_amount_by_steps(self, buy_market: MarketTradingPairTuple,
+                                             sell_market: MarketTradingPairTuple):
+        return self.c_find_best_profitable_amount_by_steps(buy_market, sell_market)
+
     def ready_for_new_orders(self, market_pair):
         return self.c_ready_for_new_orders(market_pair)
     # ---------------------------------------------------------------
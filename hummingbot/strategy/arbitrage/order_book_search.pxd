@@ -0,0 +1,37 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.connector.exchange_base cimport ExchangeBase
+
+
+cdef struct ArbitrageAmount:
+    double amount
+    double profitability
+    double bid_price
+    double ask_price
+    double bid_value
+    double ask_value
+    double walked_amount
+    int64_t steps
+    bint balance_limited
+    bint near_tie
+
+
+cdef ArbitrageAmount c_find_best_arbitrage_amount(OrderBook bid_book,
+                                                  OrderBook ask_book,
+                                                  double bid_price_rate,
+                                                  double ask_price_rate,
+                                                  double bid_price_quantum,
+                                                  double bid_size_quantum,
+                                                  double ask_price_quantum,
+                                                  double ask_size_quantum,
+                                                  double min_profitability,
+                                                  double sell_fee_percent,
+                                                  double sell_flat_fees,
+                                                  double buy_fee_percent,
+                                                  double buy_flat_fees,
+                                                  double base_balance,
+                                                  double quote_balance)
+cdef tuple c_get_fixed_quanta(ExchangeBase market, str trading_pair, object price)
+cdef object c_to_decimal_amount(double amount, object quantum)
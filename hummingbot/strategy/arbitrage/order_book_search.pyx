@@ -0,0 +1,249 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+cimport cython
+from cython.operator cimport(
+    postincrement as inc,
+    dereference as deref,
+)
+from decimal import Decimal
+from libc.float cimport DBL_MAX
+from libc.math cimport (
+    fabs,
+    floor,
+    fmax,
+    fmin,
+    rint,
+)
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+s_decimal_1 = Decimal(1)
+s_decimal_10 = Decimal(10)
+
+
+cdef inline double c_quantize_price(double price, double quantum):
+    # Rounds half to even like quantize_order_price on Decimal prices.
+    return rint(price / quantum) * quantum if quantum > 0 else price
+
+
+cdef inline double c_quantize_amount(double amount, double quantum):
+    return floor(amount / quantum) * quantum if quantum > 0 else amount
+
+
+cdef inline bint c_is_near(double a, double b):
+    # Within the error of a sum of doubles, where the comparison may go either way on Decimal numbers.
+    return fabs(a - b) <= 1e-9 * fmin(fmax(fabs(a), fabs(b)), DBL_MAX)
+
+
+@cython.cdivision(True)
+cdef ArbitrageAmount c_find_best_arbitrage_amount(OrderBook bid_book,
+                                                  OrderBook ask_book,
+                                                  double bid_price_rate,
+                                                  double ask_price_rate,
+                                                  double bid_price_quantum,
+                                                  double bid_size_quantum,
+                                                  double ask_price_quantum,
+                                                  double ask_size_quantum,
+                                                  double min_profitability,
+                                                  double sell_fee_percent,
+                                                  double sell_flat_fees,
+                                                  double buy_fee_percent,
+                                                  double buy_flat_fees,
+                                                  double base_balance,
+                                                  double quote_balance):
+    """
+    Matches the bids of the sell market's order book with the asks of the buy market's order book, best first, and
+    finds the largest amount to arbitrage whose profitability after fees exceeds the minimum profitability within the
+    balances, as ArbitrageStrategy.c_find_best_profitable_amount_by_steps does on Decimal steps, in double precision and
+    without building the steps. The entries are quantized by the given quanta as the markets quantize them.
+    Comparisons too close to tell in double precision mark the result as a near tie, to be found again in Decimal.
+
+    :param bid_book: order book of the sell market
+    :param ask_book: order book of the buy market
+    :param bid_price_rate: conversion rate for sell market prices
+    :param ask_price_rate: conversion rate for buy market prices
+    :param sell_fee_percent: fee percent of selling on the sell market
+    :param sell_flat_fees: flat fees of selling on the sell market, in its quote asset
+    :param buy_fee_percent: fee percent of buying on the buy market
+    :param buy_flat_fees: flat fees of buying on the buy market, in its quote asset
+    :param base_balance: available base balance on the sell market
+    :param quote_balance: available quote balance on the buy market
+    :return: the amount and its profitability, the unquantized bid and ask prices of the last step walked, the
+             adjusted bid and ask values of the amount, the amount and the number of steps walked, whether the amount
+             is limited by the balances and whether it is a near tie
+    """
+    cdef:
+        ArbitrageAmount result
+        set[OrderBookEntry].reverse_iterator bid_it = bid_book._bid_book.rbegin()
+        set[OrderBookEntry].iterator ask_it = ask_book._ask_book.begin()
+        double bid_leftover_amount = 0
+        double ask_leftover_amount = 0
+        double current_bid_price = 0
+        double current_ask_price = 0
+        double current_bid_raw_price = 0
+        double current_ask_raw_price = 0
+        double current_bid_price_adjusted
+        double current_ask_price_adjusted
+        double step_amount
+        double total_previous_step_base_amount = 0
+        double total_bid_value_adjusted = 0
+        double total_ask_value_adjusted = 0
+        double net_sell_proceeds
+        double net_buy_costs
+        double profitability
+        double min_profitability_ratio = 1 + min_profitability
+
+    result.amount = 0
+    result.profitability = 0
+    result.bid_price = 0
+    result.ask_price = 0
+    result.bid_value = 0
+    result.ask_value = 0
+    result.walked_amount = 0
+    result.steps = 0
+    result.balance_limited = False
+    result.near_tie = False
+
+    while True:
+        if bid_leftover_amount == 0 and ask_leftover_amount == 0:
+            # both current ask and bid orders are filled, advance to the next bid and ask order
+            if bid_it == bid_book._bid_book.rend() or ask_it == ask_book._ask_book.end():
+                break
+            current_bid_raw_price = deref(bid_it).getPrice()
+            current_bid_price = c_quantize_price(current_bid_raw_price, bid_price_quantum)
+            bid_leftover_amount = c_quantize_amount(deref(bid_it).getAmount(), bid_size_quantum)
+            inc(bid_it)
+            current_ask_raw_price = deref(ask_it).getPrice()
+            current_ask_price = c_quantize_price(current_ask_raw_price, ask_price_quantum)
+            ask_leftover_amount = c_quantize_amount(deref(ask_it).getAmount(), ask_size_quantum)
+            inc(ask_it)
+        elif bid_leftover_amount > 0 and ask_leftover_amount == 0:
+            # current ask order filled completely, advance to the next ask order
+            if ask_it == ask_book._ask_book.end():
+                break
+            current_ask_raw_price = deref(ask_it).getPrice()
+            current_ask_price = c_quantize_price(current_ask_raw_price, ask_price_quantum)
+            ask_leftover_amount = c_quantize_amount(deref(ask_it).getAmount(), ask_size_quantum)
+            inc(ask_it)
+        elif ask_leftover_amount > 0 and bid_leftover_amount == 0:
+            # current bid order filled completely, advance to the next bid order
+            if bid_it == bid_book._bid_book.rend():
+                break
+            current_bid_raw_price = deref(bid_it).getPrice()
+            current_bid_price = c_quantize_price(current_bid_raw_price, bid_price_quantum)
+            bid_leftover_amount = c_quantize_amount(deref(bid_it).getAmount(), bid_size_quantum)
+            inc(bid_it)
+        elif bid_leftover_amount < 0 or ask_leftover_amount < 0:
+            # something went wrong if leftover amount is negative
+            break
+
+        # adjust price based on the quote token rates
+        current_bid_price_adjusted = current_bid_price * bid_price_rate
+        current_ask_price_adjusted = current_ask_price * ask_price_rate
+        if current_bid_price_adjusted != current_ask_price_adjusted and \
+                c_is_near(current_bid_price_adjusted, current_ask_price_adjusted):
+            result.near_tie = True
+        # arbitrage not possible
+        if current_bid_price_adjusted < current_ask_price_adjusted:
+            break
+        # allow negative profitability for debugging
+        if min_profitability < 0 and \
+                current_bid_price_adjusted / current_ask_price_adjusted < min_profitability_ratio:
+            break
+
+        step_amount = min(bid_leftover_amount, ask_leftover_amount)
+        # skip cases where step_amount=0 for exchages like binance that include orders with 0 amount
+        if step_amount == 0:
+            continue
+
+        result.steps += 1
+        result.walked_amount = total_previous_step_base_amount + step_amount
+        result.bid_price = current_bid_raw_price
+        result.ask_price = current_ask_raw_price
+        # accumulated profitability with fees
+        total_bid_value_adjusted += current_bid_price_adjusted * step_amount
+        total_ask_value_adjusted += current_ask_price_adjusted * step_amount
+        net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee_percent) - sell_flat_fees
+        net_buy_costs = total_ask_value_adjusted * (1 + buy_fee_percent) + buy_flat_fees
+        profitability = net_sell_proceeds / net_buy_costs
+        if c_is_near(profitability, min_profitability_ratio) or c_is_near(quote_balance, net_buy_costs) or \
+                c_is_near(base_balance, total_previous_step_base_amount + step_amount):
+            result.near_tie = True
+
+        # if current step is within minimum profitability, set to best profitable order
+        # because the total amount is greater than the previous step
+        if profitability > min_profitability_ratio:
+            result.amount = total_previous_step_base_amount + step_amount
+            result.profitability = profitability
+            result.bid_value = total_bid_value_adjusted
+            result.ask_value = total_ask_value_adjusted
+
+        # stop current step if buy/sell market does not have enough asset
+        if quote_balance < net_buy_costs or base_balance < total_previous_step_base_amount + step_amount:
+            # use previous step as best profitable order if below min profitability
+            if profitability < min_profitability_ratio:
+                break
+            # buy and sell with the amount of available base or quote asset, whichever is smaller, market buys
+            # being adjusted to account for additional fees
+            result.amount = min(base_balance,
+                                (quote_balance / current_ask_price - buy_flat_fees) / (1 + buy_fee_percent))
+            result.profitability = profitability
+            result.balance_limited = True
+            break
+
+        total_previous_step_base_amount += step_amount
+        ask_leftover_amount -= step_amount
+        bid_leftover_amount -= step_amount
+
+    return result
+
+
+cdef tuple c_get_fixed_quanta(ExchangeBase market, str trading_pair, object price):
+    """
+    The price and size quanta of a trading pair if its market quantizes any price and amount by them alone, as
+    c_find_best_arbitrage_amount quantizes the order book entries. None if the quanta change with the price or the
+    amount, or if the market quantizes small amounts to 0, as it does with a minimum order size.
+    """
+    cdef:
+        object price_quantum = market.c_get_order_price_quantum(trading_pair, price)
+        object size_quantum = market.c_get_order_size_quantum(trading_pair, s_decimal_1)
+    if market.c_get_order_price_quantum(trading_pair, price * s_decimal_10) != price_quantum or \
+            market.c_get_order_size_quantum(trading_pair, s_decimal_10) != size_quantum or \
+            market.c_quantize_order_amount(trading_pair, size_quantum) != size_quantum:
+        return None
+    return price_quantum, size_quantum
+
+
+cdef object c_to_decimal_amount(double amount, object quantum):
+    """
+    Converts an amount summed from amounts quantized by quantum, removing the error of the sum in double precision.
+    """
+    cdef:
+        double units = amount / float(quantum)
+        double nearest_units = rint(units)
+    if nearest_units > 0 and fabs(units - nearest_units) <= 1e-9 * nearest_units:
+        return Decimal(int(nearest_units)) * quantum
+    return Decimal(amount)
+
+
+def find_best_arbitrage_amount(bid_book: OrderBook,
+                               ask_book: OrderBook,
+                               bid_price_rate: float = 1.,
+                               ask_price_rate: float = 1.,
+                               bid_price_quantum: float = 0.,
+                               bid_size_quantum: float = 0.,
+                               ask_price_quantum: float = 0.,
+                               ask_size_quantum: float = 0.,
+                               min_profitability: float = 0.,
+                               sell_fee_percent: float = 0.,
+                               sell_flat_fees: float = 0.,
+                               buy_fee_percent: float = 0.,
+                               buy_flat_fees: float = 0.,
+                               base_balance: float = float("inf"),
+                               quote_balance: float = float("inf")) -> dict:
+    return c_find_best_arbitrage_amount(bid_book, ask_book, bid_price_rate, ask_price_rate, bid_price_quantum,
+                                        bid_size_quantum, ask_price_quantum, ask_size_quantum, min_profitability,
+                                        sell_fee_percent, sell_flat_fees, buy_fee_percent, buy_flat_fees,
+                                        base_balance, quote_balance)
+
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from decimal import Decimal
+import numpy as np
 
 
 class PriceSize:
@@ -25,3 +26,21 @@ class Proposal:
 
     def quote(self):
         return self.market.split("-")[1]
+
+
+class ProposalBatch:
+    """
+    The proposals of all the markets of the strategy as float arrays, in the order of the markets.
+    """
+    def __init__(self, buy_prices: np.ndarray, buy_sizes: np.ndarray, sell_prices: np.ndarray,
+                 sell_sizes: np.ndarray):
+        self.buy_prices: np.ndarray = buy_prices
+        self.buy_sizes: np.ndarray = buy_sizes
+        self.sell_prices: np.ndarray = sell_prices
+        self.sell_sizes: np.ndarray = sell_sizes
+
+    def __len__(self):
+        return len(self.buy_prices)
+
+    def __repr__(self):
+        return f"ProposalBatch of {len(self)} markets"
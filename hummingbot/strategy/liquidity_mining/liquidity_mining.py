@@ -4,26 +4,22 @@ import asyncio
 from typing import Dict, List, Set
 import pandas as pd
 import numpy as np
-from statistics import mean
 import time
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
-from .data_types import Proposal, PriceSize
+from .data_types import Proposal, PriceSize, ProposalBatch
+from .proposal_engine import ProposalEngine
 from hummingbot.core.event.events import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.estimate_fee import estimate_fee
-from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
-    calculate_bid_ask_ratios_from_base_asset_ratio
-)
 from hummingbot.connector.parrot import get_campaign_summary
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
-s_decimal_nan = Decimal("NaN")
 lms_logger = None
 
 
@@ -74,12 +70,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._ready_to_trade = False
-        self._refresh_times = {market: 0 for market in market_infos}
-        self._token_balances = {}
-        self._sell_budgets = {}
-        self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._market_info_list = list(market_infos.values())
+        self._engine = ProposalEngine(list(market_infos),
+                                      token,
+                                      float(order_amount),
+                                      float(spread),
+                                      inventory_skew_enabled,
+                                      float(target_base_pct),
+                                      float(order_refresh_tolerance_pct),
+                                      float(inventory_range_multiplier),
+                                      volatility_interval,
+                                      avg_volatility_period,
+                                      float(volatility_to_spread_multiplier),
+                                      float(max_spread))
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -90,6 +93,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
         limit_orders = self.order_tracker.active_limit_orders
         return [o[1] for o in limit_orders]
 
+    @property
+    def proposal_engine(self) -> ProposalEngine:
+        return self._engine
+
+    def market_active_orders(self) -> List[List[LimitOrder]]:
+        """
+        The active orders of each market, in the order of the markets.
+        """
+        return [list(self.order_tracker.get_active_orders(market_info)) for market_info in self._market_info_list]
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point, is run every second (on normal tick setting).
@@ -104,16 +117,17 @@ class LiquidityMiningStrategy(StrategyPyBase):
             else:
                 self.logger().info(f"{self._exchange.name} is ready. Trading started.")
                 self.create_budget_allocation()
+                for index in range(len(self._market_info_list)):
+                    self.update_order_quanta(index)
 
         self.update_mid_prices()
         self.update_volatility()
-        proposals = self.create_base_proposals()
-        self._token_balances = self.adjusted_available_balances()
-        if self._inventory_skew_enabled:
-            self.apply_inventory_skew(proposals)
-        self.apply_budget_constraint(proposals)
-        self.cancel_active_orders(proposals)
-        self.execute_orders_proposal(proposals)
+        market_orders = self.market_active_orders()
+        balances = self._engine.token_balances(self.available_balances(), market_orders)
+        buy_fee = estimate_fee(self._exchange.name, True)
+        proposals = self._engine.create_proposals(balances, float(buy_fee.percent))
+        self.cancel_active_orders(proposals, market_orders)
+        self.execute_orders_proposal(proposals, market_orders)
 
         self._last_timestamp = timestamp
 
@@ -150,16 +164,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def budget_status_df(self) -> pd.DataFrame:
         data = []
         columns = ["Market", f"Budget({self._token})", "Base bal", "Quote bal", "Base/Quote"]
-        for market, market_info in self._market_infos.items():
-            mid_price = market_info.get_mid_price()
-            base_bal = self._sell_budgets[market]
-            quote_bal = self._buy_budgets[market]
+        for index, (market, market_info) in enumerate(self._market_infos.items()):
+            mid_price = float(market_info.get_mid_price())
+            base_bal = self._engine.sell_budgets[index]
+            quote_bal = self._engine.buy_budgets[index]
             total_bal_in_quote = (base_bal * mid_price) + quote_bal
             total_bal_in_token = total_bal_in_quote
             if not self.is_token_a_quote_token():
                 total_bal_in_token = base_bal + (quote_bal / mid_price)
-            base_pct = (base_bal * mid_price) / total_bal_in_quote if total_bal_in_quote > 0 else s_decimal_zero
-            quote_pct = quote_bal / total_bal_in_quote if total_bal_in_quote > 0 else s_decimal_zero
+            base_pct = (base_bal * mid_price) / total_bal_in_quote if total_bal_in_quote > 0 else 0.
+            quote_pct = quote_bal / total_bal_in_quote if total_bal_in_quote > 0 else 0.
             data.append([
                 market,
                 float(total_bal_in_token),
@@ -174,7 +188,8 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def market_status_df(self) -> pd.DataFrame:
         data = []
         columns = ["Market", "Mid price", "Best bid", "Best ask", "Volatility"]
-        for market, market_info in self._market_infos.items():
+        for market, market_info, volatility in zip(self._market_infos, self._market_info_list,
+                                                   self._engine.volatility):
             mid_price = market_info.get_mid_price()
             best_bid = self._exchange.get_price(market, False)
             best_ask = self._exchange.get_price(market, True)
@@ -185,7 +200,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 float(mid_price),
                 f"{best_bid_pct:.2%}",
                 f"{best_ask_pct:.2%}",
-                "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
+                "" if np.isnan(volatility) else f"{volatility:.2%}",
             ])
         df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
         df.sort_values(by=["Market"], inplace=True)
@@ -247,25 +262,6 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def stop(self, clock: Clock):
         pass
 
-    def create_base_proposals(self):
-        proposals = []
-        for market, market_info in self._market_infos.items():
-            spread = self._spread
-            if not self._volatility[market].is_nan():
-                # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
-            if self._max_spread > s_decimal_zero:
-                spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
-            buy_price = mid_price * (Decimal("1") - spread)
-            buy_price = self._exchange.quantize_order_price(market, buy_price)
-            buy_size = self.base_order_size(market, buy_price)
-            sell_price = mid_price * (Decimal("1") + spread)
-            sell_price = self._exchange.quantize_order_price(market, sell_price)
-            sell_size = self.base_order_size(market, sell_price)
-            proposals.append(Proposal(market, PriceSize(buy_price, buy_size), PriceSize(sell_price, sell_size)))
-        return proposals
-
     def total_port_value_in_token(self) -> Decimal:
         all_bals = self.adjusted_available_balances()
         port_value = all_bals.get(self._token, s_decimal_zero)
@@ -279,80 +275,70 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def create_budget_allocation(self):
         # Create buy and sell budgets for every market
-        self._sell_budgets = {m: s_decimal_zero for m in self._market_infos}
-        self._buy_budgets = {m: s_decimal_zero for m in self._market_infos}
+        self._engine.sell_budgets[:] = 0.
+        self._engine.buy_budgets[:] = 0.
         port_value = self.total_port_value_in_token()
         market_portion = port_value / len(self._market_infos)
         balances = self.adjusted_available_balances()
-        for market, market_info in self._market_infos.items():
+        for index, (market, market_info) in enumerate(self._market_infos.items()):
             base, quote = market.split("-")
             if self.is_token_a_quote_token():
-                self._sell_budgets[market] = balances[base]
+                self._engine.sell_budgets[index] = float(balances[base])
                 buy_budget = market_portion - (balances[base] * market_info.get_mid_price())
                 if buy_budget > s_decimal_zero:
-                    self._buy_budgets[market] = buy_budget
+                    self._engine.buy_budgets[index] = float(buy_budget)
             else:
-                self._buy_budgets[market] = balances[quote]
+                self._engine.buy_budgets[index] = float(balances[quote])
                 sell_budget = market_portion - (balances[quote] / market_info.get_mid_price())
                 if sell_budget > s_decimal_zero:
-                    self._sell_budgets[market] = sell_budget
-
-    def base_order_size(self, trading_pair: str, price: Decimal = s_decimal_zero):
-        base, quote = trading_pair.split("-")
-        if self._token == base:
-            return self._order_amount
-        if price == s_decimal_zero:
-            price = self._market_infos[trading_pair].get_mid_price()
-        return self._order_amount / price
-
-    def apply_budget_constraint(self, proposals: List[Proposal]):
-        balances = self._token_balances.copy()
-        for proposal in proposals:
-            if balances[proposal.base()] < proposal.sell.size:
-                proposal.sell.size = balances[proposal.base()]
-            proposal.sell.size = self._exchange.quantize_order_amount(proposal.market, proposal.sell.size)
-            balances[proposal.base()] -= proposal.sell.size
-
-            quote_size = proposal.buy.size * proposal.buy.price
-            quote_size = balances[proposal.quote()] if balances[proposal.quote()] < quote_size else quote_size
-            buy_fee = estimate_fee(self._exchange.name, True)
-            buy_size = quote_size / (proposal.buy.price * (Decimal("1") + buy_fee.percent))
-            proposal.buy.size = self._exchange.quantize_order_amount(proposal.market, buy_size)
-            balances[proposal.quote()] -= quote_size
-
-    def is_within_tolerance(self, cur_orders: List[LimitOrder], proposal: Proposal):
-        cur_buy = [o for o in cur_orders if o.is_buy]
-        cur_sell = [o for o in cur_orders if not o.is_buy]
-        if (cur_buy and proposal.buy.size <= 0) or (cur_sell and proposal.sell.size <= 0):
-            return False
-        if cur_buy and \
-                abs(proposal.buy.price - cur_buy[0].price) / cur_buy[0].price > self._order_refresh_tolerance_pct:
-            return False
-        if cur_sell and \
-                abs(proposal.sell.price - cur_sell[0].price) / cur_sell[0].price > self._order_refresh_tolerance_pct:
-            return False
-        return True
-
-    def cancel_active_orders(self, proposals: List[Proposal]):
-        for proposal in proposals:
-            to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders and any(self.order_age(o) > self._max_order_age for o in cur_orders):
-                to_cancel = True
-            elif self._refresh_times[proposal.market] <= self.current_timestamp and \
-                    cur_orders and not self.is_within_tolerance(cur_orders, proposal):
-                to_cancel = True
-            if to_cancel:
-                for order in cur_orders:
-                    self.cancel_order(self._market_infos[proposal.market], order.client_order_id)
-                    # To place new order on the next tick
-                    self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
-
-    def execute_orders_proposal(self, proposals: List[Proposal]):
-        for proposal in proposals:
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
-                continue
+                    self._engine.sell_budgets[index] = float(sell_budget)
+
+    def update_order_quanta(self, index: int):
+        """
+        Reads the price and size quanta of a market from the exchange for the proposals of the engine.
+        """
+        market = self._engine.markets[index]
+        mid_price = self._market_info_list[index].get_mid_price()
+        self._engine.price_quanta[index] = float(self._exchange.get_order_price_quantum(market, mid_price))
+        self._engine.size_quanta[index] = float(self._exchange.get_order_size_quantum(market, self._order_amount))
+
+    def create_proposal(self, proposals: ProposalBatch, index: int) -> Proposal:
+        """
+        The proposal of a market from the proposal batch, quantized by the exchange.
+        """
+        market = self._engine.markets[index]
+        price_sizes = []
+        for price, size in ((proposals.buy_prices[index], proposals.buy_sizes[index]),
+                            (proposals.sell_prices[index], proposals.sell_sizes[index])):
+            if not np.isfinite(price) or not np.isfinite(size):
+                price, size = 0., 0.
+            price_sizes.append(PriceSize(self._exchange.quantize_order_price(market, Decimal(str(price))),
+                                         self._exchange.quantize_order_amount(market, Decimal(str(size)))))
+        return Proposal(market, *price_sizes)
+
+    def cancel_active_orders(self, proposals: ProposalBatch, market_orders: List[List[LimitOrder]]):
+        cur_buy_prices = np.full(len(proposals), NaN)
+        cur_sell_prices = np.full(len(proposals), NaN)
+        expired = np.zeros(len(proposals), dtype=bool)
+        for index, cur_orders in enumerate(market_orders):
+            for order in cur_orders:
+                cur_prices = cur_buy_prices if order.is_buy else cur_sell_prices
+                if np.isnan(cur_prices[index]):
+                    cur_prices[index] = float(order.price)
+                if self.order_age(order) > self._max_order_age:
+                    expired[index] = True
+        to_cancel = expired | ((self._engine.refresh_times <= self.current_timestamp) &
+                               ~self._engine.within_tolerance(proposals, cur_buy_prices, cur_sell_prices))
+        for index in np.flatnonzero(to_cancel):
+            for order in market_orders[index]:
+                self.cancel_order(self._market_info_list[index], order.client_order_id)
+            # To place new order on the next tick
+            self._engine.refresh_times[index] = self.current_timestamp + 0.1
+
+    def execute_orders_proposal(self, proposals: ProposalBatch, market_orders: List[List[LimitOrder]]):
+        no_orders = np.array([len(cur_orders) == 0 for cur_orders in market_orders], dtype=bool)
+        for index in np.flatnonzero(no_orders & (self._engine.refresh_times <= self.current_timestamp)):
+            proposal = self.create_proposal(proposals, index)
             mid_price = self._market_infos[proposal.market].get_mid_price()
             spread = s_decimal_zero
             if proposal.buy.size > 0:
@@ -378,13 +364,15 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     price=proposal.sell.price
                 )
             if proposal.buy.size > 0 or proposal.sell.size > 0:
-                if not self._volatility[proposal.market].is_nan() and spread > self._spread:
-                    adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
+                volatility = self._engine.volatility[index]
+                if not np.isnan(volatility) and spread > self._spread:
+                    adjusted_vol = Decimal(str(volatility)) * self._volatility_to_spread_multiplier
                     if adjusted_vol > self._spread:
                         self.logger().info(f"({proposal.market}) Spread is widened to {spread:.2%} due to high "
                                            f"market volatility")
 
-                self._refresh_times[proposal.market] = self.current_timestamp + self._order_refresh_time
+                self._engine.refresh_times[index] = self.current_timestamp + self._order_refresh_time
+                self.update_order_quanta(index)
 
     def is_token_a_quote_token(self):
         quotes = self.all_quote_tokens()
@@ -429,21 +417,11 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 adjusted_bals[base] += order.quantity
         return adjusted_bals
 
-    def apply_inventory_skew(self, proposals: List[Proposal]):
-        for proposal in proposals:
-            buy_budget = self._buy_budgets[proposal.market]
-            sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
-            total_order_size = proposal.sell.size + proposal.buy.size
-            bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
-                float(sell_budget),
-                float(buy_budget),
-                float(mid_price),
-                float(self._target_base_pct),
-                float(total_order_size * self._inventory_range_multiplier)
-            )
-            proposal.buy.size *= Decimal(bid_ask_ratios.bid_ratio)
-            proposal.sell.size *= Decimal(bid_ask_ratios.ask_ratio)
+    def available_balances(self) -> np.ndarray:
+        """
+        The available balance of each token of the engine.
+        """
+        return np.array([float(self._exchange.get_available_balance(token)) for token in self._engine.tokens])
 
     def did_fill_order(self, event):
         order_id = event.order_id
@@ -454,41 +432,27 @@ class LiquidityMiningStrategy(StrategyPyBase):
                       f"{market_info.base_asset} is filled."
                 self.log_with_clock(logging.INFO, msg)
                 self.notify_hb_app(msg)
-                self._buy_budgets[market_info.trading_pair] -= (event.amount * event.price)
-                self._sell_budgets[market_info.trading_pair] += event.amount
+                index = self._engine.market_index(market_info.trading_pair)
+                self._engine.buy_budgets[index] -= float(event.amount * event.price)
+                self._engine.sell_budgets[index] += float(event.amount)
             else:
                 msg = f"({market_info.trading_pair}) Maker SELL order (price: {event.price}) of {event.amount} " \
                       f"{market_info.base_asset} is filled."
                 self.log_with_clock(logging.INFO, msg)
                 self.notify_hb_app(msg)
-                self._sell_budgets[market_info.trading_pair] -= event.amount
-                self._buy_budgets[market_info.trading_pair] += (event.amount * event.price)
+                index = self._engine.market_index(market_info.trading_pair)
+                self._engine.sell_budgets[index] -= float(event.amount)
+                self._engine.buy_budgets[index] += float(event.amount * event.price)
 
     def update_mid_prices(self):
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        self._engine.update_mid_prices(np.array([float(market_info.get_mid_price())
+                                                 for market_info in self._market_info_list]))
 
     def update_volatility(self):
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._engine.update_volatility()
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
-            for market, vol in self._volatility.items():
-                if not vol.is_nan():
+            for market, vol in zip(self._engine.markets, self._engine.volatility):
+                if not np.isnan(vol):
                     self.logger().info(f"{market} volatility: {vol:.2%}")
             self._last_vol_reported = self.current_timestamp
 
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+from typing import (
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+)
+import numpy as np
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from .data_types import ProposalBatch
+
+NaN = float("nan")
+
+
+class ProposalEngine:
+    """
+    Keeps the per market state of the liquidity mining strategy in float arrays, in the order of the markets: the mid
+    prices needed for the volatility, the volatility, the budgets, the next refresh times and the order quanta, so that
+    the proposals of all the markets are computed at once on each tick. The strategy converts the proposals to Decimal
+    and quantizes them with its exchange only when it places orders.
+    """
+    def __init__(self,
+                 markets: Sequence[str],
+                 token: str,
+                 order_amount: float,
+                 spread: float,
+                 inventory_skew_enabled: bool,
+                 target_base_pct: float,
+                 order_refresh_tolerance_pct: float,
+                 inventory_range_multiplier: float = 1.,
+                 volatility_interval: int = 60 * 5,
+                 avg_volatility_period: int = 10,
+                 volatility_to_spread_multiplier: float = 1.,
+                 max_spread: float = -1.):
+        self._markets: List[str] = list(markets)
+        self._market_indexes: Dict[str, int] = {market: i for i, market in enumerate(self._markets)}
+        base_quotes = [market.split("-") for market in self._markets]
+        self._tokens: List[str] = list(dict.fromkeys(t for base_quote in base_quotes for t in base_quote))
+        token_indexes = {t: i for i, t in enumerate(self._tokens)}
+        self._base_indexes: np.ndarray = np.array([token_indexes[b] for b, _ in base_quotes], dtype=np.int64)
+        self._quote_indexes: np.ndarray = np.array([token_indexes[q] for _, q in base_quotes], dtype=np.int64)
+        self._is_token_base: np.ndarray = np.array([b == token for b, _ in base_quotes], dtype=bool)
+        # Balance draws of a tick are sells of the base token then buys of the quote token, market by market; they
+        # are grouped by token for the running totals of each token.
+        draw_tokens = np.empty(2 * len(self._markets), dtype=np.int64)
+        draw_tokens[0::2] = self._base_indexes
+        draw_tokens[1::2] = self._quote_indexes
+        self._draw_order: np.ndarray = np.argsort(draw_tokens, kind="stable")
+        self._draw_tokens: np.ndarray = draw_tokens[self._draw_order]
+        group_starts = np.flatnonzero(np.r_[True, self._draw_tokens[1:] != self._draw_tokens[:-1]])
+        self._draw_group_starts: np.ndarray = np.repeat(group_starts, np.diff(np.r_[group_starts, len(draw_tokens)]))
+
+        self._order_amount = order_amount
+        self._spread = spread
+        self._inventory_skew_enabled = inventory_skew_enabled
+        self._target_base_pct = target_base_pct
+        self._order_refresh_tolerance_pct = order_refresh_tolerance_pct
+        self._inventory_range_multiplier = inventory_range_multiplier
+        self._volatility_interval = volatility_interval
+        self._avg_volatility_period = avg_volatility_period
+        self._volatility_to_spread_multiplier = volatility_to_spread_multiplier
+        self._max_spread = max_spread
+
+        # Only the last part of the mid prices needed for volatility calculation is kept, in a window twice as long
+        # that is shifted back once full.
+        self._max_mid_prices = volatility_interval * avg_volatility_period
+        self._mid_prices: np.ndarray = np.empty((len(self._markets), 2 * max(self._max_mid_prices, 1)))
+        self._mid_prices_start = 0
+        self._mid_prices_end = 0
+
+        self.volatility: np.ndarray = np.full(len(self._markets), NaN)
+        self.buy_budgets: np.ndarray = np.zeros(len(self._markets))
+        self.sell_budgets: np.ndarray = np.zeros(len(self._markets))
+        self.refresh_times: np.ndarray = np.zeros(len(self._markets))
+        # 0 until read from the exchange, no quantization until then.
+        self.price_quanta: np.ndarray = np.zeros(len(self._markets))
+        self.size_quanta: np.ndarray = np.zeros(len(self._markets))
+
+    @property
+    def markets(self) -> List[str]:
+        return self._markets
+
+    @property
+    def tokens(self) -> List[str]:
+        return self._tokens
+
+    @property
+    def base_indexes(self) -> np.ndarray:
+        return self._base_indexes
+
+    @property
+    def quote_indexes(self) -> np.ndarray:
+        return self._quote_indexes
+
+    def market_index(self, market: str) -> int:
+        return self._market_indexes[market]
+
+    @property
+    def mid_price_history(self) -> np.ndarray:
+        """
+        The kept mid prices, one row per market and one column per update, a view of the window.
+        """
+        return self._mid_prices[:, self._mid_prices_start:self._mid_prices_end]
+
+    @property
+    def mid_prices(self) -> np.ndarray:
+        return self._mid_prices[:, self._mid_prices_end - 1]
+
+    def update_mid_prices(self, mid_prices: np.ndarray):
+        if self._mid_prices_end == self._mid_prices.shape[1]:
+            length = self._mid_prices_end - self._mid_prices_start
+            self._mid_prices[:, :length] = self._mid_prices[:, self._mid_prices_start:self._mid_prices_end]
+            self._mid_prices_start, self._mid_prices_end = 0, length
+        self._mid_prices[:, self._mid_prices_end] = mid_prices
+        self._mid_prices_end += 1
+        self._mid_prices_start = max(self._mid_prices_start, self._mid_prices_end - max(self._max_mid_prices, 1))
+
+    def update_volatility(self):
+        """
+        The volatility of each market is the mean of the relative ranges of its mid prices over consecutive
+        volatility intervals, from the latest back to avg_volatility_period intervals.
+        """
+        mid_prices = self.mid_price_history
+        last_index = mid_prices.shape[1] - 1
+        first_index = max(last_index - self._max_mid_prices, 0)
+        atr = []
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i in range(last_index, first_index, self._volatility_interval * -1):
+                prices = mid_prices[:, i - self._volatility_interval + 1: i + 1]
+                if prices.shape[1] == 0:
+                    break
+                min_prices = prices.min(axis=1)
+                atr.append((prices.max(axis=1) - min_prices) / min_prices)
+        self.volatility = np.mean(atr, axis=0) if atr else np.full(len(self._markets), NaN)
+
+    def spreads(self) -> np.ndarray:
+        # volatility applies only when it is higher than the spread setting.
+        spreads = np.fmax(self._spread, self.volatility * self._volatility_to_spread_multiplier)
+        if self._max_spread > 0:
+            spreads = np.minimum(spreads, self._max_spread)
+        return spreads
+
+    def quantize_prices(self, prices: np.ndarray) -> np.ndarray:
+        quanta = np.where(self.price_quanta > 0, self.price_quanta, 1.)
+        return np.where(self.price_quanta > 0, np.round(prices / quanta) * quanta, prices)
+
+    def base_order_sizes(self, prices: np.ndarray) -> np.ndarray:
+        prices = np.where(prices == 0, self.mid_prices, prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self._is_token_base, self._order_amount, self._order_amount / prices)
+
+    def inventory_skew_ratios(self, total_order_sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The bid and ask ratios of calculate_bid_ask_ratios_from_base_asset_ratio for the budgets of all the markets.
+        """
+        base_amounts = self.sell_budgets
+        prices = self.mid_prices
+        base_ranges = total_order_sizes * self._inventory_range_multiplier
+        total_values = base_amounts * prices + self.buy_budgets
+        base_values = base_amounts * prices
+        range_values = np.minimum(base_ranges * prices, total_values * 0.5)
+        target_values = total_values * self._target_base_pct
+        left_limits = np.maximum(target_values - range_values, 0.)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bid_ratios = np.where(base_values < target_values,
+                                  2. - np.clip((base_values - left_limits) / (target_values - left_limits), 0., 1.),
+                                  1. - np.clip((base_values - target_values) / range_values, 0., 1.))
+        ask_ratios = 2. - bid_ratios
+        no_skew = (total_values <= 0) | (base_ranges <= 0)
+        return np.where(no_skew, 0., bid_ratios), np.where(no_skew, 0., ask_ratios)
+
+    def token_balances(self,
+                       available_balances: np.ndarray,
+                       market_orders: Sequence[Sequence[LimitOrder]]) -> np.ndarray:
+        """
+        The available balance of each token with the amounts of the active orders added back.
+        :param available_balances: the available balance of each token, in the order of tokens
+        :param market_orders: the active orders of each market
+        """
+        balances = np.array(available_balances, dtype=float)
+        for i, orders in enumerate(market_orders):
+            for order in orders:
+                if order.is_buy:
+                    balances[self._quote_indexes[i]] += float(order.quantity * order.price)
+                else:
+                    balances[self._base_indexes[i]] += float(order.quantity)
+        return balances
+
+    def draw_balances(self, balances: np.ndarray, draws: np.ndarray) -> np.ndarray:
+        """
+        Draws market by market from the token balances as long as they last, sells from the base token first then
+        buys from the quote token, and returns the amount each draw gets.
+        """
+        sorted_draws = draws[self._draw_order]
+        # Draws without a price do not take from the balances of the others.
+        finite_draws = np.where(np.isfinite(sorted_draws), sorted_draws, 0.)
+        drawn_before = np.cumsum(finite_draws) - finite_draws
+        drawn_before -= drawn_before[self._draw_group_starts]
+        left = np.maximum(np.maximum(balances, 0.)[self._draw_tokens] - drawn_before, 0.)
+        drawn = np.empty_like(draws)
+        drawn[self._draw_order] = np.minimum(sorted_draws, left)
+        return drawn
+
+    def create_proposals(self, balances: np.ndarray, buy_fee_pct: float) -> ProposalBatch:
+        """
+        The buy and sell proposals of all the markets around their latest mid prices, skewed by inventory if
+        enabled, and sized within the token balances.
+        :param balances: the balance of each token, from token_balances
+        :param buy_fee_pct: the fee percent of buy orders
+        """
+        spreads = self.spreads()
+        buy_prices = self.quantize_prices(self.mid_prices * (1. - spreads))
+        sell_prices = self.quantize_prices(self.mid_prices * (1. + spreads))
+        buy_sizes = self.base_order_sizes(buy_prices)
+        sell_sizes = self.base_order_sizes(sell_prices)
+        if self._inventory_skew_enabled:
+            bid_ratios, ask_ratios = self.inventory_skew_ratios(buy_sizes + sell_sizes)
+            buy_sizes = buy_sizes * bid_ratios
+            sell_sizes = sell_sizes * ask_ratios
+        draws = np.empty(2 * len(self._markets))
+        draws[0::2] = sell_sizes
+        draws[1::2] = buy_sizes * buy_prices
+        drawn = self.draw_balances(balances, draws)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy_sizes = drawn[1::2] / (buy_prices * (1. + buy_fee_pct))
+        return ProposalBatch(buy_prices, buy_sizes, sell_prices, drawn[0::2])
+
+    def empty_sizes(self, sizes: np.ndarray) -> np.ndarray:
+        """
+        Whether the sizes are quantized to 0.
+        """
+        return ~(sizes >= self.size_quanta) | (sizes <= 0)
+
+    def within_tolerance(self,
+                         proposals: ProposalBatch,
+                         buy_prices: np.ndarray,
+                         sell_prices: np.ndarray) -> np.ndarray:
+        """
+        Whether the proposals of the markets are within the refresh tolerance of their current orders.
+        :param buy_prices: the price of the first current buy order of each market, NaN if none
+        :param sell_prices: the price of the first current sell order of each market, NaN if none
+        """
+        has_buys = ~np.isnan(buy_prices)
+        has_sells = ~np.isnan(sell_prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buys_moved = np.abs(proposals.buy_prices - buy_prices) / buy_prices > self._order_refresh_tolerance_pct
+            sells_moved = np.abs(proposals.sell_prices - sell_prices) / sell_prices > \
+                self._order_refresh_tolerance_pct
+        return ~((has_buys & (self.empty_sizes(proposals.buy_sizes) | buys_moved)) |
+                 (has_sells & (self.empty_sizes(proposals.sell_sizes) | sells_moved)))
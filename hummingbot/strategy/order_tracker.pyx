@@ -2,11 +2,14 @@ from collections import (
     deque,
     OrderedDict
 )
+from decimal import Decimal
 import pandas as pd
 from typing import (
     Dict,
+    KeysView,
     List,
-    Tuple
+    Tuple,
+    ValuesView,
 )
 
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -34,16 +37,20 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        # The tracked limit orders without an in flight cancel, by market pair and by side, kept up to date on
+        # track, untrack and cancel, and as in flight cancels expire.
+        self._active_limit_orders = {}
+        self._active_bids = {}
+        self._active_asks = {}
+        self._active_order_id_to_market_pair = {}
+        # (cancel timestamp, market pair, order id) of the in flight cancels, oldest first
+        self._cancel_expiries = deque()
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
-        return limit_orders
+        self.c_expire_in_flight_cancels()
+        return [(market_pair.market, limit_order) for market_pair, orders_map in self._active_limit_orders.items()
+                for limit_order in orders_map.values()]
 
     @property
     def shadow_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -57,24 +64,43 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_limit_orders.keys()
-        for market_pair in market_pairs:
-            limit_orders = []
-            for limit_order in self._tracked_limit_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = limit_orders
-        return market_pair_to_orders
+        self.c_expire_in_flight_cancels()
+        return {market_pair: list(orders_map.values()) for market_pair, orders_map in self._active_limit_orders.items()}
 
     @property
     def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if limit_order.is_buy]
+        self.c_expire_in_flight_cancels()
+        return [(market_pair.market, limit_order) for market_pair, orders_map in self._active_bids.items()
+                for limit_order in orders_map.values()]
 
     @property
     def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if not limit_order.is_buy]
+        self.c_expire_in_flight_cancels()
+        return [(market_pair.market, limit_order) for market_pair, orders_map in self._active_asks.items()
+                for limit_order in orders_map.values()]
+
+    @property
+    def active_order_ids(self) -> KeysView[str]:
+        """
+        The ids of the tracked limit orders without an in flight cancel, a live read-only view.
+        """
+        self.c_expire_in_flight_cancels()
+        return self._active_order_id_to_market_pair.keys()
+
+    def get_active_orders(self, market_pair: MarketTradingPairTuple) -> ValuesView[LimitOrder]:
+        """
+        The tracked limit orders of a market pair without an in flight cancel, a live read-only view.
+        """
+        self.c_expire_in_flight_cancels()
+        return self._active_limit_orders.get(market_pair, {}).values()
+
+    def get_active_bids(self, market_pair: MarketTradingPairTuple) -> ValuesView[LimitOrder]:
+        self.c_expire_in_flight_cancels()
+        return self._active_bids.get(market_pair, {}).values()
+
+    def get_active_asks(self, market_pair: MarketTradingPairTuple) -> ValuesView[LimitOrder]:
+        self.c_expire_in_flight_cancels()
+        return self._active_asks.get(market_pair, {}).values()
 
     @property
     def tracked_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -121,6 +147,7 @@ cdef class OrderTracker(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
+        self.c_expire_in_flight_cancels()
 
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
@@ -140,6 +167,9 @@ cdef class OrderTracker(TimeIterator):
     cdef bint c_has_in_flight_cancel(self, str order_id):
         return self._in_flight_cancels.get(order_id, NaN) + self.CANCEL_EXPIRY_DURATION > self._current_timestamp
 
+    def has_in_flight_cancel(self, order_id: str) -> bool:
+        return self.c_has_in_flight_cancel(order_id)
+
     cdef bint c_check_and_track_cancel(self, str order_id):
         """
         :param order_id: the order id to be cancelled
@@ -151,6 +181,7 @@ cdef class OrderTracker(TimeIterator):
         if order_id in self._in_flight_pending_created:  # Checks if a Buy/SellOrderCreatedEvent has been received
             return False
 
+        self.c_expire_in_flight_cancels()
         # Maintain the cancel expiry time invariant.
         for k, cancel_timestamp in self._in_flight_cancels.items():
             if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
@@ -163,8 +194,15 @@ cdef class OrderTracker(TimeIterator):
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        market_pair = self._active_order_id_to_market_pair.get(order_id)
+        if market_pair is not None and self.c_has_in_flight_cancel(order_id):
+            self.c_remove_active_limit_order(market_pair, order_id)
+            self._cancel_expiries.append((self._current_timestamp, market_pair, order_id))
         return True
 
+    def check_and_track_cancel(self, order_id: str) -> bool:
+        return self.c_check_and_track_cancel(order_id)
+
     cdef object c_get_market_pair_from_order_id(self, str order_id):
         return self._order_id_to_market_pair.get(order_id)
 
@@ -195,6 +233,10 @@ cdef class OrderTracker(TimeIterator):
             self._tracked_limit_orders[market_pair] = {}
         if market_pair not in self._shadow_tracked_limit_orders:
             self._shadow_tracked_limit_orders[market_pair] = {}
+        if market_pair not in self._active_limit_orders:
+            self._active_limit_orders[market_pair] = {}
+            self._active_bids[market_pair] = {}
+            self._active_asks[market_pair] = {}
 
         cdef:
             LimitOrder limit_order = LimitOrder(order_id,
@@ -206,14 +248,24 @@ cdef class OrderTracker(TimeIterator):
                                                 quantity)
         self._tracked_limit_orders[market_pair][order_id] = limit_order
         self._shadow_tracked_limit_orders[market_pair][order_id] = limit_order
+        if not self.c_has_in_flight_cancel(order_id):
+            self.c_add_active_limit_order(market_pair, order_id, limit_order)
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
 
+    def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool,
+                                   price: Decimal, quantity: Decimal):
+        self.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
+
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
         if market_pair in self._tracked_limit_orders and order_id in self._tracked_limit_orders[market_pair]:
             del self._tracked_limit_orders[market_pair][order_id]
+            self.c_remove_active_limit_order(market_pair, order_id)
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
+                del self._active_limit_orders[market_pair]
+                del self._active_bids[market_pair]
+                del self._active_asks[market_pair]
             self._shadow_gc_requests.append((
                 self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
                 market_pair,
@@ -225,6 +277,9 @@ cdef class OrderTracker(TimeIterator):
         if order_id in self._in_flight_cancels:
             del self._in_flight_cancels[order_id]
 
+    def stop_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str):
+        self.c_stop_tracking_limit_order(market_pair, order_id)
+
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity):
         if market_pair not in self._tracked_market_orders:
             self._tracked_market_orders[market_pair] = {}
@@ -266,3 +321,39 @@ cdef class OrderTracker(TimeIterator):
 
     cdef c_remove_create_order_pending(self, str order_id):
         self._in_flight_pending_created.discard(order_id)
+
+    cdef c_add_active_limit_order(self, object market_pair, str order_id, LimitOrder limit_order):
+        self._active_limit_orders[market_pair][order_id] = limit_order
+        if limit_order.is_buy:
+            self._active_bids[market_pair][order_id] = limit_order
+        else:
+            self._active_asks[market_pair][order_id] = limit_order
+        self._active_order_id_to_market_pair[order_id] = market_pair
+
+    cdef c_remove_active_limit_order(self, object market_pair, str order_id):
+        if order_id not in self._active_order_id_to_market_pair:
+            return
+        del self._active_order_id_to_market_pair[order_id]
+        del self._active_limit_orders[market_pair][order_id]
+        self._active_bids[market_pair].pop(order_id, None)
+        self._active_asks[market_pair].pop(order_id, None)
+
+    cdef c_expire_in_flight_cancels(self):
+        """
+        Makes the orders whose in flight cancel has expired active again, in their tracking order.
+        """
+        cdef:
+            set market_pairs = set()
+        while len(self._cancel_expiries) > 0 and \
+                not self._cancel_expiries[0][0] + self.CANCEL_EXPIRY_DURATION > self._current_timestamp:
+            _, market_pair, order_id = self._cancel_expiries.popleft()
+            if order_id in self._tracked_limit_orders.get(market_pair, {}) and \
+                    order_id not in self._active_order_id_to_market_pair and \
+                    not self.c_has_in_flight_cancel(order_id):
+                market_pairs.add(market_pair)
+        for market_pair in market_pairs:
+            for order_id in list(self._active_limit_orders[market_pair].keys()):
+                self.c_remove_active_limit_order(market_pair, order_id)
+            for order_id, limit_order in self._tracked_limit_orders[market_pair].items():
+                if not self.c_has_in_flight_cancel(order_id):
+                    self.c_add_active_limit_order(market_pair, order_id, limit_order)
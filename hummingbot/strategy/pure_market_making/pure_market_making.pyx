@@ -389,17 +389,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def active_orders(self) -> List[LimitOrder]:
-        if self._market_info not in self.market_info_to_active_orders:
-            return []
-        return self.market_info_to_active_orders[self._market_info]
+        return list(self._sb_order_tracker.get_active_orders(self._market_info))
 
     @property
     def active_buys(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if o.is_buy]
+        return list(self._sb_order_tracker.get_active_bids(self._market_info))
 
     @property
     def active_sells(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if not o.is_buy]
+        return list(self._sb_order_tracker.get_active_asks(self._market_info))
 
     @property
     def active_non_hanging_orders(self) -> List[LimitOrder]:
@@ -1,7 +1,8 @@
 from typing import (
     Dict,
     List,
-    Tuple
+    Tuple,
+    ValuesView,
 )
 
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -47,3 +48,12 @@ cdef class TheMoneyPitOrderTracker(OrderTracker):
                 maker_orders.append(limit_order)
             market_pair_to_orders[market_pair] = maker_orders
         return market_pair_to_orders
+
+    def get_active_orders(self, market_pair: MarketTradingPairTuple) -> ValuesView[LimitOrder]:
+        return self._tracked_limit_orders.get(market_pair, {}).values()
+
+    def get_active_bids(self, market_pair: MarketTradingPairTuple) -> List[LimitOrder]:
+        return [o for o in self.get_active_orders(market_pair) if o.is_buy]
+
+    def get_active_asks(self, market_pair: MarketTradingPairTuple) -> List[LimitOrder]:
+        return [o for o in self.get_active_orders(market_pair) if not o.is_buy]
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Cost of finding the best arbitrage amount between two order books of 10, 100 and 1000 levels a side, crossed over
+all their levels so that every level is walked, with the Decimal steps of ArbitrageStrategy, with its double precision
+search checked in Decimal, and with the search alone. Also the cost of the volume weighted average price of the whole
+book, as cross exchange market making hedges its orders, next to the same walk over the order book rows in Python.
+
+Usage: python test/benchmark_arbitrage_search.py [levels ...]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import logging
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+import numpy as np
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeFee,
+)
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.arbitrage.order_book_search import find_best_arbitrage_amount
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+LEVELS = [int(arg) for arg in sys.argv[1:]] or [10, 100, 1000]
+REPEATS = 20
+TRADING_PAIR = "HBOT-USDT"
+
+
+class BenchmarkExchange(ExchangeBase):
+    def __init__(self, name: str, bids: List[OrderBookRow], asks: List[OrderBookRow]):
+        self._name = name
+        super().__init__()
+        self._order_book = OrderBook()
+        self._order_book.apply_snapshot(bids, asks, 1)
+        self._balances: Dict[str, Decimal] = {"HBOT": Decimal(10 ** 9), "USDT": Decimal(10 ** 12)}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    @property
+    def limit_orders(self) -> List[LimitOrder]:
+        return []
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self._balances[currency]
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self._order_book
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.0001")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("0.001")
+
+    def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side, amount: Decimal,
+                price: Decimal = Decimal("NaN")) -> TradeFee:
+        return TradeFee(Decimal("0.001"))
+
+
+def python_vwap(order_book: OrderBook, volume: float) -> float:
+    # The walk of OrderBook.c_get_vwap_for_volume over the order book rows, as it was.
+    total_cost = total_volume = 0.
+    for row in order_book.bid_entries():
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            total_cost += (volume - total_volume) * row.price
+            total_volume = volume
+            return total_cost / total_volume
+    return float("nan")
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function(*args)
+    return (time.perf_counter() - start) / REPEATS * 1e3
+
+
+def measure(levels: int):
+    rng = np.random.RandomState(0)
+    # The asks of the buy market all below the bids of the sell market.
+    buy_exchange = BenchmarkExchange(
+        "buy",
+        [OrderBookRow(99. - 0.01 * i, 1. + rng.rand(), 1) for i in range(levels)],
+        [OrderBookRow(100. + 0.01 * i + rng.rand() * 0.001, 1. + rng.rand(), 1) for i in range(levels)])
+    sell_exchange = BenchmarkExchange(
+        "sell",
+        [OrderBookRow(200. - 0.01 * i - rng.rand() * 0.001, 1. + rng.rand(), 1) for i in range(levels)],
+        [OrderBookRow(201. + 0.01 * i, 1. + rng.rand(), 1) for i in range(levels)])
+    buy_market = MarketTradingPairTuple(buy_exchange, TRADING_PAIR, "HBOT", "USDT")
+    sell_market = MarketTradingPairTuple(sell_exchange, TRADING_PAIR, "HBOT", "USDT")
+    strategy = ArbitrageStrategy([ArbitrageMarketPair(buy_market, sell_market)], min_profitability=Decimal("0.003"),
+                                 logging_options=ArbitrageStrategy.OPTION_LOG_CREATE_ORDER)
+
+    by_steps = strategy.find_best_profitable_amount_by_steps(buy_market, sell_market)
+    fast = strategy.find_best_profitable_amount(buy_market, sell_market)
+    assert by_steps[0] == fast[0] and by_steps[2:] == fast[2:], (by_steps, fast)
+    timings = [
+        timed(strategy.find_best_profitable_amount_by_steps, buy_market, sell_market),
+        timed(strategy.find_best_profitable_amount, buy_market, sell_market),
+        timed(find_best_arbitrage_amount, sell_exchange.get_order_book(TRADING_PAIR),
+              buy_exchange.get_order_book(TRADING_PAIR), 1., 1., 0.0001, 0.001, 0.0001, 0.001, 0.003, 0.001, 0.,
+              0.001, 0.),
+    ]
+    order_book = sell_exchange.get_order_book(TRADING_PAIR)
+    volume = sum(row.amount for row in order_book.bid_entries()) * 0.99
+    timings.append(timed(python_vwap, order_book, volume))
+    timings.append(timed(order_book.get_vwap_for_volume, False, volume))
+    print(f"{levels:>8} {timings[0]:>12.3f} {timings[1]:>12.3f} {timings[2]:>12.4f} {timings[3]:>12.3f} "
+          f"{timings[4]:>12.4f}")
+
+
+def main():
+    logging.disable(logging.INFO)
+    print(f"{'levels':>8} {'steps ms':>12} {'search ms':>12} {'float ms':>12} {'py vwap ms':>12} {'vwap ms':>12}")
+    for levels in LEVELS:
+        measure(levels)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Microbenchmark of the throttler under contention: a burst of tasks competing for a Peatio like limit (8 weight per
+period). Reports the admission lateness (time between capacity freeing and the task running) and the number of
+coroutine wake ups, against the previous polling implementation.
+
+Usage: python test/benchmark_asyncio_throttle.py
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import statistics
+import time
+from collections import deque
+
+from hummingbot.core.utils.asyncio_throttle import Throttler
+
+RATE_LIMIT = (8, 0.6)
+BURST_SIZES = [16, 64, 256]
+
+
+class PollingThrottler:
+    """
+    The previous throttler: every waiter re-sums the task logs and sleeps retry_interval until there is capacity.
+    """
+    def __init__(self, rate_limit, retry_interval=0.1):
+        self._limit, self._period = rate_limit
+        self._retry_interval = retry_interval
+        self._task_logs = deque()
+        self.wakeup_count = 0
+
+    async def acquire(self, weight):
+        while True:
+            now = time.time()
+            while self._task_logs and now - self._task_logs[0][0] > self._period:
+                self._task_logs.popleft()
+            if self._limit - sum(w for _, w in self._task_logs) - weight >= 0:
+                break
+            await asyncio.sleep(self._retry_interval)
+            self.wakeup_count += 1
+        self._task_logs.append((time.time(), weight))
+
+
+async def run_burst(acquire, burst_size):
+    start = time.time()
+    admitted = []
+
+    async def task():
+        await acquire()
+        admitted.append(time.time() - start)
+
+    await asyncio.gather(*[task() for _ in range(burst_size)])
+    admitted.sort()
+    limit, period = RATE_LIMIT
+    # Ideal admission time of the i-th task is the start of its window.
+    lateness = [(t - (i // limit) * period) * 1e3 for i, t in enumerate(admitted)]
+    return statistics.median(lateness), max(lateness)
+
+
+async def main():
+    print(f"{'engine':>8} {'burst':>6} {'p50 late ms':>12} {'max late ms':>12} {'wakeups':>8}")
+    for burst_size in BURST_SIZES:
+        polling = PollingThrottler(RATE_LIMIT)
+        p50, worst = await run_burst(lambda: polling.acquire(1), burst_size)
+        print(f"{'polling':>8} {burst_size:>6} {p50:>12.2f} {worst:>12.2f} {polling.wakeup_count:>8}")
+
+        throttler = Throttler(rate_limit=RATE_LIMIT, period_safety_margin=0)
+        p50, worst = await run_burst(lambda: throttler.weighted_task(1).acquire(), burst_size)
+        # Each waiting task is resumed exactly once, plus one timer callback per freed window.
+        wakeups = burst_size - RATE_LIMIT[0] + throttler.wakeup_count
+        print(f"{'waiters':>8} {burst_size:>6} {p50:>12.2f} {worst:>12.2f} {wakeups:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
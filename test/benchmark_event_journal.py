@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Memory held by the event logs of a connector after a million synthetic fills (with an order cancellation every ten
+fills), with the unbounded EventLogger the connectors used to keep and with EventJournal at the default retention of
+ConnectorBase, along with the time to sum the fills since a timestamp as order_filled_balances does.
+
+Usage: python test/benchmark_event_journal.py [fills]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import gc
+import time
+import tracemalloc
+from decimal import Decimal
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_journal import EventJournal
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+FILLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+START_TIMESTAMP = 1615978800.0
+TRADE_FEE = TradeFee(Decimal("0.001"))
+
+
+def log_events(logger):
+    for i in range(FILLS):
+        timestamp = START_TIMESTAMP + i * 0.5
+        logger(OrderFilledEvent(timestamp, f"HBOT-{i}", "HBOT-USDT", TradeType.BUY if i % 2 else TradeType.SELL,
+                                OrderType.LIMIT, Decimal(f"{1 + i % 1000 / 1000}"), Decimal(f"{1 + i % 100}"),
+                                TRADE_FEE, f"{i}"))
+        if i % 10 == 0:
+            logger(OrderCancelledEvent(timestamp, f"HBOT-{i}"))
+
+
+def measure(name: str, make_logger, iter_fills_since):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    logger = make_logger()
+    log_events(logger)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    since = START_TIMESTAMP + FILLS * 0.5 - 3600
+    start = time.perf_counter()
+    fills = sum(1 for _ in iter_fills_since(logger, since))
+    scan_ms = (time.perf_counter() - start) * 1e3
+    print(f"{name:<24} {current / 2 ** 20:>10.1f} {elapsed:>10.2f} {fills:>12} {scan_ms:>10.2f}")
+
+
+def main():
+    print(f"{FILLS} fills, fills of the last hour summed")
+    print(f"{'event log':<24} {'memory MB':>10} {'log s':>10} {'hour fills':>12} {'scan ms':>10}")
+    measure("EventLogger", lambda: EventLogger(),
+            lambda logger, since: [e for e in filter(lambda e: isinstance(e, OrderFilledEvent), logger.event_log)
+                                   if e.timestamp > since])
+    measure("EventJournal", lambda: EventJournal(max_events=ConnectorBase.EVENT_LOG_MAX_EVENTS),
+            lambda journal, since: journal.iter_events(OrderFilledEvent, since=since))
+
+
+if __name__ == "__main__":
+    main()
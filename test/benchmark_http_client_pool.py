@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+REST request latency against a local HTTPS stand-in of the Peatio API: a new session per request, as the data source
+helpers used to do, one default session per component (exchange, data source, rate oracle) and the shared pooled
+sessions of HTTPClientPool. Each component sends its requests in turn with a pause in between, as the polling loops
+do, plus a burst of concurrent requests.
+
+Usage: python test/benchmark_http_client_pool.py [requests per component]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import ssl
+import tempfile
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+import aiohttp
+import numpy as np
+from aiohttp import web
+
+from hummingbot.core.utils.http_client_pool import (
+    HTTPClientPool,
+    HTTPClientPoolConfig,
+)
+from hummingbot.core.utils.ssl_cert import (
+    generate_private_key,
+    generate_public_key,
+)
+from test.integration.humming_web_app import get_open_port
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+COMPONENTS = ["exchange", "order book data source", "rate oracle"]
+# Time between two requests of a component
+PAUSE = 0.005
+BURST = 20
+
+
+async def timestamp(request: web.Request) -> web.Response:
+    return web.json_response({"timestamp": time.time()})
+
+
+async def start_server(tmp_dir: str, port: int) -> web.AppRunner:
+    key_file, cert_file = join(tmp_dir, "key.pem"), join(tmp_dir, "cert.pem")
+    generate_public_key(generate_private_key(None, key_file), cert_file)
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_file, key_file)
+    app = web.Application()
+    app.router.add_get("/public/timestamp", timestamp)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port, ssl_context=server_context).start()
+    return runner
+
+
+async def timed_get(session: aiohttp.ClientSession, url: str, client_context: ssl.SSLContext) -> float:
+    start = time.perf_counter()
+    async with session.get(url, ssl=client_context) as response:
+        await response.json()
+    return time.perf_counter() - start
+
+
+async def new_session_get(url: str, client_context: ssl.SSLContext) -> float:
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        await timed_get(session, url, client_context)
+    return time.perf_counter() - start
+
+
+async def run(get_session: Callable[[str], aiohttp.ClientSession], url: str,
+              client_context: ssl.SSLContext) -> List[float]:
+    latencies: List[float] = []
+
+    async def component(name: str):
+        for _ in range(REQUESTS):
+            session = get_session(name)
+            if session is None:
+                latencies.append(await new_session_get(url, client_context))
+            else:
+                latencies.append(await timed_get(session, url, client_context))
+            await asyncio.sleep(PAUSE)
+
+    await asyncio.gather(*[component(name) for name in COMPONENTS])
+
+    async def burst_get():
+        session = get_session(COMPONENTS[0])
+        if session is None:
+            return await new_session_get(url, client_context)
+        return await timed_get(session, url, client_context)
+
+    latencies.extend(await asyncio.gather(*[burst_get() for _ in range(BURST)]))
+    return latencies
+
+
+def report(name: str, latencies: List[float], elapsed: float):
+    latencies_ms = np.array(latencies) * 1e3
+    print(f"{name:<28} {len(latencies):>8} {np.percentile(latencies_ms, 50):>8.2f} "
+          f"{np.percentile(latencies_ms, 99):>8.2f} {latencies_ms.max():>8.2f} {elapsed:>8.2f}")
+
+
+async def main():
+    port = get_open_port()
+    url = f"https://127.0.0.1:{port}/public/timestamp"
+    client_context = ssl.create_default_context()
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        runner = await start_server(tmp_dir, port)
+        print(f"{REQUESTS} requests per component, {len(COMPONENTS)} components, burst of {BURST}")
+        print(f"{'client':<28} {'requests':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'total s':>8}")
+
+        start = time.perf_counter()
+        latencies = await run(lambda name: None, url, client_context)
+        report("session per request", latencies, time.perf_counter() - start)
+
+        sessions = {name: aiohttp.ClientSession() for name in COMPONENTS}
+        start = time.perf_counter()
+        latencies = await run(lambda name: sessions[name], url, client_context)
+        report("session per component", latencies, time.perf_counter() - start)
+        for session in sessions.values():
+            await session.close()
+
+        pool = HTTPClientPool(HTTPClientPoolConfig(limit=20, keepalive_timeout=60.0))
+        start = time.perf_counter()
+        latencies = await run(lambda name: pool.get_session(url), url, client_context)
+        report("pooled session", latencies, time.perf_counter() - start)
+        print(pool.format_stats())
+        await pool.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
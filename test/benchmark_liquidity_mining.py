@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+Tick cost of the liquidity mining strategy over 10, 100 and 500 markets quoted in USDT, with a full volatility window
+of mid prices and an order on each side of every market, on an in process exchange whose mid prices take a random
+walk. The per market Decimal work the strategy used to do on each tick (mid prices, volatility, proposals, balances,
+inventory skew, budget constraint and refresh tolerance) is replayed here in Python, next to the same work done by
+ProposalEngine and to the tick of the strategy itself, which also cancels and places the orders that need it.
+
+Usage: python test/benchmark_liquidity_mining.py [markets ...]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import logging
+import time
+from decimal import Decimal
+from statistics import mean
+from typing import (
+    Dict,
+    List,
+)
+
+import numpy as np
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.event.events import OrderType
+from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
+from hummingbot.strategy.liquidity_mining.data_types import (
+    PriceSize,
+    Proposal,
+)
+from hummingbot.strategy.liquidity_mining.liquidity_mining import LiquidityMiningStrategy
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio
+)
+
+MARKETS = [int(arg) for arg in sys.argv[1:]] or [10, 100, 500]
+TICKS = 20
+START_TIMESTAMP = 1615978800.0
+VOLATILITY_INTERVAL = 300
+AVG_VOLATILITY_PERIOD = 10
+SPREAD = Decimal("0.005")
+ORDER_AMOUNT = Decimal("100")
+TOLERANCE = Decimal("0.002")
+s_decimal_zero = Decimal(0)
+
+
+class BenchmarkExchange(ExchangeBase):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__()
+        self._trading_pair_indexes = {trading_pair: i for i, trading_pair in enumerate(trading_pairs)}
+        self._random = np.random.RandomState(0)
+        self._mid_prices = 1. + self._random.rand(len(trading_pairs)) * 100.
+        self._balances = {"USDT": Decimal(len(trading_pairs) * 1000)}
+        for i, trading_pair in enumerate(trading_pairs):
+            self._balances[trading_pair.split("-")[0]] = Decimal(repr(round(1000. / self._mid_prices[i], 4)))
+
+    @property
+    def name(self) -> str:
+        return "peatio"
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    @property
+    def limit_orders(self) -> List[LimitOrder]:
+        return []
+
+    def walk(self) -> np.ndarray:
+        self._mid_prices *= 1. + self._random.normal(0., 0.0005, len(self._mid_prices))
+        return self._mid_prices
+
+    def get_mid_price(self, trading_pair: str) -> Decimal:
+        return Decimal(repr(self._mid_prices[self._trading_pair_indexes[trading_pair]]))
+
+    def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
+        return self.get_mid_price(trading_pair) * (Decimal("1.0005") if is_buy else Decimal("0.9995"))
+
+    def get_all_balances(self) -> Dict[str, Decimal]:
+        return self._balances.copy()
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self._balances.get(currency, s_decimal_zero)
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.0001")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("0.0001")
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = s_decimal_zero,
+            **kwargs) -> str:
+        return f"buy-{trading_pair}-{get_tracking_nonce()}"
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = s_decimal_zero,
+             **kwargs) -> str:
+        return f"sell-{trading_pair}-{get_tracking_nonce()}"
+
+    def cancel(self, trading_pair: str, client_order_id: str):
+        pass
+
+
+class DecimalTick:
+    """
+    The per market Decimal work of a tick of the strategy before ProposalEngine, on the state of a strategy.
+    """
+    def __init__(self, strategy: LiquidityMiningStrategy, exchange: BenchmarkExchange,
+                 market_infos: Dict[str, MarketTradingPairTuple]):
+        self.strategy = strategy
+        self.exchange = exchange
+        self.market_infos = market_infos
+        engine = strategy.proposal_engine
+        self.mid_prices = {market: [Decimal(repr(p)) for p in engine.mid_price_history[i]]
+                           for i, market in enumerate(engine.markets)}
+        self.volatility = {}
+        self.buy_budgets = {market: Decimal(repr(b)) for market, b in zip(engine.markets, engine.buy_budgets)}
+        self.sell_budgets = {market: Decimal(repr(b)) for market, b in zip(engine.markets, engine.sell_budgets)}
+
+    def __call__(self):
+        for market, market_info in self.market_infos.items():
+            self.mid_prices[market].append(market_info.get_mid_price())
+            self.mid_prices[market] = self.mid_prices[market][-1 * VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD:]
+        for market, mid_prices in self.mid_prices.items():
+            last_index = len(mid_prices) - 1
+            atr = []
+            first_index = max(last_index - (VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD), 0)
+            for i in range(last_index, first_index, VOLATILITY_INTERVAL * -1):
+                prices = mid_prices[i - VOLATILITY_INTERVAL + 1: i + 1]
+                if not prices:
+                    break
+                atr.append((max(prices) - min(prices)) / min(prices))
+            self.volatility[market] = mean(atr) if atr else Decimal("NaN")
+        proposals = []
+        for market, market_info in self.market_infos.items():
+            spread = SPREAD if self.volatility[market].is_nan() else max(SPREAD, self.volatility[market])
+            mid_price = market_info.get_mid_price()
+            buy_price = self.exchange.quantize_order_price(market, mid_price * (Decimal("1") - spread))
+            sell_price = self.exchange.quantize_order_price(market, mid_price * (Decimal("1") + spread))
+            proposals.append(Proposal(market, PriceSize(buy_price, ORDER_AMOUNT / buy_price),
+                                      PriceSize(sell_price, ORDER_AMOUNT / sell_price)))
+        balances = {t: self.exchange.get_available_balance(t) for t in self.strategy.all_tokens()}
+        for order in self.strategy.active_orders:
+            base, quote = order.trading_pair.split("-")
+            if order.is_buy:
+                balances[quote] += order.quantity * order.price
+            else:
+                balances[base] += order.quantity
+        for proposal in proposals:
+            ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
+                float(self.sell_budgets[proposal.market]), float(self.buy_budgets[proposal.market]),
+                float(self.market_infos[proposal.market].get_mid_price()), 0.5,
+                float(proposal.sell.size + proposal.buy.size))
+            proposal.buy.size *= Decimal(ratios.bid_ratio)
+            proposal.sell.size *= Decimal(ratios.ask_ratio)
+        buy_fee = estimate_fee(self.exchange.name, True)
+        for proposal in proposals:
+            proposal.sell.size = min(proposal.sell.size, balances[proposal.base()])
+            proposal.sell.size = self.exchange.quantize_order_amount(proposal.market, proposal.sell.size)
+            balances[proposal.base()] -= proposal.sell.size
+            quote_size = min(proposal.buy.size * proposal.buy.price, balances[proposal.quote()])
+            buy_size = quote_size / (proposal.buy.price * (Decimal("1") + buy_fee.percent))
+            proposal.buy.size = self.exchange.quantize_order_amount(proposal.market, buy_size)
+            balances[proposal.quote()] -= quote_size
+        within_tolerance = []
+        for proposal in proposals:
+            cur_orders = [o for o in self.strategy.active_orders if o.trading_pair == proposal.market]
+            cur_buy = [o for o in cur_orders if o.is_buy]
+            cur_sell = [o for o in cur_orders if not o.is_buy]
+            within_tolerance.append(
+                not (cur_buy and abs(proposal.buy.price - cur_buy[0].price) / cur_buy[0].price > TOLERANCE) and
+                not (cur_sell and abs(proposal.sell.price - cur_sell[0].price) / cur_sell[0].price > TOLERANCE))
+        return within_tolerance
+
+
+def engine_tick(strategy: LiquidityMiningStrategy, exchange: BenchmarkExchange):
+    strategy.update_mid_prices()
+    strategy.update_volatility()
+    market_orders = strategy.market_active_orders()
+    balances = strategy.proposal_engine.token_balances(strategy.available_balances(), market_orders)
+    proposals = strategy.proposal_engine.create_proposals(balances, float(estimate_fee(exchange.name, True).percent))
+    cur_buy_prices = np.array([next((float(o.price) for o in orders if o.is_buy), np.nan) for orders in market_orders])
+    cur_sell_prices = np.array([next((float(o.price) for o in orders if not o.is_buy), np.nan)
+                                for orders in market_orders])
+    return strategy.proposal_engine.within_tolerance(proposals, cur_buy_prices, cur_sell_prices)
+
+
+def measure(markets: int):
+    trading_pairs = [f"COIN{i}-USDT" for i in range(markets)]
+    exchange = BenchmarkExchange(trading_pairs)
+    market_infos = {tp: MarketTradingPairTuple(exchange, tp, *tp.split("-")) for tp in trading_pairs}
+    strategy = LiquidityMiningStrategy(exchange, market_infos, "USDT", ORDER_AMOUNT, SPREAD, True, Decimal("0.5"),
+                                       10., TOLERANCE, volatility_interval=VOLATILITY_INTERVAL,
+                                       avg_volatility_period=AVG_VOLATILITY_PERIOD)
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + 100000)
+    clock.add_iterator(strategy)
+    # A full volatility window of mid prices and the orders of the first ticks.
+    for _ in range(VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD - 2):
+        exchange.walk()
+        strategy.update_mid_prices()
+    timestamp = START_TIMESTAMP + 2
+    clock.backtest_til(timestamp)
+    decimal_tick = DecimalTick(strategy, exchange, market_infos)
+
+    timings = []
+    for tick in (decimal_tick, lambda: engine_tick(strategy, exchange)):
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            exchange.walk()
+            tick()
+        timings.append((time.perf_counter() - start) / TICKS * 1e3)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        exchange.walk()
+        timestamp += 1
+        clock.backtest_til(timestamp)
+    timings.append((time.perf_counter() - start) / TICKS * 1e3)
+    print(f"{markets:>8} {len(strategy.active_orders):>8} {timings[0]:>14.2f} {timings[1]:>14.2f} {timings[2]:>14.2f}")
+
+
+def main():
+    logging.disable(logging.INFO)
+    print(f"{'markets':>8} {'orders':>8} {'Decimal ms':>14} {'engine ms':>14} {'tick ms':>14}")
+    for markets in MARKETS:
+        measure(markets)
+
+
+if __name__ == "__main__":
+    main()
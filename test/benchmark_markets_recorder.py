@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Cost of recording order fills to the trades database, comparing the synchronous recorder (one query and commit per
+event on the event loop) with the write-behind recorder. Reports the event-to-return latency seen by the event loop
+and the fills per second sustained until everything is committed.
+
+Usage: python test/benchmark_markets_recorder.py
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+FILL_COUNTS = [50, 500]
+
+
+class BenchmarkConnector(ConnectorBase):
+    @property
+    def tracking_states(self) -> Dict[str, any]:
+        return {f"HBOT-{i}": {"price": "0.00000099", "amount": "10"} for i in range(20)}
+
+
+def run(write_behind: bool, fill_count: int, tmp_dir: str):
+    sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                               db_path=join(tmp_dir, f"trades_{write_behind}_{fill_count}.sqlite"))
+    market = BenchmarkConnector()
+    recorder = MarketsRecorder(sql, [market], "conf_pure_mm_1.yml", "pure_market_making", write_behind=write_behind)
+    recorder.start()
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for i in range(fill_count):
+        order_id = f"HBOT-B-ROGER-BTC-{1615978645000000 + i}"
+        for event_tag, evt in [
+            (MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent(1615978645, OrderType.LIMIT, "ROGER-BTC",
+                                                               Decimal("10"), Decimal("0.00000099"), order_id,
+                                                               str(i))),
+            (MarketEvent.OrderFilled, OrderFilledEvent(1615978645, order_id, "ROGER-BTC", TradeType.BUY,
+                                                       OrderType.LIMIT, Decimal("0.00000099"), Decimal("10"),
+                                                       TradeFee(Decimal("0.001")), str(i))),
+        ]:
+            event_start = time.perf_counter()
+            market.trigger_event(event_tag, evt)
+            latencies.append(time.perf_counter() - event_start)
+    recorder.stop()
+    elapsed = time.perf_counter() - start
+    sql.get_shared_session().close()
+    latencies.sort()
+    return (statistics.median(latencies) * 1e3, latencies[int(len(latencies) * 0.99)] * 1e3,
+            fill_count / elapsed)
+
+
+def main():
+    print(f"{'recorder':>12} {'fills':>6} {'p50 ms':>8} {'p99 ms':>8} {'fills/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            patch("hummingbot.connector.markets_recorder.data_path", return_value=tmp_dir):
+        for fill_count in FILL_COUNTS:
+            for write_behind in (False, True):
+                p50, p99, fills_per_second = run(write_behind, fill_count, tmp_dir)
+                name = "write-behind" if write_behind else "synchronous"
+                print(f"{name:>12} {fill_count:>6} {p50:>8.3f} {p99:>8.3f} {fills_per_second:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Cost of reading the depth of an order book: the pandas snapshot built from OrderBookRow objects against the NumPy
+arrays copied from the C++ books, and VWAP queries for several volumes one at a time against a single batched walk.
+
+Usage: python test/benchmark_order_book_depth.py [repetitions]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+REPETITIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+LEVELS = [50, 500, 5000]
+VWAP_VOLUMES = 20
+
+
+def make_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    order_book.apply_snapshot([OrderBookRow(100.0 - i * 0.01, 1.0, 1) for i in range(1, levels + 1)],
+                              [OrderBookRow(100.0 + i * 0.01, 1.0, 1) for i in range(1, levels + 1)],
+                              1)
+    return order_book
+
+
+def us_per_call(call: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        call()
+    return (time.perf_counter() - start) / REPETITIONS * 1e6
+
+
+def row_snapshot(order_book: OrderBook):
+    return (pd.DataFrame(data=list(order_book.bid_entries()), columns=OrderBookRow._fields, dtype="float64"),
+            pd.DataFrame(data=list(order_book.ask_entries()), columns=OrderBookRow._fields, dtype="float64"))
+
+
+def main():
+    print(f"{'levels':>7} {'row snapshot us':>16} {'snapshot us':>12} {'to_numpy us':>12} {'cumulative us':>14} "
+          f"{'vwap x{0} us':>12} {'batched vwap us':>16}".format(VWAP_VOLUMES))
+    for levels in LEVELS:
+        order_book = make_order_book(levels)
+        volumes = np.linspace(levels / VWAP_VOLUMES, levels, VWAP_VOLUMES)
+        results = [
+            us_per_call(lambda: row_snapshot(order_book)),
+            us_per_call(lambda: order_book.snapshot),
+            us_per_call(lambda: order_book.to_numpy()),
+            us_per_call(lambda: order_book.cumulative_depth(True)),
+            us_per_call(lambda: [order_book.get_vwap_for_volume(True, volume) for volume in volumes]),
+            us_per_call(lambda: order_book.get_vwap_for_volumes(True, volumes)),
+        ]
+        print(f"{levels:>7} {results[0]:>16.1f} {results[1]:>12.1f} {results[2]:>12.1f} {results[3]:>14.1f} "
+              f"{results[4]:>12.1f} {results[5]:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Throughput of the order book tracking loop on a burst of diffs queued for one trading pair, applying them one message
+at a time against draining the queue and applying each batch as a single coalesced diff.
+
+Usage: python test/benchmark_order_book_diffs.py [diffs] [price levels]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import random
+import time
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+DIFF_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+PRICE_LEVELS = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+TRADING_PAIR = "COINALPHA-BTC"
+
+
+class SnapshotDataSource(OrderBookTrackerDataSource):
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1.0 - i * 0.001, 1.0, 1) for i in range(1, PRICE_LEVELS)],
+                                  [OrderBookRow(1.0 + i * 0.001, 1.0, 1) for i in range(1, PRICE_LEVELS)],
+                                  1)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+def diff_messages() -> List[OrderBookMessage]:
+    rng = random.Random(42)
+    messages: List[OrderBookMessage] = []
+    for update_id in range(2, DIFF_COUNT + 2):
+        level: int = rng.randrange(1, PRICE_LEVELS)
+        amount: float = rng.choice([0.0, 1.0, 2.0])
+        content = {"trading_pair": TRADING_PAIR, "update_id": update_id, "bids": [], "asks": []}
+        content["bids" if rng.random() < 0.5 else "asks"] = [
+            [1.0 - level * 0.001, amount] if rng.random() < 0.5 else [1.0 + level * 0.001, amount]
+        ]
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, content, time.time()))
+    return messages
+
+
+async def diffs_per_second(batch_size: int, messages: List[OrderBookMessage]) -> float:
+    tracker = OrderBookTracker(SnapshotDataSource([TRADING_PAIR]), [TRADING_PAIR])
+    tracker.MAX_DIFF_BATCH_SIZE = batch_size
+    tracker.start()
+    await tracker.wait_for_order_books([TRADING_PAIR])
+    order_book: OrderBook = tracker.order_books[TRADING_PAIR]
+    message_queue: asyncio.Queue = tracker._tracking_message_queues[TRADING_PAIR]
+    start = time.perf_counter()
+    for message in messages:
+        message_queue.put_nowait(message)
+    while order_book.last_diff_uid < messages[-1].update_id:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    tracker.stop()
+    return len(messages) / elapsed
+
+
+async def main():
+    messages: List[OrderBookMessage] = diff_messages()
+    print(f"{DIFF_COUNT} diffs over {PRICE_LEVELS} price levels per side")
+    print(f"{'mode':>20} {'diffs/s':>10}")
+    for name, batch_size in [("one at a time", 1), ("batched", OrderBookTracker.MAX_DIFF_BATCH_SIZE)]:
+        print(f"{name:>20} {await diffs_per_second(batch_size, messages):>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Startup time of the order book tracker: time until the first order book is usable and until all of them are, with a
+mock data source whose snapshots take a configurable latency, for one at a time initialization and concurrent
+initialization, with and without a Peatio like request throttler in front of the snapshots.
+
+Usage: python test/benchmark_order_book_tracker_init.py [trading pairs] [latency in seconds]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.asyncio_throttle import Throttler
+
+TRADING_PAIRS = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+LATENCY = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+RATE_LIMIT = (8, 1.0)
+
+
+class LatencyDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], latency: float, throttler: Optional[Throttler] = None):
+        super().__init__(trading_pairs)
+        self._latency: float = latency
+        self._throttler: Optional[Throttler] = throttler
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        if self._throttler is not None:
+            async with self._throttler.weighted_task(1):
+                await asyncio.sleep(self._latency)
+        else:
+            await asyncio.sleep(self._latency)
+        return OrderBook()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+async def time_startup(concurrency: int, throttler: Optional[Throttler]):
+    trading_pairs: List[str] = [f"COIN{i}-BTC" for i in range(TRADING_PAIRS)]
+    tracker = OrderBookTracker(LatencyDataSource(trading_pairs, LATENCY, throttler), trading_pairs)
+    tracker.INIT_ORDER_BOOK_CONCURRENCY = concurrency
+    start = time.perf_counter()
+    tracker.start()
+    while len(tracker.ready_trading_pairs) == 0:
+        await asyncio.sleep(0.01)
+    first_ready = time.perf_counter() - start
+    await tracker._order_books_initialized.wait()
+    all_ready = time.perf_counter() - start
+    tracker.stop()
+    return first_ready, all_ready
+
+
+async def main():
+    print(f"{TRADING_PAIRS} trading pairs, {LATENCY * 1e3:.0f} ms snapshot latency")
+    print(f"{'mode':>24} {'first ready s':>14} {'all ready s':>12}")
+    for name, concurrency, throttler in [("sequential", 0, None),
+                                         ("concurrent (8)", 8, None),
+                                         (f"concurrent, {RATE_LIMIT[0]} req/s", 8, Throttler(RATE_LIMIT, 0))]:
+        first_ready, all_ready = await time_startup(concurrency, throttler)
+        print(f"{name:>24} {first_ready:>14.2f} {all_ready:>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Tick cost of reading the active orders of a strategy over 50 markets with 10 order levels a side, a few of them being
+cancelled, as pure market making does for each market: its active orders, active buys and active sells. The scan
+over every tracked order that OrderTracker used to do on each access is replayed here in Python, next to the
+market_pair_to_active_orders property, now built from the indexes, and the live views of the indexes.
+
+Usage: python test/benchmark_order_tracker.py [markets] [levels]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import time
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_tracker import OrderTracker
+
+MARKETS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+LEVELS = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+TICKS = 200
+START_TIMESTAMP = 1615978800.0
+
+
+def scan_active_orders(tracker: OrderTracker) -> Dict[MarketTradingPairTuple, List]:
+    market_pair_to_orders = {}
+    for market_pair, orders_map in tracker.get_limit_orders().items():
+        market_pair_to_orders[market_pair] = [o for o in orders_map.values()
+                                              if not tracker.has_in_flight_cancel(o.client_order_id)]
+    return market_pair_to_orders
+
+
+def tick_with_scan(tracker: OrderTracker, market_pairs: List[MarketTradingPairTuple]):
+    for market_pair in market_pairs:
+        active_orders = scan_active_orders(tracker).get(market_pair, [])
+        [o for o in scan_active_orders(tracker).get(market_pair, []) if o.is_buy]
+        [o for o in scan_active_orders(tracker).get(market_pair, []) if not o.is_buy]
+        len(active_orders)
+
+
+def tick_with_property(tracker: OrderTracker, market_pairs: List[MarketTradingPairTuple]):
+    for market_pair in market_pairs:
+        active_orders = tracker.market_pair_to_active_orders.get(market_pair, [])
+        [o for o in tracker.market_pair_to_active_orders.get(market_pair, []) if o.is_buy]
+        [o for o in tracker.market_pair_to_active_orders.get(market_pair, []) if not o.is_buy]
+        len(active_orders)
+
+
+def tick_with_views(tracker: OrderTracker, market_pairs: List[MarketTradingPairTuple]):
+    for market_pair in market_pairs:
+        active_orders = list(tracker.get_active_orders(market_pair))
+        list(tracker.get_active_bids(market_pair))
+        list(tracker.get_active_asks(market_pair))
+        len(active_orders)
+
+
+def measure(name: str, tick: Callable, tracker: OrderTracker, market_pairs: List[MarketTradingPairTuple]):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        tick(tracker, market_pairs)
+    elapsed_ms = (time.perf_counter() - start) / TICKS * 1e3
+    print(f"{name:<36} {elapsed_ms:>10.3f}")
+
+
+def main():
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + 1000)
+    tracker = OrderTracker()
+    clock.add_iterator(tracker)
+    clock.backtest_til(START_TIMESTAMP)
+    market_pairs = [MarketTradingPairTuple(None, f"COIN{i}-USDT", f"COIN{i}", "USDT") for i in range(MARKETS)]
+    for market_pair in market_pairs:
+        for level in range(LEVELS):
+            for is_buy in (True, False):
+                order_id = f"{'buy' if is_buy else 'sell'}://{market_pair.trading_pair}/{level}"
+                tracker.start_tracking_limit_order(market_pair, order_id, is_buy, Decimal(100), Decimal(1))
+                if level == LEVELS - 1:
+                    tracker.check_and_track_cancel(order_id)
+    assert scan_active_orders(tracker) == tracker.market_pair_to_active_orders
+    print(f"{MARKETS} markets x {LEVELS} levels, {len(tracker.active_order_ids)} active orders")
+    print(f"{'active orders read as':<36} {'tick ms':>10}")
+    measure("scan of every tracked order", tick_with_scan, tracker, market_pairs)
+    measure("market_pair_to_active_orders", tick_with_property, tracker, market_pairs)
+    measure("get_active_orders/bids/asks views", tick_with_views, tracker, market_pairs)
+
+
+if __name__ == "__main__":
+    main()
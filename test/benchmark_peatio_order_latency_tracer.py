@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Per stage cost of the Peatio order latency tracing as PeatioExchange pays it: the enabled check alone while tracing is
+disabled, and recording a stage while it is enabled, with a full ring of traced orders.
+
+Usage: python test/benchmark_peatio_order_latency_tracer.py [calls]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import time
+
+from hummingbot.connector.exchange.peatio.peatio_order_latency_tracer import (
+    OrderLatencyStage,
+    PeatioOrderLatencyTracer,
+)
+
+CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+CAPACITY = 10000
+
+
+class Exchange:
+    def __init__(self, tracer: PeatioOrderLatencyTracer):
+        self._order_latency_tracer = tracer
+
+    def stage(self, order_id: str):
+        # As the exchange guards each stage
+        if self._order_latency_tracer.enabled:
+            self._order_latency_tracer.record(order_id, OrderLatencyStage.ACKED)
+
+
+def per_call_ns(func, order_ids) -> float:
+    start = time.perf_counter()
+    for order_id in order_ids:
+        func(order_id)
+    return (time.perf_counter() - start) / len(order_ids) * 1e9
+
+
+def main():
+    tracer = PeatioOrderLatencyTracer(CAPACITY, enabled=True)
+    order_ids = [f"HBOT-{i}" for i in range(CAPACITY)]
+    for order_id in order_ids:
+        tracer.start(order_id, "ROGER-BTC")
+    calls = (order_ids * (CALLS // CAPACITY + 1))[:CALLS]
+    exchange = Exchange(tracer)
+    tracer.enabled = False
+    print(f"disabled, per stage          {per_call_ns(exchange.stage, calls):>8.1f} ns")
+    tracer.enabled = True
+    print(f"enabled, per stage           {per_call_ns(exchange.stage, calls):>8.1f} ns")
+    start_calls = calls[:CAPACITY * 10]
+    print(f"enabled, start (queued)      {per_call_ns(lambda o: tracer.start(o, 'ROGER-BTC'), start_calls):>8.1f} ns")
+    start = time.perf_counter()
+    tracer.format_summary()
+    print(f"summary of {len(tracer)} orders    {(time.perf_counter() - start) * 1e3:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Tick to script latency of the script bridge: the time from ScriptIterator.c_tick sending OnTick until the script's
+on_tick runs in the script process, with the CPU time used by both processes, for 1 s and 100 ms clock ticks. The
+strategy and market are stand-ins with the pure market making parameters and a few balances.
+
+Usage: python test/benchmark_script_bridge.py [seconds per run]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import os
+import tempfile
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+import numpy as np
+import psutil
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.script.script_iterator import ScriptIterator
+
+DURATION = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+LATENCY_FILE_ENV = "SCRIPT_BRIDGE_LATENCY_FILE"
+
+SCRIPT = f'''
+import os
+import time
+from hummingbot.script.script_base import ScriptBase
+
+
+class LatencyScript(ScriptBase):
+    def on_tick(self):
+        # The mid price is the time the tick was sent at.
+        with open(os.environ["{LATENCY_FILE_ENV}"], "a") as latency_file:
+            latency_file.write(f"{{time.time() - float(self.mid_price)}}\\n")
+'''
+
+
+class MockMarket:
+    name = "binance"
+
+    def __init__(self):
+        self._balances: Dict[str, Decimal] = {f"COIN{i}": Decimal(i + 1) for i in range(20)}
+
+    def get_all_balances(self) -> Dict[str, Decimal]:
+        return self._balances
+
+    def get_available_balance(self, token: str) -> Decimal:
+        return self._balances[token]
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+class MockMarketInfo:
+    def __init__(self, market: MockMarket):
+        self.market = market
+
+
+class MockStrategy:
+    trading_pair = "COIN0-COIN1"
+
+    def __init__(self, market: MockMarket):
+        self.market_info = MockMarketInfo(market)
+        self.buy_levels = self.sell_levels = self.order_levels = 3
+        self.bid_spread = self.ask_spread = Decimal("0.01")
+        self.order_amount = Decimal("1")
+        self.order_level_spread = self.order_level_amount = Decimal("0.01")
+        self.order_refresh_time = 30.0
+        self.order_refresh_tolerance_pct = Decimal("0")
+        self.filled_order_delay = 60.0
+        self.hanging_orders_enabled = False
+        self.hanging_orders_cancel_pct = Decimal("0.1")
+        self.inventory_skew_enabled = False
+        self.inventory_target_base_pct = Decimal("0.5")
+        self.inventory_range_multiplier = Decimal("1")
+        self.order_override = {}
+
+    def all_markets_ready(self) -> bool:
+        return True
+
+    def get_mid_price(self) -> Decimal:
+        return Decimal(repr(time.time()))
+
+
+def cpu_time(process: psutil.Process) -> float:
+    times = process.cpu_times()
+    return times.user + times.system
+
+
+async def run(tick_size: float, script_file: str, latency_file: str) -> Tuple[List[float], float, float]:
+    market = MockMarket()
+    script_iterator = ScriptIterator(script_file, [market], MockStrategy(market), 0.1, True)
+    clock = Clock(ClockMode.REALTIME, tick_size)
+    clock.add_iterator(script_iterator)
+    # Let the script process start up.
+    await asyncio.sleep(1.0)
+    script_process: psutil.Process = psutil.Process().children()[-1]
+    parent_cpu, script_cpu = cpu_time(psutil.Process()), cpu_time(script_process)
+    with clock:
+        await clock.run_til(time.time() + DURATION)
+        await asyncio.sleep(0.2)
+        parent_cpu, script_cpu = cpu_time(psutil.Process()) - parent_cpu, cpu_time(script_process) - script_cpu
+    with open(latency_file) as f:
+        latencies: List[float] = [float(line) for line in f]
+    os.remove(latency_file)
+    return latencies, parent_cpu, script_cpu
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_file: str = join(temp_dir, "latency_script.py")
+        with open(script_file, "w") as f:
+            f.write(SCRIPT)
+        latency_file: str = join(temp_dir, "latencies.txt")
+        os.environ[LATENCY_FILE_ENV] = latency_file
+        print(f"{DURATION:.0f} s per run")
+        print(f"{'tick size':>10} {'ticks':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'cpu % parent':>13} "
+              f"{'cpu % script':>13}")
+        for tick_size in (1.0, 0.1):
+            latencies, parent_cpu, script_cpu = asyncio.get_event_loop().run_until_complete(
+                run(tick_size, script_file, latency_file))
+            latencies_ms = np.array(latencies) * 1e3
+            print(f"{tick_size:>10} {len(latencies):>6} {np.percentile(latencies_ms, 50):>8.2f} "
+                  f"{np.percentile(latencies_ms, 99):>8.2f} {latencies_ms.max():>8.2f} "
+                  f"{parent_cpu / DURATION * 100:>13.2f} {script_cpu / DURATION * 100:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Per call cost of the ScriptBase mid price helpers with a full day of mid prices, comparing the Decimal helpers over
+the mid_prices list with the fast_* helpers over the float64 mid price history, and the cost of adding a mid price.
+
+Usage: python test/benchmark_script_price_history.py [calls]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import time
+from decimal import Decimal
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot.script.script_base import ScriptBase
+
+CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+# (interval, length) as a script would call the helpers with
+WINDOWS: List[Tuple[int, int]] = [(1, 60), (60, 10), (60, 100), (1, 3600), (1, 86400)]
+
+
+def time_call(func: Callable[[], object], calls: int = CALLS) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    script_base = ScriptBase()
+    prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 1e-4, script_base.max_mid_prices_length)))
+    for price in prices:
+        script_base.add_mid_price(Decimal(f"{price:.8f}"))
+    # Once full, every new price pushes the oldest out.
+    add_cost = time_call(lambda: script_base.add_mid_price(Decimal("100.0")), 1000)
+    print(f"{len(script_base.mid_prices)} mid prices, add_mid_price {add_cost * 1e6:.1f} us")
+    print(f"{'helper':<24} {'interval':>8} {'length':>7} {'decimal ms':>11} {'fast ms':>9} {'speedup':>8}")
+    helpers = [("avg_mid_price", script_base.avg_mid_price, script_base.fast_avg_mid_price),
+               ("avg_price_volatility", script_base.avg_price_volatility, script_base.fast_avg_price_volatility),
+               ("median_price_volatility", script_base.median_price_volatility,
+                script_base.fast_median_price_volatility)]
+    for name, helper, fast_helper in helpers:
+        for interval, length in WINDOWS:
+            if name != "avg_mid_price" and length == len(script_base.mid_prices):
+                length -= 1
+            decimal_cost = time_call(lambda: helper(interval, length))
+            fast_cost = time_call(lambda: fast_helper(interval, length), CALLS * 10)
+            print(f"{name:<24} {interval:>8} {length:>7} {decimal_cost * 1e3:>11.3f} {fast_cost * 1e3:>9.4f} "
+                  f"{decimal_cost / fast_cost:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
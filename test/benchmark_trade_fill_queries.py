@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Trade history reads on a synthetic trades database: the history report, the session performance and the trades export,
+loading TradeFill objects as they used to against the columnar reads and the aggregation in the database.
+
+Usage: python test/benchmark_trade_fill_queries.py [number of trade fills]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import random
+import tempfile
+import time
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from unittest.mock import patch
+
+import pandas as pd
+
+from hummingbot.client.performance import (
+    PerformanceTracker,
+    calculate_performance_metrics,
+)
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+NUMBER_OF_FILLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+CONFIG_FILE_PATH = "conf_pure_mm_1.yml"
+MARKETS = [("binance", "ETH-USDT"), ("binance", "BTC-USDT"), ("kucoin", "ETH-USDT")]
+START_TIMESTAMP = 1577836800000
+# The current session is the last 1% of the fills.
+SESSION_START = START_TIMESTAMP + int(NUMBER_OF_FILLS * 0.99) * 1000
+
+
+async def last_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
+    return Decimal("100")
+
+
+def create_database(db_path: str) -> SQLConnectionManager:
+    sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    rng = random.Random(0)
+    rows: List[Dict[str, Any]] = []
+    for i in range(NUMBER_OF_FILLS):
+        market, trading_pair = MARKETS[i % len(MARKETS)]
+        base, quote = trading_pair.split("-")
+        # A fifth of the fills are from other strategy configs.
+        config_file_path = CONFIG_FILE_PATH if i % 5 else "conf_pure_mm_2.yml"
+        rows.append({"config_file_path": config_file_path, "strategy": "pure_market_making", "market": market,
+                     "symbol": trading_pair, "base_asset": base, "quote_asset": quote,
+                     "timestamp": START_TIMESTAMP + i * 1000,
+                     "order_id": f"buy-{trading_pair}-{(START_TIMESTAMP + i * 1000 - 5000) * 1000}",
+                     "trade_type": rng.choice(["BUY", "SELL"]), "order_type": "LIMIT",
+                     "price": rng.uniform(90, 110), "amount": rng.uniform(0.1, 10), "leverage": 1,
+                     "trade_fee": {"percent": 0.001, "flat_fees": []}, "exchange_trade_id": str(i),
+                     "position": "NILL"})
+        if len(rows) == 100000:
+            sql.engine.execute(TradeFill.__table__.insert(), rows)
+            rows = []
+    if rows:
+        sql.engine.execute(TradeFill.__table__.insert(), rows)
+    return sql
+
+
+def orm_trades(sql: SQLConnectionManager, start_timestamp: int) -> List[TradeFill]:
+    # As HummingbotApplication._get_trades_from_session used to query them
+    session = sql.get_shared_session()
+    trades: List[TradeFill] = (session.query(TradeFill)
+                               .filter(TradeFill.timestamp >= start_timestamp,
+                                       TradeFill.config_file_path.like(f"%{CONFIG_FILE_PATH}%"))
+                               .order_by(TradeFill.timestamp.desc())
+                               .all())
+    trades.reverse()
+    return trades
+
+
+def orm_history(sql: SQLConnectionManager, start_timestamp: int) -> int:
+    trades: List[TradeFill] = orm_trades(sql, start_timestamp)
+    for market, trading_pair in set((t.market, t.symbol) for t in trades):
+        cur_trades = [t for t in trades if t.market == market and t.symbol == trading_pair]
+        asyncio.get_event_loop().run_until_complete(
+            calculate_performance_metrics(market, trading_pair, cur_trades, {}))
+    sql.get_shared_session().expunge_all()
+    return len(trades)
+
+
+def database_history(sql: SQLConnectionManager, start_timestamp: int) -> int:
+    tracker = PerformanceTracker()
+    tracker.reset_from_database(sql.get_shared_session(), start_timestamp, CONFIG_FILE_PATH)
+    for market, trading_pair in tracker.accumulators.keys():
+        asyncio.get_event_loop().run_until_complete(tracker.performance_metrics(market, trading_pair, {}))
+    return tracker.num_trades
+
+
+def orm_export(sql: SQLConnectionManager) -> int:
+    df: pd.DataFrame = TradeFill.to_pandas(orm_trades(sql, START_TIMESTAMP))
+    sql.get_shared_session().expunge_all()
+    return len(df)
+
+
+def columns_export(sql: SQLConnectionManager) -> int:
+    trades: pd.DataFrame = TradeFill.get_trade_columns(sql.get_shared_session(), CONFIG_FILE_PATH, START_TIMESTAMP,
+                                                       columns=TradeFill.DISPLAY_COLUMNS)
+    return len(TradeFill.columns_to_pandas(trades))
+
+
+def timed(name: str, func, *args) -> float:
+    start = time.perf_counter()
+    count = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<45} {count:>9} fills {elapsed:>9.3f} s")
+    return elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            patch("hummingbot.client.performance.get_last_price", side_effect=last_price):
+        start = time.perf_counter()
+        sql = create_database(join(tmp_dir, "trades.sqlite"))
+        print(f"{NUMBER_OF_FILLS} trade fills created in {time.perf_counter() - start:.1f} s")
+        print("history of all the trades")
+        timed("TradeFill objects + calculate_performance_metrics", orm_history, sql, START_TIMESTAMP)
+        timed("database aggregation", database_history, sql, START_TIMESTAMP)
+        print("history of the session")
+        timed("TradeFill objects + calculate_performance_metrics", orm_history, sql, SESSION_START)
+        timed("database aggregation", database_history, sql, SESSION_START)
+        print("export of all the trades")
+        timed("TradeFill objects + to_pandas", orm_export, sql)
+        timed("columns + columns_to_pandas", columns_export, sql)
+        sql.get_shared_session().close()
+        sql.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
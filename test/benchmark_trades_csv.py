@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Fill recording latency of the trades CSV versus the size of the file, comparing the previous pandas path (read the
+whole file to check the header, then append a one row DataFrame) with the persistent TradesCSVWriter.
+
+Usage: python test/benchmark_trades_csv.py
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import os
+import tempfile
+import time
+import warnings
+
+import pandas as pd
+
+from hummingbot.connector.markets_recorder import TradesCSVWriter
+
+HEADER = ("id", "config_file_path", "strategy", "market", "symbol", "base_asset", "quote_asset", "timestamp",
+          "order_id", "trade_type", "order_type", "price", "amount", "leverage", "trade_fee", "exchange_trade_id",
+          "position", "age")
+FILE_SIZES = [1000, 10000, 100000]
+SAMPLES = 50
+
+
+def row(i: int) -> tuple:
+    return (i, "conf_pure_mm_1.yml", "pure_market_making", "peatio", "ROGER-BTC", "ROGER", "BTC",
+            1615978645000 + i, f"HBOT-BRG{i}", "BUY", "LIMIT", 0.00000099, 10.0, 1,
+            {"percent": 0.001, "flat_fees": []}, str(i), "NILL", "00:00:01")
+
+
+def pandas_append(csv_path: str, field_data: tuple):
+    df = pd.read_csv(csv_path, header=None)
+    if tuple(df.iloc[0].values) != HEADER:
+        raise ValueError("Header mismatch")
+    pd.DataFrame([field_data]).to_csv(csv_path, mode='a', header=False, index=False)
+
+
+def prefill(csv_path: str, rows: int):
+    writer = TradesCSVWriter(csv_path, flush_rows=10000)
+    for i in range(rows):
+        writer.write_row(HEADER, row(i))
+    writer.close()
+
+
+def main():
+    warnings.simplefilter("ignore", pd.errors.DtypeWarning)
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    print(f"{'rows in file':>12} {'pandas ms/fill':>15} {'writer ms/fill':>15}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_size in FILE_SIZES:
+            csv_path = os.path.join(tmp_dir, f"trades_{file_size}.csv")
+            prefill(csv_path, file_size)
+            start = time.perf_counter()
+            for i in range(SAMPLES):
+                pandas_append(csv_path, row(file_size + i))
+            pandas_ms = (time.perf_counter() - start) / SAMPLES * 1e3
+
+            writer = TradesCSVWriter(csv_path)
+            start = time.perf_counter()
+            for i in range(SAMPLES):
+                writer.write_row(HEADER, row(file_size + SAMPLES + i))
+            writer_ms = (time.perf_counter() - start) / SAMPLES * 1e3
+            writer.close()
+            print(f"{file_size:>12} {pandas_ms:>15.3f} {writer_ms:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Per sample cost of the trailing indicators against the sampling window size, comparing the incremental indicators
+with recomputing the statistic over the whole window on every sample as they used to.
+
+Usage: python test/benchmark_trailing_indicators.py [samples]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.average_volatility import AverageVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import \
+    ExponentialMovingAverageIndicator
+
+SAMPLES = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+WINDOW_SIZES = [30, 300, 3000, 30000]
+
+
+def recomputed_volatility(window_size: int) -> Callable[[float], float]:
+    sampling_buffer, processing_buffer = RingBuffer(window_size), RingBuffer(1)
+
+    def add_sample(price: float) -> float:
+        sampling_buffer.add_value(price)
+        processing_buffer.add_value(np.var(sampling_buffer.get_as_numpy_array()))
+        return np.sqrt(np.mean(processing_buffer.get_as_numpy_array()))
+    return add_sample
+
+
+def recomputed_ema(window_size: int) -> Callable[[float], float]:
+    sampling_buffer = RingBuffer(window_size)
+
+    def add_sample(price: float) -> float:
+        sampling_buffer.add_value(price)
+        return pd.Series(sampling_buffer.get_as_numpy_array()).ewm(span=window_size, adjust=True).mean().iloc[-1]
+    return add_sample
+
+
+def incremental_volatility(window_size: int) -> Callable[[float], float]:
+    indicator = AverageVolatilityIndicator(window_size, 1)
+
+    def add_sample(price: float) -> float:
+        indicator.add_sample(price)
+        return indicator.current_value
+    return add_sample
+
+
+def incremental_ema(window_size: int) -> Callable[[float], float]:
+    indicator = ExponentialMovingAverageIndicator(window_size)
+
+    def add_sample(price: float) -> float:
+        indicator.add_sample(price)
+        return indicator.current_value
+    return add_sample
+
+
+def us_per_sample(add_sample: Callable[[float], float], window_size: int, prices: List[float]) -> float:
+    # Fill the window first, the cost of interest is the one of a full buffer.
+    for price in prices[:window_size]:
+        add_sample(price)
+    start = time.perf_counter()
+    for price in prices[window_size:window_size + SAMPLES]:
+        add_sample(price)
+    return (time.perf_counter() - start) / SAMPLES * 1e6
+
+
+def main():
+    prices: List[float] = list(100 + np.cumsum(np.random.RandomState(42).normal(0, 1, max(WINDOW_SIZES) + SAMPLES)))
+    print(f"{'window':>8} {'vol recomputed us':>18} {'vol incremental us':>19} "
+          f"{'ema recomputed us':>18} {'ema incremental us':>19}")
+    for window_size in WINDOW_SIZES:
+        results = [us_per_sample(factory(window_size), window_size, prices)
+                   for factory in (recomputed_volatility, incremental_volatility, recomputed_ema, incremental_ema)]
+        print(f"{window_size:>8} {results[0]:>18.2f} {results[1]:>19.2f} {results[2]:>18.2f} {results[3]:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Replays Peatio ob-inc websocket traffic through the order book diff pipeline, from the raw message to the order book,
+comparing the row based path (json, OrderBookRow lists) with the numpy path (ujson, arrays parsed on receipt, applied
+in batches). Reports messages per second and the memory blocks and bytes held per message while it waits in the
+tracker queue.
+
+The traffic is read from a file of raw ranger messages, one per line, or generated if no file is given.
+
+Usage: python test/connector/exchange/peatio/benchmark_peatio_order_book_diffs.py [recorded messages file]
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import json
+import random
+import time
+import tracemalloc
+from collections import deque
+from typing import (
+    Callable,
+    List,
+)
+
+import ujson
+
+from hummingbot.connector.exchange.peatio.peatio_order_book import PeatioOrderBook
+from hummingbot.connector.exchange.peatio.peatio_order_book_message import PeatioOrderBookMessage
+from hummingbot.connector.exchange.peatio.peatio_order_book_tracker import PeatioOrderBookTracker
+from hummingbot.connector.exchange.peatio.peatio_utils import convert_from_exchange_trading_pair
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+MESSAGE_COUNT = 50000
+BATCH_SIZE = 100
+MARKET = "rogerbtc"
+
+
+def generated_traffic() -> List[str]:
+    rng = random.Random(42)
+    messages: List[str] = []
+    for sequence in range(1, MESSAGE_COUNT + 1):
+        side: str = "bids" if rng.random() < 0.5 else "asks"
+        level: int = rng.randrange(1, 200)
+        price: float = 0.000001 - level * 1e-9 if side == "bids" else 0.000001 + level * 1e-9
+        amount: str = "" if rng.random() < 0.3 else f"{rng.uniform(1, 10000):.2f}"
+        messages.append(json.dumps({f"{MARKET}.ob-inc": {side: [f"{price:.9f}", amount], "sequence": sequence}}))
+    return messages
+
+
+def row_message(raw: str, timestamp: int) -> PeatioOrderBookMessage:
+    for msg_key, data in json.loads(raw).items():
+        trading_pair: str = convert_from_exchange_trading_pair(msg_key.split(".")[0])
+        return PeatioOrderBook.diff_message_from_exchange(data, timestamp, metadata={"trading_pair": trading_pair})
+
+
+def numpy_message(raw: str, timestamp: int) -> PeatioOrderBookMessage:
+    for msg_key, data in ujson.loads(raw).items():
+        trading_pair: str = convert_from_exchange_trading_pair(msg_key.split(".")[0])
+        return PeatioOrderBook.numpy_diff_message_from_exchange(data, timestamp, trading_pair)
+
+
+def new_order_book() -> PeatioOrderBook:
+    order_book = PeatioOrderBook()
+    order_book.apply_snapshot([OrderBookRow(0.000001 - i * 1e-9, 100.0, 0) for i in range(1, 200)],
+                              [OrderBookRow(0.000001 + i * 1e-9, 100.0, 0) for i in range(1, 200)], 0)
+    return order_book
+
+
+def messages_per_second(traffic: List[str], parse: Callable[[str, int], PeatioOrderBookMessage],
+                        batch_size: int) -> float:
+    tracker = PeatioOrderBookTracker([convert_from_exchange_trading_pair(MARKET)])
+    order_book = new_order_book()
+    past_diffs_window = deque(maxlen=tracker.PAST_DIFF_WINDOW_SIZE)
+    start = time.perf_counter()
+    batch: List[PeatioOrderBookMessage] = []
+    for index, raw in enumerate(traffic):
+        batch.append(parse(raw, 1615978645 + index // 100))
+        if len(batch) == batch_size:
+            tracker._apply_diff_messages(tracker._trading_pairs[0], order_book, batch, past_diffs_window)
+            batch = []
+    if len(batch) > 0:
+        tracker._apply_diff_messages(tracker._trading_pairs[0], order_book, batch, past_diffs_window)
+    return len(traffic) / (time.perf_counter() - start)
+
+
+def queued_footprint(traffic: List[str], parse: Callable[[str, int], PeatioOrderBookMessage]):
+    sample: List[str] = traffic[:10000]
+    tracemalloc.start()
+    messages = [parse(raw, 1615978645) for raw in sample]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    del messages
+    return (sum(stat.count for stat in stats) / len(sample), sum(stat.size for stat in stats) / len(sample))
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as fd:
+            traffic: List[str] = [line.strip() for line in fd if ".ob-inc" in line]
+    else:
+        traffic: List[str] = generated_traffic()
+    print(f"{len(traffic)} ob-inc messages")
+    print(f"{'pipeline':>22} {'msgs/s':>10} {'blocks/msg':>11} {'bytes/msg':>10}")
+    for name, parse, batch_size in [("rows, one at a time", row_message, 1),
+                                    ("numpy, one at a time", numpy_message, 1),
+                                    (f"numpy, batches of {BATCH_SIZE}", numpy_message, BATCH_SIZE)]:
+        rate: float = messages_per_second(traffic, parse, batch_size)
+        blocks, size = queued_footprint(traffic, parse)
+        print(f"{name:>22} {rate:>10.0f} {blocks:>11.1f} {size:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
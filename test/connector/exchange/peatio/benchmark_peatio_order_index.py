@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Measures the cost of routing a user stream order message to its in-flight order as the number of open orders grows.
+The per-message cost should stay flat since lookups go through the exchange order id index.
+
+Usage: python test/connector/exchange/peatio/benchmark_peatio_order_index.py
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import time
+from decimal import Decimal
+
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+from hummingbot.connector.exchange.peatio.peatio_exchange import PeatioExchange
+
+TRADING_PAIR = "ROGER-BTC"
+OPEN_ORDER_COUNTS = [10, 100, 1000, 5000]
+MESSAGES = 20000
+
+
+def build_connector(open_orders: int) -> PeatioExchange:
+    connector = PeatioExchange("", "", trading_pairs=[TRADING_PAIR], trading_required=False)
+    for i in range(open_orders):
+        connector.start_tracking_order(f"HBOT-{i}", str(i), TRADING_PAIR, TradeType.BUY, Decimal("0.00000099"),
+                                       Decimal("10"), OrderType.LIMIT)
+    return connector
+
+
+def main():
+    print(f"{'open orders':>12} {'us / message':>14}")
+    for open_orders in OPEN_ORDER_COUNTS:
+        connector = build_connector(open_orders)
+        # Messages for the last tracked order, the worst case for a linear scan.
+        message = {"id": str(open_orders - 1), "state": "wait", "executed_volume": "0", "price": "0.00000099",
+                   "updated_at": 1596553643}
+        start = time.perf_counter()
+        for _ in range(MESSAGES):
+            connector._process_order_message(dict(message))
+        elapsed = time.perf_counter() - start
+        print(f"{open_orders:>12} {elapsed / MESSAGES * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
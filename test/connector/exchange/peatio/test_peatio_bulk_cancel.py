@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import unittest
+from collections import Counter
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_exchange import PeatioExchange
+from test.integration.humming_web_app import get_open_port
+
+
+class MockPeatioCancelAPI:
+    """
+    Serves market/orders/cancel (by market and side) and market/orders/{id}/cancel, counting the requests made to
+    each. Cancelled orders are confirmed on the user stream of the connector, unless the stream is quiet, and are
+    in the cancel by market response, unless it leaves them out.
+    """
+    def __init__(self):
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.request_counts: Counter = Counter()
+        self.bulk_requests: List[Dict[str, str]] = []
+        self.connector: Optional[PeatioExchange] = None
+        self.stream_confirms: bool = True
+        self.bulk_responds_orders: bool = True
+        self.bulk_cancel_status: int = 200
+
+    def add_order(self, exchange_order_id: int, market: str, side: str):
+        self.orders[exchange_order_id] = {"id": exchange_order_id, "market": market, "side": side,
+                                          "ord_type": "limit", "price": "0.00000099", "avg_price": "0",
+                                          "state": "wait", "origin_volume": "10.0", "remaining_volume": "10.0",
+                                          "executed_volume": "0"}
+
+    def confirm(self, orders: List[Dict[str, Any]], connector: PeatioExchange):
+        for order in orders:
+            order["state"] = "cancel"
+            if self.stream_confirms:
+                connector._user_stream_tracker.user_stream.put_nowait({"order": dict(order)})
+
+    async def bulk_cancel(self, request: web.Request) -> web.Response:
+        self.request_counts["bulk"] += 1
+        if self.bulk_cancel_status != 200:
+            return web.json_response({"errors": ["server.internal_error"]}, status=self.bulk_cancel_status)
+        params = await request.json()
+        self.bulk_requests.append(params)
+        orders = [o for o in self.orders.values()
+                  if o["market"] == params["market"] and o["state"] == "wait" and
+                  o["side"] == params.get("side", o["side"])]
+        response = [dict(o) for o in orders] if self.bulk_responds_orders else []
+        # The cancellations are confirmed after the response, to the connector of the test that requested them.
+        asyncio.get_event_loop().call_later(0.01, self.confirm, orders, self.connector)
+        return web.json_response(response)
+
+    async def cancel(self, request: web.Request) -> web.Response:
+        self.request_counts["single"] += 1
+        order = self.orders[int(request.match_info["order_id"])]
+        order["state"] = "cancel"
+        return web.json_response(order)
+
+
+class PeatioBulkCancelUnitTest(unittest.TestCase):
+    markets = ["ROGER-BTC", "ROGER-USDT"]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.mock_api = MockPeatioCancelAPI()
+        app = web.Application()
+        app.router.add_post("/market/orders/cancel", cls.mock_api.bulk_cancel)
+        app.router.add_post("/market/orders/{order_id}/cancel", cls.mock_api.cancel)
+        cls.runner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        port = get_open_port()
+        cls.ev_loop.run_until_complete(web.TCPSite(cls.runner, "127.0.0.1", port).start())
+        cls._url_patcher = patch.object(Constants, "REST_URL", f"http://127.0.0.1:{port}")
+        cls._url_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._url_patcher.stop()
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    def setUp(self):
+        self.mock_api.orders.clear()
+        self.mock_api.request_counts.clear()
+        self.mock_api.bulk_requests.clear()
+        self.mock_api.stream_confirms = True
+        self.mock_api.bulk_responds_orders = True
+        self.mock_api.bulk_cancel_status = 200
+        self._bulk_cancel_patcher = patch.object(Constants, "BULK_CANCEL", True)
+        self._bulk_cancel_patcher.start()
+        self.connector = PeatioExchange("", "", trading_pairs=self.markets, trading_required=False)
+        self.connector._throttler = Throttler(rate_limit=(1000, 1.0))
+        self.mock_api.connector = self.connector
+        self.event_logger = EventLogger()
+        self.connector.add_listener(MarketEvent.OrderCancelled, self.event_logger)
+        self.listener_task = asyncio.ensure_future(self.connector._user_stream_event_listener())
+
+    def tearDown(self):
+        self.listener_task.cancel()
+        self.connector.remove_listener(MarketEvent.OrderCancelled, self.event_logger)
+        self._bulk_cancel_patcher.stop()
+
+    def track_orders(self, trading_pair: str, side: TradeType, count: int, first_id: int):
+        for exchange_order_id in range(first_id, first_id + count):
+            self.mock_api.add_order(exchange_order_id, trading_pair.replace("-", "").lower(), side.name.lower())
+            self.connector.start_tracking_order(f"HBOT-{exchange_order_id}", str(exchange_order_id), trading_pair,
+                                                side, Decimal("0.00000099"), Decimal("10"), OrderType.LIMIT)
+
+    def cancelled_ids(self) -> List[str]:
+        return sorted(e.order_id for e in self.event_logger.event_log)
+
+    def test_cancel_all_by_market(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 10, 1)
+        self.track_orders("ROGER-BTC", TradeType.SELL, 10, 11)
+        self.track_orders("ROGER-USDT", TradeType.BUY, 5, 21)
+        results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertEqual(25, len(results))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"bulk": 2}, self.mock_api.request_counts)
+        self.assertEqual([{"market": "rogerbtc"}, {"market": "rogerusdt"}],
+                         sorted(self.mock_api.bulk_requests, key=lambda r: r["market"]))
+        self.assertEqual(25, len(self.cancelled_ids()))
+        self.assertEqual(0, len(self.connector.in_flight_orders))
+
+    def test_strategy_refresh_of_one_side(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 3, 1)
+        self.track_orders("ROGER-BTC", TradeType.SELL, 3, 4)
+
+        async def run():
+            # As a strategy cancelling its buy orders on a tick
+            for i in range(1, 4):
+                self.connector.cancel("ROGER-BTC", f"HBOT-{i}")
+            await asyncio.sleep(0.1)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual({"bulk": 1}, self.mock_api.request_counts)
+        self.assertEqual([{"market": "rogerbtc", "side": "buy"}], self.mock_api.bulk_requests)
+        self.assertEqual(["HBOT-1", "HBOT-2", "HBOT-3"], self.cancelled_ids())
+        self.assertEqual({"HBOT-4", "HBOT-5", "HBOT-6"}, set(self.connector.in_flight_orders.keys()))
+
+    def test_partial_cancels_one_by_one(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 3, 1)
+        self.track_orders("ROGER-BTC", TradeType.SELL, 3, 4)
+
+        async def run():
+            for order_id in ["HBOT-1", "HBOT-2", "HBOT-4"]:
+                self.connector.cancel("ROGER-BTC", order_id)
+            await asyncio.sleep(0.1)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual({"single": 3}, self.mock_api.request_counts)
+        self.assertEqual(["HBOT-1", "HBOT-2", "HBOT-4"], self.cancelled_ids())
+
+    def test_cancels_confirmed_by_the_response(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 4, 1)
+        self.mock_api.stream_confirms = False
+        results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"bulk": 1}, self.mock_api.request_counts)
+        self.assertEqual(4, len(self.cancelled_ids()))
+        self.assertEqual(0, len(self.connector.in_flight_orders))
+
+    def test_unconfirmed_cancels_retried_one_by_one(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 4, 1)
+        self.mock_api.stream_confirms = False
+        self.mock_api.bulk_responds_orders = False
+        # Within the timeout of cancel_all, after waiting for the confirmations
+        results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"bulk": 1, "single": 4}, self.mock_api.request_counts)
+        self.assertEqual(4, len(self.cancelled_ids()))
+
+    def test_bulk_cancel_failure_falls_back(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 4, 1)
+        self.mock_api.bulk_cancel_status = 422
+        results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"bulk": 1, "single": 4}, self.mock_api.request_counts)
+
+    def test_disabled_by_default(self):
+        self._bulk_cancel_patcher.stop()
+        self.track_orders("ROGER-BTC", TradeType.BUY, 4, 1)
+        results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"single": 4}, self.mock_api.request_counts)
+        self._bulk_cancel_patcher.start()
+
+    def test_enabled_by_config(self):
+        self._bulk_cancel_patcher.stop()
+        self.track_orders("ROGER-BTC", TradeType.BUY, 4, 1)
+        with patch.object(global_config_map["peatio_bulk_cancel"], "value", True):
+            self.assertTrue(self.connector.bulk_cancel)
+            results = self.ev_loop.run_until_complete(self.connector.cancel_all(5.0))
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"bulk": 1}, self.mock_api.request_counts)
+        self._bulk_cancel_patcher.start()
+
+    def test_orders_placed_while_throttled_keep_the_market(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 3, 1)
+        throttler = Throttler(rate_limit=(1, 0.2))
+        self.connector._throttler = throttler
+
+        async def run():
+            # The cancel by market waits for the throttler, while the strategy places another order.
+            async with throttler.weighted_task(request_weight=1):
+                pass
+            cancel_task = asyncio.ensure_future(self.connector._cancel_orders("ROGER-BTC",
+                                                                              ["HBOT-1", "HBOT-2", "HBOT-3"]))
+            await asyncio.sleep(0.01)
+            self.connector._throttler = Throttler(rate_limit=(1000, 1.0))
+            self.track_orders("ROGER-BTC", TradeType.BUY, 1, 9)
+            return await cancel_task
+
+        results = self.ev_loop.run_until_complete(run())
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual({"single": 3}, self.mock_api.request_counts)
+        self.assertEqual(["HBOT-1", "HBOT-2", "HBOT-3"], self.cancelled_ids())
+        self.assertEqual({"HBOT-9"}, set(self.connector.in_flight_orders.keys()))
+
+    def test_orders_not_placed_yet_keep_the_market(self):
+        self.track_orders("ROGER-BTC", TradeType.BUY, 3, 1)
+        # An order still waiting for its create order response is not cancelled by market.
+        self.connector.start_tracking_order("HBOT-9", None, "ROGER-BTC", TradeType.BUY, Decimal("0.00000099"),
+                                            Decimal("10"), OrderType.LIMIT)
+        tracked_orders = [self.connector.in_flight_orders[f"HBOT-{i}"] for i in range(1, 4)]
+        self.assertEqual((False, None), self.connector._bulk_cancel_scope("ROGER-BTC", tracked_orders))
+        pending_order = self.connector.in_flight_orders["HBOT-9"]
+        self.assertEqual((False, None), self.connector._bulk_cancel_scope("ROGER-BTC",
+                                                                          tracked_orders + [pending_order]))
+        self.connector._update_exchange_order_id(pending_order, "9")
+        self.assertEqual((True, None), self.connector._bulk_cancel_scope("ROGER-BTC",
+                                                                         tracked_orders + [pending_order]))
+
+
+if __name__ == "__main__":
+    unittest.main()
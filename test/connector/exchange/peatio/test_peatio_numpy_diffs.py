@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import unittest
+from collections import deque
+from typing import List
+
+from hummingbot.connector.exchange.peatio.peatio_active_order_tracker import entries_to_numpy_diff
+from hummingbot.connector.exchange.peatio.peatio_order_book import PeatioOrderBook
+from hummingbot.connector.exchange.peatio.peatio_order_book_message import PeatioOrderBookMessage
+from hummingbot.connector.exchange.peatio.peatio_order_book_tracker import PeatioOrderBookTracker
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class PeatioNumpyDiffsUnitTest(unittest.TestCase):
+    trading_pair: str = "ROGER-BTC"
+
+    def create_order_book(self) -> PeatioOrderBook:
+        order_book = PeatioOrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.9, 1.0, 1000), OrderBookRow(0.8, 1.0, 1000)],
+                                  [OrderBookRow(1.1, 1.0, 1000)], 1000)
+        return order_book
+
+    def ob_inc_messages(self, numpy_diffs: bool) -> List[PeatioOrderBookMessage]:
+        raw_messages = [({"bids": ["0.95", "2.0"], "sequence": 11}, 2),
+                        ({"bids": ["0.9", ""], "sequence": 12}, 2),
+                        ({"asks": ["1.05", "3.0"], "sequence": 13}, 3),
+                        ({"bids": ["0.95", "4.0"], "sequence": 14}, 3)]
+        if numpy_diffs:
+            return [PeatioOrderBook.numpy_diff_message_from_exchange(dict(msg), timestamp, self.trading_pair)
+                    for msg, timestamp in raw_messages]
+        return [PeatioOrderBook.diff_message_from_exchange(dict(msg), timestamp, {"trading_pair": self.trading_pair})
+                for msg, timestamp in raw_messages]
+
+    def test_entries_to_numpy_diff(self):
+        self.assertEqual([[0.95, 2.0, 7.0]], entries_to_numpy_diff(["0.95", "2.0"], 7).tolist())
+        self.assertEqual([[0.95, 0.0, 7.0], [0.9, 1.5, 7.0]],
+                         entries_to_numpy_diff([["0.95", ""], ["0.9", "1.5"]], 7).tolist())
+        self.assertEqual((0, 3), entries_to_numpy_diff(None, 7).shape)
+        self.assertEqual((0, 3), entries_to_numpy_diff([], 7).shape)
+
+    def test_numpy_diff_message(self):
+        message = self.ob_inc_messages(True)[0]
+        self.assertEqual(self.trading_pair, message.trading_pair)
+        self.assertEqual(2000, message.update_id)
+        bids, asks = message.numpy_diffs
+        self.assertEqual([[0.95, 2.0, 2000.0]], bids.tolist())
+        self.assertEqual((0, 3), asks.shape)
+        self.assertIsNone(self.ob_inc_messages(False)[0].numpy_diffs)
+
+    def test_batched_numpy_diffs_match_row_diffs(self):
+        tracker = PeatioOrderBookTracker([self.trading_pair])
+        numpy_order_book, row_order_book = self.create_order_book(), self.create_order_book()
+        past_diffs_window = deque()
+        tracker._apply_diff_messages(self.trading_pair, numpy_order_book, self.ob_inc_messages(True),
+                                     past_diffs_window)
+        for message in self.ob_inc_messages(False):
+            tracker._apply_diff_messages(self.trading_pair, row_order_book, [message], deque())
+        for numpy_side, row_side in zip(numpy_order_book.snapshot, row_order_book.snapshot):
+            self.assertEqual(row_side.values.tolist(), numpy_side.values.tolist())
+        self.assertEqual([[0.95, 4.0, 3000.0], [0.8, 1.0, 1000.0]], numpy_order_book.snapshot[0].values.tolist())
+        self.assertEqual(3000, numpy_order_book.last_diff_uid)
+        self.assertEqual(4, len(past_diffs_window))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import time
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.connector.exchange.peatio.peatio_api_order_book_data_source import PeatioAPIOrderBookDataSource
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_order_book import PeatioOrderBook
+from hummingbot.connector.exchange.peatio.peatio_order_book_resync import PeatioOrderBookResyncScheduler
+from hummingbot.connector.exchange.peatio.peatio_order_book_tracker import PeatioOrderBookTracker
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+RESYNC = PeatioOrderBookResyncScheduler.RESYNC_PRIORITY
+SCHEDULED = PeatioOrderBookResyncScheduler.SCHEDULED_PRIORITY
+
+
+class PeatioOrderBookResyncSchedulerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1615978800.0
+
+    def test_resyncs_before_scheduled_refreshes(self):
+        scheduler = PeatioOrderBookResyncScheduler(30.0)
+        now = self.start_timestamp
+        scheduler.request("ROGER-BTC", "scheduled", SCHEDULED, now)
+        scheduler.request("BTC-USDT", "scheduled", SCHEDULED, now)
+        scheduler.request("ETH-USDT", "gap", RESYNC, now + 1)
+        self.assertEqual(("ETH-USDT", "gap"), scheduler.pop_ready(now + 1))
+        self.assertEqual(("ROGER-BTC", "scheduled"), scheduler.pop_ready(now + 1))
+        # A resync raises the priority of the pending scheduled refresh, the reverse does nothing.
+        self.assertTrue(scheduler.request("BTC-USDT", "crossed", RESYNC, now + 2))
+        self.assertFalse(scheduler.request("BTC-USDT", "scheduled", SCHEDULED, now + 2))
+        self.assertFalse(scheduler.request("BTC-USDT", "gap", RESYNC, now + 2))
+        self.assertEqual(("BTC-USDT", "crossed"), scheduler.pop_ready(now + 2))
+        self.assertIsNone(scheduler.pop_ready(now + 2))
+        self.assertIsNone(scheduler.next_ready_time())
+
+    def test_cooldown(self):
+        scheduler = PeatioOrderBookResyncScheduler(30.0)
+        now = self.start_timestamp
+        scheduler.record_fetch("ROGER-BTC", "gap", now)
+        scheduler.request("ROGER-BTC", "gap", RESYNC, now + 1)
+        scheduler.request("BTC-USDT", "scheduled", SCHEDULED, now + 1)
+        # The scheduled refresh of another pair goes first while the resync waits for its cooldown.
+        self.assertEqual(("BTC-USDT", "scheduled"), scheduler.pop_ready(now + 1))
+        self.assertIsNone(scheduler.pop_ready(now + 29))
+        self.assertEqual(now + 30, scheduler.next_ready_time())
+        self.assertEqual(("ROGER-BTC", "gap"), scheduler.pop_ready(now + 30))
+
+    def test_hourly_counts(self):
+        scheduler = PeatioOrderBookResyncScheduler(30.0, history_hours=2)
+        now = self.start_timestamp
+        for hour in range(3):
+            for i in range(hour + 1):
+                scheduler.record_fetch("ROGER-BTC", "gap", now + hour * 3600 + i * 60)
+        scheduler.record_fetch("BTC-USDT", "stale", now + 2 * 3600)
+        self.assertEqual({"gap": 3, "stale": 1}, scheduler.fetch_counts(now + 2 * 3600))
+        self.assertEqual({}, scheduler.fetch_counts(now))
+        self.assertEqual({now + 3600: 2, now + 2 * 3600: 4}, scheduler.hourly_fetch_counts())
+
+
+class PeatioOrderBookResyncUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = ["ROGER-BTC", "BTC-USDT"]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.snapshot_requests: List[str] = []
+
+        async def get_order_book_data(trading_pair: str) -> Dict[str, Any]:
+            self.snapshot_requests.append(trading_pair)
+            return {"timestamp": 1615978645, "asks": [["1.2", "1.0"]], "bids": [["0.8", "1.0"]]}
+
+        for patcher in [patch.object(Constants, "ORDER_BOOK_SNAPSHOT_INTERVAL", 0.01),
+                        patch.object(Constants, "ORDER_BOOK_STALE_CHECK_INTERVAL", 0.01),
+                        patch.object(PeatioAPIOrderBookDataSource, "get_order_book_data",
+                                     side_effect=get_order_book_data)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_stale_order_books_resynced(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+        snapshots: asyncio.Queue = asyncio.Queue()
+        now = time.time()
+        data_source._public_stream_connected_at = now - 2 * Constants.ORDER_BOOK_STALE_TIMEOUT
+        data_source._last_update_times["BTC-USDT"] = now
+        task = asyncio.ensure_future(data_source.listen_for_order_book_snapshots(self.ev_loop, snapshots))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        # Resynced once, the fetch resets the staleness.
+        self.assertEqual(["ROGER-BTC"], self.snapshot_requests)
+        self.assertEqual({"stale": 1}, data_source.resync_scheduler.fetch_counts(time.time()))
+        snapshot = snapshots.get_nowait()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual("ROGER-BTC", snapshot.trading_pair)
+
+    def test_no_stale_resyncs_while_disconnected(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+        task = asyncio.ensure_future(data_source.listen_for_order_book_snapshots(self.ev_loop, asyncio.Queue()))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        self.assertEqual([], self.snapshot_requests)
+
+    def test_repeated_resyncs_wait_for_cooldown(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+
+        async def run():
+            data_source.request_resync("ROGER-BTC", "gap")
+            await asyncio.sleep(0.02)
+            data_source.request_resync("ROGER-BTC", "crossed")
+            data_source.request_resync("BTC-USDT", "crossed")
+            await asyncio.sleep(0.1)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual(["ROGER-BTC", "BTC-USDT"], self.snapshot_requests)
+        self.assertTrue(data_source.resync_scheduler.is_pending("ROGER-BTC"))
+        data_source._resync_task.cancel()
+
+    def test_crossing_diffs_detected(self):
+        order_book = PeatioOrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.9, 1.0, 1)], [OrderBookRow(1.1, 1.0, 1)], 1)
+
+        def crosses(bids: List[List[float]], asks: List[List[float]]) -> bool:
+            return PeatioOrderBookTracker.crosses_book(order_book,
+                                                       np.array(bids, dtype="float64").reshape(-1, 3),
+                                                       np.array(asks, dtype="float64").reshape(-1, 3))
+
+        self.assertFalse(crosses([[1.0, 1.0, 2]], [[1.05, 1.0, 2]]))
+        self.assertTrue(crosses([[1.1, 1.0, 2]], []))
+        self.assertTrue(crosses([], [[0.85, 1.0, 2]]))
+        # The best ask is taken out by the same diffs.
+        self.assertFalse(crosses([[1.1, 1.0, 2]], [[1.1, 0.0, 2], [1.2, 1.0, 2]]))
+        # A level added then removed within the same diffs is not in the book once they are applied.
+        self.assertFalse(crosses([[1.15, 1.0, 2], [1.15, 0.0, 3]], []))
+        self.assertFalse(crosses([], [[0.85, 1.0, 2], [0.95, 1.0, 2], [0.85, 0.0, 3]]))
+        self.assertTrue(crosses([[1.15, 0.0, 2], [1.15, 1.0, 3]], []))
+        self.assertFalse(PeatioOrderBookTracker.crosses_book(PeatioOrderBook(), np.zeros((0, 3)), np.zeros((0, 3))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.connector.exchange.peatio.peatio_exchange import PeatioExchange
+
+
+def order_message(exchange_order_id: str, state: str = "wait", executed_volume: str = "0") -> dict:
+    return {
+        "id": exchange_order_id,
+        "market": "rogerbtc",
+        "side": "buy",
+        "ord_type": "limit",
+        "price": "0.00000099",
+        "avg_price": "0.00000099",
+        "state": state,
+        "origin_volume": "10.0",
+        "executed_volume": executed_volume,
+        "created_at": 1596481983,
+        "updated_at": 1596553643,
+    }
+
+
+class PeatioOrderIndexUnitTest(unittest.TestCase):
+    trading_pair = "ROGER-BTC"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.connector = PeatioExchange("", "", trading_pairs=[self.trading_pair], trading_required=False)
+        self.event_logger = EventLogger()
+        self.connector.add_listener(MarketEvent.OrderCancelled, self.event_logger)
+
+    def tearDown(self):
+        self.connector.remove_listener(MarketEvent.OrderCancelled, self.event_logger)
+
+    def track_order(self, client_order_id: str, exchange_order_id: str = None):
+        self.connector.start_tracking_order(client_order_id, exchange_order_id, self.trading_pair, TradeType.BUY,
+                                            Decimal("0.00000099"), Decimal("10"), OrderType.LIMIT)
+
+    def test_index_follows_tracking(self):
+        self.track_order("HBOT-1", "101")
+        self.track_order("HBOT-2")
+        self.assertEqual("HBOT-1", self.connector._exchange_order_ids["101"])
+        self.connector._update_exchange_order_id(self.connector.in_flight_orders["HBOT-2"], "102")
+        self.assertEqual("HBOT-2", self.connector._exchange_order_ids["102"])
+        self.connector.stop_tracking_order("HBOT-1")
+        self.assertNotIn("101", self.connector._exchange_order_ids)
+        self.assertIsNone(self.connector._tracked_order_by_exchange_id("101"))
+        self.assertIs(self.connector.in_flight_orders["HBOT-2"],
+                      self.connector._tracked_order_by_exchange_id("102"))
+
+    def test_message_routed_by_exchange_order_id(self):
+        self.track_order("HBOT-1", "101")
+        self.track_order("HBOT-2", "102")
+        self.connector._process_order_message(order_message("102", state="cancel"))
+        self.assertIn("HBOT-1", self.connector.in_flight_orders)
+        self.assertNotIn("HBOT-2", self.connector.in_flight_orders)
+        self.assertEqual(["HBOT-2"], [e.order_id for e in self.event_logger.event_log])
+
+    def test_early_message_buffered_until_order_acknowledged(self):
+        self.track_order("HBOT-1")
+        self.connector._process_order_message(order_message("101", state="cancel"))
+        self.assertIn("101", self.connector._pending_order_messages)
+        self.assertIn("HBOT-1", self.connector.in_flight_orders)
+
+        self.connector._update_exchange_order_id(self.connector.in_flight_orders["HBOT-1"], "101")
+        self.connector._replay_pending_order_messages("101")
+        self.assertNotIn("101", self.connector._pending_order_messages)
+        self.assertNotIn("HBOT-1", self.connector.in_flight_orders)
+        self.assertEqual(1, len(self.event_logger.event_log))
+
+    def test_unknown_message_not_buffered_without_pending_orders(self):
+        self.track_order("HBOT-1", "101")
+        self.connector._process_order_message(order_message("999", state="cancel"))
+        self.ev_loop.run_until_complete(self.connector._process_trade_message(
+            {"id": 1, "order_id": "999", "amount": "1.0", "total": "0.00000099", "created_at": 1615978645}))
+        self.assertEqual({}, self.connector._pending_order_messages)
+        self.assertEqual(0, len(self.event_logger.event_log))
+
+    def test_restore_tracking_states_rebuilds_index(self):
+        self.track_order("HBOT-1", "101")
+        saved_states = self.connector.tracking_states
+        connector = PeatioExchange("", "", trading_pairs=[self.trading_pair], trading_required=False)
+        connector.restore_tracking_states(saved_states)
+        self.assertEqual("HBOT-1", connector._exchange_order_ids["101"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import json
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_exchange import PeatioExchange
+from hummingbot.connector.exchange.peatio.peatio_order_latency_tracer import (
+    OrderLatencyStage,
+    PeatioOrderLatencyTracer,
+)
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.event.events import OrderType
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from test.integration.humming_web_app import get_open_port
+
+
+class PeatioOrderLatencyTracerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1615978800.0
+
+    def test_ring_keeps_last_orders(self):
+        tracer = PeatioOrderLatencyTracer(capacity=3, enabled=True)
+        for i in range(5):
+            tracer.start(f"HBOT-{i}", "ROGER-BTC", self.start_timestamp + i)
+            tracer.record(f"HBOT-{i}", OrderLatencyStage.ACKED, self.start_timestamp + i + 0.1)
+        self.assertEqual(3, len(tracer))
+        self.assertEqual({}, tracer.stage_timestamps("HBOT-1"))
+        self.assertEqual({"queued": self.start_timestamp + 4, "acked": self.start_timestamp + 4.1},
+                         tracer.stage_timestamps("HBOT-4"))
+        # Orders placed before tracing are ignored.
+        tracer.record("HBOT-0", OrderLatencyStage.ACKED)
+        self.assertEqual(3, len(tracer.intervals()["queued to acked"]))
+
+    def test_first_only_stages(self):
+        tracer = PeatioOrderLatencyTracer(capacity=3, enabled=True)
+        tracer.start("HBOT-1", "ROGER-BTC", self.start_timestamp)
+        tracer.record("HBOT-1", OrderLatencyStage.SENT, self.start_timestamp + 1)
+        tracer.record("HBOT-1", OrderLatencyStage.SENT, self.start_timestamp + 2)
+        tracer.record("HBOT-1", OrderLatencyStage.FILLED, self.start_timestamp + 3)
+        tracer.record("HBOT-1", OrderLatencyStage.FILLED, self.start_timestamp + 4)
+        timestamps = tracer.stage_timestamps("HBOT-1")
+        self.assertEqual(self.start_timestamp + 2, timestamps["sent"])
+        self.assertEqual(self.start_timestamp + 3, timestamps["filled"])
+
+    def test_ws_update_before_ack(self):
+        tracer = PeatioOrderLatencyTracer(capacity=3, enabled=True)
+        tracer.start("HBOT-1", "ROGER-BTC", self.start_timestamp)
+        tracer.record("HBOT-1", OrderLatencyStage.SENT, self.start_timestamp + 0.01)
+        tracer.record_ws_update("101", None, self.start_timestamp + 0.05)
+        tracer.record_exchange_order_id("HBOT-1", "101", self.start_timestamp + 0.08)
+        tracer.record_ws_update("101", "HBOT-1", self.start_timestamp + 0.2)
+        intervals = tracer.intervals()
+        self.assertAlmostEqual(0.04, intervals["websocket confirmation"][0], places=6)
+        self.assertAlmostEqual(0.07, intervals["create order response"][0], places=6)
+        self.assertEqual(0, len(intervals["cancel"]))
+
+    def test_summary_and_dump(self):
+        tracer = PeatioOrderLatencyTracer(capacity=10, enabled=True)
+        for i in range(4):
+            tracer.start(f"HBOT-{i}", "ROGER-BTC", self.start_timestamp)
+            tracer.record(f"HBOT-{i}", OrderLatencyStage.THROTTLED, self.start_timestamp + 0.001 * (i + 1))
+        summary = tracer.format_summary()
+        self.assertIn("Traced orders: 4", summary)
+        self.assertIn("throttle wait", summary)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, "latency.jsonl")
+            self.assertEqual(4, tracer.dump(path))
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(["HBOT-0", "HBOT-1", "HBOT-2", "HBOT-3"], [r["client_order_id"] for r in records])
+        self.assertEqual({"client_order_id": "HBOT-3", "trading_pair": "ROGER-BTC", "queued": self.start_timestamp,
+                          "throttled": self.start_timestamp + 0.004}, records[-1])
+        tracer.reset()
+        self.assertEqual(0, len(tracer))
+
+
+class PeatioOrderLatencyTracingUnitTest(unittest.TestCase):
+    trading_pair = "ROGER-BTC"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+        async def create_order(request: web.Request) -> web.Response:
+            await asyncio.sleep(0.02)
+            return web.json_response({"id": 101, "state": "pending"})
+
+        async def cancel_order(request: web.Request) -> web.Response:
+            return web.json_response({"id": int(request.match_info["order_id"]), "state": "cancel"})
+
+        app = web.Application()
+        app.router.add_post("/market/orders", create_order)
+        app.router.add_post("/market/orders/{order_id}/cancel", cancel_order)
+        cls.runner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        port = get_open_port()
+        cls.ev_loop.run_until_complete(web.TCPSite(cls.runner, "127.0.0.1", port).start())
+        cls._url_patcher = patch.object(Constants, "REST_URL", f"http://127.0.0.1:{port}")
+        cls._url_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._url_patcher.stop()
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    def setUp(self):
+        self.connector = PeatioExchange("", "", trading_pairs=[self.trading_pair], trading_required=False)
+        self.connector._throttler = Throttler(rate_limit=(1000, 1.0))
+        self.connector._trading_rules[self.trading_pair] = TradingRule(
+            self.trading_pair, min_order_size=Decimal("1"), min_price_increment=Decimal("1e-8"),
+            min_base_amount_increment=Decimal("1e-8"))
+
+    def place_and_cancel(self) -> str:
+        async def run() -> str:
+            order_id = self.connector.buy(self.trading_pair, Decimal("10"), OrderType.LIMIT, Decimal("0.00000099"))
+            await asyncio.sleep(0.01)
+            # The user stream confirms the order before the create order response.
+            self.connector._user_stream_tracker.user_stream.put_nowait(
+                {"order": {"id": 101, "market": "rogerbtc", "state": "wait", "side": "buy", "ord_type": "limit",
+                           "price": "0.00000099", "avg_price": "0", "origin_volume": "10.0",
+                           "executed_volume": "0"}})
+            listener = asyncio.ensure_future(self.connector._user_stream_event_listener())
+            await asyncio.sleep(0.1)
+            self.connector.cancel(self.trading_pair, order_id)
+            await asyncio.sleep(0.05)
+            listener.cancel()
+            return order_id
+
+        return self.ev_loop.run_until_complete(run())
+
+    def test_order_stages_traced(self):
+        self.connector.order_latency_tracer.enabled = True
+        order_id = self.place_and_cancel()
+        stages = self.connector.order_latency_tracer.stage_timestamps(order_id)
+        self.assertEqual(["queued", "throttled", "sent", "acked", "first_ws_update", "cancel_requested",
+                          "cancel_acked"], list(stages.keys()))
+        self.assertLess(stages["first_ws_update"], stages["acked"])
+        self.assertLessEqual(stages["throttled"], stages["sent"])
+        self.assertGreaterEqual(stages["acked"] - stages["sent"], 0.02)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(self.connector.order_latency_tracer.enabled)
+        self.place_and_cancel()
+        self.assertEqual(0, len(self.connector.order_latency_tracer))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import unittest
+from collections import Counter
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_exchange import PeatioExchange
+from test.integration.humming_web_app import get_open_port
+
+
+class MockPeatioOrdersAPI:
+    """
+    Serves market/orders (list, paginated by page and limit, filtered by market and state) and
+    market/orders/{id}, counting the requests made to each.
+    """
+    def __init__(self):
+        self.orders: List[Dict[str, any]] = []
+        self.request_counts: Counter = Counter()
+
+    def add_order(self, exchange_order_id: int, market: str, state: str):
+        self.orders.append({
+            "id": exchange_order_id,
+            "market": market,
+            "side": "buy",
+            "ord_type": "limit",
+            "price": "0.00000099",
+            "avg_price": "0",
+            "state": state,
+            "origin_volume": "10.0",
+            "remaining_volume": "10.0",
+            "executed_volume": "0",
+            "created_at": 1596481983,
+            "updated_at": 1596553643,
+        })
+
+    async def list_orders(self, request: web.Request) -> web.Response:
+        self.request_counts["list"] += 1
+        limit = int(request.query.get("limit", 100))
+        page = int(request.query.get("page", 1))
+        orders = [o for o in reversed(self.orders)
+                  if o["market"] == request.query.get("market", o["market"]) and
+                  o["state"] == request.query.get("state", o["state"])]
+        return web.json_response(orders[(page - 1) * limit:page * limit])
+
+    async def get_order(self, request: web.Request) -> web.Response:
+        self.request_counts["single"] += 1
+        order_id = int(request.match_info["order_id"])
+        orders = [o for o in self.orders if o["id"] == order_id]
+        if not orders:
+            return web.json_response({"errors": ["record.not_found"]}, status=404)
+        return web.json_response(orders[0])
+
+
+class PeatioOrderStatusSweepUnitTest(unittest.TestCase):
+    markets = ["ROGER-BTC", "ROGER-USDT"]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.mock_api = MockPeatioOrdersAPI()
+        app = web.Application()
+        app.router.add_get("/market/orders", cls.mock_api.list_orders)
+        app.router.add_get("/market/orders/{order_id}", cls.mock_api.get_order)
+        cls.runner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        port = get_open_port()
+        cls.ev_loop.run_until_complete(web.TCPSite(cls.runner, "127.0.0.1", port).start())
+        cls._url_patcher = patch.object(Constants, "REST_URL", f"http://127.0.0.1:{port}")
+        cls._url_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._url_patcher.stop()
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    def setUp(self):
+        self.mock_api.orders.clear()
+        self.mock_api.request_counts.clear()
+        self.connector = PeatioExchange("", "", trading_pairs=self.markets, trading_required=False)
+        self.connector._throttler = Throttler(rate_limit=(1000, 1.0))
+
+    def tearDown(self):
+        if self.connector._shared_client is not None:
+            self.ev_loop.run_until_complete(self.connector._shared_client.close())
+
+    def track_orders(self, count: int, state: str = "wait", first_id: int = 1):
+        for exchange_order_id in range(first_id, first_id + count):
+            trading_pair = self.markets[exchange_order_id % len(self.markets)]
+            self.mock_api.add_order(exchange_order_id, trading_pair.replace("-", "").lower(), state)
+            self.connector.start_tracking_order(f"HBOT-{exchange_order_id}", str(exchange_order_id), trading_pair,
+                                                TradeType.BUY, Decimal("0.00000099"), Decimal("10"), OrderType.LIMIT)
+
+    def test_sweep_uses_a_few_list_requests_per_market(self):
+        self.track_orders(60)
+        self.ev_loop.run_until_complete(self.connector._update_order_status_by_market())
+        self.assertEqual(2, self.mock_api.request_counts["list"])
+        self.assertEqual(0, self.mock_api.request_counts["single"])
+        self.assertTrue(all(o.last_state == "wait" for o in self.connector.in_flight_orders.values()))
+
+    def test_sweep_paginates_open_orders(self):
+        with patch.object(Constants, "ORDER_STATUS_PAGE_LIMIT", 10):
+            self.track_orders(60)
+            self.ev_loop.run_until_complete(self.connector._update_order_status_by_market())
+        # 30 open orders per market, paging stops once all of them are found.
+        self.assertEqual(6, self.mock_api.request_counts["list"])
+        self.assertEqual(0, self.mock_api.request_counts["single"])
+
+    def test_closed_orders_found_in_recent_orders(self):
+        self.track_orders(10)
+        self.track_orders(2, state="cancel", first_id=11)
+        self.ev_loop.run_until_complete(self.connector._update_order_status_by_market())
+        # One open orders request and one recent orders request per market.
+        self.assertEqual(4, self.mock_api.request_counts["list"])
+        self.assertEqual(0, self.mock_api.request_counts["single"])
+        self.assertEqual(10, len(self.connector.in_flight_orders))
+
+    def test_falls_back_to_single_lookups_for_missing_orders(self):
+        self.track_orders(10)
+        self.connector.start_tracking_order("HBOT-999", "999", "ROGER-BTC", TradeType.BUY, Decimal("0.00000099"),
+                                            Decimal("10"), OrderType.LIMIT)
+        self.ev_loop.run_until_complete(self.connector._update_order_status_by_market())
+        self.assertEqual(1, self.mock_api.request_counts["single"])
+        self.assertEqual(1, self.connector._order_not_found_records["HBOT-999"])
+
+
+if __name__ == "__main__":
+    unittest.main()
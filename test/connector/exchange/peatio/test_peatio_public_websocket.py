@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import asyncio
+import json
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+import websockets
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.connector.exchange.peatio.peatio_api_order_book_data_source import PeatioAPIOrderBookDataSource
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from test.integration.humming_web_app import get_open_port
+
+
+class MockRangerServer:
+    """
+    Stands in for the ranger public websocket: sends an order book snapshot of each subscribed market followed by the
+    increments in the given order, dropping or reordering some of them, then closes the connection.
+    """
+    def __init__(self, increments: Dict[str, List[int]]):
+        self.port: int = get_open_port()
+        self.increments: Dict[str, List[int]] = increments
+        self.connections: int = 0
+        self.subscriptions: List[List[str]] = []
+        self._server = None
+
+    async def start(self):
+        self._server = await websockets.serve(self._handler, "127.0.0.1", self.port, close_timeout=0.1)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handler(self, websocket, path):
+        self.connections += 1
+        request: Dict[str, Any] = json.loads(await websocket.recv())
+        self.subscriptions.append(request["streams"])
+        await websocket.send(json.dumps({"success": {"message": "subscribed", "streams": request["streams"]}}))
+        for market, sequences in self.increments.items():
+            await websocket.send(json.dumps({f"{market}.ob-snap": {
+                "asks": [["1.1", "1.0"]], "bids": [["0.9", "1.0"]], "sequence": 10
+            }}))
+        for market, sequences in self.increments.items():
+            for sequence in sequences:
+                await websocket.send(json.dumps({f"{market}.ob-inc": {
+                    "bids": [str(sequence / 100), "1.0"], "sequence": sequence
+                }}))
+            await websocket.send(json.dumps({f"{market}.trades": {"trades": [
+                {"tid": self.connections, "taker_type": "buy", "date": 1615978645, "price": "1.0", "amount": "1.0"}
+            ]}}))
+        await asyncio.sleep(0.2)
+
+
+class PeatioPublicWebsocketUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = ["ROGER-BTC", "BTC-USDT"]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.server = MockRangerServer({
+            # 13 is late, 17 and 18 are lost.
+            "rogerbtc": [11, 12, 14, 13, 15, 16, 19],
+            "btcusdt": [11, 12, 13],
+        })
+        self.ev_loop.run_until_complete(self.server.start())
+        self.addCleanup(lambda: self.ev_loop.run_until_complete(self.server.stop()))
+        self.snapshot_requests: List[str] = []
+
+        async def get_order_book_data(trading_pair: str) -> Dict[str, Any]:
+            self.snapshot_requests.append(trading_pair)
+            return {"timestamp": 1615978645, "asks": [["1.2", "1.0"]], "bids": [["0.8", "1.0"]]}
+
+        for patcher in [patch.object(Constants, "WS_PUBLIC_URL", f"ws://127.0.0.1:{self.server.port}"),
+                        patch.object(Constants, "WS_RECONNECT_BASE_DELAY", 0.05),
+                        patch.object(PeatioAPIOrderBookDataSource, "get_order_book_data",
+                                     side_effect=get_order_book_data)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_listeners(self, data_source: PeatioAPIOrderBookDataSource, duration: float):
+        diffs, trades = asyncio.Queue(), asyncio.Queue()
+        tasks = [asyncio.ensure_future(data_source.listen_for_order_book_diffs(self.ev_loop, diffs)),
+                 asyncio.ensure_future(data_source.listen_for_trades(self.ev_loop, trades))]
+        self.ev_loop.run_until_complete(asyncio.sleep(duration))
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        # Let the shared connection close.
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        return [diffs.get_nowait() for _ in range(diffs.qsize())], [trades.get_nowait() for _ in range(trades.qsize())]
+
+    def test_streams_share_one_connection(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+        diffs, trades = self.run_listeners(data_source, 0.15)
+        self.assertEqual(1, self.server.connections)
+        self.assertEqual(["rogerbtc.trades", "rogerbtc.ob-inc", "rogerbtc.ob-snap",
+                          "btcusdt.trades", "btcusdt.ob-inc", "btcusdt.ob-snap"], self.server.subscriptions[0])
+        self.assertEqual(["ROGER-BTC", "BTC-USDT"], [trade.trading_pair for trade in trades])
+        self.assertEqual(OrderBookMessageType.TRADE, trades[0].type)
+        self.assertIsNone(data_source._public_stream_task)
+
+    def test_sequence_gaps_resync_affected_pair(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+        diffs, _ = self.run_listeners(data_source, 0.15)
+        roger_messages: List[OrderBookMessage] = [diff for diff in diffs if diff.trading_pair == "ROGER-BTC"]
+        ranger_messages = [message for message in roger_messages if "sequence" in message.content]
+        resync_snapshots = [message for message in roger_messages if "sequence" not in message.content]
+        self.assertEqual([OrderBookMessageType.SNAPSHOT] + [OrderBookMessageType.DIFF] * 6,
+                         [message.type for message in ranger_messages])
+        # The late increment is dropped.
+        self.assertEqual([10, 11, 12, 14, 15, 16, 19], [message.content["sequence"] for message in ranger_messages])
+        # Two gaps, the second one may come while the first resync is still being served.
+        self.assertIn(len(self.snapshot_requests), (1, 2))
+        self.assertEqual({"ROGER-BTC"}, set(self.snapshot_requests))
+        self.assertEqual(len(self.snapshot_requests), len(resync_snapshots))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, resync_snapshots[0].type)
+        self.assertEqual([["0.8", "1.0"]], resync_snapshots[0].content["bids"])
+        btc_messages = [diff for diff in diffs if diff.trading_pair == "BTC-USDT"]
+        self.assertEqual([10, 11, 12, 13], [message.content["sequence"] for message in btc_messages])
+
+    def test_reconnects_with_backoff(self):
+        data_source = PeatioAPIOrderBookDataSource(self.trading_pairs)
+        with patch("hummingbot.connector.exchange.peatio.peatio_api_order_book_data_source.ws_reconnect_delay",
+                   return_value=0.05) as reconnect_delay:
+            diffs, trades = self.run_listeners(data_source, 0.9)
+        self.assertGreaterEqual(self.server.connections, 2)
+        # Messages were received on every connection, so the backoff starts over each time.
+        self.assertEqual([0] * reconnect_delay.call_count, [args[0] for args, _ in reconnect_delay.call_args_list])
+        self.assertEqual(2 * self.server.connections, len(trades))
+        # Sequences start over with the snapshot of each connection.
+        snapshots = [diff for diff in diffs if diff.type is OrderBookMessageType.SNAPSHOT and
+                     diff.content.get("sequence") == 10]
+        self.assertEqual(2 * self.server.connections, len(snapshots))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import copy
+import random
+import unittest
+from decimal import Decimal
+from typing import Dict
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCreatedEvent,
+    TradeFee,
+    TradeType,
+)
+
+
+class MockInFlightOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state == "filled"
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.last_state == "cancelled"
+
+    @property
+    def is_failure(self) -> bool:
+        return self.last_state == "failed"
+
+
+class MockConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self._in_flight_orders: Dict[str, MockInFlightOrder] = {}
+        self.timestamp: float = 1615978800.0
+
+    @property
+    def in_flight_orders(self) -> Dict[str, MockInFlightOrder]:
+        return self._in_flight_orders
+
+    def estimate_fee_pct(self, is_maker: bool) -> Decimal:
+        return Decimal("0.001")
+
+    def track(self, order_id: str, trading_pair: str, trade_type: TradeType, price: Decimal, amount: Decimal):
+        self._in_flight_orders[order_id] = MockInFlightOrder(order_id, None, trading_pair, OrderType.LIMIT, trade_type,
+                                                             price, amount, "open")
+
+    def create(self, order_id: str, trading_pair: str, trade_type: TradeType, price: Decimal, amount: Decimal):
+        self.track(order_id, trading_pair, trade_type, price, amount)
+        if trade_type is TradeType.BUY:
+            self.trigger_event(MarketEvent.BuyOrderCreated,
+                               BuyOrderCreatedEvent(self.timestamp, OrderType.LIMIT, trading_pair, amount, price,
+                                                    order_id))
+        else:
+            self.trigger_event(MarketEvent.SellOrderCreated,
+                               SellOrderCreatedEvent(self.timestamp, OrderType.LIMIT, trading_pair, amount, price,
+                                                     order_id))
+
+    def fill(self, order_id: str, amount: Decimal):
+        order = self._in_flight_orders[order_id]
+        order.executed_amount_base += amount
+        order.executed_amount_quote += amount * order.price
+        if order.executed_amount_base >= order.amount:
+            order.last_state = "filled"
+        self.trigger_event(MarketEvent.OrderFilled,
+                           OrderFilledEvent(self.timestamp, order_id, order.trading_pair, order.trade_type,
+                                            OrderType.LIMIT, order.price, amount, TradeFee(Decimal(0))))
+        if order.is_done:
+            del self._in_flight_orders[order_id]
+
+    def cancel(self, trading_pair: str, order_id: str):
+        self._in_flight_orders[order_id].last_state = "cancelled"
+        self.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(self.timestamp, order_id))
+        del self._in_flight_orders[order_id]
+
+    def fail(self, order_id: str):
+        # As when the create order request fails, the order is no longer tracked before its event.
+        del self._in_flight_orders[order_id]
+        self.trigger_event(MarketEvent.OrderFailure,
+                           MarketOrderFailureEvent(self.timestamp, order_id, OrderType.LIMIT))
+
+    def take_snapshot(self):
+        self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self._in_flight_orders.items()}
+        self._in_flight_orders_snapshot_timestamp = self.timestamp
+
+
+class BalanceLedgerUnitTest(unittest.TestCase):
+    trading_pairs = ["HBOT-USDT", "HBOT-BTC", "BTC-USDT"]
+
+    def setUp(self):
+        self.connector = MockConnector()
+        self.ledger = self.connector.balance_ledger
+
+    def recomputed_available_balance(self, currency: str, available_balance: Decimal) -> Decimal:
+        # The computation of ConnectorBase.apply_balance_update_since_snapshot over all the orders and events
+        connector = self.connector
+        return available_balance + \
+            connector.in_flight_asset_balances(connector.in_flight_orders_snapshot).get(currency, Decimal(0)) - \
+            connector.in_flight_asset_balances(connector.in_flight_orders).get(currency, Decimal(0)) + \
+            connector.order_filled_balances(connector.in_flight_orders_snapshot_timestamp).get(currency, Decimal(0))
+
+    def test_random_order_flow(self):
+        rng = random.Random(42)
+        connector = self.connector
+        next_id = 0
+        for step in range(500):
+            connector.timestamp += rng.choice([0, 0, 0.5, 1])
+            action = rng.random()
+            if action < 0.35 or not connector.in_flight_orders:
+                next_id += 1
+                trade_type = rng.choice([TradeType.BUY, TradeType.SELL])
+                price = Decimal(rng.randint(1, 100000)) / Decimal(1000)
+                amount = Decimal(rng.randint(1, 1000)) / Decimal(100)
+                if rng.random() < 0.2:
+                    # Tracked but not created yet
+                    connector.track(f"HBOT-{next_id}", rng.choice(self.trading_pairs), trade_type, price, amount)
+                else:
+                    connector.create(f"HBOT-{next_id}", rng.choice(self.trading_pairs), trade_type, price, amount)
+            else:
+                order_id = rng.choice(list(connector.in_flight_orders.keys()))
+                order = connector.in_flight_orders[order_id]
+                if action < 0.75:
+                    remaining = order.amount - order.executed_amount_base
+                    connector.fill(order_id, remaining if rng.random() < 0.4 else remaining / 2)
+                elif action < 0.95:
+                    connector.cancel(order.trading_pair, order_id)
+                else:
+                    connector.fail(order_id)
+            if rng.random() < 0.1:
+                connector.take_snapshot()
+            for currency in ("HBOT", "USDT", "BTC"):
+                self.assertEqual(self.recomputed_available_balance(currency, Decimal(100)),
+                                 connector.apply_balance_update_since_snapshot(currency, Decimal(100)),
+                                 f"{currency} at step {step}")
+            self.assertEqual({}, self.ledger.check_consistency())
+        self.assertGreater(len(connector.order_filled_balances()), 0)
+
+    def test_idle_until_queried(self):
+        self.connector.create("HBOT-1", "HBOT-USDT", TradeType.BUY, Decimal("2"), Decimal("10"))
+        self.connector.fill("HBOT-1", Decimal("4"))
+        self.connector.create("HBOT-2", "HBOT-USDT", TradeType.SELL, Decimal("3"), Decimal("5"))
+        self.assertEqual(0, len(self.ledger._order_balances))
+        self.assertEqual({"USDT": Decimal("12.012"), "HBOT": Decimal("5")},
+                         self.ledger.locked_balances(self.connector.in_flight_orders))
+        self.assertEqual({"HBOT": Decimal("4"), "USDT": Decimal("-8")}, self.ledger.filled_balances())
+        self.connector.fill("HBOT-2", Decimal("5"))
+        self.assertEqual({"USDT": Decimal("12.012"), "HBOT": Decimal("0")},
+                         self.ledger.locked_balances(self.connector.in_flight_orders))
+        self.assertEqual({"HBOT": Decimal("-1"), "USDT": Decimal("7")}, self.ledger.filled_balances())
+        self.assertEqual({}, self.ledger.check_consistency())
+
+    def test_order_tracked_after_one_completed(self):
+        self.ledger.locked_balances(self.connector.in_flight_orders)
+        self.connector.create("HBOT-1", "HBOT-USDT", TradeType.BUY, Decimal("2"), Decimal("10"))
+        # The completed order leaves the ledger on the next query, when another order is tracked already.
+        self.connector.fill("HBOT-1", Decimal("10"))
+        self.connector.track("HBOT-2", "HBOT-USDT", TradeType.SELL, Decimal("100"), Decimal("2"))
+        self.assertEqual(Decimal("2"), self.ledger.locked_balances(self.connector.in_flight_orders)["HBOT"])
+        self.assertEqual({}, self.ledger.check_consistency())
+
+    def test_balance_limit(self):
+        self.connector.create("HBOT-1", "HBOT-USDT", TradeType.BUY, Decimal("2"), Decimal("10"))
+        self.assertEqual(Decimal("29.98"), self.connector.apply_balance_limit("USDT", Decimal(100), Decimal(50)))
+        self.connector.fill("HBOT-1", Decimal("10"))
+        self.assertEqual(Decimal("30"), self.connector.apply_balance_limit("USDT", Decimal(100), Decimal(50)))
+        self.assertEqual(Decimal("15"), self.connector.apply_balance_limit("HBOT", Decimal(100), Decimal(5)))
+
+    def test_fills_since_earlier_timestamp(self):
+        for i in range(4):
+            self.connector.create(f"HBOT-{i}", "HBOT-USDT", TradeType.SELL, Decimal("2"), Decimal("1"))
+            self.connector.fill(f"HBOT-{i}", Decimal("1"))
+            self.connector.timestamp += 1
+        start = self.connector.timestamp - 4
+        self.assertEqual({"HBOT": Decimal("-2"), "USDT": Decimal("4")}, self.ledger.filled_balances(start + 1.5))
+        self.assertEqual({"HBOT": Decimal("-3"), "USDT": Decimal("6")}, self.ledger.filled_balances(start + 0.5))
+        self.assertEqual({"HBOT": Decimal("-1"), "USDT": Decimal("2")}, self.ledger.filled_balances(start + 2.5))
+        self.assertEqual({}, self.ledger.check_consistency())
+
+
+if __name__ == "__main__":
+    unittest.main()
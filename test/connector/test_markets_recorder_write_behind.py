@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Dict
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "conf_pure_mm_1.yml"
+
+
+class MockConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self.event_count = 0
+
+    @property
+    def tracking_states(self) -> Dict[str, any]:
+        return {"event_count": self.event_count}
+
+
+class MarketsRecorderWriteBehindUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self._data_path_patcher = patch("hummingbot.connector.markets_recorder.data_path",
+                                        return_value=self.tmp_dir.name)
+        self._data_path_patcher.start()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=join(self.tmp_dir.name, "trades.sqlite"))
+        self.commit_count = 0
+        event.listen(self.sql.engine, "commit", self.count_commit)
+        self.market = MockConnector()
+
+    def tearDown(self):
+        event.remove(self.sql.engine, "commit", self.count_commit)
+        self._data_path_patcher.stop()
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def count_commit(self, conn):
+        self.commit_count += 1
+
+    def create_recorder(self, **kwargs) -> MarketsRecorder:
+        recorder = MarketsRecorder(self.sql, [self.market], CONFIG_FILE_PATH, "pure_market_making", **kwargs)
+        recorder.start()
+        return recorder
+
+    def trigger(self, event_tag: MarketEvent, evt):
+        self.market.event_count += 1
+        self.market.trigger_event(event_tag, evt)
+
+    def place_and_fill(self, count: int):
+        for i in range(count):
+            order_id = f"HBOT-B-ROGER-BTC-{1615978645000000 + i}"
+            self.trigger(MarketEvent.BuyOrderCreated,
+                         BuyOrderCreatedEvent(1615978645, OrderType.LIMIT, "ROGER-BTC", Decimal("10"),
+                                              Decimal("0.00000099"), order_id, str(i)))
+            self.trigger(MarketEvent.OrderFilled,
+                         OrderFilledEvent(1615978645, order_id, "ROGER-BTC", TradeType.BUY, OrderType.LIMIT,
+                                          Decimal("0.00000099"), Decimal("10"), TradeFee(Decimal("0.001")), str(i)))
+
+    def test_wal_mode(self):
+        self.assertEqual("wal", self.sql.engine.execute("PRAGMA journal_mode").scalar())
+
+    def test_events_saved_in_batches(self):
+        recorder = self.create_recorder(flush_interval=0.5)
+        self.commit_count = 0
+        self.place_and_fill(20)
+        self.assertEqual(0, self.commit_count)
+        self.assertGreater(recorder.pending_records_count, 0)
+
+        trades = recorder.get_trades_for_config(CONFIG_FILE_PATH)
+        self.assertEqual(20, len(trades))
+        self.assertLessEqual(self.commit_count, 2)
+        self.assertTrue(all(o.last_status == "OrderFilled"
+                            for o in recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, self.market)))
+        self.assertEqual(40, self.sql.get_shared_session().query(OrderStatus).count())
+        market_state: MarketState = recorder.get_market_states(CONFIG_FILE_PATH, self.market)
+        self.assertEqual({"event_count": 40}, market_state.saved_state)
+        recorder.stop()
+
+    def test_status_updates_coalesced_per_order(self):
+        recorder = self.create_recorder(flush_interval=0.5)
+        self.place_and_fill(1)
+        order_id = f"HBOT-B-ROGER-BTC-{1615978645000000}"
+        self.trigger(MarketEvent.OrderCancelled, OrderCancelledEvent(1615978646, order_id))
+        self.trigger(MarketEvent.OrderCancelled, OrderCancelledEvent(1615978646, "HBOT-UNKNOWN"))
+        recorder.flush()
+        session = self.sql.get_shared_session()
+        order: Order = session.query(Order).filter(Order.id == order_id).one()
+        self.assertEqual("OrderCancelled", order.last_status)
+        self.assertEqual(["BuyOrderCreated", "OrderFilled", "OrderCancelled"],
+                         [s.status for s in session.query(OrderStatus).order_by(OrderStatus.id)])
+        recorder.stop()
+
+    def test_stop_writes_out_queued_records(self):
+        recorder = self.create_recorder(flush_interval=10.0)
+        self.place_and_fill(5)
+        recorder.stop()
+        self.assertEqual(5, self.sql.get_shared_session().query(TradeFill).count())
+        with open(join(self.tmp_dir.name, "trades_conf_pure_mm_1.csv")) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(6, len(lines))
+        self.assertEqual(["1", "2", "3", "4", "5"], [line.split(",")[0] for line in lines[1:]])
+
+    def test_synchronous_mode(self):
+        recorder = self.create_recorder(write_behind=False)
+        self.commit_count = 0
+        self.place_and_fill(3)
+        self.assertEqual(6, self.commit_count)
+        self.assertEqual(0, recorder.pending_records_count)
+        self.assertEqual(3, len(recorder.get_trades_for_config(CONFIG_FILE_PATH)))
+        recorder.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
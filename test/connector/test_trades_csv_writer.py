@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import asyncio
+import glob
+import os
+import tempfile
+import unittest
+
+from hummingbot.connector.markets_recorder import TradesCSVWriter
+
+HEADER = ("id", "price", "amount")
+
+
+class TradesCSVWriterUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = join(self.tmp_dir.name, "trades_conf_pure_mm_1.csv")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_lines(self, path=None):
+        with open(path or self.csv_path) as f:
+            return f.read().splitlines()
+
+    def test_header_written_once(self):
+        writer = TradesCSVWriter(self.csv_path)
+        writer.write_row(HEADER, (1, 0.1, 10))
+        writer.write_row(HEADER, (2, 0.2, None))
+        writer.close()
+        self.assertEqual(["id,price,amount", "1,0.1,10", "2,0.2,"], self.read_lines())
+
+    def test_appends_to_file_with_matching_header(self):
+        writer = TradesCSVWriter(self.csv_path)
+        writer.write_row(HEADER, (1, 0.1, 10))
+        writer.close()
+        writer = TradesCSVWriter(self.csv_path)
+        writer.write_row(HEADER, (2, 0.2, 20))
+        writer.close()
+        self.assertEqual(["id,price,amount", "1,0.1,10", "2,0.2,20"], self.read_lines())
+
+    def test_rotates_on_header_change(self):
+        writer = TradesCSVWriter(self.csv_path)
+        writer.write_row(HEADER, (1, 0.1, 10))
+        writer.write_row(HEADER + ("age",), (2, 0.2, 20, "n/a"))
+        writer.close()
+        self.assertEqual(["id,price,amount,age", "2,0.2,20,n/a"], self.read_lines())
+        old_files = glob.glob(join(self.tmp_dir.name, "trades_conf_pure_mm_1_old_*.csv"))
+        self.assertEqual(1, len(old_files))
+        self.assertEqual(["id,price,amount", "1,0.1,10"], self.read_lines(old_files[0]))
+
+    def test_rows_flushed_by_count_and_timer(self):
+        writer = TradesCSVWriter(self.csv_path, flush_interval=0.1, flush_rows=3)
+        writer.write_row(HEADER, (1, 0.1, 10))
+        writer.write_row(HEADER, (2, 0.2, 20))
+        self.assertEqual(1, len(self.read_lines()))
+        writer.write_row(HEADER, (3, 0.3, 30))
+        self.assertEqual(4, len(self.read_lines()))
+        writer.write_row(HEADER, (4, 0.4, 40))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+        self.assertEqual(5, len(self.read_lines()))
+        writer.close()
+        self.assertTrue(os.path.exists(self.csv_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
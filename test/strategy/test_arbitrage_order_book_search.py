@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import math
+import unittest
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+
+import numpy as np
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeFee,
+)
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.arbitrage.order_book_search import find_best_arbitrage_amount
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class SearchExchange(ExchangeBase):
+    def __init__(self, name: str, price_quantum: Decimal, size_quantum: Decimal, fee_percent: Decimal):
+        self._name = name
+        super().__init__()
+        self._order_book = OrderBook()
+        self._balances: Dict[str, Decimal] = {}
+        self.price_quantum = price_quantum
+        self.size_quantum = size_quantum
+        self.fee_percent = fee_percent
+        self.flat_fee = Decimal(0)
+        self.large_amount_fee_percent = fee_percent
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    @property
+    def limit_orders(self) -> List[LimitOrder]:
+        return []
+
+    def set_balance(self, currency: str, balance: Decimal):
+        self._balances[currency] = balance
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self._balances.get(currency, Decimal(0))
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self._order_book
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return self.price_quantum
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return self.size_quantum
+
+    def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side, amount: Decimal,
+                price: Decimal = Decimal("NaN")) -> TradeFee:
+        percent = self.large_amount_fee_percent if amount > 5 else self.fee_percent
+        return TradeFee(percent, [(quote_currency, self.flat_fee)] if self.flat_fee else [])
+
+
+class ArbitrageOrderBookSearchUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.first = SearchExchange("first", Decimal("0.25"), Decimal("0.125"), Decimal("0.001"))
+        self.second = SearchExchange("second", Decimal("0.5"), Decimal("0.25"), Decimal("0.002"))
+        self.first_pair = MarketTradingPairTuple(self.first, "HBOT-USDT", "HBOT", "USDT")
+        self.second_pair = MarketTradingPairTuple(self.second, "HBOT-USDT", "HBOT", "USDT")
+        self.strategy = ArbitrageStrategy([ArbitrageMarketPair(self.first_pair, self.second_pair)],
+                                          min_profitability=Decimal("0.003"),
+                                          logging_options=ArbitrageStrategy.OPTION_LOG_CREATE_ORDER)
+        for exchange in (self.first, self.second):
+            exchange.set_balance("HBOT", Decimal(1000))
+            exchange.set_balance("USDT", Decimal(100000))
+
+    def set_books(self, rng: np.random.RandomState, levels: int, cross: float):
+        # Prices and amounts are exact in binary, on and off the quanta of the exchanges.
+        for exchange, mid_price in ((self.first, 100.), (self.second, 100. + cross)):
+            bids = [OrderBookRow(mid_price - 0.125 * (i + 1 + rng.randint(3)), 0.0625 * rng.randint(0, 40), 1)
+                    for i in range(levels)]
+            asks = [OrderBookRow(mid_price + 0.125 * (i + 1 + rng.randint(3)), 0.0625 * rng.randint(0, 40), 1)
+                    for i in range(levels)]
+            exchange.get_order_book("HBOT-USDT").apply_snapshot(bids, asks, 1)
+
+    def assert_same_as_steps(self, buy_pair: MarketTradingPairTuple, sell_pair: MarketTradingPairTuple):
+        amount, profitability, bid_price, ask_price = self.strategy.find_best_profitable_amount(buy_pair, sell_pair)
+        expected = self.strategy.find_best_profitable_amount_by_steps(buy_pair, sell_pair)
+        self.assertEqual(expected[0], amount)
+        self.assertAlmostEqual(float(expected[1]), float(profitability), places=12)
+        self.assertEqual((expected[2], expected[3]), (bid_price, ask_price))
+        return amount
+
+    def test_same_as_steps(self):
+        rng = np.random.RandomState(0)
+        amounts = []
+        for _ in range(100):
+            self.set_books(rng, 20, rng.uniform(-1., 4.))
+            self.first.set_balance("USDT", Decimal(int(rng.choice([100, 1000, 100000]))))
+            self.second.set_balance("HBOT", Decimal(int(rng.choice([1, 10, 1000]))))
+            amounts.append(self.assert_same_as_steps(self.first_pair, self.second_pair))
+            amounts.append(self.assert_same_as_steps(self.second_pair, self.first_pair))
+        # Amounts found within the books, limited by the balances and nothing to arbitrage.
+        self.assertTrue(any(0 < amount < 10 for amount in amounts))
+        self.assertTrue(any(amount >= 10 for amount in amounts))
+        self.assertIn(Decimal(0), amounts)
+
+    def test_same_as_steps_with_fees_of_the_amount(self):
+        rng = np.random.RandomState(1)
+        self.first.flat_fee = Decimal("0.01")
+        self.second.large_amount_fee_percent = Decimal("0.0005")
+        for _ in range(30):
+            self.set_books(rng, 20, rng.uniform(0., 4.))
+            self.assert_same_as_steps(self.first_pair, self.second_pair)
+            self.assert_same_as_steps(self.second_pair, self.first_pair)
+
+    def test_empty_books(self):
+        self.set_books(np.random.RandomState(2), 5, 2.)
+        self.first.get_order_book("HBOT-USDT").apply_snapshot([], [], 2)
+        self.assertEqual((0, 0, 0, 0), self.strategy.find_best_profitable_amount(self.first_pair, self.second_pair))
+
+    def test_find_best_arbitrage_amount(self):
+        bid_book, ask_book = OrderBook(), OrderBook()
+        bid_book.apply_snapshot([OrderBookRow(102., 1., 1), OrderBookRow(101.5, 2., 1), OrderBookRow(100.5, 5., 1)],
+                                [], 1)
+        ask_book.apply_snapshot([], [OrderBookRow(100., 2., 1), OrderBookRow(101., 3., 1)], 1)
+        # Steps of 1 at 102/100, 1 at 101.5/100, 1 at 101.5/101; the last one is not profitable enough.
+        result = find_best_arbitrage_amount(bid_book, ask_book, min_profitability=0.015)
+        self.assertEqual(3, result["steps"])
+        self.assertEqual(2., result["amount"])
+        self.assertAlmostEqual(203.5 / 200., result["profitability"])
+        self.assertEqual((101.5, 101.), (result["bid_price"], result["ask_price"]))
+        self.assertEqual((203.5, 200.), (result["bid_value"], result["ask_value"]))
+        self.assertFalse(result["balance_limited"])
+
+        # Quantized amounts of 0 are skipped: steps of 1 at 102/101 and 1.5 at 102/101, 101.5 being quantized to 102.
+        result = find_best_arbitrage_amount(bid_book, ask_book, bid_price_quantum=2., ask_size_quantum=2.5,
+                                            min_profitability=0.005)
+        self.assertEqual((2, 2.5), (result["steps"], result["amount"]))
+        self.assertAlmostEqual(255. / 252.5, result["profitability"])
+
+        result = find_best_arbitrage_amount(bid_book, ask_book, min_profitability=0.005, buy_fee_percent=0.001,
+                                            quote_balance=150.)
+        self.assertTrue(result["balance_limited"])
+        self.assertAlmostEqual(150. / 100. / 1.001, result["amount"])
+        self.assertFalse(result["near_tie"])
+        result = find_best_arbitrage_amount(bid_book, ask_book, min_profitability=203.5 / 200. - 1.)
+        self.assertTrue(result["near_tie"])
+        self.assertTrue(math.isclose(1., result["amount"]) or math.isclose(2., result["amount"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
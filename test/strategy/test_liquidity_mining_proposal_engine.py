@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import unittest
+from decimal import Decimal
+from statistics import mean
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.liquidity_mining.proposal_engine import ProposalEngine
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio
+)
+
+
+class ProposalEngineUnitTest(unittest.TestCase):
+    markets = ["ETH-USDT", "HBOT-USDT", "HBOT-ETH", "BTC-USDT"]
+
+    def engine(self, **kwargs) -> ProposalEngine:
+        params = dict(token="USDT", order_amount=100., spread=0.005, inventory_skew_enabled=False,
+                      target_base_pct=0.5, order_refresh_tolerance_pct=0.002, volatility_interval=5,
+                      avg_volatility_period=3)
+        params.update(kwargs)
+        return ProposalEngine(self.markets, **params)
+
+    def volatility(self, mid_prices: List[float], interval: int, period: int) -> float:
+        # Volatility of a list of mid prices as the strategy used to compute it.
+        last_index = len(mid_prices) - 1
+        atr = []
+        first_index = max(last_index - (interval * period), 0)
+        for i in range(last_index, first_index, interval * -1):
+            prices = mid_prices[i - interval + 1: i + 1]
+            if not prices:
+                break
+            atr.append((max(prices) - min(prices)) / min(prices))
+        return mean(atr) if atr else float("nan")
+
+    def test_mid_prices_and_volatility(self):
+        engine = self.engine()
+        mid_prices = [[] for _ in self.markets]
+        rng = np.random.RandomState(0)
+        for tick in range(50):
+            tick_prices = 100. * (1. + rng.normal(0., 0.01, len(self.markets)))
+            engine.update_mid_prices(tick_prices)
+            engine.update_volatility()
+            for i, market_prices in enumerate(mid_prices):
+                market_prices.append(tick_prices[i])
+                mid_prices[i] = market_prices[-15:]
+            self.assertEqual(mid_prices, engine.mid_price_history.tolist())
+            expected = [self.volatility(market_prices, 5, 3) for market_prices in mid_prices]
+            np.testing.assert_allclose(expected, engine.volatility, rtol=1e-12)
+        np.testing.assert_array_equal(engine.mid_price_history[:, -1], engine.mid_prices)
+
+    def test_spreads(self):
+        engine = self.engine(volatility_to_spread_multiplier=2., max_spread=0.02)
+        engine.volatility = np.array([float("nan"), 0.001, 0.004, 0.05])
+        np.testing.assert_allclose([0.005, 0.005, 0.008, 0.02], engine.spreads())
+
+    def test_inventory_skew_ratios(self):
+        engine = self.engine(target_base_pct=0.3, inventory_range_multiplier=2.)
+        engine.update_mid_prices(np.array([2000., 0.5, 0.00025, 50000.]))
+        cases = [(0.5, 1000.), (10., 0.), (0.1, 10000.), (0., 0.)]
+        for sell_budgets in ([c[0] for c in cases], [0.2, 2000., 10., 0.01]):
+            engine.sell_budgets = np.array(sell_budgets)
+            engine.buy_budgets = np.array([c[1] for c in cases])
+            total_order_sizes = np.array([0.1, 400., 0., 0.004])
+            bid_ratios, ask_ratios = engine.inventory_skew_ratios(total_order_sizes)
+            for i in range(len(self.markets)):
+                expected = calculate_bid_ask_ratios_from_base_asset_ratio(
+                    engine.sell_budgets[i], engine.buy_budgets[i], engine.mid_prices[i], 0.3,
+                    total_order_sizes[i] * 2.)
+                self.assertAlmostEqual(expected.bid_ratio, bid_ratios[i])
+                self.assertAlmostEqual(expected.ask_ratio, ask_ratios[i])
+
+    def test_draw_balances(self):
+        engine = self.engine()
+        # ETH, USDT, HBOT, BTC
+        balances = np.array([1., 500., 250., -1.])
+        draws = np.array([0.4, 300., 200., 150., 100., 0.8, 0.01, 1000.])
+        expected = []
+        left = dict(enumerate(balances))
+        tokens = np.empty(len(draws), dtype=np.int64)
+        tokens[0::2] = engine.base_indexes
+        tokens[1::2] = engine.quote_indexes
+        for token, draw in zip(tokens, draws):
+            drawn = max(min(draw, left[token]), 0.)
+            left[token] -= drawn
+            expected.append(drawn)
+        np.testing.assert_allclose(expected, engine.draw_balances(balances, draws))
+        np.testing.assert_allclose([0.4, 300., 200., 150., 50., 0.6, 0., 50.], expected)
+
+    def test_create_proposals(self):
+        engine = self.engine(inventory_skew_enabled=True)
+        engine.price_quanta = np.array([0.01, 0.0001, 0.000001, 1.])
+        engine.size_quanta = np.array([0.001, 1., 1., 0.0001])
+        engine.update_mid_prices(np.array([2000., 0.5, 0.00025, 50000.]))
+        engine.sell_budgets = np.array([0.05, 200., 200., 0.])
+        engine.buy_budgets = np.array([100., 100., 0.05, 100.])
+        orders = [[LimitOrder("buy-1", "ETH-USDT", True, "ETH", "USDT", Decimal("1990"), Decimal("0.05"))], [], [],
+                  [LimitOrder("sell-1", "BTC-USDT", False, "BTC", "USDT", Decimal("50300"), Decimal("0.001"))]]
+        balances = engine.token_balances(np.array([0.05, 200., 400., 0.]), orders)
+        np.testing.assert_allclose([0.05, 299.5, 400., 0.001], balances)
+        proposals = engine.create_proposals(balances, 0.001)
+        self.assertEqual(4, len(proposals))
+        np.testing.assert_allclose([1990., 0.4975, 0.000249, 49750.], proposals.buy_prices)
+        np.testing.assert_allclose([2010., 0.5025, 0.000251, 50250.], proposals.sell_prices)
+        # The proposals of each market in turn as the strategy used to create them.
+        left = dict(enumerate(balances))
+        for i in range(len(self.markets)):
+            mid_price, price_quantum = engine.mid_prices[i], engine.price_quanta[i]
+            buy_price = round(mid_price * 0.995 / price_quantum) * price_quantum
+            sell_price = round(mid_price * 1.005 / price_quantum) * price_quantum
+            buy_size, sell_size = 100. / buy_price, 100. / sell_price
+            ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
+                engine.sell_budgets[i], engine.buy_budgets[i], mid_price, 0.5, buy_size + sell_size)
+            buy_size *= ratios.bid_ratio
+            sell_size *= ratios.ask_ratio
+            base, quote = engine.base_indexes[i], engine.quote_indexes[i]
+            sell_size = min(sell_size, left[base])
+            left[base] -= sell_size
+            quote_size = min(buy_size * buy_price, left[quote])
+            left[quote] -= quote_size
+            buy_size = quote_size / (buy_price * 1.001)
+            self.assertAlmostEqual(buy_price, proposals.buy_prices[i])
+            self.assertAlmostEqual(sell_price, proposals.sell_prices[i])
+            self.assertAlmostEqual(buy_size, proposals.buy_sizes[i])
+            self.assertAlmostEqual(sell_size, proposals.sell_sizes[i])
+        # Without a base budget BTC-USDT only bids, its current sell order is to be cancelled.
+        self.assertEqual(0., proposals.sell_sizes[3])
+        self.assertGreater(proposals.buy_sizes[3], 0.)
+
+        within_tolerance = engine.within_tolerance(proposals, np.array([1990., np.nan, np.nan, np.nan]),
+                                                   np.array([np.nan, np.nan, np.nan, 50300.]))
+        self.assertEqual([True, True, True, False], within_tolerance.tolist())
+        proposals.buy_sizes[0] = 0.0009
+        self.assertFalse(engine.within_tolerance(proposals, np.array([1990., np.nan, np.nan, np.nan]),
+                                                 np.full(4, np.nan))[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
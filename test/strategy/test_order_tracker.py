@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_tracker import OrderTracker
+from hummingbot.strategy.pure_market_making.pure_market_making_order_tracker import PureMarketMakingOrderTracker
+
+
+class OrderTrackerUnitTest(unittest.TestCase):
+    start_timestamp: float = 1615978800.0
+    market_pairs = [MarketTradingPairTuple(None, "HBOT-USDT", "HBOT", "USDT"),
+                    MarketTradingPairTuple(None, "HBOT-BTC", "HBOT", "BTC")]
+
+    def setUp(self):
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 1000)
+        self.tracker = OrderTracker()
+        self.clock.add_iterator(self.tracker)
+        self.clock.backtest_til(self.start_timestamp)
+
+    def track(self, tracker: OrderTracker, market_pair: MarketTradingPairTuple, levels: int) -> List[str]:
+        order_ids = []
+        for i in range(levels):
+            for is_buy in (True, False):
+                order_id = f"{'buy' if is_buy else 'sell'}://{market_pair.trading_pair}/{i}"
+                tracker.start_tracking_limit_order(market_pair, order_id, is_buy, Decimal(100 + (-i if is_buy else i)),
+                                                   Decimal(1))
+                order_ids.append(order_id)
+        return order_ids
+
+    def assert_views_consistent(self):
+        # The indexes match a scan over the tracked orders.
+        expected = {market_pair: [o for o in orders.values()
+                                  if not self.tracker.has_in_flight_cancel(o.client_order_id)]
+                    for market_pair, orders in self.tracker.get_limit_orders().items()}
+        self.assertEqual(expected, self.tracker.market_pair_to_active_orders)
+        self.assertEqual([(market_pair.market, o) for market_pair, orders in expected.items() for o in orders],
+                         self.tracker.active_limit_orders)
+        for market_pair, orders in expected.items():
+            self.assertEqual(orders, list(self.tracker.get_active_orders(market_pair)))
+            self.assertEqual([o for o in orders if o.is_buy], list(self.tracker.get_active_bids(market_pair)))
+            self.assertEqual([o for o in orders if not o.is_buy], list(self.tracker.get_active_asks(market_pair)))
+        self.assertEqual({o.client_order_id for orders in expected.values() for o in orders},
+                         set(self.tracker.active_order_ids))
+
+    def test_track_cancel_untrack(self):
+        order_ids = self.track(self.tracker, self.market_pairs[0], 3)
+        self.track(self.tracker, self.market_pairs[1], 2)
+        self.assert_views_consistent()
+        active_orders = self.tracker.get_active_orders(self.market_pairs[0])
+        self.assertEqual(6, len(active_orders))
+
+        self.assertTrue(self.tracker.check_and_track_cancel(order_ids[0]))
+        self.assertFalse(self.tracker.check_and_track_cancel(order_ids[0]))
+        self.tracker.check_and_track_cancel(order_ids[3])
+        # The view is live.
+        self.assertEqual(4, len(active_orders))
+        self.assertEqual(2, len(self.tracker.active_bids) - len(self.tracker.get_active_bids(self.market_pairs[1])))
+        self.assert_views_consistent()
+
+        self.tracker.stop_tracking_limit_order(self.market_pairs[0], order_ids[0])
+        self.tracker.stop_tracking_limit_order(self.market_pairs[0], order_ids[1])
+        self.assertEqual(3, len(active_orders))
+        self.assert_views_consistent()
+        for order_id in order_ids[2:]:
+            self.tracker.stop_tracking_limit_order(self.market_pairs[0], order_id)
+        self.assertNotIn(self.market_pairs[0], self.tracker.market_pair_to_active_orders)
+        self.assertEqual(0, len(self.tracker.get_active_orders(self.market_pairs[0])))
+        self.assert_views_consistent()
+
+    def test_expired_cancels_active_again(self):
+        order_ids = self.track(self.tracker, self.market_pairs[0], 2)
+        self.tracker.check_and_track_cancel(order_ids[1])
+        self.clock.backtest_til(self.start_timestamp + 30)
+        self.tracker.check_and_track_cancel(order_ids[2])
+        self.assertEqual([order_ids[0], order_ids[3]],
+                         [o.client_order_id for o in self.tracker.get_active_orders(self.market_pairs[0])])
+        self.clock.backtest_til(self.start_timestamp + 60)
+        # Active again in their tracking order
+        self.assertEqual([order_ids[0], order_ids[1], order_ids[3]],
+                         [o.client_order_id for o in self.tracker.get_active_orders(self.market_pairs[0])])
+        self.assert_views_consistent()
+        # A new cancel of the order, once the previous one is dropped
+        self.clock.backtest_til(self.start_timestamp + 61)
+        self.assertTrue(self.tracker.check_and_track_cancel(order_ids[1]))
+        self.clock.backtest_til(self.start_timestamp + 90)
+        self.assertEqual([order_ids[0], order_ids[2], order_ids[3]],
+                         [o.client_order_id for o in self.tracker.get_active_orders(self.market_pairs[0])])
+        self.assert_views_consistent()
+
+    def test_pure_market_making_tracker_keeps_cancelling_orders(self):
+        tracker = PureMarketMakingOrderTracker()
+        self.clock.add_iterator(tracker)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_ids = self.track(tracker, self.market_pairs[0], 2)
+        tracker.check_and_track_cancel(order_ids[0])
+        self.assertEqual(order_ids, [o.client_order_id for o in tracker.get_active_orders(self.market_pairs[0])])
+        self.assertEqual([order_ids[0], order_ids[2]],
+                         [o.client_order_id for o in tracker.get_active_bids(self.market_pairs[0])])
+
+
+if __name__ == "__main__":
+    unittest.main()
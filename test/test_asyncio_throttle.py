@@ -0,0 +1,92 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler,
+)
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    async def run_tasks(self, throttler: Throttler, weights: List[int], limit_ids: List[str] = None) -> List[float]:
+        start = time.time()
+        admitted: List[float] = [0.0] * len(weights)
+
+        async def task(i, weight):
+            async with throttler.weighted_task(weight, limit_ids):
+                admitted[i] = time.time() - start
+
+        await asyncio.gather(*[task(i, weight) for i, weight in enumerate(weights)])
+        return admitted
+
+    def test_tasks_within_limit_are_not_delayed(self):
+        throttler = Throttler(rate_limit=(5, 0.5), period_safety_margin=0)
+        admitted = self.ev_loop.run_until_complete(self.run_tasks(throttler, [1] * 5))
+        self.assertTrue(all(t < 0.05 for t in admitted))
+        self.assertEqual(5, throttler.current_weight())
+
+    def test_waiters_admitted_in_fifo_order_when_capacity_frees(self):
+        throttler = Throttler(rate_limit=(2, 0.3), period_safety_margin=0)
+        admitted = self.ev_loop.run_until_complete(self.run_tasks(throttler, [1] * 6))
+        self.assertEqual(sorted(admitted), admitted)
+        self.assertTrue(all(t < 0.05 for t in admitted[:2]))
+        self.assertTrue(all(0.29 < t < 0.4 for t in admitted[2:4]))
+        self.assertTrue(all(0.59 < t < 0.7 for t in admitted[4:]))
+        # One timer wake up per freed window, no polling.
+        self.assertEqual(2, throttler.wakeup_count)
+
+    def test_weighted_tasks(self):
+        throttler = Throttler(rate_limit=(10, 0.3), period_safety_margin=0)
+        admitted = self.ev_loop.run_until_complete(self.run_tasks(throttler, [6, 6, 4]))
+        self.assertLess(admitted[0], 0.05)
+        self.assertTrue(0.29 < admitted[1] < 0.4)
+        # FIFO: the light task does not jump ahead of the blocked heavy one.
+        self.assertTrue(0.29 < admitted[2] < 0.4)
+
+    def test_per_endpoint_pools(self):
+        throttler = Throttler(rate_limit=(10, 0.3), period_safety_margin=0,
+                              rate_limits=[RateLimit("orders", 1, 0.3)])
+
+        async def run():
+            return await asyncio.gather(self.run_tasks(throttler, [1, 1], ["orders"]),
+                                        self.run_tasks(throttler, [1, 1]))
+
+        orders, others = self.ev_loop.run_until_complete(run())
+        self.assertLess(orders[0], 0.05)
+        self.assertTrue(0.29 < orders[1] < 0.4)
+        # Requests outside of the orders pool are not held back by it.
+        self.assertTrue(all(t < 0.05 for t in others))
+        self.assertEqual(1, throttler.current_weight("orders"))
+
+    def test_unknown_limit_id(self):
+        throttler = Throttler(rate_limit=(10, 1.0))
+        with self.assertRaises(ValueError):
+            throttler.weighted_task(1, ["unknown"])
+
+    def test_cancelled_waiter_is_removed(self):
+        throttler = Throttler(rate_limit=(1, 0.3), period_safety_margin=0)
+
+        async def run():
+            async with throttler.weighted_task(1):
+                pass
+            waiter = asyncio.ensure_future(throttler.weighted_task(1).acquire())
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, throttler.waiting_count)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(0, throttler.waiting_count)
+
+        self.ev_loop.run_until_complete(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
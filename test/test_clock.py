@@ -0,0 +1,102 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class MockStrategy(StrategyPyBase):
+    def __init__(self, slow_ticks: List[int] = None, tick_duration: float = 0.0):
+        super().__init__()
+        self.timestamps: List[float] = []
+        self._slow_ticks: List[int] = slow_ticks or []
+        self._tick_duration: float = tick_duration
+
+    def tick(self, timestamp: float):
+        if len(self.timestamps) in self._slow_ticks:
+            time.sleep(self._tick_duration)
+        self.timestamps.append(timestamp)
+
+
+class ClockUnitTest(unittest.TestCase):
+    start_timestamp: float = 1615978645.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_sub_second_backtest_ticks_do_not_drift(self):
+        clock = Clock(ClockMode.BACKTEST, 0.1, self.start_timestamp, self.start_timestamp + 100)
+        strategy = MockStrategy()
+        clock.add_iterator(strategy)
+        clock.backtest_til(self.start_timestamp + 50)
+        clock.backtest()
+        self.assertEqual(1000, len(strategy.timestamps))
+        self.assertEqual([self.start_timestamp + i * 0.1 for i in range(1, 1001)], strategy.timestamps)
+
+    def test_iterator_tick_stats(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 100)
+        fast_strategy = MockStrategy()
+        slow_strategy = MockStrategy(slow_ticks=[10, 20], tick_duration=0.01)
+        clock.add_iterator(fast_strategy)
+        clock.add_iterator(slow_strategy)
+        clock.backtest()
+        self.assertEqual(100, clock.stats.tick_count)
+        slow_stats = clock.stats.get_iterator_stats(slow_strategy)
+        self.assertEqual(100, slow_stats.tick_count)
+        self.assertGreaterEqual(slow_stats.max_duration, 0.01)
+        self.assertLess(slow_stats.p50, 0.01)
+        self.assertLess(clock.stats.get_iterator_stats(fast_strategy).max_duration, 0.01)
+        self.assertEqual(0, clock.stats.overrun_count)
+        self.assertIn("MockStrategy", clock.stats.format_status())
+
+        clock.remove_iterator(slow_strategy)
+        self.assertIsNone(clock.stats.get_iterator_stats(slow_strategy))
+
+    def test_realtime_overrun_skips_ticks(self):
+        clock = Clock(ClockMode.REALTIME, 0.1)
+        strategy = MockStrategy(slow_ticks=[1], tick_duration=0.25)
+        clock.add_iterator(strategy)
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 1.0))
+        self.assertGreaterEqual(clock.stats.skipped_tick_count, 2)
+        self.assertEqual(1, clock.stats.overrun_count)
+        self.assertEqual(1, clock.stats.get_iterator_stats(strategy).overrun_count)
+        tick_indexes = [round(ts / 0.1) for ts in strategy.timestamps]
+        self.assertEqual([i * 0.1 for i in tick_indexes], strategy.timestamps)
+        self.assertEqual(sorted(set(tick_indexes)), tick_indexes)
+        # Every tick on the grid was either run or counted as skipped.
+        self.assertEqual(tick_indexes[-1] - tick_indexes[0] + 1,
+                         len(tick_indexes) + clock.stats.skipped_tick_count)
+
+    def test_connectors_tick_first(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10,
+                      connectors_first=True)
+        strategy = MockStrategy()
+        connector = NetworkIterator()
+        script = MockStrategy()
+        clock.add_iterator(strategy)
+        clock.add_iterator(connector)
+        self.assertEqual([connector, strategy], clock.child_iterators)
+        clock.add_iterator(script, priority=-2)
+        self.assertEqual([script, connector, strategy], clock.child_iterators)
+
+    def test_insertion_order_by_default(self):
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        strategy = MockStrategy()
+        connector = NetworkIterator()
+        clock.add_iterator(strategy)
+        clock.add_iterator(connector)
+        self.assertEqual([strategy, connector], clock.child_iterators)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.event.event_journal import EventJournal
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class EventJournalUnitTest(unittest.TestCase):
+    start_timestamp: float = 1615978800.0
+
+    def fill(self, timestamp: float, trading_pair: str = "HBOT-USDT") -> OrderFilledEvent:
+        return OrderFilledEvent(timestamp, "HBOT-1", trading_pair, TradeType.BUY, OrderType.LIMIT, Decimal("1"),
+                                Decimal("1"), TradeFee(Decimal(0)))
+
+    def test_indexes(self):
+        journal = EventJournal()
+        events = [self.fill(self.start_timestamp, "HBOT-USDT"),
+                  OrderCancelledEvent(self.start_timestamp + 1, "HBOT-2"),
+                  self.fill(self.start_timestamp + 2, "HBOT-BTC"),
+                  self.fill(self.start_timestamp + 3, "HBOT-USDT")]
+        for event in events:
+            journal(event)
+        self.assertEqual(events, journal.event_log)
+        self.assertEqual([events[0], events[2], events[3]], list(journal.iter_events(OrderFilledEvent)))
+        self.assertEqual([events[1]], list(journal.iter_events(OrderCancelledEvent)))
+        self.assertEqual([events[0], events[3]], list(journal.iter_events(trading_pair="HBOT-USDT")))
+        self.assertEqual([events[3]], list(journal.iter_events(OrderFilledEvent, "HBOT-USDT",
+                                                               since=self.start_timestamp + 1)))
+        self.assertEqual([], list(journal.iter_events(trading_pair="ETH-USDT")))
+
+    def test_since_with_events_out_of_order(self):
+        journal = EventJournal()
+        timestamps = [1, 2, 5, 3, 4, 6, 6, 7]
+        for timestamp in timestamps:
+            journal(self.fill(self.start_timestamp + timestamp))
+        for since in [0, 1, 2.5, 3, 4.5, 6, 7]:
+            expected: List[float] = [t for t in timestamps if t > since]
+            self.assertEqual(expected, [e.timestamp - self.start_timestamp
+                                        for e in journal.iter_events(since=self.start_timestamp + since)])
+
+    def test_retention_by_count(self):
+        spilled = []
+        journal = EventJournal(max_events=2500, spill=spilled.append)
+        for i in range(10000):
+            if i % 2:
+                journal(self.fill(self.start_timestamp + i, "HBOT-USDT" if i % 4 == 1 else "HBOT-BTC"))
+            else:
+                journal(OrderCancelledEvent(self.start_timestamp + i, f"HBOT-{i}"))
+        self.assertEqual(2500, len(journal))
+        self.assertEqual(7500, journal.evicted_count)
+        self.assertEqual(7500, len(spilled))
+        self.assertEqual(self.start_timestamp + 7500, journal.event_log[0].timestamp)
+        fills = list(journal.iter_events(OrderFilledEvent))
+        self.assertEqual(1250, len(fills))
+        self.assertEqual(self.start_timestamp + 7501, fills[0].timestamp)
+        self.assertEqual(625, len(list(journal.iter_events(trading_pair="HBOT-BTC"))))
+        self.assertEqual(10, len(list(journal.iter_events(OrderFilledEvent, since=self.start_timestamp + 9979))))
+
+    def test_retention_by_age(self):
+        journal = EventJournal(max_age=60)
+        for i in range(300):
+            journal(self.fill(self.start_timestamp + i))
+        self.assertEqual(61, len(journal))
+        self.assertEqual(self.start_timestamp + 239, journal.event_log[0].timestamp)
+        journal.clear()
+        self.assertEqual(0, len(journal))
+        self.assertEqual([], list(journal.iter_events(OrderFilledEvent)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.connector.exchange.peatio.peatio_constants import Constants
+from hummingbot.connector.exchange.peatio.peatio_utils import (
+    api_call_with_retries,
+    rest_client_session,
+)
+from hummingbot.core.utils.http_client_pool import (
+    HTTPClientPool,
+    HTTPClientPoolConfig,
+    LatencyHistogram,
+)
+from test.integration.humming_web_app import get_open_port
+
+
+class HTTPClientPoolUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+        async def get_order(request: web.Request) -> web.Response:
+            await asyncio.sleep(0.01)
+            return web.json_response({"id": int(request.match_info["order_id"])})
+
+        async def get_timestamp(request: web.Request) -> web.Response:
+            return web.json_response({"timestamp": 1615978645})
+
+        app = web.Application()
+        app.router.add_get("/market/orders/{order_id}", get_order)
+        app.router.add_get("/public/timestamp", get_timestamp)
+        cls.runner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        cls.port = get_open_port()
+        cls.ev_loop.run_until_complete(web.TCPSite(cls.runner, "127.0.0.1", cls.port).start())
+        cls.url = f"http://127.0.0.1:{cls.port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    def setUp(self):
+        self.pool = HTTPClientPool()
+        self.addCleanup(lambda: self.ev_loop.run_until_complete(self.pool.close()))
+
+    async def get(self, path: str):
+        async with self.pool.get_session(self.url).get(f"{self.url}{path}") as response:
+            return await response.json()
+
+    async def get_session(self, url: str):
+        # Sessions are created on the running event loop.
+        return self.pool.get_session(url)
+
+    def test_sessions_per_host(self):
+        session = self.ev_loop.run_until_complete(self.get_session(f"{self.url}/public/timestamp"))
+        self.assertIs(session, self.ev_loop.run_until_complete(self.get_session(f"{self.url}/market/orders/1")))
+        self.assertIsNot(session, self.ev_loop.run_until_complete(
+            self.get_session(f"http://localhost:{self.port}/public/timestamp")))
+        self.ev_loop.run_until_complete(session.close())
+        # A closed session is replaced.
+        self.assertFalse(self.ev_loop.run_until_complete(self.get_session(self.url)).closed)
+
+    def test_session_of_another_loop_closed(self):
+        other_loop = asyncio.new_event_loop()
+        self.addCleanup(other_loop.close)
+        stale_session = other_loop.run_until_complete(self.get_session(self.url))
+        session = self.ev_loop.run_until_complete(self.get_session(self.url))
+        self.assertIsNot(stale_session, session)
+        self.assertTrue(stale_session.closed)
+        self.assertFalse(session.closed)
+
+    def test_host_config(self):
+        self.pool.configure("127.0.0.1", HTTPClientPoolConfig(limit=2, keepalive_timeout=5.0))
+        connector = self.ev_loop.run_until_complete(self.get_session(self.url)).connector
+        self.assertEqual(2, connector.limit)
+        self.assertEqual(HTTPClientPoolConfig(), self.pool.config("localhost"))
+
+    def test_connections_reused(self):
+        self.pool.configure("127.0.0.1", HTTPClientPoolConfig(limit=2))
+
+        async def run():
+            await asyncio.gather(*[self.get(f"/market/orders/{i}") for i in range(10)])
+            for _ in range(5):
+                await self.get("/public/timestamp")
+
+        self.ev_loop.run_until_complete(run())
+        stats = self.pool.stats()[f"http://127.0.0.1:{self.port}"]
+        # No more connections than the limit, kept alive in between requests.
+        self.assertEqual(2, stats["connections_created"])
+        self.assertEqual(13, stats["connections_reused"])
+        self.assertEqual(0, stats["active_connections"])
+        self.assertEqual(2, stats["idle_connections"])
+        self.assertEqual({"GET /market/orders/{id}", "GET /public/timestamp"}, set(stats["endpoints"].keys()))
+        orders_histogram = stats["endpoints"]["GET /market/orders/{id}"]
+        self.assertEqual(10, orders_histogram.count)
+        self.assertGreaterEqual(orders_histogram.mean_ms, 10)
+        self.assertIn("GET /public/timestamp: 5 requests, 0 errors", self.pool.format_stats())
+
+    def test_request_errors_counted(self):
+        async def run():
+            session = self.pool.get_session(self.url)
+            with self.assertRaises(Exception):
+                await session.get(f"http://127.0.0.1:{get_open_port()}/public/timestamp")
+
+        # A request to another host on the same session
+        self.ev_loop.run_until_complete(run())
+        host_stats = list(self.pool.stats().values())[0]
+        self.assertEqual(1, host_stats["endpoints"]["GET /public/timestamp"].errors)
+
+    def test_trace_request_ctx_called_when_sent(self):
+        sent = []
+
+        async def run():
+            request = self.pool.get_session(self.url).get(f"{self.url}/market/orders/1",
+                                                          trace_request_ctx=lambda: sent.append(time.perf_counter()))
+            await asyncio.sleep(0.01)
+            # Nothing is sent until the request is awaited.
+            self.assertEqual([], sent)
+            async with request as response:
+                await response.json()
+            return time.perf_counter()
+
+        received = self.ev_loop.run_until_complete(run())
+        self.assertEqual(1, len(sent))
+        self.assertGreaterEqual(received - sent[0], 0.01)
+
+    def test_peatio_requests_share_session(self):
+        with patch.object(Constants, "REST_URL", self.url), \
+                patch.object(HTTPClientPool, "_shared_instance", self.pool):
+            response = self.ev_loop.run_until_complete(api_call_with_retries("GET", "public/timestamp"))
+            self.assertEqual({"timestamp": 1615978645}, response)
+            session = self.ev_loop.run_until_complete(self.get_session(self.url))
+            self.assertIs(session, rest_client_session())
+            self.assertFalse(session.closed)
+            self.assertEqual(Constants.HTTP_CONNECTION_LIMIT, session.connector.limit)
+
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0.0, histogram.percentile(50))
+        for latency_ms in [0.5, 3.0, 3.5, 4.0, 40.0]:
+            histogram.add(latency_ms)
+        self.assertEqual({1: 1, 5: 3, 50: 1}, histogram.buckets())
+        self.assertEqual(5, histogram.percentile(50))
+        self.assertEqual(40.0, histogram.percentile(99))
+        self.assertAlmostEqual(10.2, histogram.mean_ms)
+
+    def test_endpoint_name(self):
+        self.assertEqual("GET /api/v2/peatio/market/orders/{id}/cancel",
+                         HTTPClientPool.endpoint_name("get", "https://x.com/api/v2/peatio/market/orders/123/cancel"))
+        self.assertEqual("POST /orders/{id}",
+                         HTTPClientPool.endpoint_name("POST",
+                                                      "https://x.com/orders/9a8b7c6d-1234-5678-9abc-def012345678"))
+        self.assertEqual("GET /", HTTPClientPool.endpoint_name("GET", "https://x.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot(
+            [OrderBookRow(10.0 - i, 1.0 + i, 1) for i in range(5)],
+            [OrderBookRow(11.0 + i, 2.0, 2) for i in range(5)],
+            2
+        )
+
+    def test_to_numpy(self):
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual((5, 3), bids.shape)
+        self.assertEqual([10.0, 9.0, 8.0, 7.0, 6.0], list(bids[:, 0]))
+        self.assertEqual([1.0, 2.0, 3.0, 4.0, 5.0], list(bids[:, 1]))
+        self.assertEqual([11.0, 12.0, 13.0, 14.0, 15.0], list(asks[:, 0]))
+        self.assertEqual([2.0] * 5, list(asks[:, 2]))
+
+        bids, asks = self.order_book.to_numpy(2)
+        self.assertEqual([10.0, 9.0], list(bids[:, 0]))
+        self.assertEqual([11.0, 12.0], list(asks[:, 0]))
+        self.assertEqual((0, 3), OrderBook().to_numpy()[0].shape)
+
+        bids_df, asks_df = self.order_book.snapshot
+        self.assertEqual(list(bids_df.price), [10.0, 9.0, 8.0, 7.0, 6.0])
+        self.assertEqual(list(asks_df.update_id), [2.0] * 5)
+
+    def test_cumulative_depth(self):
+        asks = self.order_book.cumulative_depth(True)
+        self.assertEqual([2.0, 4.0, 6.0, 8.0, 10.0], list(asks[:, 2]))
+        bids = self.order_book.cumulative_depth(False, 3)
+        self.assertEqual([10.0, 9.0, 8.0], list(bids[:, 0]))
+        self.assertEqual([1.0, 3.0, 6.0], list(bids[:, 2]))
+
+    def test_get_vwap_for_volumes(self):
+        volumes = [7.5, 0.5, 3.0, 100.0, 0.0, 2.0]
+        for is_buy in (True, False):
+            vwaps = self.order_book.get_vwap_for_volumes(is_buy, volumes)
+            self.assertEqual(len(volumes), len(vwaps))
+            for volume, vwap in zip(volumes, vwaps):
+                if volume in (0.0, 100.0):
+                    self.assertTrue(math.isnan(vwap))
+                else:
+                    expected = self.order_book.get_vwap_for_volume(is_buy, volume).result_price
+                    self.assertAlmostEqual(expected, vwap)
+        self.assertEqual(0, len(self.order_book.get_vwap_for_volumes(True, np.array([]))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import asyncio
+import time
+import unittest
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+    """
+    Serves order book snapshots after a per trading pair latency, failing the first fetch of the pairs in failures.
+    """
+    def __init__(self, trading_pairs: List[str], latencies: Dict[str, float], failures: List[str] = None):
+        super().__init__(trading_pairs)
+        self.latencies: Dict[str, float] = latencies
+        self.failures: List[str] = failures or []
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies[trading_pair])
+            if trading_pair in self.failures:
+                self.failures.remove(trading_pair)
+                raise IOError(f"Error fetching OrderBook for {trading_pair}.")
+        finally:
+            self.in_flight -= 1
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.9, 1.0, 100)], [OrderBookRow(1.1, 1.0, 100)], 100)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    INIT_ORDER_BOOK_CONCURRENCY = 4
+    INIT_ORDER_BOOK_RETRY_INTERVAL = 0.1
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = [f"COIN{i}-BTC" for i in range(12)]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def create_tracker(self, latencies: Dict[str, float] = None, failures: List[str] = None) -> OrderBookTracker:
+        latencies = latencies or {trading_pair: 0.1 for trading_pair in self.trading_pairs}
+        tracker = MockOrderBookTracker(MockDataSource(self.trading_pairs, latencies, failures), self.trading_pairs)
+        tracker.start()
+        self.addCleanup(tracker.stop)
+        return tracker
+
+    def test_concurrent_initialization(self):
+        tracker = self.create_tracker()
+        start = time.time()
+        self.ev_loop.run_until_complete(tracker._order_books_initialized.wait())
+        # 12 snapshots, 4 at a time.
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(4, tracker.data_source.max_in_flight)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+
+    def test_ready_on_required_subset(self):
+        latencies = {trading_pair: 0.05 if i < 2 else 1.0 for i, trading_pair in enumerate(self.trading_pairs)}
+        tracker = self.create_tracker(latencies)
+        tracker.required_trading_pairs = self.trading_pairs[:2]
+        self.assertFalse(tracker.ready)
+        self.ev_loop.run_until_complete(tracker.wait_for_order_books(self.trading_pairs[:2]))
+        self.assertTrue(tracker.ready)
+        self.assertTrue(tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(tracker.is_order_book_ready(self.trading_pairs[-1]))
+        tracker.required_trading_pairs = None
+        self.assertFalse(tracker.ready)
+
+    def test_failed_snapshot_retried(self):
+        tracker = self.create_tracker(failures=[self.trading_pairs[0]])
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 2))
+        self.assertTrue(tracker.is_order_book_ready(self.trading_pairs[0]))
+
+    def test_diffs_received_during_initialization_are_replayed(self):
+        trading_pair = self.trading_pairs[0]
+        tracker = self.create_tracker()
+
+        def diff(update_id: int, price: float) -> OrderBookMessage:
+            return OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair, "update_id": update_id, "bids": [[price, 2.0]], "asks": []
+            }, time.time())
+
+        async def run():
+            await asyncio.sleep(0.01)
+            # Older than the snapshot, dropped on replay.
+            tracker._order_book_diff_stream.put_nowait(diff(99, 0.8))
+            tracker._order_book_diff_stream.put_nowait(diff(101, 0.95))
+            await tracker.wait_for_order_books([trading_pair])
+            await asyncio.sleep(0.05)
+
+        self.ev_loop.run_until_complete(run())
+        bids, _ = tracker.order_books[trading_pair].snapshot
+        self.assertEqual([0.95, 0.9], list(bids.price))
+
+    def test_queued_diffs_applied_in_one_batch(self):
+        trading_pair = self.trading_pairs[0]
+        tracker = self.create_tracker()
+
+        def diff(update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+            return OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks
+            }, time.time())
+
+        async def run():
+            await tracker.wait_for_order_books([trading_pair])
+            await asyncio.sleep(0.01)
+            message_queue: asyncio.Queue = tracker._tracking_message_queues[trading_pair]
+            message_queue.put_nowait(diff(101, [[0.95, 1.0]], [[1.05, 1.0]]))
+            message_queue.put_nowait(diff(102, [[0.95, 3.0], [0.9, 0.0]], []))
+            message_queue.put_nowait(diff(103, [], [[1.05, 0.0], [1.2, 4.0]]))
+            await asyncio.sleep(0.05)
+
+        self.ev_loop.run_until_complete(run())
+        order_book: OrderBook = tracker.order_books[trading_pair]
+        bids, asks = order_book.snapshot
+        self.assertEqual([0.95], list(bids.price))
+        self.assertEqual([3.0], list(bids.amount))
+        self.assertEqual([1.1, 1.2], list(asks.price))
+        self.assertEqual(103, order_book.last_diff_uid)
+        self.assertEqual(3, len(tracker._past_diffs_windows[trading_pair]))
+        stats = tracker.queue_stats[trading_pair]
+        self.assertEqual(1, stats.batch_count)
+        self.assertEqual(3, stats.max_queue_depth)
+        self.assertEqual(3, stats.diff_count)
+
+    def test_coalesce_diff_rows(self):
+        bids, asks = OrderBookTracker.coalesce_diff_rows([
+            ([OrderBookRow(1.0, 1.0, 1), OrderBookRow(0.9, 1.0, 1)], [OrderBookRow(1.1, 1.0, 1)]),
+            ([OrderBookRow(1.0, 0.0, 2)], [OrderBookRow(1.1, 2.0, 2), OrderBookRow(1.2, 1.0, 2)]),
+        ])
+        self.assertEqual([OrderBookRow(1.0, 0.0, 2), OrderBookRow(0.9, 1.0, 1)], bids)
+        self.assertEqual([OrderBookRow(1.1, 2.0, 2), OrderBookRow(1.2, 1.0, 2)], asks)
+
+
+if __name__ == "__main__":
+    unittest.main()
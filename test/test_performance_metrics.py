@@ -1,13 +1,27 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
+import random
+import tempfile
 import unittest
 import asyncio
 from unittest.mock import patch
 
-from hummingbot.client.performance import calculate_performance_metrics
+from hummingbot.client.performance import (
+    PerformanceMetrics,
+    PerformanceTracker,
+    calculate_performance_metrics,
+)
 from hummingbot.core.data_type.trade import Trade, TradeType, TradeFee
+# TradeFill relates to Order, which relates to OrderStatus, they are mapped before trade fills are created.
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -33,3 +47,111 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
             calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
         self.assertEqual(Decimal("250"), metrics.trade_pnl)
         print(metrics)
+
+
+async def mock_last_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
+    return {"HBOT-USDT": Decimal("101.5"), "BNB-USDT": Decimal("300")}.get(trading_pair)
+
+
+class PerformanceTrackerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    @staticmethod
+    def trade_fills(count: int, derivative: bool, seed: int = 0) -> List[TradeFill]:
+        rng = random.Random(seed)
+        trades: List[TradeFill] = []
+        for i in range(count):
+            # Some orders are filled several times in a row.
+            if i > 0 and rng.random() < 0.3:
+                order_id, trade_type, position = trades[-1].order_id, trades[-1].trade_type, trades[-1].position
+            else:
+                order_id, trade_type = f"order-{i}", rng.choice(["BUY", "SELL"])
+                position = rng.choice(["OPEN", "CLOSE"]) if derivative else "NILL"
+            flat_fees = [{"asset": "BNB", "amount": rng.uniform(0, 0.01)}] if rng.random() < 0.2 else []
+            trades.append(TradeFill(config_file_path="conf.yml", strategy="pure_market_making", market="binance",
+                                    symbol=trading_pair, base_asset=base, quote_asset=quote, timestamp=1000 + i,
+                                    order_id=order_id, trade_type=trade_type, order_type="LIMIT",
+                                    price=rng.uniform(90, 110), amount=rng.uniform(0.1, 10), leverage=1,
+                                    trade_fee={"percent": 0.001 if not flat_fees else 0, "flat_fees": flat_fees},
+                                    exchange_trade_id=f"trade-{i}", position=position))
+        return trades
+
+    def assert_tracker_matches_batch(self, trades: List[TradeFill]):
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        tracker = PerformanceTracker()
+        tracker.reset(1000, trades[:len(trades) // 2])
+        for trade in trades[len(trades) // 2:]:
+            tracker.add_fill(trade.market, trade.symbol, trade.timestamp, trade.trade_type, trade.price, trade.amount,
+                             trade.trade_fee, trade.order_id, trade.position)
+        # Fills from before the start are not counted.
+        tracker.add_fill("binance", trading_pair, 999, "BUY", 100.0, 1.0, {"percent": 0.1, "flat_fees": []},
+                         "order-old", "NILL")
+        with patch("hummingbot.client.performance.get_last_price", side_effect=mock_last_price):
+            expected: PerformanceMetrics = self.ev_loop.run_until_complete(
+                calculate_performance_metrics("binance", trading_pair, trades, cur_bals))
+            actual: PerformanceMetrics = self.ev_loop.run_until_complete(
+                tracker.performance_metrics("binance", trading_pair, cur_bals))
+        self.assertEqual(len(trades), tracker.num_trades)
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected.fees, actual.fees)
+        self.assertEqual(expected.trade_pnl, actual.trade_pnl)
+        self.assertEqual(expected.return_pct, actual.return_pct)
+
+    def test_spot_trades_match_batch_computation(self):
+        self.assert_tracker_matches_batch(self.trade_fills(500, derivative=False))
+
+    def test_derivative_trades_match_batch_computation(self):
+        trades = self.trade_fills(500, derivative=True, seed=1)
+        self.assert_tracker_matches_batch(trades)
+        tracker = PerformanceTracker()
+        tracker.reset(1000, trades)
+        self.assertTrue(tracker.accumulators[("binance", trading_pair)].is_derivative)
+
+    def test_last_prices_cached(self):
+        tracker = PerformanceTracker(price_ttl=60.0)
+        tracker.reset(1000, self.trade_fills(20, derivative=False))
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        with patch("hummingbot.client.performance.get_last_price", side_effect=mock_last_price) as last_price:
+            for _ in range(3):
+                self.ev_loop.run_until_complete(tracker.performance_metrics("binance", trading_pair, cur_bals))
+        # The trading pair price and the BNB fee price, once each.
+        self.assertEqual(2, last_price.call_count)
+        self.assertIsNone(self.ev_loop.run_until_complete(
+            tracker.performance_metrics("kucoin", trading_pair, cur_bals)))
+
+    def test_reset_from_database(self):
+        spot_trades = self.trade_fills(300, derivative=False, seed=2)
+        derivative_trades = self.trade_fills(300, derivative=True, seed=3)
+        for trade in derivative_trades:
+            trade.market = "binance_perpetual"
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        expected: List[PerformanceMetrics] = []
+        with patch("hummingbot.client.performance.get_last_price", side_effect=mock_last_price):
+            for market, trades in (("binance", spot_trades), ("binance_perpetual", derivative_trades)):
+                expected.append(self.ev_loop.run_until_complete(
+                    calculate_performance_metrics(market, trading_pair, trades, cur_bals)))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=join(tmp_dir, "trades.sqlite"))
+            session = sql.get_shared_session()
+            session.add_all(spot_trades + derivative_trades)
+            session.commit()
+            tracker = PerformanceTracker()
+            tracker.reset_from_database(session, 1000, "conf.yml")
+            session.close()
+            sql.engine.dispose()
+        for market, expected_perf in zip(("binance", "binance_perpetual"), expected):
+            with patch("hummingbot.client.performance.get_last_price", side_effect=mock_last_price):
+                actual: PerformanceMetrics = self.ev_loop.run_until_complete(
+                    tracker.performance_metrics(market, trading_pair, cur_bals))
+            self.assertEqual(expected_perf.num_buys, actual.num_buys)
+            self.assertEqual(expected_perf.num_sells, actual.num_sells)
+            self.assertEqual(expected_perf.start_price, actual.start_price)
+            self.assertEqual(expected_perf.cur_price, actual.cur_price)
+            self.assertEqual(expected_perf.fees.keys(), actual.fees.keys())
+            # The database sums the spot fills in its own order.
+            for name in ("tot_vol_base", "tot_vol_quote", "trade_pnl", "fee_in_quote", "return_pct"):
+                self.assertAlmostEqual(float(getattr(expected_perf, name)), float(getattr(actual, name)), places=6)
+        self.assertTrue(tracker.accumulators[("binance_perpetual", trading_pair)].is_derivative)
+        self.assertFalse(tracker.accumulators[("binance", trading_pair)].is_derivative)
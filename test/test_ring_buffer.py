@@ -95,3 +95,27 @@ class RingBufferTest(unittest.TestCase):
         value = Decimal(3.141592653)
         self.buffer.add_value(value)
         self.assertAlmostEqual(float(value), self.buffer.get_last_value(), 6)
+
+    def test_numpy_view_is_ordered_and_not_copied(self):
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+            view = self.buffer.get_as_numpy_view()
+            expected = list(range(max(0, i + 1 - self.BUFFER_LENGTH), i + 1))
+            self.assertEqual(expected, list(view))
+            self.assertEqual(len(expected), len(self.buffer))
+        self.assertTrue(view.flags.c_contiguous)
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.shares_memory(view, self.buffer.get_as_numpy_view()))
+        self.assertFalse(np.shares_memory(view, self.buffer.get_as_numpy_array()))
+        self.assertEqual(5, self.buffer.get_first_value())
+
+    def test_running_statistics_match_numpy(self):
+        values = np.random.RandomState(42).lognormal(5, 1, self.BUFFER_LENGTH * 10)
+        self.assertTrue(np.isnan(self.buffer.running_mean))
+        for i, value in enumerate(values):
+            self.buffer.add_value(value)
+            window = values[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            self.assertAlmostEqual(np.mean(window), self.buffer.running_mean, 9)
+            self.assertAlmostEqual(np.var(window), self.buffer.running_variance, 7)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.std(window), self.buffer.std_dev, 9)
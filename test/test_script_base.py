@@ -3,10 +3,14 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 
+import asyncio
 import unittest
 from decimal import Decimal
+from multiprocessing import Queue
 from statistics import mean
 from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import OnTick, apply_balance_changes, balance_changes, set_child_queue
+from hummingbot.script.script_queue import ScriptQueueReader
 
 
 class ScriptIteratorUnitTest(unittest.TestCase):
@@ -74,3 +78,63 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("0.01")))
         self.assertEqual(Decimal("1"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("1")))
         self.assertEqual(Decimal("-1.75"), ScriptBase.round_by_step(Decimal("-1.8"), Decimal("0.25")))
+
+    def test_fast_helpers_match(self):
+        script_base = ScriptBase()
+        script_base.max_mid_prices_length = 50
+        for i in range(80):
+            script_base.add_mid_price(Decimal(100 + (i * 7) % 13) / Decimal(10))
+        self.assertEqual(50, len(script_base.mid_prices))
+        self.assertEqual(50, len(script_base.mid_price_history))
+        self.assertEqual([float(p) for p in script_base.take_samples(script_base.mid_prices, 3, 5)],
+                         list(script_base.mid_price_samples(3, 5)))
+        self.assertIsNone(script_base.mid_price_samples(3, 18))
+        self.assertIsNone(script_base.fast_avg_price_volatility(7, 8))
+        for interval, length in ((1, 50), (1, 10), (3, 5), (7, 6), (100, 1)):
+            self.assertAlmostEqual(float(script_base.avg_mid_price(interval, length)),
+                                   script_base.fast_avg_mid_price(interval, length))
+        for interval, length in ((1, 49), (3, 5), (7, 6), (10, 1)):
+            self.assertAlmostEqual(float(script_base.avg_price_volatility(interval, length)),
+                                   script_base.fast_avg_price_volatility(interval, length))
+            self.assertAlmostEqual(float(script_base.median_price_volatility(interval, length)),
+                                   script_base.fast_median_price_volatility(interval, length))
+
+    def test_balance_changes(self):
+        previous = {"binance": {"BTC": Decimal("1"), "ETH": Decimal("2")}, "kucoin": {"USDT": Decimal("3")}}
+        current = {"binance": {"BTC": Decimal("1"), "ETH": Decimal("2.5"), "BNB": Decimal("4")}, "kucoin": {}}
+        changes = balance_changes(previous, current)
+        self.assertEqual({"binance": {"ETH": Decimal("2.5"), "BNB": Decimal("4")}, "kucoin": {"USDT": None}}, changes)
+        self.assertEqual({}, balance_changes(current, current))
+        apply_balance_changes(previous, changes)
+        self.assertEqual(current, previous)
+
+    def test_apply_on_tick_changes(self):
+        child_queue = Queue()
+        set_child_queue(child_queue)
+        script_base = ScriptBase()
+        script_base.apply_on_tick_changes(OnTick(Decimal("100"), {"bid_spread": Decimal("0.01"), "buy_levels": 2},
+                                                 {"binance": {"BTC": Decimal("1")}},
+                                                 {"binance": {"BTC": Decimal("0.5")}}))
+        script_base.apply_on_tick_changes(OnTick(Decimal("101"), {"buy_levels": 3},
+                                                 {"binance": {"ETH": Decimal("2")}},
+                                                 {"binance": {"BTC": None}}))
+        self.assertEqual(Decimal("0.01"), script_base.pmm_parameters.bid_spread)
+        self.assertEqual(3, script_base.pmm_parameters.buy_levels)
+        self.assertEqual({"binance": {"BTC": Decimal("1"), "ETH": Decimal("2")}}, script_base.all_total_balances)
+        self.assertEqual({"binance": {}}, script_base.all_available_balances)
+        # Values from the parent are not sent back, only the ones the script changes.
+        self.assertTrue(child_queue.empty())
+        script_base.pmm_parameters.buy_levels = 1
+        self.assertEqual("buy_levels", child_queue.get(timeout=1).name)
+
+    def test_queue_reader(self):
+        ev_loop = asyncio.get_event_loop()
+        mp_queue = Queue()
+        reader = ScriptQueueReader(mp_queue, ev_loop, poll_timeout=0.1)
+        reader.start()
+        mp_queue.put("item")
+        mp_queue.put(None)
+        self.assertEqual("item", ev_loop.run_until_complete(asyncio.wait_for(reader.get(), 1)))
+        self.assertIsNone(ev_loop.run_until_complete(asyncio.wait_for(reader.get(), 1)))
+        reader._thread.join(1)
+        self.assertFalse(reader._thread.is_alive())
@@ -0,0 +1,95 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import tempfile
+import unittest
+from typing import List
+
+import pandas as pd
+from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradeFillUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = join(self.tmp_dir.name, "trades.sqlite")
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.session = self.sql.get_shared_session()
+
+    def tearDown(self):
+        self.session.close()
+        self.sql.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def trade_fill(i: int, config_file_path: str = "conf.yml", market: str = "binance",
+                   trade_type: str = "BUY", percent: float = 0.001) -> TradeFill:
+        return TradeFill(config_file_path=config_file_path, strategy="pure_market_making", market=market,
+                         symbol="HBOT-USDT", base_asset="HBOT", quote_asset="USDT", timestamp=1615000000000 + i * 1000,
+                         order_id=f"buy-HBOT-USDT-{1615000000000000 - i * 1000000}", trade_type=trade_type,
+                         order_type="LIMIT", price=100.0 + i, amount=1.0 + i, leverage=1,
+                         trade_fee={"percent": percent, "flat_fees": []}, exchange_trade_id=f"trade-{i}",
+                         position="NILL")
+
+    def add_trade_fills(self) -> List[TradeFill]:
+        trades: List[TradeFill] = [self.trade_fill(0), self.trade_fill(1, trade_type="SELL"),
+                                   self.trade_fill(2, market="kucoin"), self.trade_fill(3, percent=0.002),
+                                   self.trade_fill(4, config_file_path="conf_other.yml"), self.trade_fill(5)]
+        self.session.add_all(trades)
+        self.session.commit()
+        return trades
+
+    def test_trade_columns(self):
+        trades = self.add_trade_fills()
+        columns: pd.DataFrame = TradeFill.get_trade_columns(self.session, "conf.yml", trades[1].timestamp)
+        self.assertEqual(["trade-1", "trade-2", "trade-3", "trade-5"], list(columns["exchange_trade_id"]))
+        self.assertEqual({"percent": 0.002, "flat_fees": []}, columns["trade_fee"][2])
+        chunks = list(TradeFill.iter_trade_columns(self.session, columns=["price", "amount"], chunk_size=4))
+        self.assertEqual([4, 2], [len(chunk) for chunk in chunks])
+        self.assertEqual(["price", "amount"], list(chunks[0].columns))
+        self.assertEqual(0, len(TradeFill.get_trade_columns(self.session, "conf_missing.yml")))
+        # Formatted the same way as the TradeFill objects.
+        expected: pd.DataFrame = TradeFill.to_pandas(trades)
+        columns = TradeFill.get_trade_columns(self.session, columns=TradeFill.DISPLAY_COLUMNS)
+        pd.testing.assert_frame_equal(expected, TradeFill.columns_to_pandas(columns), check_dtype=False)
+
+    def test_aggregate_trades(self):
+        self.add_trade_fills()
+        aggregates: pd.DataFrame = TradeFill.aggregate_trades(self.session, "conf.yml")
+        aggregates = aggregates.sort_values(["market", "trade_type", "trade_fee"]).reset_index(drop=True)
+        self.assertEqual([("binance", "BUY", 2), ("binance", "BUY", 1), ("binance", "SELL", 1), ("kucoin", "BUY", 1)],
+                         list(zip(aggregates["market"], aggregates["trade_type"], aggregates["num_trades"])))
+        # trade 0 and 5
+        self.assertEqual(1.0 + 6.0, aggregates["amount"][0])
+        self.assertEqual(100.0 * 1.0 + 105.0 * 6.0, aggregates["quote_amount"][0])
+        self.assertEqual(1615000005000, aggregates["last_timestamp"][0])
+        self.assertEqual((100.0, 105.0), TradeFill.get_first_and_last_prices(self.session, "binance", "HBOT-USDT",
+                                                                             "conf.yml"))
+        self.assertIsNone(TradeFill.get_first_and_last_prices(self.session, "binance", "BTC-USDT", "conf.yml"))
+
+    def test_index_migration(self):
+        index_name = "tf_config_timestamp_market_symbol_index"
+        # Bring the database back to how it was before the index was added.
+        self.sql.engine.execute(f'DROP INDEX "{index_name}"')
+        self.sql.engine.execute('CREATE INDEX tf_config_timestamp_index ON "TradeFill" (config_file_path, timestamp)')
+        self.sql.get_local_db_version().value = "20210119"
+        self.session.commit()
+        self.session.close()
+        self.sql.engine.dispose()
+
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.session = self.sql.get_shared_session()
+        self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, self.sql.get_local_db_version().value)
+        index_names = DatabaseTransformation.index_names(self.sql.engine, "TradeFill")
+        self.assertIn(index_name, index_names)
+        self.assertNotIn("tf_config_timestamp_index", index_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
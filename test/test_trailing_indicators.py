@@ -0,0 +1,40 @@
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.average_volatility import AverageVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import \
+    ExponentialMovingAverageIndicator
+
+
+class TrailingIndicatorsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.prices = 100 + np.cumsum(np.random.RandomState(42).normal(0, 1, 200))
+
+    def test_exponential_moving_average(self):
+        sampling_length = 30
+        indicator = ExponentialMovingAverageIndicator(sampling_length)
+        for i, price in enumerate(self.prices):
+            indicator.add_sample(price)
+            window = self.prices[max(0, i + 1 - sampling_length):i + 1]
+            expected = pd.Series(window).ewm(span=sampling_length, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 9)
+
+    def test_average_volatility(self):
+        sampling_length, processing_length = 30, 15
+        indicator = AverageVolatilityIndicator(sampling_length, processing_length)
+        variances = []
+        for i, price in enumerate(self.prices):
+            indicator.add_sample(price)
+            variances.append(np.var(self.prices[max(0, i + 1 - sampling_length):i + 1]))
+            expected = np.sqrt(np.mean(variances[-processing_length:]))
+            self.assertAlmostEqual(expected, indicator.current_value, 9)
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertTrue(indicator.is_processing_buffer_full)
+
+
+if __name__ == "__main__":
+    unittest.main()